@@ -4,7 +4,6 @@ Lightweight genre classifier with heuristic scoring and optional Llama refinemen
 
 from __future__ import annotations
 
-import re
 from typing import Dict
 
 try:
@@ -12,6 +11,8 @@ try:
 except Exception:
     LlamaAgent = None  # type: ignore
 
+from pipeline_common.keyword_scorer import KeywordScorer, cached_result, sample_windows, text_digest
+
 
 KEYWORDS = {
     "philosophy": ["philosophy", "reason", "virtue", "ethics", "logic", "metaphysics", "stoic", "plato", "aristotle"],
@@ -21,15 +22,17 @@ KEYWORDS = {
     "science": ["experiment", "theory", "physics", "biology", "chemistry", "data"],
 }
 
+_SCORER = KeywordScorer(KEYWORDS)
+
 
 def _heuristic_scores(text: str) -> Dict[str, float]:
-    text_lower = text.lower()
-    scores: Dict[str, float] = {}
-    for genre, words in KEYWORDS.items():
-        count = sum(len(re.findall(rf"\\b{re.escape(w)}\\b", text_lower)) for w in words)
-        scores[genre] = count
-    total = sum(scores.values()) or 1.0
-    return {k: v / total for k, v in scores.items()}
+    # One token pass over evenly spaced windows; cached by text digest
+    def _compute() -> Dict[str, float]:
+        scores = _SCORER.score(sample_windows(text))
+        total = sum(scores.values()) or 1.0
+        return {k: v / total for k, v in scores.items()}
+
+    return dict(cached_result("genre_classifier", text_digest(text, _SCORER.signature), _compute))
 
 
 def classify_text(text: str, use_llama: bool = False) -> Dict[str, float]:
@@ -1,4 +1,3 @@
-import hashlib
 import logging
 import sys
 from pathlib import Path
@@ -7,7 +6,7 @@ from typing import Any, Tuple
 logger = logging.getLogger(__name__)
 
 
-def _load_pipeline_common() -> Tuple[Any, Any, Any, Any]:
+def _load_pipeline_common() -> Tuple[Any, Any, Any, Any, Any]:
     """
     Import pipeline_common after ensuring the repo root is on sys.path.
 
@@ -24,11 +23,12 @@ def _load_pipeline_common() -> Tuple[Any, Any, Any, Any]:
         ensure_phase_and_file,
         ensure_phase_block,
     )
+    from pipeline_common.fingerprint import file_sha256
 
-    return PipelineState, StateError, ensure_phase_and_file, ensure_phase_block
+    return PipelineState, StateError, ensure_phase_and_file, ensure_phase_block, file_sha256
 
 
-PipelineState, StateError, ensure_phase_and_file, ensure_phase_block = (
+PipelineState, StateError, ensure_phase_and_file, ensure_phase_block, _file_sha256 = (
     _load_pipeline_common()
 )
 
@@ -38,13 +38,10 @@ def compute_sha256(path: Path) -> str:
     Compute a sha256 hash for the given file path.
 
     This helper is placed in utils so Phase 1 and Phase 2 can share the
-    implementation without diverging hash behavior.
+    implementation without diverging hash behavior.  Digests come from the
+    shared fingerprint index, so an unchanged file is not read again.
     """
-    digest = hashlib.sha256()
-    with open(path, "rb") as handle:
-        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+    return _file_sha256(path)
 
 
 def _state_for_path(json_path: Path) -> PipelineState:
@@ -8,14 +8,7 @@ from pathlib import Path
 from time import perf_counter
 from typing import Any, Dict, List, Optional, Tuple
 
-import chardet
 import ebooklib
-import ftfy
-import hachoir.metadata
-import hachoir.parser
-import pikepdf
-import pymupdf as fitz  # PyMuPDF
-from docx import Document
 from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 
@@ -28,7 +21,7 @@ def _configure_sys_path() -> None:
             sys.path.insert(0, str(path))
 
 
-def _load_pipeline_common() -> Tuple[Any, Any, Any, Any, Any]:
+def _load_pipeline_common() -> Tuple[Any, Any, Any, Any, Any, Any]:
     _configure_sys_path()
     from pipeline_common import (
         PipelineState,
@@ -36,6 +29,7 @@ def _load_pipeline_common() -> Tuple[Any, Any, Any, Any, Any]:
         ensure_phase_and_file,
         ensure_phase_block,
     )
+    from pipeline_common.pdf_page_cache import PdfPageCache
     from pipeline_common.state_manager import StateTransaction
 
     return (
@@ -44,6 +38,7 @@ def _load_pipeline_common() -> Tuple[Any, Any, Any, Any, Any]:
         ensure_phase_and_file,
         ensure_phase_block,
         StateTransaction,
+        PdfPageCache,
     )
 
 
@@ -58,12 +53,28 @@ def _load_utils() -> Tuple[Any, Any]:
     return utils_compute_sha256, log_error
 
 
+_configure_sys_path()
+from pipeline_common import startup_profile  # noqa: E402
+from pipeline_common.lazy_import import lazy_module  # noqa: E402
+
+startup_profile.enable_if_requested("phase1_validation")
+
+# Format libraries load on first use, so --help and single-format runs skip the rest
+chardet = lazy_module("chardet")
+docx = lazy_module("docx")
+fitz = lazy_module("pymupdf")  # PyMuPDF
+ftfy = lazy_module("ftfy")
+hachoir_metadata = lazy_module("hachoir.metadata")
+hachoir_parser = lazy_module("hachoir.parser")
+pikepdf = lazy_module("pikepdf")
+
 (
     PipelineState,
     StateError,
     ensure_phase_and_file,
     ensure_phase_block,
     StateTransaction,
+    PdfPageCache,
 ) = _load_pipeline_common()
 utils_compute_sha256, log_error = _load_utils()
 
@@ -179,24 +190,28 @@ def _alphabetic_ratio(text: str) -> float:
     return sum(ratios) / len(ratios)
 
 
-def classify_pdf(file_path: Path) -> str:
+def classify_pdf(file_path: Path, sha256: Optional[str] = None) -> str:
     """
     Classify a PDF using a deterministic heuristic:
     - Extractable text length
     - Pagewise density (chars per page area)
     - Replacement character count
     - Average token alphabetic ratio
+
+    Page text and geometry come from the shared page cache, so the PyMuPDF
+    pass done here is reused by Phase 2 (and skipped entirely on re-runs).
     """
-    doc = fitz.open(file_path)
-    total_pages = len(doc)
+    pages = PdfPageCache.for_file(file_path, sha256, opener=fitz.open)
+    page_texts = pages.texts("pymupdf")
+    page_stats = pages.page_stats()
+    total_pages = len(page_texts)
     total_text_len = 0
     total_replacements = 0
     alpha_ratios: List[float] = []
     text_like_pages = 0
     dense_pages = 0
 
-    for page in doc:
-        text = page.get_text() or ""
+    for text, stats in zip(page_texts, page_stats):
         cleaned = text.strip()
         length = len(cleaned)
         total_text_len += length
@@ -207,15 +222,13 @@ def classify_pdf(file_path: Path) -> str:
         if alpha_ratio:
             alpha_ratios.append(alpha_ratio)
 
-        page_area = max(float(page.rect.width * page.rect.height), 1.0)
+        page_area = max(float(stats["width"] * stats["height"]), 1.0)
         density = length / page_area
         if length >= 150 or (length >= 60 and alpha_ratio >= 0.55):
             text_like_pages += 1
         if density > 0.001:
             dense_pages += 1
 
-    doc.close()
-
     text_ratio = text_like_pages / total_pages if total_pages else 0.0
     density_ratio = dense_pages / total_pages if total_pages else 0.0
     avg_alpha = sum(alpha_ratios) / len(alpha_ratios) if alpha_ratios else 0.0
@@ -245,10 +258,10 @@ def classify_pdf(file_path: Path) -> str:
     return classification
 
 
-def classify_file(file_path: Path) -> str:
+def classify_file(file_path: Path, sha256: Optional[str] = None) -> str:
     ext = file_path.suffix.lower()
     if ext == ".pdf":
-        return classify_pdf(file_path)
+        return classify_pdf(file_path, sha256)
     if ext in {".txt", ".epub", ".docx"}:
         return "text"
     return "unknown"
@@ -281,7 +294,7 @@ def repair_epub(file_path: Path, retries: int = 2) -> bool:
 def repair_docx(file_path: Path, retries: int = 2) -> bool:
     for attempt in range(1, retries + 1):
         try:
-            doc = Document(file_path)
+            doc = docx.Document(file_path)
             doc.save(file_path)
             logger.info("DOCX repair attempt %s succeeded.", attempt)
             return True
@@ -364,7 +377,7 @@ def validate_docx(
     repair_attempted = False
     repair_success = False
     try:
-        Document(file_path)
+        docx.Document(file_path)
     except Exception as exc:
         repair_attempted = True
         errors.append(str(exc))
@@ -396,7 +409,7 @@ def validate_txt(
     return {}, repair_attempted, repair_success
 
 
-def extract_metadata(file_path: Path) -> Dict[str, Optional[str]]:
+def extract_metadata(file_path: Path, sha256: Optional[str] = None) -> Dict[str, Optional[str]]:
     file_ext = file_path.suffix.lower()
     metadata_dict: Dict[str, Optional[str]] = {
         "title": None,
@@ -406,19 +419,17 @@ def extract_metadata(file_path: Path) -> Dict[str, Optional[str]]:
 
     if file_ext == ".pdf":
         try:
-            doc = fitz.open(file_path)
-            pdf_meta = doc.metadata or {}
+            pdf_meta = PdfPageCache.for_file(file_path, sha256, opener=fitz.open).metadata()
             metadata_dict["title"] = pdf_meta.get("title")
             metadata_dict["author"] = pdf_meta.get("author")
             metadata_dict["creation_date"] = pdf_meta.get("creationDate")
-            doc.close()
         except Exception as exc:
             logger.warning("PyMuPDF metadata extraction failed: %s", exc)
 
     try:
-        parser = hachoir.parser.createParser(str(file_path))
+        parser = hachoir_parser.createParser(str(file_path))
         if parser:
-            extracted = hachoir.metadata.extractMetadata(parser)
+            extracted = hachoir_metadata.extractMetadata(parser)
             if extracted:
                 metadata_dict["title"] = metadata_dict[
                     "title"
@@ -666,7 +677,7 @@ def validate_and_repair(
             return reused
 
     if mode == "fast":
-        meta = extract_metadata(path)
+        meta = extract_metadata(path, sha256_hash)
         end_time = perf_counter()
         duration = end_time - start_time
         try:
@@ -723,8 +734,10 @@ def validate_and_repair(
     artifacts_path = (
         write_artifacts(path, Path(artifacts_dir)) if repair_success else None
     )
+    # Repair rewrites the file, so only reuse the digest if it is unchanged
+    content_sha = None if repair_success else sha256_hash
     try:
-        classification = classify_file(path)
+        classification = classify_file(path, content_sha)
     except Exception as exc:
         classification = "unknown"
         errors.append(str(exc))
@@ -737,7 +750,7 @@ def validate_and_repair(
                 _categorize_error(exc, file_ext),
             )
         logger.error("Classification failed: %s", exc)
-    meta = extract_metadata(path)
+    meta = extract_metadata(path, content_sha)
     end_time = perf_counter()
     duration = end_time - start_time
     logger.info(
@@ -801,7 +814,7 @@ def persist_and_log(
         logger.info("Persisted metadata for %s", file_id)
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(
         description="Phase 1: Validate and repair audiobook files."
     )
@@ -831,7 +844,8 @@ def main():
         default="thorough",
         help="Fast mode skips repairs/classification; thorough runs full validation.",
     )
-    args = parser.parse_args()
+    startup_profile.add_argument(parser)
+    args = parser.parse_args(argv)
 
     metadata = validate_and_repair(
         args.file,
@@ -3,13 +3,23 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from pipeline_common import PipelineState
+from collections import OrderedDict
+
+from pipeline_common import PipelineState, pdf_page_cache
 from phase1_validation import validation
 
 
+@pytest.fixture(autouse=True)
+def _isolated_page_cache(monkeypatch: pytest.MonkeyPatch):
+    """Keep mocked PyMuPDF pages out of the shared page cache."""
+    monkeypatch.setenv(pdf_page_cache.CACHE_ENV, "off")
+    monkeypatch.setattr(pdf_page_cache, "_REGISTRY", OrderedDict())
+
+
 def _mock_pdf_doc(text_len: int = 600) -> MagicMock:
     page = MagicMock()
-    page.get_text.return_value = "text" * (text_len // 4)
+    text = "text" * (text_len // 4)
+    page.get_text.side_effect = lambda kind="text": {"blocks": []} if kind == "dict" else text
     page.rect.width = 100
     page.rect.height = 100
     doc = MagicMock()
@@ -12,6 +12,8 @@ import time
 from pathlib import Path
 from typing import Dict, Match, Optional
 
+from pipeline_common.text_rules import Replace, RuleTable, Sub
+
 try:
     from nemo_text_processing.text_normalization.normalize import Normalizer
 
@@ -27,9 +29,76 @@ try:
 except ImportError:
     NUM2WORDS_AVAILABLE = False
 
+try:
+    from unidecode import unidecode
+except ImportError:
+    unidecode = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 
+def _collapse_single_letters(match: Match[str]) -> str:
+    parts = match.group(0).split()
+    return " ".join([p for p in parts if len(p) > 1]) or ""
+
+
+def _normalize_currency(match: Match[str]) -> str:
+    amount_str = match.group(1).replace(" ", "")
+    try:
+        if NUM2WORDS_AVAILABLE:
+            amount = float(amount_str)
+            return num2words(amount, to="currency", currency="USD")
+    except ValueError:
+        return match.group(0)
+    return match.group(0)
+
+
+# "â€" is a prefix of the longer mojibake keys, so they only fire if it has not
+# already been replaced; the table keeps that sequential behaviour.
+ENCODING_RULES = [
+    Replace(
+        "mojibake_quotes",
+        {"â€œ": '"', "â€": '"', "â€™": "'", "â€˜": "'", 'â€"': "—"},
+    ),
+]
+if unidecode is not None:
+    # unidecode maps characters independently, so only non-ASCII runs need it
+    ENCODING_RULES.append(Sub("unidecode", r"[^\x00-\x7f]+", lambda m: unidecode(m.group(0))))
+
+OCR_ARTIFACT_RULES = [
+    Sub("single_letter_lines", r"^\s*[a-zA-Z]\s*$", "", flags=re.MULTILINE, streamable=False),
+    Sub(
+        "single_letter_runs",
+        r"\b[a-zA-Z]\b(?:\s+\b[a-zA-Z]\b){2,}",
+        _collapse_single_letters,
+        streamable=False,
+    ),
+]
+
+BASIC_RULES = [
+    Sub("currency", r"\$\s*(\d+\.\d{2})", _normalize_currency, requires=("$",), streamable=False),
+]
+
+WHITESPACE_RULES = [
+    Sub("collapse_spaces", r"  +", " ", requires=("  ",)),
+    Sub("collapse_newlines", r"\n{3,}", "\n\n", requires=("\n\n\n",), streamable=False),
+    Sub("space_after_sentence", r"([.!?])([A-Z])", r"\1 \2"),
+    # Fix spaced characters (e.g., "T h e G i f t" → "The Gift")
+    # Matches 2+ single letters separated by spaces (PDF header/title artifact)
+    Sub(
+        "spaced_letters",
+        r"\b[a-zA-Z]\b(?:\s+\b[a-zA-Z]\b)+",
+        lambda m: m.group(0).replace(" ", ""),
+        streamable=False,
+    ),
+]
+
+ENCODING_TABLE = RuleTable("cleaner_encoding", ENCODING_RULES)
+OCR_ARTIFACT_TABLE = RuleTable("cleaner_ocr", OCR_ARTIFACT_RULES)
+BASIC_TABLE = RuleTable("cleaner_basic", BASIC_RULES)
+WHITESPACE_TABLE = RuleTable("cleaner_whitespace", WHITESPACE_RULES)
+
+
 class TTSTextCleaner:
     """
     Production-grade text cleaner for TTS preprocessing.
@@ -87,33 +156,11 @@ class TTSTextCleaner:
 
     def _fix_encoding(self, text: str) -> str:
         """Fix common PDF encoding artifacts."""
-        text = text.replace("â€œ", '"').replace("â€", '"')
-        text = text.replace("â€™", "'").replace("â€˜", "'")
-        text = text.replace('â€"', "—").replace('â€"', "–")
-
-        try:
-            from unidecode import unidecode
-
-            text = unidecode(text)
-        except ImportError:
-            pass
-
-        return text
+        return ENCODING_TABLE.apply(text)[0]
 
     def _remove_ocr_artifacts(self, text: str) -> str:
         """Remove OCR noise like single letters on their own lines."""
-        text = re.sub(r"^\s*[a-zA-Z]\s*$", "", text, flags=re.MULTILINE)
-
-        def collapse_single_letters(match: Match[str]) -> str:
-            parts = match.group(0).split()
-            return " ".join([p for p in parts if len(p) > 1]) or ""
-
-        text = re.sub(
-            r"\b[a-zA-Z]\b(?:\s+\b[a-zA-Z]\b){2,}",
-            collapse_single_letters,
-            text,
-        )
-        return text
+        return OCR_ARTIFACT_TABLE.apply(text)[0]
 
     def _normalize_with_nemo(self, text: str) -> str:
         """Normalize text using NeMo Text Processing."""
@@ -148,33 +195,11 @@ class TTSTextCleaner:
         This is a BASIC fallback and doesn't handle complex cases.
         Install NeMo Text Processing for proper TTS normalization.
         """
-
-        def normalize_currency(match: Match[str]) -> str:
-            amount_str = match.group(1).replace(" ", "")
-            try:
-                if NUM2WORDS_AVAILABLE:
-                    amount = float(amount_str)
-                    return num2words(amount, to="currency", currency="USD")
-            except ValueError:
-                return match.group(0)
-            return match.group(0)
-
-        text = re.sub(r"\$\s*(\d+\.\d{2})", normalize_currency, text)
-        return text
+        return BASIC_TABLE.apply(text)[0]
 
     def _normalize_whitespace(self, text: str) -> str:
         """Normalize whitespace (collapse multiple spaces, preserve paragraphs)."""
-        text = re.sub(r" +", " ", text)
-        text = re.sub(r"\n\n+", "\n\n", text)
-        text = re.sub(r"([.!?])([A-Z])", r"\1 \2", text)
-        # Fix spaced characters (e.g., "T h e G i f t" → "The Gift")
-        # Matches 2+ single letters separated by spaces (PDF header/title artifact)
-        text = re.sub(
-            r"\b[a-zA-Z]\b(?:\s+\b[a-zA-Z]\b)+",
-            lambda m: m.group(0).replace(" ", ""),
-            text,
-        )
-        return text
+        return WHITESPACE_TABLE.apply(text)[0]
 
     def clean_text_file(
         self, input_path: Path, output_path: Path
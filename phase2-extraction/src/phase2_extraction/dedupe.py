@@ -9,11 +9,28 @@ Defense-in-depth safeguard against consecutive text duplication from any source:
 
 This module provides lightweight deduplication that protects downstream phases
 (Chunking, TTS) from redundancy regardless of upstream cause.
+
+Beyond exact consecutive repeats, ``dedupe_near_duplicates`` catches recurring
+boilerplate (running headers, footers with changing page numbers, recurring
+about once per page) and non-adjacent duplicated passages with a windowed MinHash/LSH index, in one
+streaming pass with memory bounded by the window.
 """
 
+from __future__ import annotations
+
 import hashlib
 import logging
-from typing import Iterable, Iterator, List, Optional
+import re
+from collections import deque
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    from pipeline_common.lazy_import import lazy_module
+except ImportError:  # standalone use without the repo root on sys.path
+    from importlib import import_module as lazy_module
+
+np = lazy_module("numpy")
 
 logger = logging.getLogger(__name__)
 
@@ -191,9 +208,370 @@ def validate_no_duplicates(
     return is_valid, duplicate_indices
 
 
+# --- Near-duplicate detection -------------------------------------------------
+
+_PRIME = (1 << 31) - 1  # Mersenne prime; a * x + b stays below 2**62 in int64
+_SHINGLE_BASE = 257
+_DIGITS = re.compile(r"\d+")
+_SPACES = re.compile(r"\s+")
+NEAR_DEDUPE_ACTIONS = ("remove", "flag", "off")
+# Headings and chapter markers are structure, never boilerplate, however often they recur
+_HEADING_LINE = re.compile(
+    r"^\s*(<CHAPTER:[^>]*>|(chapter|book|part|section|volume|prologue|epilogue|interlude)\b)",
+    re.IGNORECASE,
+)
+
+
+def is_structural_line(line: str) -> bool:
+    """Heading, chapter marker or letterless scene break (``* * *``, ``###``)."""
+    return bool(_HEADING_LINE.match(line)) or not any(char.isalpha() for char in line)
+
+
+def is_periodic(positions: Iterable[int], min_period: int = 3, max_jitter: float = 0.35) -> bool:
+    """
+    True when ``positions`` recur at a steady stride of at least ``min_period``.
+
+    Running headers and footers appear once per page, so the gaps between
+    them stay within ``max_jitter`` of the median gap; repeated dialogue or
+    a recurring phrase in the prose does not.
+    """
+    ordered = sorted(positions)
+    gaps = [later - earlier for earlier, later in zip(ordered, ordered[1:])]
+    if not gaps:
+        return False
+    median = sorted(gaps)[len(gaps) // 2]
+    if median < min_period:
+        return False
+    return all(abs(gap - median) <= max_jitter * median for gap in gaps)
+
+
+def _sketch_text(text: str) -> str:
+    """Case, whitespace and digit-insensitive form (page numbers do not break a match)."""
+    return _SPACES.sub(" ", _DIGITS.sub("0", text.lower())).strip()
+
+
+class NearDuplicateIndex:
+    """
+    Windowed MinHash/LSH index over a stream of text blocks.
+
+    Each block is reduced to its set of character shingles, hashed with a
+    polynomial rolling hash, and summarised by ``num_perm`` MinHash values.
+    Signatures are split into ``bands`` LSH bands; only blocks sharing a band
+    bucket are compared.  Blocks older than ``window`` positions are evicted,
+    so memory is bounded by the window, not the book.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.85,
+        window: int = 500,
+        num_perm: int = 64,
+        bands: int = 16,
+        shingle_chars: int = 5,
+        bucket_size: int = 8,
+        seed: int = 1,
+    ) -> None:
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.window = window
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_chars = shingle_chars
+        self.bucket_size = bucket_size
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, size=(num_perm, 1), dtype=np.int64)
+        self._b = rng.integers(0, _PRIME, size=(num_perm, 1), dtype=np.int64)
+        # position -> (signature, band keys, sketch text)
+        self._entries: Dict[int, Tuple[np.ndarray, List[Tuple[int, bytes]], str]] = {}
+        self._buckets: Dict[Tuple[int, bytes], Deque[int]] = {}
+        self._exact: Dict[str, int] = {}  # sketch text -> latest position (repeats skip MinHash)
+        self._order: Deque[int] = deque()
+
+    def shingles(self, text: str) -> np.ndarray:
+        """Distinct rolling hashes of the ``shingle_chars``-grams of ``text``'s sketch form."""
+        codes = np.frombuffer(_sketch_text(text).encode("utf-32-le"), dtype=np.uint32).astype(np.int64)
+        if not len(codes):
+            return np.zeros(1, dtype=np.int64)
+        k = min(self.shingle_chars, len(codes))
+        count = len(codes) - k + 1
+        hashes = np.zeros(count, dtype=np.int64)
+        for offset in range(k):
+            hashes = (hashes * _SHINGLE_BASE + codes[offset : offset + count]) % _PRIME
+        return np.unique(hashes)
+
+    def signature(self, text: str) -> np.ndarray:
+        return ((self._a * self.shingles(text)[None, :] + self._b) % _PRIME).min(axis=1)
+
+    def add(self, position: int, text: str) -> Optional[Tuple[int, float]]:
+        """
+        Index the block at stream ``position``.
+
+        Returns (position, similarity) of the most similar block still in the
+        window at or above ``threshold``, or None.
+        """
+        self._evict(position)
+        sketch = _sketch_text(text)
+        previous = self._exact.get(sketch)
+
+        if previous is not None:
+            signature, keys, _ = self._entries[previous]
+            best: Optional[Tuple[int, float]] = (previous, 1.0)
+        else:
+            signature = self.signature(sketch)
+            keys = [(band, row.tobytes()) for band, row in enumerate(signature.reshape(self.bands, self.rows))]
+            candidates = sorted({candidate for key in keys for candidate in self._buckets.get(key, ())})
+            best = None
+            if candidates:
+                stacked = np.stack([self._entries[candidate][0] for candidate in candidates])
+                matches = np.count_nonzero(stacked == signature, axis=1)
+                top = int(matches.argmax())  # earliest on ties
+                similarity = float(matches[top]) / len(signature)
+                if similarity >= self.threshold:
+                    best = (candidates[top], similarity)
+
+        self._entries[position] = (signature, keys, sketch)
+        self._exact[sketch] = position
+        for key in keys:
+            self._buckets.setdefault(key, deque(maxlen=self.bucket_size)).append(position)
+        self._order.append(position)
+        return best
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _evict(self, position: int) -> None:
+        while self._order and self._order[0] <= position - self.window:
+            old = self._order.popleft()
+            _, keys, sketch = self._entries.pop(old)
+            if self._exact.get(sketch) == old:
+                del self._exact[sketch]
+            for key in keys:
+                bucket = self._buckets.get(key)
+                if bucket and bucket[0] == old:
+                    bucket.popleft()
+                if bucket is not None and not bucket:
+                    del self._buckets[key]
+
+
+@dataclass
+class NearDuplicate:
+    """One flagged block in the audit report."""
+
+    kind: str  # "boilerplate" (recurring short line) or "passage" (repeated paragraph)
+    index: int  # Line or paragraph number in the scanned text
+    first_index: int  # Earliest similar block in the window
+    similarity: float
+    preview: str
+
+
+@dataclass
+class NearDuplicateReport:
+    """Audit of a near-duplicate pass: what was found and what was done with it."""
+
+    actions: Dict[str, str]
+    findings: List[NearDuplicate] = field(default_factory=list)
+    scanned: Dict[str, int] = field(default_factory=dict)
+
+    def counts(self) -> Dict[str, int]:
+        counts = {kind: 0 for kind in self.actions}
+        for finding in self.findings:
+            counts[finding.kind] += 1
+        return counts
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "actions": dict(self.actions),
+            "scanned": dict(self.scanned),
+            "counts": self.counts(),
+            "findings": [asdict(finding) for finding in self.findings],
+        }
+
+
+def iter_near_duplicates(
+    blocks: Iterable[str],
+    kind: str,
+    threshold: float,
+    min_repeats: int = 2,
+    keep_first: bool = True,
+    min_chars: int = 1,
+    max_chars: Optional[int] = None,
+    window: int = 500,
+    skip: Optional[Callable[[str], bool]] = None,
+    group_filter: Optional[Callable[[Iterable[int]], bool]] = None,
+) -> Iterator[Tuple[str, Optional[NearDuplicate]]]:
+    """
+    Yield ``(block, finding)`` for every block, in order.
+
+    A block is flagged once ``min_repeats`` similar blocks (including it)
+    fall within ``window`` positions of each other; with ``keep_first`` the
+    earliest of them stays unflagged.  Blocks outside ``min_chars``..
+    ``max_chars`` (stripped length), or for which ``skip(block)`` is true,
+    are never indexed.  With ``group_filter`` a group is flagged only while
+    ``group_filter(member positions)`` holds.  Output lags the input
+    by at most ``window`` blocks so earlier members of a group can still be
+    flagged when it reaches ``min_repeats``.
+    """
+    index = NearDuplicateIndex(threshold=threshold, window=window)
+    group_of: Dict[int, int] = {}
+    members: Dict[int, Deque[int]] = {}
+    pending: Dict[int, List[Any]] = {}
+    order: Deque[int] = deque()
+
+    for position, block in enumerate(blocks):
+        entry: List[Any] = [block, None]
+        pending[position] = entry
+        order.append(position)
+
+        size = len(block.strip())
+        indexable = size >= min_chars and (max_chars is None or size <= max_chars)
+        if indexable and not (skip is not None and skip(block)):
+            match = index.add(position, block)
+            group = group_of.get(match[0], position) if match else position
+            group_of[position] = group
+            group_members = members.setdefault(group, deque())
+            group_members.append(position)
+            while group_members[0] <= position - window:
+                group_members.popleft()
+            if len(group_members) >= min_repeats and (
+                group_filter is None or group_filter(group_members)
+            ):
+                first = group_members[0]
+                similarity = match[1] if match else 1.0
+                for member in group_members:
+                    target = pending.get(member)
+                    if target is None or target[1] is not None or (keep_first and member == first):
+                        continue
+                    target[1] = NearDuplicate(
+                        kind=kind,
+                        index=member,
+                        first_index=first,
+                        similarity=round(similarity, 3),
+                        preview=target[0].strip()[:80],
+                    )
+
+        while order and order[0] <= position - window:
+            old = order.popleft()
+            group = group_of.pop(old, None)
+            if group is not None:
+                group_members = members[group]
+                if group_members and group_members[0] == old:
+                    group_members.popleft()
+                if not group_members:
+                    del members[group]
+            yield tuple(pending.pop(old))  # type: ignore[misc]
+
+    while order:
+        yield tuple(pending.pop(order.popleft()))  # type: ignore[misc]
+
+
+def dedupe_near_duplicates(
+    text: str,
+    boilerplate_action: str = "flag",
+    passage_action: str = "flag",
+    line_threshold: float = 0.9,
+    passage_threshold: float = 0.85,
+    boilerplate_min_chars: int = 8,
+    boilerplate_max_chars: int = 60,
+    boilerplate_min_repeats: int = 5,
+    boilerplate_min_period: int = 3,
+    boilerplate_max_jitter: float = 0.35,
+    passage_min_chars: int = 200,
+    window: int = 400,
+) -> Tuple[str, NearDuplicateReport]:
+    """
+    Flag or remove recurring boilerplate lines and repeated passages.
+
+    1. Lines of ``boilerplate_min_chars``..``boilerplate_max_chars`` that
+       recur (similarity >= ``line_threshold``, digits ignored)
+       ``boilerplate_min_repeats`` times within ``window`` lines, at a
+       steady stride of at least ``boilerplate_min_period`` lines (gaps
+       within ``boilerplate_max_jitter`` of the median, i.e. about once per
+       page), are boilerplate: running headers and footers, including
+       page-numbered ones.  Every occurrence is affected.  Headings,
+       ``<CHAPTER:id>`` markers and scene breaks are never touched, and
+       short lines that recur irregularly (dialogue tags, refrains) are
+       left alone.
+    2. Paragraphs of at least ``passage_min_chars`` that repeat an earlier
+       paragraph within ``window`` paragraphs (similarity >=
+       ``passage_threshold``) are duplicate passages; the first is kept.
+
+    Each action is "remove", "flag" (report only, the default) or "off".
+
+    Returns:
+        (text, report) -- the report lists every finding for auditing
+
+    Example:
+        >>> bodies = ["It rained.", "The road was long.", "Nobody came.", "She left early.", "Night fell."]
+        >>> pages = [f"THE LONG ROAD  {n}\\n{body}\\n" for n, body in enumerate(bodies, 1)]
+        >>> clean, report = dedupe_near_duplicates("\\n".join(pages), boilerplate_action="remove")
+        >>> "LONG ROAD" in clean, report.counts()["boilerplate"]
+        (False, 5)
+    """
+    actions = {"boilerplate": boilerplate_action, "passage": passage_action}
+    for action in actions.values():
+        if action not in NEAR_DEDUPE_ACTIONS:
+            raise ValueError(f"Unknown near-dedupe action {action!r}; expected one of {NEAR_DEDUPE_ACTIONS}")
+    report = NearDuplicateReport(actions=actions)
+
+    if boilerplate_action != "off":
+        lines = text.split("\n")
+        report.scanned["lines"] = len(lines)
+        kept = []
+        for line, finding in iter_near_duplicates(
+            lines,
+            "boilerplate",
+            line_threshold,
+            min_repeats=boilerplate_min_repeats,
+            keep_first=False,
+            min_chars=boilerplate_min_chars,
+            max_chars=boilerplate_max_chars,
+            window=window,
+            skip=is_structural_line,
+            group_filter=lambda members: is_periodic(
+                members, boilerplate_min_period, boilerplate_max_jitter
+            ),
+        ):
+            if finding is not None:
+                report.findings.append(finding)
+                if boilerplate_action == "remove":
+                    continue
+            kept.append(line)
+        text = "\n".join(kept)
+
+    if passage_action != "off":
+        paragraphs = text.split("\n\n")
+        report.scanned["paragraphs"] = len(paragraphs)
+        kept = []
+        for paragraph, finding in iter_near_duplicates(
+            paragraphs, "passage", passage_threshold, min_chars=passage_min_chars, window=window
+        ):
+            if finding is not None:
+                report.findings.append(finding)
+                if passage_action == "remove":
+                    continue
+            kept.append(paragraph)
+        text = "\n\n".join(kept)
+
+    counts = report.counts()
+    if any(counts.values()):
+        logger.info(
+            f"Near-duplicates: {counts['boilerplate']} boilerplate lines ({boilerplate_action}), "
+            f"{counts['passage']} repeated passages ({passage_action})"
+        )
+    return text, report
+
+
 __all__ = [
     'dedupe_consecutive',
     'dedupe_paragraphs',
     'dedupe_lines',
     'validate_no_duplicates',
+    'is_structural_line',
+    'is_periodic',
+    'NearDuplicateIndex',
+    'NearDuplicate',
+    'NearDuplicateReport',
+    'iter_near_duplicates',
+    'dedupe_near_duplicates',
 ]
@@ -7,27 +7,34 @@ All orchestration lives in ingest.py; no CLI entry point is exposed here.
 
 from __future__ import annotations
 
-import hashlib
 import logging
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, Dict, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 try:
-    import fitz  # PyMuPDF
+    from pipeline_common.lazy_import import lazy_module
+except ImportError:  # standalone use without the repo root on sys.path
+    from importlib import import_module as lazy_module
+
+# Backends load on first use; the flags only check that they are installed
+try:
+    fitz = lazy_module("fitz")  # PyMuPDF
 
     PYMUPDF_AVAILABLE = True
 except ImportError:
     PYMUPDF_AVAILABLE = False
 
 try:
-    from pypdf import PdfReader
+    pypdf = lazy_module("pypdf")
 
     PYPDF_AVAILABLE = True
 except ImportError:
     PYPDF_AVAILABLE = False
 
 try:
-    import pdfplumber
+    pdfplumber = lazy_module("pdfplumber")
 
     PDFPLUMBER_AVAILABLE = True
 except ImportError:
@@ -35,21 +42,41 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+PDF_BACKENDS = ("pypdf", "pdfplumber", "pymupdf")
+DEFAULT_SAMPLE_PAGES = 12
+PAGE_FALLBACK_THRESHOLD = 0.5
+
 
 def compute_sha256(file_path: Path) -> str:
-    """Compute sha256 hash for change detection / reuse checks."""
-    sha = hashlib.sha256()
-    with file_path.open("rb") as handle:
-        for block in iter(lambda: handle.read(1024 * 1024), b""):
-            sha.update(block)
-    return sha.hexdigest()
+    """Compute sha256 hash for change detection / reuse checks (cached by stat data)."""
+    from pipeline_common.fingerprint import file_sha256
+
+    return file_sha256(file_path)
+
+
+def page_cache(file_path: Path, sha256: Optional[str] = None):
+    """
+    Shared per-page cache for ``file_path`` (see ``pipeline_common.pdf_page_cache``).
+
+    Every PDF reader in Phase 2 goes through it, so each backend parses the
+    document at most once per run and not at all when Phase 1 (or an earlier
+    run) already cached the pages.
+    """
+    from pipeline_common.pdf_page_cache import PdfPageCache
+
+    return PdfPageCache.for_file(file_path, sha256)
 
 
-def _get_expected_page_count(file_path: Path) -> Optional[int]:
+def _get_expected_page_count(file_path: Path, sha256: Optional[str] = None) -> Optional[int]:
     """Best-effort page count for quality checks."""
+    try:
+        return page_cache(file_path, sha256).page_count()
+    except Exception as exc:  # pragma: no cover - defensive guardrail
+        logger.debug(f"Page cache page count failed: {exc}")
+
     if PYPDF_AVAILABLE:
         try:
-            return len(PdfReader(str(file_path)).pages)
+            return len(pypdf.PdfReader(str(file_path)).pages)
         except Exception as exc:  # pragma: no cover - defensive guardrail
             logger.debug(f"pypdf page count failed: {exc}")
 
@@ -150,42 +177,49 @@ def validate_extraction_quality(
     return score
 
 
-def _extract_text_pypdf(file_path: Path) -> str:
-    if not PYPDF_AVAILABLE:
-        return ""
-    try:
-        reader = PdfReader(str(file_path))
-        return "\n".join(page.extract_text() or "" for page in reader.pages)
-    except Exception as exc:
-        logger.warning(f"pypdf extraction failed: {exc}")
-        return ""
+def page_offsets(pages: List[str], separator: str = "\n") -> List[int]:
+    """
+    Character offset of every page in ``separator.join(pages)``.
+
+    Entry ``i`` is where page ``i + 1`` starts; a final entry holds the text
+    length, so page ``n`` spans ``offsets[n - 1]:offsets[n]``.
+    """
+    offsets = [0]
+    for page in pages:
+        offsets.append(offsets[-1] + len(page) + len(separator))
+    if pages:
+        offsets[-1] -= len(separator)
+    return offsets
 
 
-def _extract_text_pdfplumber(file_path: Path) -> str:
-    if not PDFPLUMBER_AVAILABLE:
-        return ""
-    try:
-        with pdfplumber.open(str(file_path)) as pdf:
-            return "\n".join(page.extract_text() or "" for page in pdf.pages)
-    except Exception as exc:
-        logger.warning(f"pdfplumber extraction failed: {exc}")
-        return ""
+_BACKEND_LABELS = {"pypdf": "pypdf", "pdfplumber": "pdfplumber", "pymupdf": "PyMuPDF"}
 
 
-def _extract_text_pymupdf(file_path: Path) -> str:
-    if not PYMUPDF_AVAILABLE:
-        return ""
+def _extract_pages(file_path: Path, method: str, sha256: Optional[str] = None) -> List[str]:
+    if method not in _available_backends():
+        return []
     try:
-        with fitz.open(str(file_path)) as doc:
-            return "\n".join(page.get_text() for page in doc)
+        return page_cache(file_path, sha256).texts(method)
     except Exception as exc:
-        logger.warning(f"PyMuPDF extraction failed: {exc}")
-        return ""
+        logger.warning(f"{_BACKEND_LABELS[method]} extraction failed: {exc}")
+        return []
+
+
+def _extract_text_pypdf(file_path: Path, sha256: Optional[str] = None) -> str:
+    return "\n".join(_extract_pages(file_path, "pypdf", sha256))
+
+
+def _extract_text_pdfplumber(file_path: Path, sha256: Optional[str] = None) -> str:
+    return "\n".join(_extract_pages(file_path, "pdfplumber", sha256))
+
 
+def _extract_text_pymupdf(file_path: Path, sha256: Optional[str] = None) -> str:
+    return "\n".join(_extract_pages(file_path, "pymupdf", sha256))
 
-def extract_text_single(file_path: Path, method: str) -> str:
+
+def extract_text_single(file_path: Path, method: str, sha256: Optional[str] = None) -> str:
     """Extract text using a specific method name."""
-    method_map: Dict[str, Callable[[Path], str]] = {
+    method_map: Dict[str, Callable[..., str]] = {
         "pypdf": _extract_text_pypdf,
         "pdfplumber": _extract_text_pdfplumber,
         "pymupdf": _extract_text_pymupdf,
@@ -194,34 +228,181 @@ def extract_text_single(file_path: Path, method: str) -> str:
     if method not in method_map:
         raise ValueError(f"Unknown extraction method: {method}")
 
-    return method_map[method](file_path)
+    return method_map[method](file_path, sha256)
+
+
+def _available_backends() -> List[str]:
+    available = {
+        "pypdf": PYPDF_AVAILABLE,
+        "pdfplumber": PDFPLUMBER_AVAILABLE,
+        "pymupdf": PYMUPDF_AVAILABLE,
+    }
+    return [name for name in PDF_BACKENDS if available[name]]
+
+
+def default_pdf_workers() -> int:
+    """Process-pool size for page-parallel extraction."""
+    return max(1, min(os.cpu_count() or 1, 8))
 
 
-def extract_text_multipass(file_path: Path) -> Tuple[str, str, float]:
+def sample_pages(page_count: int, sample_size: int = DEFAULT_SAMPLE_PAGES) -> List[int]:
+    """
+    Stratified page sample: the middle page of ``sample_size`` equal strata.
+
+    Spreading the sample keeps front matter, body and back matter all
+    represented; short documents are sampled in full.
+    """
+    if page_count <= sample_size:
+        return list(range(page_count))
+    stratum = page_count / sample_size
+    return sorted({int(stratum * (i + 0.5)) for i in range(sample_size)})
+
+
+def page_quality(text: str) -> float:
+    """
+    Cheap per-page score used to spot pages the winning backend mangled.
+
+    ``validate_extraction_quality`` needs book-sized input; this only looks
+    at emptiness, replacement characters and the alphabetic ratio.
+    """
+    stripped = text.strip()
+    if not stripped:
+        return 0.0
+    score = 1.0
+    if stripped.count("\ufffd") / len(stripped) > 0.01:
+        score -= 0.5
+    visible = [c for c in stripped if not c.isspace()]
+    alpha_ratio = sum(1 for c in visible if c.isalpha()) / max(len(visible), 1)
+    if alpha_ratio < 0.5:
+        score -= 0.5
+    return max(0.0, score)
+
+
+@dataclass
+class SampledExtraction:
+    """Full-document pages from the backend that won on the page sample."""
+
+    method: str
+    pages: List[str]
+    sample_scores: Dict[str, float]
+    sample: List[int]
+    fallback_pages: Dict[int, str] = field(default_factory=dict)
+
+
+def extract_pages_sampled(
+    file_path: Path,
+    sha256: Optional[str] = None,
+    sample_size: int = DEFAULT_SAMPLE_PAGES,
+    workers: Optional[int] = None,
+) -> Optional[SampledExtraction]:
+    """
+    Sample-first PDF extraction.
+
+    1. Score every available backend on a stratified page sample.
+    2. Extract the whole document with the winner only (page ranges across
+       a process pool, reassembled in page order via the page cache).
+    3. Re-extract only the pages the winner scored poorly on with the other
+       backends, keeping the first alternative that scores well.
+
+    Returns None when the sample is inconclusive (no backend produced text),
+    so callers can fall back to exhaustive multi-pass extraction.
+    """
+    cache = page_cache(file_path, sha256)
+    page_count = cache.page_count()
+    sample = sample_pages(page_count, sample_size)
+    backends = _available_backends()
+
+    sample_scores: Dict[str, float] = {}
+    for backend in backends:
+        try:
+            text = "\n".join(cache.texts(backend, sample))
+        except Exception as exc:
+            logger.warning(f"{backend}: sample extraction failed: {exc}")
+            continue
+        if text.strip():
+            sample_scores[backend] = validate_extraction_quality(text, f"{backend} (sample)", len(sample))
+
+    if not sample_scores:
+        return None
+
+    # Same tie-break as exhaustive multi-pass: first backend in PDF_BACKENDS order
+    winner = max(sample_scores.keys(), key=lambda key: sample_scores[key])
+    logger.info(f"Sample winner: {winner} ({len(sample)}/{page_count} pages sampled, scores={sample_scores})")
+
+    pages = cache.texts(winner, workers=workers or default_pdf_workers())
+    result = SampledExtraction(method=winner, pages=list(pages), sample_scores=sample_scores, sample=sample)
+
+    poor = [index for index, text in enumerate(pages) if page_quality(text) < PAGE_FALLBACK_THRESHOLD]
+    for backend in backends:
+        if backend == winner or not poor:
+            continue
+        try:
+            alternatives = cache.texts(backend, poor)
+        except Exception as exc:
+            logger.debug(f"{backend}: page fallback failed: {exc}")
+            continue
+        still_poor = []
+        for index, text in zip(poor, alternatives):
+            if page_quality(text) >= PAGE_FALLBACK_THRESHOLD and page_quality(text) > page_quality(pages[index]):
+                result.pages[index] = text
+                result.fallback_pages[index] = backend
+            else:
+                still_poor.append(index)
+        poor = still_poor
+
+    if result.fallback_pages:
+        logger.info(f"Per-page fallback replaced {len(result.fallback_pages)} page(s)")
+    return result
+
+
+def extract_pages_multipass(
+    file_path: Path,
+    sha256: Optional[str] = None,
+    strategy: str = "sampled",
+    sample_size: int = DEFAULT_SAMPLE_PAGES,
+    workers: Optional[int] = None,
+) -> Tuple[List[str], str, float]:
     """
     Multi-pass extraction: try multiple methods, pick the best.
 
-    Returns (text, method_used, quality_score)
+    ``sha256`` is the Phase 1 digest of the file (keys the page cache).
+    ``strategy="sampled"`` picks the backend on a page sample and extracts
+    the full document only with the winner (see ``extract_pages_sampled``);
+    ``"full"`` runs every backend over every page.  Documents no longer than
+    two samples always use the exhaustive path.
+
+    Returns (pages, method_used, quality_score); the document text is
+    ``"\n".join(pages)`` and ``page_offsets(pages)`` locates each page in it.
     """
     logger.info("=" * 60)
     logger.info("MULTI-PASS EXTRACTION")
     logger.info("=" * 60)
 
-    results: Dict[str, Tuple[str, float]] = {}
-    expected_pages = _get_expected_page_count(file_path)
-    methods: Tuple[Tuple[str, Callable[[Path], str]], ...] = (
-        ("pypdf", _extract_text_pypdf),
-        ("pdfplumber", _extract_text_pdfplumber),
-        ("pymupdf", _extract_text_pymupdf),
-    )
-
-    for method_name, extract_func in methods:
-        text = extract_func(file_path)
+    expected_pages = _get_expected_page_count(file_path, sha256)
+    if strategy == "sampled" and expected_pages and expected_pages > 2 * sample_size:
+        try:
+            sampled = extract_pages_sampled(file_path, sha256, sample_size, workers)
+        except Exception as exc:
+            logger.warning(f"Sampled extraction failed, running every backend: {exc}")
+            sampled = None
+        if sampled is not None:
+            text = "\n".join(sampled.pages)
+            score = validate_extraction_quality(text, sampled.method, expected_pages)
+            logger.info("=" * 60)
+            logger.info(f"BEST: {sampled.method} (score: {score:.2f}, {len(text):,} chars)")
+            logger.info("=" * 60)
+            return sampled.pages, sampled.method, score
+
+    results: Dict[str, Tuple[List[str], str, float]] = {}
+
+    for method_name in PDF_BACKENDS:
+        pages = _extract_pages(file_path, method_name, sha256)
+        text = "\n".join(pages)
         if text.strip():
             score = validate_extraction_quality(
                 text, method_name, expected_pages
             )
-            results[method_name] = (text, score)
+            results[method_name] = (pages, text, score)
             logger.info(
                 f"{method_name}: {len(text):,} chars (score={score:.2f})"
             )
@@ -230,10 +411,10 @@ def extract_text_multipass(file_path: Path) -> Tuple[str, str, float]:
 
     if not results:
         logger.error("All extraction methods failed.")
-        return "", "none", 0.0
+        return [], "none", 0.0
 
-    best_method = max(results.keys(), key=lambda key: results[key][1])
-    best_text, best_score = results[best_method]
+    best_method = max(results.keys(), key=lambda key: results[key][2])
+    best_pages, best_text, best_score = results[best_method]
 
     logger.info("=" * 60)
     logger.info(
@@ -241,12 +422,35 @@ def extract_text_multipass(file_path: Path) -> Tuple[str, str, float]:
     )
     logger.info("=" * 60)
 
-    return best_text, best_method, best_score
+    return best_pages, best_method, best_score
+
+
+def extract_text_multipass(
+    file_path: Path,
+    sha256: Optional[str] = None,
+    strategy: str = "sampled",
+    sample_size: int = DEFAULT_SAMPLE_PAGES,
+    workers: Optional[int] = None,
+) -> Tuple[str, str, float]:
+    """
+    ``extract_pages_multipass`` with the pages joined into one text.
+
+    Returns (text, method_used, quality_score)
+    """
+    pages, method, score = extract_pages_multipass(file_path, sha256, strategy, sample_size, workers)
+    return "\n".join(pages), method, score
 
 
 __all__ = [
     "compute_sha256",
+    "page_cache",
+    "sample_pages",
+    "page_quality",
+    "SampledExtraction",
+    "extract_pages_sampled",
     "validate_extraction_quality",
     "extract_text_single",
+    "page_offsets",
+    "extract_pages_multipass",
     "extract_text_multipass",
 ]
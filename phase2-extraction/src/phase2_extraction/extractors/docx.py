@@ -15,7 +15,12 @@ from typing import Tuple, Dict
 import logging
 
 try:
-    from docx import Document
+    from pipeline_common.lazy_import import lazy_module
+except ImportError:  # standalone use without the repo root on sys.path
+    from importlib import import_module as lazy_module
+
+try:
+    docx = lazy_module("docx")
 
     DOCX_AVAILABLE = True
 except ImportError:
@@ -50,7 +55,7 @@ def extract(path: Path) -> Tuple[str, Dict]:
     logger.info(f"Extracting DOCX: {path.name}")
 
     try:
-        doc = Document(str(path))
+        doc = docx.Document(str(path))
         text_parts = []
         heading_count = 0
         paragraph_count = 0
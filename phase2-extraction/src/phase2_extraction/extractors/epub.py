@@ -4,43 +4,196 @@ EPUB Text Extractor
 Extracts text from EPUB ebooks while preserving:
 - Chapter structure
 - HTML formatting removal
-- Reading order
+- Reading order (spine order)
+
+Chapters are parsed once with lxml (the parser ebooklib itself is built
+on), across a process pool for large books, and yielded in spine order by
+``iter_chapters``.  The speedup is in parsing only: ebooklib loads the whole
+book up front, and ``extract`` still joins every chapter before the Phase 2
+normalizer runs on the full text, so peak memory is unchanged.
 
 Reason: EPUBs are structured HTML; preserving chapter boundaries
 helps create natural TTS chunks that align with the book's structure.
 """
 
-from pathlib import Path
-from typing import Tuple, Dict
+from __future__ import annotations
+
 import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
 
 try:
+    import ebooklib
     from ebooklib import epub
+    from ebooklib.utils import parse_html_string
+    from lxml import etree
 
     EPUB_AVAILABLE = True
 except ImportError:
     EPUB_AVAILABLE = False
 
-try:
-    from bs4 import BeautifulSoup
-
-    BS4_AVAILABLE = True
-except ImportError:
-    BS4_AVAILABLE = False
+from ..structure_detector import StructureNode
 
 logger = logging.getLogger(__name__)
 
+CHAPTER_SEPARATOR = "\n\n"
+PARALLEL_MIN_ITEMS = 64  # below this, starting a process pool costs more than it saves
+BATCH_ITEMS = 16  # documents per worker task
+
+# Text nodes outside <script>/<style>: the strings BeautifulSoup's get_text() yields once those are decomposed
+_BODY_TEXT = (
+    etree.XPath(".//text()[not(parent::script or parent::style)]", smart_strings=False)
+    if EPUB_AVAILABLE
+    else None
+)
+
+
+@dataclass
+class EpubChapter:
+    """One non-empty document of the book, in spine order."""
+
+    item_id: str
+    text: str
+    node: StructureNode  # Offsets into the joined book text
+
+    @property
+    def block(self) -> str:
+        """Chapter text with its ``<CHAPTER:id>`` marker, as joined into the book."""
+        return _chapter_block(self.item_id, self.text)
+
 
-def extract(path: Path) -> Tuple[str, Dict]:
+def _chapter_block(item_id: str, text: str) -> str:
+    return f"<CHAPTER:{item_id}>\n{text}"
+
+
+def default_workers() -> int:
+    """Process-pool size for chapter parsing."""
+    return max(1, min(os.cpu_count() or 1, 8))
+
+
+def document_text(content: bytes) -> Optional[str]:
+    """
+    Text of an XHTML document's ``<body>``: one stripped string per line,
+    script and style dropped.  None if the document cannot be parsed.
+    """
+    try:
+        body = parse_html_string(content).find("body")
+    except Exception:
+        return None
+    # Same rule as ebooklib's get_body_content(): a body without child elements is empty
+    if body is None or len(body) == 0:
+        return ""
+    return "\n".join(piece for piece in (value.strip() for value in _BODY_TEXT(body)) if piece)
+
+
+def _parse_batch(contents: List[bytes]) -> List[Optional[str]]:
+    """Worker-process entry point."""
+    return [document_text(content) for content in contents]
+
+
+def _spine_documents(book: Any) -> List[Any]:
+    """Document items in spine order, then any documents the spine does not reference."""
+    documents = list(book.get_items_of_type(ebooklib.ITEM_DOCUMENT))
+    by_id = {item.get_id(): item for item in documents}
+    ordered = []
+    seen = set()
+    for entry in book.spine:
+        idref = entry[0] if isinstance(entry, (tuple, list)) else entry
+        if idref in by_id and idref not in seen:
+            seen.add(idref)
+            ordered.append(by_id[idref])
+    return ordered + [item for item in documents if item.get_id() not in seen]
+
+
+def _toc_titles(toc: Any) -> Dict[str, str]:
+    """Document file name -> first navigation title pointing into it."""
+    titles: Dict[str, str] = {}
+    # ebooklib returns a bare entry instead of a list for some single-entry NCX files
+    pending = list(toc) if isinstance(toc, (tuple, list)) else [toc]
+    while pending:
+        entry = pending.pop(0)
+        if isinstance(entry, (tuple, list)):
+            section, children = entry[0], entry[1]
+            pending[:0] = [section, *children]
+            continue
+        href = getattr(entry, "href", None)
+        title = (getattr(entry, "title", None) or "").strip()
+        if href and title:
+            titles.setdefault(href.split("#", 1)[0], title)
+    return titles
+
+
+def _parse_documents(documents: List[Any], workers: int) -> Iterator[Optional[str]]:
+    """Document texts in order; large books are parsed in batches across a process pool."""
+    if workers <= 1 or len(documents) < PARALLEL_MIN_ITEMS:
+        for item in documents:
+            yield document_text(item.content)
+        return
+
+    logger.info(f"Parsing {len(documents):,} EPUB documents across {workers} processes")
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque[Future] = deque()
+        for start in range(0, len(documents), BATCH_ITEMS):
+            contents = [item.content for item in documents[start : start + BATCH_ITEMS]]
+            pending.append(pool.submit(_parse_batch, contents))
+            if len(pending) >= 2 * workers:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
+
+
+def iter_chapters(book: Any, workers: Optional[int] = None) -> Iterator[EpubChapter]:
+    """
+    Yield the non-empty chapters of ``book`` in spine order.
+
+    Each chapter carries a level-1 structure node whose offsets locate its
+    block in ``CHAPTER_SEPARATOR.join(chapter.block for chapter in ...)``;
+    the title comes from the navigation TOC when it names the document.
+    ``extract`` collects every chapter; nothing downstream consumes this
+    iterator chapter by chapter yet.
+    """
+    documents = _spine_documents(book)
+    titles = _toc_titles(book.toc)
+    offset = 0
+    count = 0
+
+    for item, chapter_text in zip(documents, _parse_documents(documents, workers or default_workers())):
+        if chapter_text is None:
+            logger.warning(f"Failed to parse chapter {item.get_id()}")
+            continue
+        if not chapter_text.strip():
+            continue
+
+        item_id = item.get_id() or f"chapter_{count}"
+        start = offset + (len(CHAPTER_SEPARATOR) if count else 0)
+        offset = start + len(_chapter_block(item_id, chapter_text))
+        node = StructureNode(
+            level=1,
+            title=titles.get(item.file_name) or item_id,
+            char_offset=start,
+            char_end=offset,
+        )
+        count += 1
+        logger.debug(f"Extracted chapter {count}: {item_id} ({len(chapter_text)} chars)")
+        yield EpubChapter(item_id=item_id, text=chapter_text, node=node)
+
+
+def extract(path: Path, workers: Optional[int] = None) -> Tuple[str, Dict]:
     """
     Extract text from EPUB file with chapter preservation.
 
     Args:
         path: Path to EPUB file
+        workers: Processes for chapter parsing (default: CPU count, max 8;
+            small books are always parsed in-process)
 
     Returns:
         (text, metadata) where text includes chapter markers and metadata
-        contains book information
+        contains book information plus one ``structure`` node per chapter
 
     Reason: Chapter markers (<CHAPTER:id>) allow the chunker to avoid
     splitting across chapter boundaries, maintaining narrative coherence.
@@ -56,53 +209,19 @@ def extract(path: Path) -> Tuple[str, Dict]:
             "quality_score": 0.0,
         }
 
-    if not BS4_AVAILABLE:
-        error_msg = "beautifulsoup4 library not available. Install with: poetry add beautifulsoup4"
-        logger.error(error_msg)
-        return "", {
-            "title": path.stem,
-            "error": error_msg,
-            "quality_score": 0.0,
-        }
-
     logger.info(f"Extracting EPUB: {path.name}")
 
     try:
         book = epub.read_epub(str(path))
-        chapters = []
-        chapter_count = 0
-
-        # Extract all document items (chapters, sections, etc.)
-        for item in book.get_items_of_type(epub.ITEM_DOCUMENT):
-            # Parse HTML content
-            content = item.get_body_content()
-            if not content:
-                continue
-
-            try:
-                soup = BeautifulSoup(content, "html.parser")
-
-                # Remove script and style tags
-                for script in soup(["script", "style"]):
-                    script.decompose()
-
-                # Get text
-                chapter_text = soup.get_text(separator="\n", strip=True)
-
-                if chapter_text.strip():
-                    # Add chapter marker with item ID for reference
-                    item_id = item.get_id() or f"chapter_{chapter_count}"
-                    chapters.append(f"<CHAPTER:{item_id}>\n{chapter_text}")
-                    chapter_count += 1
-                    logger.debug(
-                        f"Extracted chapter {chapter_count}: {item_id} ({len(chapter_text)} chars)"
-                    )
+        chapters: List[str] = []
+        structure: List[Dict] = []
 
-            except Exception as e:
-                logger.warning(f"Failed to parse chapter {item.get_id()}: {e}")
-                continue
+        for chapter in iter_chapters(book, workers):
+            chapters.append(chapter.block)
+            structure.append(chapter.node.model_dump())
+        chapter_count = len(chapters)
 
-        text = "\n\n".join(chapters)
+        text = CHAPTER_SEPARATOR.join(chapters)
 
         # Extract metadata from EPUB
         metadata = {
@@ -110,6 +229,7 @@ def extract(path: Path) -> Tuple[str, Dict]:
             "author": "Unknown",
             "char_count": len(text),
             "chapter_count": chapter_count,
+            "structure": structure,
         }
 
         # Try to get Dublin Core metadata
@@ -4,56 +4,317 @@ OCR Text Extractor
 Extracts text from scanned PDFs using EasyOCR (CPU-only).
 
 Strategy:
-- Batch processing to stay within 4GB memory limit
-- Quality confidence tracking per page
-- Progress logging for long documents
+- Pipelined: one rendering process feeds a bounded queue consumed by N
+  recognition processes, each holding its own EasyOCR reader
+- Adaptive DPI: every page is read at a low DPI first; only pages with
+  low confidence are re-rendered and re-read at high DPI
+- Resumable: each page result (text + confidence) is cached under
+  .pipeline/ocr_cache/<sha256>/ as soon as it arrives, so a crash at page
+  480 of 500 resumes at page 480 and re-runs skip cached pages
+- Pages are reassembled in page order regardless of completion order
 
 Reason: Scanned PDFs require OCR. EasyOCR is CPU-only and works
-well for English text. Batching prevents memory exhaustion on large files.
+well for English text. Rasterization and recognition overlap instead of
+alternating, and the bounded queue keeps memory flat on large files.
 """
 
-from pathlib import Path
-from typing import Tuple, Dict
+import json
 import logging
+import os
+import queue
+import tempfile
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 
 try:
-    import easyocr
+    from pipeline_common.lazy_import import lazy_module
+except ImportError:  # standalone use without the repo root on sys.path
+    from importlib import import_module as lazy_module
+
+# easyocr pulls in torch, so OCR backends load when a page is first rendered
+try:
+    easyocr = lazy_module("easyocr")
 
     EASYOCR_AVAILABLE = True
 except ImportError:
     EASYOCR_AVAILABLE = False
 
 try:
-    from pdf2image import convert_from_path
+    pdf2image = lazy_module("pdf2image")
 
     PDF2IMAGE_AVAILABLE = True
 except ImportError:
     PDF2IMAGE_AVAILABLE = False
 
+try:
+    fitz = lazy_module("fitz")  # PyMuPDF
+
+    PYMUPDF_AVAILABLE = True
+except ImportError:
+    PYMUPDF_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+OCR_CACHE_ENV = "PIPELINE_OCR_CACHE"
+DISABLE_VALUES = {"0", "off", "false", "none", "disabled"}
+DEFAULT_CACHE_ROOT = Path(__file__).resolve().parents[4] / ".pipeline" / "ocr_cache"
+LANGUAGES = ["en"]
+LOW_DPI = 200
+HIGH_DPI = 300
+RETRY_CONFIDENCE = 0.6
+RESULT_POLL_SEC = 5.0
+
+PageResult = Dict[str, Any]
+
+
+def default_workers() -> int:
+    """Recognition processes: EasyOCR is multi-threaded, so use about half the cores."""
+    return max(1, min(4, (os.cpu_count() or 2) // 2))
+
+
+class OcrPageCache:
+    """Per-page OCR results stored as ``<root>/<sha256>/page_NNNNN.json``."""
+
+    def __init__(self, root: Optional[Path], sha256: str):
+        self.page_dir = Path(root) / sha256 if root is not None else None
+
+    @classmethod
+    def from_env(cls, sha256: str, root: Optional[Path] = None) -> "OcrPageCache":
+        """Cache rooted at ``root``, else ``$PIPELINE_OCR_CACHE``, else .pipeline/ocr_cache."""
+        if root is None:
+            env = os.environ.get(OCR_CACHE_ENV, "").strip()
+            if env.lower() in DISABLE_VALUES:
+                return cls(None, sha256)
+            root = Path(env) if env else DEFAULT_CACHE_ROOT
+        return cls(root, sha256)
+
+    def _path(self, index: int) -> Optional[Path]:
+        return self.page_dir / f"page_{index:05d}.json" if self.page_dir is not None else None
+
+    def get(self, index: int) -> Optional[PageResult]:
+        path = self._path(index)
+        if path is None or not path.exists():
+            return None
+        try:
+            return json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.debug(f"Ignoring unreadable OCR cache entry {path}: {exc}")
+            return None
+
+    def put(self, index: int, result: PageResult) -> None:
+        path = self._path(index)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=f".{path.stem}.", suffix=".tmp", dir=path.parent)
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(result, handle)
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.debug(f"Could not persist OCR cache entry {path}: {exc}")
+
+
+class _PageRenderer:
+    """Renders single pages to grayscale arrays (PyMuPDF, else pdf2image/poppler)."""
+
+    def __init__(self, pdf_path: str):
+        self.pdf_path = pdf_path
+        self._doc = fitz.open(pdf_path) if PYMUPDF_AVAILABLE else None
+
+    def render(self, index: int, dpi: int):
+        import numpy as np
+
+        if self._doc is not None:
+            pix = self._doc.load_page(index).get_pixmap(dpi=dpi, colorspace=fitz.csGRAY)
+            return np.frombuffer(pix.samples, dtype=np.uint8).reshape(pix.height, pix.width).copy()
+        images = pdf2image.convert_from_path(self.pdf_path, first_page=index + 1, last_page=index + 1, dpi=dpi, grayscale=True)
+        return np.asarray(images[0])
+
+    def close(self) -> None:
+        if self._doc is not None:
+            self._doc.close()
+
+
+def _page_count(path: Path) -> int:
+    if PYMUPDF_AVAILABLE:
+        with fitz.open(str(path)) as doc:
+            return len(doc)
+    return int(pdf2image.pdfinfo_from_path(str(path))["Pages"])
+
+
+def _new_reader(languages: Sequence[str]):
+    return easyocr.Reader(list(languages), gpu=False, verbose=False)
+
+
+def _recognize(reader, image) -> PageResult:
+    """Run OCR on one page image: text, mean confidence and detection count."""
+    # EasyOCR returns: (bbox, text, confidence)
+    detections = reader.readtext(image, paragraph=True)
+    texts = [detection[1] for detection in detections]
+    confidences = [detection[2] for detection in detections if len(detection) > 2]
+    return {
+        "text": "\n".join(texts),
+        "confidence": sum(confidences) / len(confidences) if confidences else 0.0,
+        "detections": len(detections),
+    }
+
+
+def _render_worker(pdf_path: str, plan: Sequence[Tuple[int, int]], jobs, results) -> None:
+    """Rendering stage: page images into the bounded job queue (blocks while it is full)."""
+    renderer = _PageRenderer(pdf_path)
+    try:
+        for index, dpi in plan:
+            try:
+                jobs.put((index, dpi, renderer.render(index, dpi)))
+            except Exception as exc:
+                results.put((index, dpi, {"error": f"render failed: {type(exc).__name__}: {exc}"}))
+    finally:
+        renderer.close()
+
 
-def extract(path: Path, batch_size: int = 10) -> Tuple[str, Dict]:
+def _recognition_worker(languages: Sequence[str], threads: int, jobs, results) -> None:
+    """Recognition stage: one EasyOCR reader per process, pages until the stop marker."""
+    try:
+        import torch
+
+        torch.set_num_threads(max(1, threads))
+    except ImportError:
+        pass
+    reader = _new_reader(languages)
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+        index, dpi, image = job
+        try:
+            result = _recognize(reader, image)
+        except Exception as exc:
+            result = {"error": f"{type(exc).__name__}: {exc}"}
+        results.put((index, dpi, result))
+
+
+class _SerialOcr:
+    """In-process rendering and recognition (``workers=0``)."""
+
+    def __init__(self, pdf_path: str, languages: Sequence[str]):
+        self.pdf_path = pdf_path
+        self.languages = languages
+        self._reader = None
+
+    def run(self, plan: Sequence[Tuple[int, int]]) -> Iterator[Tuple[int, int, PageResult]]:
+        renderer = _PageRenderer(self.pdf_path)
+        try:
+            for index, dpi in plan:
+                try:
+                    if self._reader is None:
+                        self._reader = _new_reader(self.languages)
+                    result = _recognize(self._reader, renderer.render(index, dpi))
+                except Exception as exc:
+                    result = {"error": f"{type(exc).__name__}: {exc}"}
+                yield index, dpi, result
+        finally:
+            renderer.close()
+
+    def close(self) -> None:
+        self._reader = None
+
+
+class _PipelinedOcr:
+    """Renderer process -> bounded queue -> N recognition processes -> results queue."""
+
+    def __init__(self, pdf_path: str, languages: Sequence[str], workers: int, queue_depth: int):
+        self.pdf_path = pdf_path
+        self._ctx = get_context("spawn")
+        self._jobs = self._ctx.Queue(maxsize=max(1, queue_depth))
+        self._results = self._ctx.Queue()
+        threads = max(1, (os.cpu_count() or workers) // workers)
+        self._workers = [
+            self._ctx.Process(
+                target=_recognition_worker,
+                args=(list(languages), threads, self._jobs, self._results),
+                daemon=True,
+            )
+            for _ in range(workers)
+        ]
+        for process in self._workers:
+            process.start()
+
+    def run(self, plan: Sequence[Tuple[int, int]]) -> Iterator[Tuple[int, int, PageResult]]:
+        renderer = self._ctx.Process(
+            target=_render_worker,
+            args=(self.pdf_path, list(plan), self._jobs, self._results),
+            daemon=True,
+        )
+        renderer.start()
+        try:
+            for _ in plan:
+                while True:
+                    try:
+                        yield self._results.get(timeout=RESULT_POLL_SEC)
+                        break
+                    except queue.Empty:
+                        # A dead worker takes its in-flight page with it; fail fast, the cache resumes
+                        if any(process.exitcode not in (None, 0) for process in self._workers):
+                            raise RuntimeError("An OCR recognition worker crashed")
+                        if not renderer.is_alive() and renderer.exitcode not in (0, None):
+                            raise RuntimeError(f"OCR renderer exited with code {renderer.exitcode}")
+        finally:
+            renderer.join(timeout=RESULT_POLL_SEC)
+            if renderer.is_alive():
+                renderer.terminate()
+
+    def close(self) -> None:
+        for _ in self._workers:
+            try:
+                self._jobs.put(None, timeout=RESULT_POLL_SEC)
+            except queue.Full:
+                break
+        for process in self._workers:
+            process.join(timeout=RESULT_POLL_SEC)
+            if process.is_alive():
+                process.terminate()
+
+
+def _is_final(result: PageResult, high_dpi: int, retry_confidence: float) -> bool:
+    """Cached page needs no further work (confident, already high DPI, or already retried)."""
+    return result["confidence"] >= retry_confidence or result["dpi"] >= high_dpi or bool(result.get("retried"))
+
+
+def extract(
+    path: Path,
+    batch_size: int = 10,
+    workers: Optional[int] = None,
+    sha256: Optional[str] = None,
+    cache_root: Optional[Path] = None,
+    low_dpi: int = LOW_DPI,
+    high_dpi: int = HIGH_DPI,
+    retry_confidence: float = RETRY_CONFIDENCE,
+) -> Tuple[str, Dict]:
     """
     Extract text from scanned PDF using OCR.
 
     Args:
         path: Path to PDF file
-        batch_size: Number of pages to process at once (default: 10)
-                   Lower values use less memory but take longer
+        batch_size: Depth of the rendered-page queue (default: 10)
+                   Lower values use less memory
+        workers: Recognition processes (default: half the cores, max 4);
+                 0 runs rendering and recognition in-process
+        sha256: Phase 1 file digest, keys the page cache (computed if omitted)
+        cache_root: Override for the OCR cache root (default .pipeline/ocr_cache)
+        low_dpi: First-pass render DPI
+        high_dpi: Retry DPI for pages below ``retry_confidence``
+        retry_confidence: Mean detection confidence that triggers a retry
 
     Returns:
         (text, metadata) with OCR confidence scores
 
     Strategy:
-    1. Convert PDF pages to images in batches
-    2. Run EasyOCR on each image
-    3. Track confidence scores
-    4. Aggregate results
-
-    Reason: Processing in batches prevents memory exhaustion on
-    large PDFs (e.g., 500+ page books). Default batch_size=10 keeps
-    memory under 4GB on most systems.
+    1. Load cached page results; only uncached pages are rendered
+    2. Render at low DPI and recognize, pipelined across processes
+    3. Re-render low-confidence pages at high DPI, keep the better read
+    4. Reassemble pages in order and aggregate confidences
     """
     if not EASYOCR_AVAILABLE:
         error_msg = (
@@ -67,7 +328,7 @@ def extract(path: Path, batch_size: int = 10) -> Tuple[str, Dict]:
             "quality_score": 0.0,
         }
 
-    if not PDF2IMAGE_AVAILABLE:
+    if not (PYMUPDF_AVAILABLE or PDF2IMAGE_AVAILABLE):
         error_msg = (
             "pdf2image library not available. Install with: poetry add pdf2image\n"
             "Also requires poppler: brew install poppler (Mac) or apt-get install poppler-utils (Linux)"
@@ -79,113 +340,82 @@ def extract(path: Path, batch_size: int = 10) -> Tuple[str, Dict]:
             "quality_score": 0.0,
         }
 
+    workers = default_workers() if workers is None else workers
     logger.info(f"OCR Extraction: {path.name}")
     logger.warning("OCR is slow - expect ~5-10 seconds per page")
-    logger.info(f"Processing in batches of {batch_size} pages")
 
+    engine = None
     try:
-        # Initialize EasyOCR reader (CPU-only)
-        logger.debug("Initializing EasyOCR reader (this may take a moment)...")
-        reader = easyocr.Reader(["en"], gpu=False, verbose=False)
-        logger.debug("EasyOCR reader initialized")
-
-        # Get total page count (quick check)
-        try:
-            import fitz
-
-            doc = fitz.open(str(path))
-            total_pages = len(doc)
-            doc.close()
-            logger.info(f"Document has {total_pages} pages")
-        except Exception as exc:
-            logger.warning("Could not determine page count: %s", exc)
-            total_pages = None
-
+        from pipeline_common.pdf_page_cache import file_sha256
+
+        cache = OcrPageCache.from_env(sha256 or file_sha256(path), cache_root)
+        total_pages = _page_count(path)
+        logger.info(f"Document has {total_pages} pages")
+
+        pages: Dict[int, PageResult] = {}
+        retry: List[int] = []
+        first_pass: List[Tuple[int, int]] = []
+        for index in range(total_pages):
+            cached = cache.get(index)
+            if cached is None:
+                first_pass.append((index, low_dpi))
+                continue
+            pages[index] = cached
+            if not _is_final(cached, high_dpi, retry_confidence):
+                retry.append(index)
+        cached_count = len(pages)
+        if cached_count:
+            logger.info(f"Resuming: {cached_count}/{total_pages} pages cached")
+
+        if first_pass or retry:
+            logger.info(f"OCR with {workers or 'in-process'} recognition worker(s), queue depth {batch_size}")
+            if workers > 0:
+                engine = _PipelinedOcr(str(path), LANGUAGES, workers, batch_size)
+            else:
+                engine = _SerialOcr(str(path), LANGUAGES)
+
+        errors: Dict[int, str] = {}
+        if first_pass:
+            logger.info(f"First pass: {len(first_pass)} pages at {low_dpi} DPI")
+            for index, dpi, result in engine.run(first_pass):
+                if "error" in result:
+                    logger.error(f"OCR failed on page {index + 1}: {result['error']}")
+                    errors[index] = result["error"]
+                    continue
+                result["dpi"] = dpi
+                pages[index] = result
+                cache.put(index, result)
+                logger.info(
+                    f"  Page {index + 1}: {len(result['text'])} chars, confidence: {result['confidence']:.2%}"
+                )
+                if not _is_final(result, high_dpi, retry_confidence):
+                    retry.append(index)
+
+        if retry:
+            logger.info(f"Retrying {len(retry)} low-confidence pages at {high_dpi} DPI")
+            for index, dpi, result in engine.run([(i, high_dpi) for i in sorted(retry)]):
+                previous = pages[index]
+                if "error" not in result and result["confidence"] > previous["confidence"]:
+                    result["dpi"] = dpi
+                    logger.info(
+                        f"  Page {index + 1}: confidence {previous['confidence']:.2%} -> {result['confidence']:.2%}"
+                    )
+                    previous = result
+                previous["retried"] = True
+                pages[index] = previous
+                cache.put(index, previous)
+
+        # Reassemble in page order; failed pages count as zero confidence
         all_results = []
         all_confidences = []
-        page_num = 0
-
-        # Process in batches
-        while True:
-            # Convert batch of pages to images
-            logger.info(
-                f"Converting pages {page_num+1}-{page_num+batch_size} to images..."
-            )
-
-            try:
-                images = convert_from_path(
-                    str(path),
-                    first_page=page_num + 1,
-                    last_page=page_num + batch_size,
-                    dpi=300,  # Higher DPI = better OCR but slower
-                    fmt="jpeg",
-                    jpegopt={
-                        "quality": 85,
-                        "progressive": True,
-                        "optimize": True,
-                    },
-                )
-            except Exception as e:
-                # Likely reached end of document
-                if page_num == 0:
-                    raise  # If first batch fails, it's a real error
-                logger.debug(f"Reached end of document or error: {e}")
-                break
-
-            if not images:
-                break
-
-            # Process each image
-            for i, img in enumerate(images):
-                current_page = page_num + i + 1
-                logger.info(f"OCR processing page {current_page}...")
-
-                try:
-                    # Run OCR
-                    result = reader.readtext(img, paragraph=True)
-
-                    # Extract text and confidences
-                    page_text = []
-                    page_confidences = []
-
-                    for detection in result:
-                        # EasyOCR returns: (bbox, text, confidence)
-                        text = detection[1]
-                        confidence = detection[2]
-
-                        page_text.append(text)
-                        page_confidences.append(confidence)
-
-                    # Combine page text
-                    combined_text = "\n".join(page_text)
-                    all_results.append(combined_text)
-
-                    # Track confidences
-                    if page_confidences:
-                        page_avg_conf = sum(page_confidences) / len(
-                            page_confidences
-                        )
-                        all_confidences.append(page_avg_conf)
-                        logger.info(
-                            f"  Page {current_page}: {len(combined_text)} chars, "
-                            f"confidence: {page_avg_conf:.2%}"
-                        )
-                    else:
-                        logger.warning(
-                            f"  Page {current_page}: No text detected"
-                        )
-                        all_confidences.append(0.0)
-
-                except Exception as e:
-                    logger.error(f"OCR failed on page {current_page}: {e}")
-                    all_confidences.append(0.0)
-                    continue
-
-            page_num += batch_size
-
-            # Safety check: prevent infinite loop
-            if total_pages and page_num >= total_pages:
-                break
+        for index in range(total_pages):
+            if index in pages:
+                all_results.append(pages[index]["text"])
+                all_confidences.append(pages[index]["confidence"])
+                if not pages[index]["detections"]:
+                    logger.warning(f"  Page {index + 1}: No text detected")
+            elif index in errors:
+                all_confidences.append(0.0)
 
         # Combine all pages
         text = "\n\n".join(all_results)
@@ -201,6 +431,10 @@ def extract(path: Path, batch_size: int = 10) -> Tuple[str, Dict]:
             "title": path.stem,
             "char_count": len(text),
             "pages_processed": len(all_results),
+            "pages_cached": cached_count,
+            "pages_retried_high_dpi": len(retry),
+            "pages_failed": len(errors),
+            "ocr_workers": workers,
             "ocr_confidence_avg": avg_confidence,
             "ocr_confidence_min": (
                 min(all_confidences) if all_confidences else 0.0
@@ -234,7 +468,7 @@ def extract(path: Path, batch_size: int = 10) -> Tuple[str, Dict]:
 
         logger.info("=" * 60)
         logger.info("OCR COMPLETE")
-        logger.info(f"Pages processed: {len(all_results)}")
+        logger.info(f"Pages processed: {len(all_results)} ({cached_count} from cache)")
         logger.info(f"Total chars: {len(text):,}")
         logger.info(f"Average confidence: {avg_confidence:.2%}")
         logger.info("=" * 60)
@@ -255,3 +489,6 @@ def extract(path: Path, batch_size: int = 10) -> Tuple[str, Dict]:
             "error": f"OCR failed: {type(e).__name__}: {str(e)}",
             "quality_score": 0.0,
         }
+    finally:
+        if engine is not None:
+            engine.close()
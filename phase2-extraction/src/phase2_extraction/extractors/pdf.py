@@ -13,43 +13,54 @@ This is a modularized version that preserves all existing functionality.
 
 import logging
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+from ..extraction import (
+    DEFAULT_SAMPLE_PAGES,
+    PDFPLUMBER_AVAILABLE,
+    PYMUPDF_AVAILABLE,
+    PYPDF_AVAILABLE,
+    extract_pages_sampled,
+    page_cache,
+)
 from ..extraction import (
     validate_extraction_quality as base_validate_extraction_quality,
 )
 
-# Try optional extraction libraries
-try:
-    from pypdf import PdfReader
+logger = logging.getLogger(__name__)
 
-    PYPDF_AVAILABLE = True
-except ImportError:
-    PYPDF_AVAILABLE = False
 
-try:
-    import pdfplumber
+def validate_extraction_quality(text: str, method_name: str) -> float:
+    """Delegate to shared Phase 2 quality validation."""
+    return base_validate_extraction_quality(text, method_name)
 
-    PDFPLUMBER_AVAILABLE = True
-except ImportError:
-    PDFPLUMBER_AVAILABLE = False
 
-try:
-    import fitz  # PyMuPDF
+def _join_pages(method_name: str, page_texts: List[str]) -> str:
+    """
+    Join non-empty pages the way each backend always has.
 
-    PYMUPDF_AVAILABLE = True
-except ImportError:
-    PYMUPDF_AVAILABLE = False
+    PyMuPDF drops whitespace-only pages; pypdf and pdfplumber keep them.
+    """
+    label = "PyMuPDF" if method_name == "pymupdf" else method_name
+    pages_text = []
 
-logger = logging.getLogger(__name__)
+    for i, page_text in enumerate(page_texts):
+        if page_text.strip() if method_name == "pymupdf" else page_text:
+            pages_text.append(page_text)
+        else:
+            logger.debug(f"{label}: Page {i+1} yielded no text")
 
+    text = "\n".join(pages_text)
 
-def validate_extraction_quality(text: str, method_name: str) -> float:
-    """Delegate to shared Phase 2 quality validation."""
-    return base_validate_extraction_quality(text, method_name)
+    if text.strip():
+        logger.info(f"{label}: Extracted {len(text):,} chars from {len(pages_text)} pages")
+    else:
+        logger.warning(f"{label}: No text extracted")
+
+    return text
 
 
-def extract_text_pypdf(file_path: Path) -> str:
+def extract_text_pypdf(file_path: Path, sha256: Optional[str] = None) -> str:
     """
     Extract using pypdf library.
 
@@ -62,33 +73,13 @@ def extract_text_pypdf(file_path: Path) -> str:
 
     try:
         logger.debug("Attempting extraction with pypdf...")
-        reader = PdfReader(str(file_path))
-        pages_text = []
-
-        for i, page in enumerate(reader.pages):
-            page_text = page.extract_text()
-            if page_text:
-                pages_text.append(page_text)
-            else:
-                logger.debug(f"pypdf: Page {i+1} yielded no text")
-
-        text = "\n".join(pages_text)
-
-        if text.strip():
-            logger.info(
-                f"pypdf: Extracted {len(text):,} chars from {len(pages_text)} pages"
-            )
-        else:
-            logger.warning("pypdf: No text extracted")
-
-        return text
-
+        return _join_pages("pypdf", page_cache(file_path, sha256).texts("pypdf"))
     except Exception as e:
         logger.warning(f"pypdf extraction failed: {type(e).__name__}: {e}")
         return ""
 
 
-def extract_text_pdfplumber(file_path: Path) -> str:
+def extract_text_pdfplumber(file_path: Path, sha256: Optional[str] = None) -> str:
     """
     Extract using pdfplumber library.
 
@@ -101,27 +92,7 @@ def extract_text_pdfplumber(file_path: Path) -> str:
 
     try:
         logger.debug("Attempting extraction with pdfplumber...")
-        pages_text = []
-
-        with pdfplumber.open(str(file_path)) as pdf:
-            for i, page in enumerate(pdf.pages):
-                page_text = page.extract_text()
-                if page_text:
-                    pages_text.append(page_text)
-                else:
-                    logger.debug(f"pdfplumber: Page {i+1} yielded no text")
-
-        text = "\n".join(pages_text)
-
-        if text.strip():
-            logger.info(
-                f"pdfplumber: Extracted {len(text):,} chars from {len(pages_text)} pages"
-            )
-        else:
-            logger.warning("pdfplumber: No text extracted")
-
-        return text
-
+        return _join_pages("pdfplumber", page_cache(file_path, sha256).texts("pdfplumber"))
     except Exception as e:
         logger.warning(
             f"pdfplumber extraction failed: {type(e).__name__}: {e}"
@@ -129,7 +100,7 @@ def extract_text_pdfplumber(file_path: Path) -> str:
         return ""
 
 
-def extract_text_pymupdf(file_path: Path) -> str:
+def extract_text_pymupdf(file_path: Path, sha256: Optional[str] = None) -> str:
     """
     Extract using PyMuPDF (fitz) library.
 
@@ -142,34 +113,13 @@ def extract_text_pymupdf(file_path: Path) -> str:
 
     try:
         logger.debug("Attempting extraction with PyMuPDF...")
-        doc = fitz.open(str(file_path))
-        pages_text = []
-
-        for i, page in enumerate(doc):
-            page_text = page.get_text()
-            if page_text.strip():
-                pages_text.append(page_text)
-            else:
-                logger.debug(f"PyMuPDF: Page {i+1} yielded no text")
-
-        text = "\n".join(pages_text)
-        doc.close()
-
-        if text.strip():
-            logger.info(
-                f"PyMuPDF: Extracted {len(text):,} chars from {len(pages_text)} pages"
-            )
-        else:
-            logger.warning("PyMuPDF: No text extracted")
-
-        return text
-
+        return _join_pages("pymupdf", page_cache(file_path, sha256).texts("pymupdf"))
     except Exception as e:
         logger.warning(f"PyMuPDF extraction failed: {type(e).__name__}: {e}")
         return ""
 
 
-def extract_pdf_metadata(file_path: Path) -> Dict:
+def extract_pdf_metadata(file_path: Path, sha256: Optional[str] = None) -> Dict:
     """
     Extract PDF metadata using PyMuPDF.
 
@@ -181,8 +131,7 @@ def extract_pdf_metadata(file_path: Path) -> Dict:
         return metadata
 
     try:
-        doc = fitz.open(str(file_path))
-        pdf_meta = doc.metadata
+        pdf_meta = page_cache(file_path, sha256).metadata()
 
         if pdf_meta:
             metadata["title"] = pdf_meta.get("title") or file_path.stem
@@ -194,7 +143,6 @@ def extract_pdf_metadata(file_path: Path) -> Dict:
             if pdf_meta.get("keywords"):
                 metadata["keywords"] = pdf_meta.get("keywords")
 
-        doc.close()
         logger.debug(f"Extracted metadata: {metadata}")
 
     except Exception as e:
@@ -203,13 +151,62 @@ def extract_pdf_metadata(file_path: Path) -> Dict:
     return metadata
 
 
+def _extract_sampled(
+    path: Path, sha256: Optional[str], sample_size: int, workers: Optional[int]
+) -> Optional[Tuple[str, Dict]]:
+    """Sample-first extraction (see ``extraction.extract_pages_sampled``); None if inconclusive."""
+    try:
+        sampled = extract_pages_sampled(path, sha256, sample_size, workers)
+    except Exception as e:
+        logger.warning(f"Sampled extraction failed: {type(e).__name__}: {e}")
+        return None
+    if sampled is None:
+        return None
+
+    text = _join_pages(sampled.method, sampled.pages)
+    if not text.strip():
+        return None
+    quality_score = validate_extraction_quality(text, sampled.method)
+
+    logger.info("=" * 60)
+    logger.info(f"BEST METHOD: {sampled.method} (sampled {len(sampled.sample)} pages)")
+    logger.info(f"Quality Score: {quality_score:.2f}/1.0")
+    logger.info(f"Length: {len(text):,} chars")
+    logger.info("=" * 60)
+
+    metadata = extract_pdf_metadata(path, sha256)
+    metadata.update(
+        {
+            "quality_score": quality_score,
+            "tool_used": sampled.method,
+            "char_count": len(text),
+            "methods_tried": list(sampled.sample_scores.keys()),
+            "sample_scores": sampled.sample_scores,
+            "sample_pages": len(sampled.sample),
+            "fallback_pages": {str(k + 1): v for k, v in sampled.fallback_pages.items()},
+        }
+    )
+    return text, metadata
+
+
 def extract(
-    path: Path, force_method: Optional[str] = None
+    path: Path,
+    force_method: Optional[str] = None,
+    sha256: Optional[str] = None,
+    strategy: str = "sampled",
+    sample_size: int = DEFAULT_SAMPLE_PAGES,
+    workers: Optional[int] = None,
 ) -> Tuple[str, Dict]:
     """
     Multi-pass PDF extraction with comprehensive quality validation.
 
-    Strategy:
+    Strategy ("sampled", the default, for documents longer than two samples):
+    1. Score each available backend on a stratified page sample
+    2. Extract the full document only with the winner, page-parallel
+    3. Re-extract only the pages the winner handled poorly
+    4. Extract metadata separately
+
+    Strategy "full" (and short documents):
     1. Try all available extraction methods (pypdf, pdfplumber, PyMuPDF)
     2. Validate quality of each result
     3. Select the best result based on quality score
@@ -218,6 +215,10 @@ def extract(
     Args:
         path: Path to PDF file
         force_method: Optional - force specific method ('pypdf', 'pdfplumber', 'pymupdf')
+        sha256: Optional - Phase 1 file digest, keys the shared page cache
+        strategy: 'sampled' (default) or 'full'
+        sample_size: Pages in the stratified sample
+        workers: Process-pool size for page-parallel extraction (default: CPU count, max 8)
 
     Returns:
         (text, metadata) where metadata includes:
@@ -253,12 +254,12 @@ def extract(
                 "error": f"Unknown method: {force_method}",
             }
 
-        text = method_map[force_method](path)
+        text = method_map[force_method](path, sha256)
         quality_score = (
             validate_extraction_quality(text, force_method) if text else 0.0
         )
 
-        metadata = extract_pdf_metadata(path)
+        metadata = extract_pdf_metadata(path, sha256)
         metadata.update(
             {
                 "quality_score": quality_score,
@@ -269,6 +270,17 @@ def extract(
 
         return text, metadata
 
+    if strategy == "sampled":
+        try:
+            page_count = page_cache(path, sha256).page_count()
+        except Exception as e:
+            logger.debug(f"Page count unavailable: {e}")
+            page_count = 0
+        if page_count > 2 * sample_size:
+            sampled = _extract_sampled(path, sha256, sample_size, workers)
+            if sampled is not None:
+                return sampled
+
     # Multi-pass: try all methods
     results = {}
 
@@ -280,7 +292,7 @@ def extract(
 
     for method_name, extract_func in methods:
         logger.info(f"\nTrying {method_name}...")
-        text = extract_func(path)
+        text = extract_func(path, sha256)
 
         if text.strip():
             score = validate_extraction_quality(text, method_name)
@@ -304,7 +316,7 @@ def extract(
             "Recommendation: Run Phase 1 validation to check PDF type"
         )
 
-        metadata = extract_pdf_metadata(path)
+        metadata = extract_pdf_metadata(path, sha256)
         metadata.update(
             {
                 "quality_score": 0.0,
@@ -326,7 +338,7 @@ def extract(
     logger.info("=" * 60)
 
     # Get metadata
-    metadata = extract_pdf_metadata(path)
+    metadata = extract_pdf_metadata(path, sha256)
     metadata.update(
         {
             "quality_score": best_score,
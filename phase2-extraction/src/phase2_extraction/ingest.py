@@ -24,23 +24,28 @@ from time import perf_counter
 from typing import Any, Dict, List, Optional, Tuple
 
 try:
-    from pipeline_common import PipelineState, StateError
+    from pipeline_common import startup_profile
 except ImportError:
     project_root = Path(__file__).resolve().parents[3]
     package_root = Path(__file__).resolve().parents[1]
     for _path in (project_root, package_root):
         if str(_path) not in sys.path:
             sys.path.insert(0, str(_path))
-    from pipeline_common import PipelineState, StateError
+    from pipeline_common import startup_profile
+
+startup_profile.enable_if_requested("phase2_extraction")
+
+from pipeline_common import PipelineState, StateError  # noqa: E402
 
 # Extractors
 from .extractors import docx, epub, html, ocr, txt
 
 # Normalization and utilities
-from .extraction import extract_text_multipass
+from .extraction import DEFAULT_SAMPLE_PAGES, extract_pages_multipass, page_offsets
 from .normalize import normalize_text
 from .structure_detector import (
     StructureNode,
+    anchor_nodes,
     calculate_section_boundaries,
     detect_structure_heuristic,
     extract_pdf_structure_by_fonts,
@@ -76,7 +81,8 @@ def load_file_metadata(
         file_override: Optional path to override file location
 
     Returns:
-        Dict with file_path and classification
+        Dict with file_path, classification, file_size and sha256 (the
+        Phase 1 digest, or None when it does not describe the file on disk)
 
     Raises:
         FileNotFoundError: If pipeline.json or file not found
@@ -106,10 +112,13 @@ def load_file_metadata(
     if file_override:
         file_path = file_override
         logger.info(f"Using file override: {file_path}")
+        sha256 = None
     else:
         file_path = Path(
             file_data.get("file_path") or file_data.get("artifacts_path", "")
         )
+        # Phase 1 hashes before repairing in place, so the digest is stale after a repair
+        sha256 = None if file_data.get("repair_success") else (file_data.get("sha256") or file_data.get("hash"))
 
     # Get classification from Phase 1
     classification = file_data.get("classification", "unknown")
@@ -128,6 +137,7 @@ def load_file_metadata(
         "file_path": file_path,
         "classification": classification,
         "file_size": file_path.stat().st_size,
+        "sha256": sha256,
     }
 
 
@@ -172,6 +182,8 @@ def extract_text(
     detected_format: str,
     force_ocr: bool = False,
     classification: str = "unknown",
+    sha256: Optional[str] = None,
+    settings: Optional[Dict[str, Any]] = None,
 ) -> Tuple[str, Dict]:
     """
     Extract text using appropriate method based on format and classification.
@@ -181,9 +193,12 @@ def extract_text(
         detected_format: Format from detection ('pdf', 'docx', etc.)
         force_ocr: Force OCR extraction for PDFs
         classification: Classification from Phase 1 ('text', 'scanned', 'mixed')
+        sha256: Phase 1 file digest; keys the shared PDF page cache
+        settings: Phase 2 config (pdf_strategy, pdf_sample_pages, pdf_workers, epub_workers)
 
     Returns:
-        (text, metadata) from extractor
+        (text, metadata) from extractor; text-layer PDF metadata also carries
+        ``page_offsets`` (page -> char offset map used to anchor structure)
 
     Strategy:
     1. For PDFs: Check classification and force_ocr flag
@@ -200,6 +215,7 @@ def extract_text(
     logger.info(f"Classification: {classification}")
     logger.info(f"Force OCR: {force_ocr}")
     logger.info("=" * 60)
+    settings = settings or {}
 
     # PDF handling with OCR decision
     if detected_format == "pdf":
@@ -207,27 +223,35 @@ def extract_text(
             logger.info(
                 "Using OCR path for PDF (forced or classified as scanned)"
             )
-            return with_retry(lambda: ocr.extract(file_path))
-
-        text, method_used, quality_score = extract_text_multipass(file_path)
+            return with_retry(lambda: ocr.extract(file_path, sha256=sha256))
+
+        pages, method_used, quality_score = extract_pages_multipass(
+            file_path,
+            sha256,
+            strategy=settings.get("pdf_strategy", "sampled"),
+            sample_size=int(settings.get("pdf_sample_pages", DEFAULT_SAMPLE_PAGES)),
+            workers=int(settings.get("pdf_workers") or 0) or None,
+        )
+        text = "\n".join(pages)
 
         if classification == "mixed" and quality_score < 0.6:
             logger.warning(
                 "Low quality from text extraction on mixed PDF - trying OCR fallback..."
             )
-            return with_retry(lambda: ocr.extract(file_path))
+            return with_retry(lambda: ocr.extract(file_path, sha256=sha256))
 
         if not text.strip():
             logger.warning(
                 "Text extraction returned empty result - trying OCR fallback..."
             )
-            return with_retry(lambda: ocr.extract(file_path))
+            return with_retry(lambda: ocr.extract(file_path, sha256=sha256))
 
         metadata = {
             "title": file_path.stem,
             "tool_used": method_used,
             "quality_score": quality_score,
             "char_count": len(text),
+            "page_offsets": page_offsets(pages),
         }
         return text, metadata
 
@@ -237,7 +261,11 @@ def extract_text(
 
     # EPUB
     elif detected_format == "epub":
-        return with_retry(lambda: epub.extract(file_path))
+        return with_retry(
+            lambda: epub.extract(
+                file_path, workers=int(settings.get("epub_workers") or 0) or None
+            )
+        )
 
     # HTML
     elif detected_format == "html":
@@ -301,6 +329,7 @@ def main(
         file_path = file_metadata["file_path"]
         classification = file_metadata["classification"]
         file_size = file_metadata["file_size"]
+        file_sha256 = file_metadata.get("sha256")
 
         logger.info(f"  File: {file_path}")
         logger.info(
@@ -316,8 +345,11 @@ def main(
         # Stage 3: Extract Text
         logger.info("\nStage 3: Extracting text...")
         text, extraction_metadata = extract_text(
-            file_path, detected_format, force_ocr, classification
+            file_path, detected_format, force_ocr, classification, file_sha256, settings
         )
+        # Only needed for structure (Stage 4); kept out of the saved metadata
+        text_page_offsets = extraction_metadata.pop("page_offsets", None)
+        chapter_structure = extraction_metadata.pop("structure", None)
         quality_score = extraction_metadata.get("quality_score", 0.0)
 
         if not text or len(text) < 50:
@@ -361,13 +393,18 @@ def main(
         )
         logger.info(f"  Quality score: {quality_score:.2f}")
 
-        # Stage 4: Structure detection for PDFs (pre-normalization)
+        # Stage 4: Structure detection for PDFs (pre-normalization);
+        # EPUB chapters arrive with their structure nodes from the extractor
         structure_payload: List[Dict[str, Any]] = []
         structure_path: Optional[Path] = None
         if detected_format == "pdf":
             logger.info("\nStage 4: Detecting document structure...")
-            toc_nodes = extract_pdf_toc(str(file_path))
-            font_nodes = extract_pdf_structure_by_fonts(str(file_path), text)
+            toc_nodes = anchor_nodes(
+                extract_pdf_toc(str(file_path), file_sha256), text, text_page_offsets
+            )
+            font_nodes = extract_pdf_structure_by_fonts(
+                str(file_path), text, file_sha256, text_page_offsets
+            )
             heuristic_nodes = detect_structure_heuristic(text)
             merged_nodes = _merge_structure_nodes(
                 text, [toc_nodes, font_nodes, heuristic_nodes]
@@ -377,23 +414,29 @@ def main(
                 if merged_nodes
                 else []
             )
-            if bounded_nodes:
-                structure_payload = [
-                    _safe_model_dump(node) for node in bounded_nodes
-                ]
-                structure_path = (
-                    extracted_dir / f"{file_id}_structure.json"
-                ).resolve()
-                extracted_dir.mkdir(parents=True, exist_ok=True)
-                structure_path.write_text(
-                    json.dumps(
-                        structure_payload, indent=2, ensure_ascii=False
-                    ),
-                    encoding="utf-8",
-                )
-                logger.info(f"  ✓ Saved structure to {structure_path}")
-            else:
+            structure_payload = [
+                _safe_model_dump(node) for node in bounded_nodes
+            ]
+            if not structure_payload:
                 logger.info("  No structure detected.")
+        elif chapter_structure:
+            logger.info(
+                f"\nStage 4: Using {len(chapter_structure)} chapter nodes from the extractor"
+            )
+            structure_payload = chapter_structure
+
+        if structure_payload:
+            structure_path = (
+                extracted_dir / f"{file_id}_structure.json"
+            ).resolve()
+            extracted_dir.mkdir(parents=True, exist_ok=True)
+            structure_path.write_text(
+                json.dumps(
+                    structure_payload, indent=2, ensure_ascii=False
+                ),
+                encoding="utf-8",
+            )
+            logger.info(f"  ✓ Saved structure to {structure_path}")
 
         # Stage 5: Normalize Text
         logger.info("\nStage 5: Normalizing text for TTS...")
@@ -550,7 +593,8 @@ def main(
         raise
 
 
-if __name__ == "__main__":
+def cli(argv: Optional[List[str]] = None) -> None:
+    """Command-line entry point (``python -m phase2_extraction.ingest``)."""
     parser = argparse.ArgumentParser(
         description="Phase 2: Multi-Format Text Extraction",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -602,8 +646,9 @@ Examples:
         type=Path,
         help="Optional: Path to config.yaml (defaults to package config)",
     )
+    startup_profile.add_argument(parser)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Run extraction
     main(
@@ -614,3 +659,7 @@ Examples:
         force_ocr=args.force_ocr,
         config_path=args.config,
     )
+
+
+if __name__ == "__main__":
+    cli()
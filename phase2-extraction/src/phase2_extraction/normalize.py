@@ -2,7 +2,8 @@
 Text Normalization Pipeline
 
 Prepares extracted text for TTS synthesis by:
-1. Removing PDF artifacts (page numbers, headers, footers)
+1. Removing PDF artifacts (page numbers, headers, footers), including
+   recurring near-duplicate boilerplate and repeated passages
 2. Converting numbers to words for TTS clarity
 3. Preserving structural elements (headings, footnotes)
 4. Delegating whitespace/unicode cleanup to the configured TTS normalizer
@@ -19,7 +20,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional, Tuple
 
 from .cleaner import TTSTextCleaner
-from .dedupe import dedupe_paragraphs
+from .dedupe import dedupe_near_duplicates, dedupe_paragraphs
 from .utils import load_config
 
 try:
@@ -45,6 +46,16 @@ except (ImportError, AttributeError):
 
 logger = logging.getLogger(__name__)
 
+BOOK_CHAPTER_PATTERN = re.compile(r"\b(Book|Chapter|Section|Part)\s+(\d+)\b", re.IGNORECASE)
+LINE_START_NUMBER_PATTERN = re.compile(r"^(\d+)\s+(?=[A-Z])", re.MULTILINE)
+PAGE_NUMBER_LINE = re.compile(r"^\s*\d+\s*$")
+RULE_LINE = re.compile(r"^\s*[-=_]{3,}\s*$")
+PAGE_LABEL_LINE = re.compile(r"^\s*page\s+\d+(\s+of\s+\d+)?\s*$", re.IGNORECASE)
+INLINE_PAGE_NUMBER = re.compile(r"^\d{1,4}\s+[A-Z]")
+INLINE_PAGE_NUMBER_PREFIX = re.compile(r"^\d{1,4}\s+")
+FOOTNOTE_PATTERN = re.compile(r"\[(\d+)\]([^\[\n]+?)(?=\[\d+\]|$)")
+HEADING_MARKER_PATTERN = re.compile(r"<HEADING:\d+>")
+
 
 def convert_numbers_to_words(text: str) -> Tuple[str, int]:
     """Convert numbers at line starts and headings into words for better TTS output."""
@@ -61,12 +72,7 @@ def convert_numbers_to_words(text: str) -> Tuple[str, int]:
         conversion_count += 1
         return f"{prefix} {num2words(num, to='ordinal').title()}"
 
-    text = re.sub(
-        r"\b(Book|Chapter|Section|Part)\s+(\d+)\b",
-        replace_book_chapter,
-        text,
-        flags=re.IGNORECASE,
-    )
+    text = BOOK_CHAPTER_PATTERN.sub(replace_book_chapter, text)
 
     def replace_line_start_number(match: re.Match[str]) -> str:
         nonlocal conversion_count
@@ -76,12 +82,7 @@ def convert_numbers_to_words(text: str) -> Tuple[str, int]:
             return num2words(num).title() + " "
         return match.group(0)
 
-    text = re.sub(
-        r"^(\d+)\s+(?=[A-Z])",
-        replace_line_start_number,
-        text,
-        flags=re.MULTILINE,
-    )
+    text = LINE_START_NUMBER_PATTERN.sub(replace_line_start_number, text)
     return text, conversion_count
 
 
@@ -112,6 +113,7 @@ def _apply_primary_normalizer(
 
     normalized, tts_stats = normalize_for_tts(text)
     metrics["normalizer"] = "regex"
+    metrics["normalizer_rule_counts"] = tts_stats.get("rule_counts", {})
     metrics["changes"].extend(tts_stats.get("changes", []))
     is_ready, issues = validate_tts_readiness(normalized)
     metrics["tts_ready"] = len(issues) == 0
@@ -180,22 +182,20 @@ def normalize_text(
             cleaned_lines.append("")
             continue
 
-        if re.match(r"^\s*\d+\s*$", line_stripped):
+        if PAGE_NUMBER_LINE.match(line_stripped):
             metrics["removed_junk_lines"] += 1
             continue
 
-        if re.match(r"^\s*[-=_]{3,}\s*$", line_stripped):
+        if RULE_LINE.match(line_stripped):
             metrics["removed_junk_lines"] += 1
             continue
 
-        if re.match(
-            r"^\s*page\s+\d+(\s+of\s+\d+)?\s*$", line_stripped, re.IGNORECASE
-        ):
+        if PAGE_LABEL_LINE.match(line_stripped):
             metrics["removed_junk_lines"] += 1
             continue
 
-        if re.match(r"^\d{1,4}\s+[A-Z]", line_stripped):
-            cleaned_line = re.sub(r"^\d{1,4}\s+", "", line_stripped)
+        if INLINE_PAGE_NUMBER.match(line_stripped):
+            cleaned_line = INLINE_PAGE_NUMBER_PREFIX.sub("", line_stripped)
             cleaned_lines.append(cleaned_line)
             metrics["removed_inline_numbers"] += 1
             continue
@@ -211,6 +211,37 @@ def normalize_text(
             f"Removed {metrics['removed_inline_numbers']} inline page numbers"
         )
 
+    # Stage 2b: Near-duplicate boilerplate and repeated passages (windowed MinHash)
+    boilerplate_action = str(resolved_config.get("near_dedupe_boilerplate", "flag"))
+    passage_action = str(resolved_config.get("near_dedupe_passages", "flag"))
+    if boilerplate_action != "off" or passage_action != "off":
+        text, near_report = dedupe_near_duplicates(
+            text,
+            boilerplate_action=boilerplate_action,
+            passage_action=passage_action,
+            line_threshold=float(resolved_config.get("near_dedupe_line_threshold", 0.9)),
+            passage_threshold=float(resolved_config.get("near_dedupe_passage_threshold", 0.85)),
+            window=int(resolved_config.get("near_dedupe_window", 400)),
+        )
+        near_counts = near_report.counts()
+        metrics["near_duplicates"] = near_counts
+        if any(near_counts.values()):
+            metrics["changes"].append(
+                f"Near-duplicates: {near_counts['boilerplate']} boilerplate lines ({boilerplate_action}), "
+                f"{near_counts['passage']} repeated passages ({passage_action})"
+            )
+            try:
+                report_dir = artifacts_dir / "dedupe"
+                report_dir.mkdir(parents=True, exist_ok=True)
+                report_path = report_dir / f"{file_id}_near_duplicates.json"
+                report_path.write_text(
+                    json.dumps(near_report.to_dict(), indent=2, ensure_ascii=False),
+                    encoding="utf-8",
+                )
+                metrics["near_duplicates_report"] = str(report_path)
+            except Exception as exc:  # pragma: no cover - filesystem issues
+                logger.warning(f"Failed to save near-duplicate report: {exc}")
+
     # Stage 3: Convert Numbers to Words
     text, num_conversions = convert_numbers_to_words(text)
     if num_conversions > 0:
@@ -220,16 +251,18 @@ def normalize_text(
         )
 
     # Stage 4: Extract and Tag Footnotes
+    # One pass both collects and tags; the tagged text is kept only if a footnote had content
     footnotes = []
-    footnote_pattern = r"\[(\d+)\]([^\[\n]+?)(?=\[\d+\]|$)"
-    for match in re.finditer(footnote_pattern, text, re.DOTALL):
-        footnote_num = match.group(1)
+
+    def tag_footnote(match: re.Match[str]) -> str:
         footnote_text = match.group(2).strip()
         if footnote_text:
-            footnotes.append({"number": footnote_num, "text": footnote_text})
+            footnotes.append({"number": match.group(1), "text": footnote_text})
+        return "[FOOTNOTE]"
 
+    tagged_text = FOOTNOTE_PATTERN.sub(tag_footnote, text)
     if footnotes:
-        text = re.sub(footnote_pattern, "[FOOTNOTE]", text)
+        text = tagged_text
         metrics["extracted_footnotes"] = len(footnotes)
         metrics["changes"].append(f"Extracted {len(footnotes)} footnotes")
 
@@ -245,7 +278,7 @@ def normalize_text(
             logger.warning(f"Failed to save footnotes: {exc}")
 
     # Stage 5: Count Preserved Headings
-    heading_count = len(re.findall(r"<HEADING:\d+>", text))
+    heading_count = len(HEADING_MARKER_PATTERN.findall(text))
     metrics["preserved_headings"] = heading_count
     if heading_count > 0:
         metrics["changes"].append(f"Preserved {heading_count} headings")
@@ -8,13 +8,14 @@ This is an OPTIONAL enhancement - plain text extraction still works as before.
 """
 
 import logging
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence, Tuple
 from pathlib import Path
 import re
 
-import pymupdf as fitz
 from pydantic import BaseModel
 
+from .extraction import page_cache
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,7 +29,70 @@ class StructureNode(BaseModel):
     page: Optional[int] = None  # Original page number (PDF only)
 
 
-def extract_pdf_toc(pdf_path: str) -> List[StructureNode]:
+class HeadingAnchor:
+    """
+    Locates headings in the extracted text in reading order.
+
+    ``page_offsets`` is the page -> character offset map produced during
+    extraction (``extraction.page_offsets``); each search is restricted to
+    the heading's page and resumes from the previous heading's position, so
+    repeated titles ("Chapter", "Notes") anchor to their own occurrence and
+    a whole book is anchored in one pass over the text.  Without the map the
+    cursor still applies, over the full text.
+    """
+
+    def __init__(self, text: str, page_offsets: Optional[Sequence[int]] = None):
+        self.text = text
+        self.page_offsets = page_offsets
+        self.cursor = 0
+
+    def page_range(self, page: Optional[int]) -> Tuple[int, int]:
+        """Character span of 1-based ``page`` (the whole text if unknown)."""
+        offsets = self.page_offsets
+        if not offsets or page is None or not 1 <= page < len(offsets):
+            return 0, len(self.text)
+        return offsets[page - 1], offsets[page]
+
+    def _search(self, title: str, start: int, end: int) -> int:
+        index = self.text.find(title, start, end)
+        if index == -1:
+            match = re.compile(re.escape(title), re.IGNORECASE).search(self.text, start, end)
+            index = match.start() if match else -1
+        return index
+
+    def locate(self, title: str, page: Optional[int] = None) -> Optional[int]:
+        """Offset of ``title`` at or after the cursor on its page, else earlier on that page."""
+        start, end = self.page_range(page)
+        index = self._search(title, max(self.cursor, start), end)
+        if index == -1 and self.cursor > start:
+            # Out-of-order heading on a page the cursor already entered
+            index = self._search(title, start, min(self.cursor, end))
+        if index == -1:
+            return None
+        self.cursor = max(self.cursor, index + len(title))
+        return index
+
+
+def anchor_nodes(
+    nodes: List[StructureNode], text: str, page_offsets: Optional[Sequence[int]] = None
+) -> List[StructureNode]:
+    """
+    Fill in char offsets of page-numbered nodes (e.g. TOC entries).
+
+    Nodes whose title is not found start at their page (at 0 without
+    ``page_offsets``).
+    """
+    anchor = HeadingAnchor(text, page_offsets)
+    for node in nodes:
+        offset = anchor.locate(node.title, node.page)
+        if offset is None:
+            offset = anchor.page_range(node.page)[0]
+        node.char_offset = offset
+        node.char_end = offset + len(node.title)
+    return nodes
+
+
+def extract_pdf_toc(pdf_path: str, sha256: Optional[str] = None) -> List[StructureNode]:
     """
     Extract Table of Contents from PDF if available.
 
@@ -37,14 +101,13 @@ def extract_pdf_toc(pdf_path: str) -> List[StructureNode]:
 
     Args:
         pdf_path: Path to PDF file
+        sha256: Optional Phase 1 file digest (keys the shared page cache)
 
     Returns:
         List of StructureNode objects representing TOC hierarchy
     """
     try:
-        doc = fitz.open(pdf_path)
-        toc = doc.get_toc()  # Returns [(level, title, page), ...]
-        doc.close()
+        toc = page_cache(Path(pdf_path), sha256).toc()  # [(level, title, page), ...]
 
         if not toc:
             logger.info("No embedded TOC found in PDF")
@@ -72,7 +135,10 @@ def extract_pdf_toc(pdf_path: str) -> List[StructureNode]:
 
 
 def extract_pdf_structure_by_fonts(
-    pdf_path: str, text: str
+    pdf_path: str,
+    text: str,
+    sha256: Optional[str] = None,
+    page_offsets: Optional[Sequence[int]] = None,
 ) -> List[StructureNode]:
     """
     Extract document structure by analyzing font sizes.
@@ -80,38 +146,33 @@ def extract_pdf_structure_by_fonts(
     Headings typically use larger or bold fonts. This method:
     1. Analyzes font size distribution
     2. Identifies outlier sizes (likely headings)
-    3. Maps headings to their positions in the extracted text
+    3. Maps headings to their positions in the extracted text, in page
+       order (see ``HeadingAnchor``)
 
     Args:
         pdf_path: Path to PDF file
         text: Extracted plain text (for position mapping)
+        sha256: Optional Phase 1 file digest (keys the shared page cache)
+        page_offsets: Optional page -> char offset map of ``text``
 
     Returns:
         List of StructureNode objects detected by font analysis
     """
     try:
-        doc = fitz.open(pdf_path)
+        page_spans = page_cache(Path(pdf_path), sha256).spans()
 
-        # Collect all text blocks with font information
+        # Collect all text spans with font information
         font_data = []
-        for page_num, page in enumerate(doc):
-            blocks = page.get_text("dict")["blocks"]
-            for block in blocks:
-                if "lines" in block:
-                    for line in block["lines"]:
-                        for span in line["spans"]:
-                            font_data.append(
-                                {
-                                    "text": span["text"],
-                                    "size": span["size"],
-                                    "flags": span[
-                                        "flags"
-                                    ],  # Bold, italic, etc.
-                                    "page": page_num + 1,
-                                }
-                            )
-
-        doc.close()
+        for page_num, spans in enumerate(page_spans):
+            for span_text, size, flags in spans:
+                font_data.append(
+                    {
+                        "text": span_text,
+                        "size": size,
+                        "flags": flags,  # Bold, italic, etc.
+                        "page": page_num + 1,
+                    }
+                )
 
         if not font_data:
             logger.info("No font data found in PDF")
@@ -167,17 +228,13 @@ def extract_pdf_structure_by_fonts(
         size_to_level = {size: idx for idx, size in enumerate(unique_sizes)}
 
         # Create StructureNode objects
+        anchor = HeadingAnchor(text, page_offsets)
         nodes = []
         for heading in heading_candidates:
-            # Try to find position in text
             title = heading["title"]
-            char_offset = text.find(title)
-
-            if char_offset == -1:
-                # Try case-insensitive search
-                pattern = re.escape(title)
-                match = re.search(pattern, text, re.IGNORECASE)
-                char_offset = match.start() if match else 0
+            char_offset = anchor.locate(title, heading["page"])
+            if char_offset is None:
+                char_offset = anchor.page_range(heading["page"])[0]
 
             node = StructureNode(
                 level=size_to_level[heading["size"]],
@@ -322,7 +379,11 @@ def calculate_section_boundaries(
 
 
 def extract_structure(
-    pdf_path: str, text: str, enable_heuristic: bool = True
+    pdf_path: str,
+    text: str,
+    enable_heuristic: bool = True,
+    sha256: Optional[str] = None,
+    page_offsets: Optional[Sequence[int]] = None,
 ) -> List[StructureNode]:
     """
     Main entry point: Extract document structure using best available method.
@@ -336,6 +397,8 @@ def extract_structure(
         pdf_path: Path to PDF file (or None for non-PDF)
         text: Extracted plain text
         enable_heuristic: Whether to use heuristic fallback
+        sha256: Optional Phase 1 file digest (keys the shared page cache)
+        page_offsets: Optional page -> char offset map of ``text``
 
     Returns:
         List of StructureNode objects representing document hierarchy
@@ -345,11 +408,11 @@ def extract_structure(
     # Try PDF-specific methods first
     if pdf_path and Path(pdf_path).suffix.lower() == ".pdf":
         # Method 1: Embedded TOC
-        nodes = extract_pdf_toc(pdf_path)
+        nodes = anchor_nodes(extract_pdf_toc(pdf_path, sha256), text, page_offsets)
 
         # Method 2: Font analysis (if TOC didn't work)
         if not nodes:
-            nodes = extract_pdf_structure_by_fonts(pdf_path, text)
+            nodes = extract_pdf_structure_by_fonts(pdf_path, text, sha256, page_offsets)
 
     # Fallback: Heuristic detection
     if not nodes and enable_heuristic:
@@ -13,100 +13,107 @@ import re
 import unicodedata
 from typing import Tuple
 
+from pipeline_common.text_rules import Call, Replace, RuleTable, Sub
 
-def normalize_spaces(text: str) -> str:
-    """Collapse multiple spaces and tabs into single space."""
-    # First convert tabs to spaces
-    text = text.replace("\t", " ")
-    # Then collapse any multiple spaces (the winning formula from normalize_now.py)
-    text = re.sub(r" +", " ", text)
-    # Clean up excessive newlines
-    text = re.sub(r"\n\n\n+", "\n\n", text)
-    # Trim trailing whitespace from lines
-    text = "\n".join(line.rstrip() for line in text.split("\n"))
-    return text
+MULTI_SPACE_PATTERN = re.compile(r"  +")
+EXCESS_NEWLINES_PATTERN = re.compile(r"\n{4,}")
+OCEANOFPDF_PATTERN = re.compile(r"OceanofPDF\.com")
 
 
-def normalize_unicode(text: str) -> str:
-    """Normalize unicode characters (fancy quotes, etc.)."""
+def _strip_line_ends(text: str) -> str:
+    """Trim trailing whitespace from lines."""
+    return "\n".join(line.rstrip() for line in text.split("\n"))
+
+
+# Rules marked streamable=False can match across a paragraph break ("\n\n"),
+# which keeps the combined table from being streamed paragraph by paragraph.
+SPACE_RULES = [
+    # First convert tabs to spaces, then collapse any multiple spaces
+    Replace("tabs_to_spaces", {"\t": " "}),
+    Sub("collapse_spaces", r"  +", " ", requires=("  ",)),
+    # Clean up excessive newlines
+    Sub("collapse_newlines", r"\n\n\n+", "\n\n", requires=("\n\n\n",), streamable=False),
+    Call("strip_line_ends", _strip_line_ends),
+]
+
+UNICODE_REPLACEMENTS = {
+    "\u2018": "'",  # Left single quote
+    "\u2019": "'",  # Right single quote
+    "\u201c": '"',  # Left double quote
+    "\u201d": '"',  # Right double quote
+    "\u2013": "-",  # En dash
+    "\u2014": "--",  # Em dash
+    "\u2026": "...",  # Ellipsis
+}
+
+UNICODE_RULES = [
     # Normalize to NFKC (canonical decomposition + composition)
-    text = unicodedata.normalize("NFKC", text)
+    Call("nfkc", lambda text: unicodedata.normalize("NFKC", text)),
+    Replace("unicode_punctuation", UNICODE_REPLACEMENTS),
+]
 
-    # Replace common problematic characters
-    replacements = {
-        "\u2018": "'",  # Left single quote
-        "\u2019": "'",  # Right single quote
-        "\u201c": '"',  # Left double quote
-        "\u201d": '"',  # Right double quote
-        "\u2013": "-",  # En dash
-        "\u2014": "--",  # Em dash
-        "\u2026": "...",  # Ellipsis
-    }
+ARTIFACT_RULES = [
+    Sub("oceanofpdf", r"OceanofPDF\.com", "", flags=re.IGNORECASE, requires=(".com",)),
+    Sub("downloaded_from", r"Downloaded from.*\.com", "", flags=re.IGNORECASE, requires=(".com",)),
+    Sub("visit_us_at", r"Visit us at.*\.com", "", flags=re.IGNORECASE, requires=(".com",)),
+]
 
-    for old, new in replacements.items():
-        text = text.replace(old, new)
+PUNCTUATION_RULES = [
+    # Remove space before punctuation, ensure space after it (unless end of line)
+    Sub("space_before_punctuation", r"\s+([.,!?;:])", r"\1", streamable=False),
+    Sub("space_after_punctuation", r"([.,!?;:])([^\s\n])", r"\1 \2"),
+]
 
-    return text
+SPACE_TABLE = RuleTable("tts_spaces", SPACE_RULES)
+UNICODE_TABLE = RuleTable("tts_unicode", UNICODE_RULES)
+ARTIFACT_TABLE = RuleTable("tts_artifacts", ARTIFACT_RULES)
+PUNCTUATION_TABLE = RuleTable("tts_punctuation", PUNCTUATION_RULES)
+TTS_TABLE = RuleTable("tts", SPACE_RULES + UNICODE_RULES + ARTIFACT_RULES + PUNCTUATION_RULES)
 
 
-def remove_pdf_artifacts(text: str) -> str:
-    """Remove common PDF extraction artifacts."""
-    artifacts = [
-        r"OceanofPDF\.com",
-        r"Downloaded from.*\.com",
-        r"Visit us at.*\.com",
-    ]
+def normalize_spaces(text: str) -> str:
+    """Collapse multiple spaces and tabs into single space."""
+    return SPACE_TABLE.apply(text)[0]
 
-    for pattern in artifacts:
-        text = re.sub(pattern, "", text, flags=re.IGNORECASE)
 
-    return text
+def normalize_unicode(text: str) -> str:
+    """Normalize unicode characters (fancy quotes, etc.)."""
+    return UNICODE_TABLE.apply(text)[0]
 
 
-def fix_punctuation_spacing(text: str) -> str:
-    """Fix spacing around punctuation for better TTS prosody."""
-    # Remove space before punctuation
-    text = re.sub(r"\s+([.,!?;:])", r"\1", text)
+def remove_pdf_artifacts(text: str) -> str:
+    """Remove common PDF extraction artifacts."""
+    return ARTIFACT_TABLE.apply(text)[0]
 
-    # Ensure space after punctuation (unless end of line)
-    text = re.sub(r"([.,!?;:])([^\s\n])", r"\1 \2", text)
 
-    return text
+def fix_punctuation_spacing(text: str) -> str:
+    """Fix spacing around punctuation for better TTS prosody."""
+    return PUNCTUATION_TABLE.apply(text)[0]
 
 
 def normalize_for_tts(text: str) -> Tuple[str, dict]:
     """
-    Apply all TTS normalizations.
+    Apply all TTS normalizations in one compiled rule table.
 
     Returns:
-        (normalized_text, stats_dict)
+        (normalized_text, stats_dict); ``stats_dict["rule_counts"]`` holds
+        the number of substitutions made by each rule.
     """
     original_len = len(text)
 
     # Track changes
     stats = {"original_length": original_len, "changes": []}
 
-    # 1. Normalize spaces
-    before = len(re.findall(r" {2,}", text))
-    text = normalize_spaces(text)
-    after = len(re.findall(r" {2,}", text))
-    if before > after:
-        stats["changes"].append(
-            f"Collapsed {before - after} multiple-space instances"
-        )
-
-    # 2. Normalize unicode
-    text = normalize_unicode(text)
-    stats["changes"].append("Normalized unicode characters")
-
-    # 3. Remove PDF artifacts
-    text = remove_pdf_artifacts(text)
-    stats["changes"].append("Removed PDF artifacts")
-
-    # 4. Fix punctuation spacing
-    text = fix_punctuation_spacing(text)
-    stats["changes"].append("Fixed punctuation spacing")
+    before = sum(1 for _ in MULTI_SPACE_PATTERN.finditer(text))
+    text, counts = TTS_TABLE.apply(text)
+    # Space normalization leaves no runs of spaces behind
+    if before:
+        stats["changes"].append(f"Collapsed {before} multiple-space instances")
+    stats["changes"].extend(
+        ["Normalized unicode characters", "Removed PDF artifacts", "Fixed punctuation spacing"]
+    )
 
+    stats["rule_counts"] = counts
     stats["final_length"] = len(text)
     stats["size_change"] = len(text) - original_len
 
@@ -123,14 +130,14 @@ def validate_tts_readiness(text: str) -> Tuple[bool, list]:
     issues = []
 
     # Check for multiple spaces
-    multiple_spaces = len(re.findall(r" {2,}", text))
+    multiple_spaces = sum(1 for _ in MULTI_SPACE_PATTERN.finditer(text))
     if multiple_spaces > 0:
         issues.append(
             f"Found {multiple_spaces} multiple-space instances (will cause TTS pauses)"
         )
 
     # Check for excessive non-ASCII
-    non_ascii = len([c for c in text if ord(c) > 127])
+    non_ascii = len(text) - len(text.encode("ascii", "ignore"))
     non_ascii_pct = (non_ascii / len(text) * 100) if text else 0
     if non_ascii_pct > 5:
         issues.append(
@@ -139,12 +146,12 @@ def validate_tts_readiness(text: str) -> Tuple[bool, list]:
 
     # Check for common artifacts
     artifacts = [
-        ("OceanofPDF.com", r"OceanofPDF\.com"),
-        ("Multiple consecutive newlines", r"\n{4,}"),
+        ("OceanofPDF.com", OCEANOFPDF_PATTERN),
+        ("Multiple consecutive newlines", EXCESS_NEWLINES_PATTERN),
     ]
 
     for name, pattern in artifacts:
-        if re.search(pattern, text):
+        if pattern.search(text):
             issues.append(f"Found artifact: {name}")
 
     is_ready = len(issues) == 0
@@ -6,7 +6,9 @@ Validates the defense-in-depth safety net against text duplication.
 
 import pytest
 from phase2_extraction.dedupe import (
+    NearDuplicateIndex,
     dedupe_consecutive,
+    dedupe_near_duplicates,
     dedupe_paragraphs,
     dedupe_lines,
     validate_no_duplicates,
@@ -131,6 +133,89 @@ class TestValidateNoDuplicates:
         assert indices == []
 
 
+class TestNearDuplicates:
+    """Test windowed MinHash detection of boilerplate and repeated passages."""
+
+    PASSAGE = (
+        "The lighthouse keeper climbed the spiral stairs every evening at dusk, "
+        "counting the steps aloud as his father had done, and trimmed the wick "
+        "before the fog rolled in from the grey and restless sea beyond the point."
+    )
+
+    WORDS = ["gull", "rope", "tide", "salt", "lamp", "oar", "reef", "mast", "fog", "kelp", "bell", "pier"]
+
+    def _pages(self, count):
+        return [
+            f"THE LIGHTHOUSE  {page}\nThe {self.WORDS[page % 12]} and the {self.WORDS[(page * 5) % 12]} "
+            f"were all that {self.WORDS[(page * 7) % 12]} night left.\nThe Keeper's Log | {page + 100}"
+            for page in range(1, count + 1)
+        ]
+
+    def test_removes_running_headers_with_page_numbers(self):
+        """Should drop recurring header/footer lines but keep body lines."""
+        text, report = dedupe_near_duplicates("\n\n".join(self._pages(12)), boilerplate_action="remove")
+
+        assert "THE LIGHTHOUSE" not in text
+        assert "The Keeper's Log |" not in text
+        assert text.count("were all that") == 12
+        assert report.counts() == {"boilerplate": 24, "passage": 0}
+        assert report.to_dict()["findings"][0]["kind"] == "boilerplate"
+
+    def test_flags_boilerplate_by_default(self):
+        """Should report running headers without deleting them unless asked."""
+        text = "\n\n".join(self._pages(12))
+        flagged, report = dedupe_near_duplicates(text)
+        assert flagged == text
+        assert report.counts()["boilerplate"] == 24
+
+    def test_keeps_headings_markers_and_irregular_repeats(self):
+        """Should never drop chapter headings, markers, scene breaks or repeated dialogue."""
+        lines = []
+        for chapter in range(1, 11):
+            lines += [f"<CHAPTER:chapter_{chapter:03d}>", f"Chapter {chapter}", "* * * * * * * *"]
+            lines += ["He nodded."] * (chapter % 3 + 1)
+            lines += ['"Yes," she said.']
+            lines += [f"The {self.WORDS[chapter]} met the {self.WORDS[n]} by the water." for n in range(chapter * 7 % 10)]
+        text = "\n".join(lines)
+
+        clean, report = dedupe_near_duplicates(text, boilerplate_action="remove")
+        assert clean == text
+        assert report.counts()["boilerplate"] == 0
+
+    def test_flags_or_removes_non_adjacent_passages(self):
+        """Should keep the first copy and flag or drop later near-copies."""
+        near_copy = self.PASSAGE.replace("grey", "gray")
+        paragraphs = [self.PASSAGE, "An unrelated paragraph in between.", near_copy, "Another one."]
+        text = "\n\n".join(paragraphs)
+
+        flagged, report = dedupe_near_duplicates(text, passage_action="flag")
+        assert flagged == text
+        assert [(f.index, f.first_index) for f in report.findings] == [(2, 0)]
+        assert report.findings[0].similarity >= 0.85
+
+        removed, _ = dedupe_near_duplicates(text, passage_action="remove")
+        assert removed == "\n\n".join(paragraphs[:2] + paragraphs[3:])
+
+    def test_window_bounds_detection_and_memory(self):
+        """Should forget blocks older than the window."""
+        filler = [f"Filler paragraph {chr(65 + i % 26)}{i} with words." for i in range(30)]
+        text = "\n\n".join([self.PASSAGE, *filler, self.PASSAGE])
+
+        _, near = dedupe_near_duplicates(text, passage_action="flag", window=40)
+        _, far = dedupe_near_duplicates(text, passage_action="flag", window=10)
+        assert near.counts()["passage"] == 1
+        assert far.counts()["passage"] == 0
+
+        index = NearDuplicateIndex(window=10)
+        for position, paragraph in enumerate(filler):
+            index.add(position, paragraph)
+        assert len(index) == 10
+
+    def test_rejects_unknown_action(self):
+        with pytest.raises(ValueError):
+            dedupe_near_duplicates("text", boilerplate_action="delete")
+
+
 class TestRealWorldScenarios:
     """Test real-world duplication patterns from the bug report."""
 
@@ -0,0 +1,83 @@
+"""
+Tests for spine-ordered, chapter-parallel EPUB extraction.
+
+Tests verify that:
+1. Chapters come out in spine order with script/style text dropped
+2. Per-chapter structure nodes locate each chapter block in the joined text
+3. Process-pool parsing of a large book matches in-process parsing
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+epub_lib = pytest.importorskip("ebooklib.epub")
+
+from phase2_extraction.extractors import epub  # noqa: E402
+
+
+def _write_book(path: Path, chapters, spine_order=None, toc_titles=None) -> Path:
+    book = epub_lib.EpubBook()
+    book.set_identifier("test-book")
+    book.set_title("Test Book")
+    book.add_author("A. Writer")
+    items = []
+    for index, body in enumerate(chapters):
+        item = epub_lib.EpubHtml(title=f"c{index}", file_name=f"c{index}.xhtml", uid=f"c{index}")
+        item.content = f"<html><body>{body}</body></html>"
+        book.add_item(item)
+        items.append(item)
+    book.toc = [epub_lib.Link(f"c{index}.xhtml", title, f"toc{index}") for index, title in (toc_titles or {}).items()]
+    book.add_item(epub_lib.EpubNcx())
+    book.spine = [items[index] for index in (spine_order or range(len(items)))]
+    epub_lib.write_epub(str(path), book)
+    return path
+
+
+def test_chapters_follow_spine_with_structure(tmp_path):
+    path = _write_book(
+        tmp_path / "book.epub",
+        [
+            "<h1>Second</h1><p>Second chapter text.</p>",
+            "<h1>First</h1><script>var x = 1;</script><p>Opening <b>words</b> here.</p><style>p {}</style>",
+            "<p>   </p><div></div>",
+        ],
+        spine_order=[1, 0, 2],
+        toc_titles={1: "Chapter One"},
+    )
+
+    text, metadata = epub.extract(path, workers=1)
+
+    assert text == (
+        "<CHAPTER:c1>\nFirst\nOpening\nwords\nhere.\n\n"
+        "<CHAPTER:c0>\nSecond\nSecond chapter text."
+    )
+    assert metadata["chapter_count"] == 2
+    assert metadata["author"] == "A. Writer"
+    nodes = metadata["structure"]
+    assert [node["title"] for node in nodes] == ["Chapter One", "c0"]
+    for node in nodes:
+        block = text[node["char_offset"] : node["char_end"]]
+        assert block.startswith("<CHAPTER:") and block.endswith(".")
+
+
+def test_parallel_parse_matches_in_process(tmp_path, monkeypatch):
+    chapters = [f"<h2>Part {index}</h2><p>Body of part {index} &amp; more.</p>" for index in range(40)]
+    path = _write_book(tmp_path / "omnibus.epub", chapters)
+    monkeypatch.setattr(epub, "PARALLEL_MIN_ITEMS", 8)
+    monkeypatch.setattr(epub, "BATCH_ITEMS", 3)
+
+    sequential = epub.extract(path, workers=1)
+    parallel = epub.extract(path, workers=2)
+
+    assert parallel == sequential
+    assert sequential[1]["chapter_count"] == 40
+    assert "Body of part 39 & more." in sequential[0]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,97 @@
+"""
+Tests for the resumable OCR extractor.
+
+Tests verify that:
+1. Page results are cached and re-runs skip cached pages
+2. Only low-confidence pages are re-read at high DPI
+3. Pages are reassembled in page order
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+fitz = pytest.importorskip("pymupdf")
+
+
+class FakeReader:
+    """Stands in for easyocr.Reader: low confidence on odd pages at low DPI."""
+
+    calls = []
+
+    def __init__(self, languages, gpu=False, verbose=False):
+        pass
+
+    def readtext(self, image, paragraph=True):
+        index = len(FakeReader.calls)
+        FakeReader.calls.append(image.shape[0])
+        high_dpi = image.shape[0] > 1500
+        return [([0, 0, 0, 0], f"read {index} at {'high' if high_dpi else 'low'}", 0.9 if high_dpi else 0.4)]
+
+
+@pytest.fixture
+def ocr_module(monkeypatch):
+    from phase2_extraction.extractors import ocr
+
+    FakeReader.calls = []
+    monkeypatch.setattr(ocr, "EASYOCR_AVAILABLE", True)
+    monkeypatch.setattr(ocr, "easyocr", type("FakeEasyOCR", (), {"Reader": FakeReader}), raising=False)
+    return ocr
+
+
+@pytest.fixture
+def scanned_pdf(tmp_path):
+    path = tmp_path / "scan.pdf"
+    doc = fitz.open()
+    for _ in range(4):
+        doc.new_page()
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def test_low_confidence_pages_retry_at_high_dpi(ocr_module, scanned_pdf, tmp_path):
+    """Test that every page is read once at low DPI and retried only when unsure."""
+    text, metadata = ocr_module.extract(scanned_pdf, workers=0, cache_root=tmp_path / "cache", low_dpi=100)
+
+    assert metadata["pages_processed"] == 4
+    assert metadata["pages_retried_high_dpi"] == 4
+    assert len(FakeReader.calls) == 8
+    assert metadata["ocr_confidence_avg"] == pytest.approx(0.9)
+    assert text.split("\n\n") == [f"read {i} at high" for i in range(4, 8)]
+
+
+def test_rerun_skips_cached_pages(ocr_module, scanned_pdf, tmp_path):
+    """Test that a second run is served entirely from the page cache."""
+    cache_root = tmp_path / "cache"
+    first, _ = ocr_module.extract(scanned_pdf, workers=0, cache_root=cache_root, low_dpi=100)
+    FakeReader.calls = []
+
+    second, metadata = ocr_module.extract(scanned_pdf, workers=0, cache_root=cache_root, low_dpi=100)
+
+    assert second == first
+    assert metadata["pages_cached"] == 4
+    assert FakeReader.calls == []
+
+
+def test_partial_cache_resumes_missing_pages(ocr_module, scanned_pdf, tmp_path):
+    """Test that only pages missing from the cache are recognized."""
+    cache = ocr_module.OcrPageCache(tmp_path / "cache", "digest")
+    for index in (0, 1, 2):
+        cache.put(index, {"text": f"cached {index}", "confidence": 0.95, "detections": 1, "dpi": 100})
+
+    text, metadata = ocr_module.extract(
+        scanned_pdf, workers=0, sha256="digest", cache_root=tmp_path / "cache", low_dpi=100, high_dpi=100
+    )
+
+    assert metadata["pages_cached"] == 3
+    assert len(FakeReader.calls) == 1
+    assert text.split("\n\n") == ["cached 0", "cached 1", "cached 2", "read 0 at low"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,98 @@
+"""
+Tests for sample-first PDF backend selection.
+
+Tests verify that:
+1. The page sample is stratified across the document
+2. Sampled extraction matches exhaustive multi-pass output
+3. Poor pages fall back to another backend
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+fitz = pytest.importorskip("pymupdf")
+
+WORDS = "the and of to a in is that for it river story lantern harbour".split()
+
+
+@pytest.fixture
+def book_pdf(tmp_path, monkeypatch):
+    """40-page text PDF with an isolated page cache."""
+    import pipeline_common.pdf_page_cache as page_cache_module
+
+    monkeypatch.setenv("PIPELINE_PAGE_CACHE", "off")
+    monkeypatch.setattr(page_cache_module, "_REGISTRY", page_cache_module.OrderedDict())
+
+    path = tmp_path / "book.pdf"
+    doc = fitz.open()
+    for index in range(40):
+        page = doc.new_page()
+        for line in range(20):
+            words = [WORDS[(index + line + n) % len(WORDS)] for n in range(10)]
+            page.insert_text((50, 72 + 16 * line), " ".join(words), fontsize=10)
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def test_sample_pages_is_stratified():
+    """Test that the sample spans the whole document."""
+    from phase2_extraction.extraction import sample_pages
+
+    assert sample_pages(5, 12) == [0, 1, 2, 3, 4]
+    sample = sample_pages(600, 12)
+    assert len(sample) == 12
+    assert sample[0] < 50 and sample[-1] > 550
+
+
+def test_page_quality_flags_garbled_pages():
+    """Test the per-page score used for fallback."""
+    from phase2_extraction.extraction import page_quality
+
+    assert page_quality("A perfectly ordinary page of prose.") == 1.0
+    assert page_quality("   \n") == 0.0
+    assert page_quality("�� 12 34 �") < 0.5
+
+
+def test_sampled_matches_full_multipass(book_pdf):
+    """Test that sample-first selection reproduces exhaustive output."""
+    import pipeline_common.pdf_page_cache as page_cache_module
+    from phase2_extraction.extraction import extract_text_multipass
+
+    sampled = extract_text_multipass(book_pdf, sample_size=4, workers=1)
+    cache = page_cache_module.PdfPageCache.for_file(book_pdf)
+    assert cache.parses.get(sampled[1]) == 2  # sample pass + remaining pages
+
+    page_cache_module._REGISTRY.clear()
+    full = extract_text_multipass(book_pdf, strategy="full")
+    assert sampled == full
+
+
+def test_poor_pages_fall_back_to_other_backend(book_pdf, monkeypatch):
+    """Test that only poorly extracted pages are re-extracted."""
+    import pipeline_common.pdf_page_cache as page_cache_module
+    from phase2_extraction.extraction import extract_pages_sampled
+
+    original = page_cache_module._TEXT_READERS["pypdf"]
+
+    def garble_page_7(pdf_path, pages):
+        texts = original(pdf_path, pages)
+        if 7 in texts:
+            texts[7] = "�" * 40
+        return texts
+
+    monkeypatch.setitem(page_cache_module._TEXT_READERS, "pypdf", garble_page_7)
+    result = extract_pages_sampled(book_pdf, sample_size=4, workers=1)
+
+    assert result.method == "pypdf"
+    assert list(result.fallback_pages) == [7]
+    assert "�" not in result.pages[7] and result.pages[7].strip()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
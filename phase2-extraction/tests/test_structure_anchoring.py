@@ -0,0 +1,92 @@
+"""
+Tests for offset-indexed heading anchoring in structure detection.
+
+Tests verify that:
+1. page_offsets locates every page in the joined extraction text
+2. Repeated font-detected headings anchor to their own page, not the first match
+3. TOC entries are anchored by page, falling back to the page start
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from phase2_extraction import structure_detector  # noqa: E402
+from phase2_extraction.extraction import page_offsets  # noqa: E402
+from phase2_extraction.structure_detector import (  # noqa: E402
+    StructureNode,
+    anchor_nodes,
+    extract_pdf_structure_by_fonts,
+)
+
+HEADINGS = 1000
+
+
+class FakePageCache:
+    def __init__(self, page_spans):
+        self.page_spans = page_spans
+
+    def spans(self):
+        return self.page_spans
+
+
+def _book():
+    """A contents page naming every chapter, then one "CHAPTER" heading per page."""
+    pages = ["CONTENTS\n" + "\n".join("CHAPTER" for _ in range(HEADINGS))]
+    spans = [[["CONTENTS", 10.0, 0]]]
+    for index in range(HEADINGS):
+        body = f"Body of part {index}, where the previous chapter ends."
+        pages.append(f"CHAPTER\n{body}")
+        spans.append([["CHAPTER", 18.0, 16], [body, 10.0, 0]])
+    return pages, spans
+
+
+def test_page_offsets_locate_pages_in_joined_text():
+    pages = ["first", "", "third page"]
+    text = "\n".join(pages)
+    offsets = page_offsets(pages)
+
+    assert offsets[-1] == len(text)
+    assert [text[offsets[i] : offsets[i + 1]].strip("\n") for i in range(len(pages))] == pages
+    assert page_offsets([]) == [0]
+
+
+def test_repeated_headings_anchor_to_their_own_page(monkeypatch):
+    pages, spans = _book()
+    text = "\n".join(pages)
+    offsets = page_offsets(pages)
+    monkeypatch.setattr(structure_detector, "page_cache", lambda path, sha256=None: FakePageCache(spans))
+
+    nodes = extract_pdf_structure_by_fonts("book.pdf", text, page_offsets=offsets)
+
+    assert len(nodes) == HEADINGS
+    assert [node.char_offset for node in nodes] == offsets[1:HEADINGS + 1]
+    assert all(text.startswith("CHAPTER", node.char_offset) for node in nodes)
+
+    # Without the page map the cursor still keeps repeated titles apart
+    unindexed = extract_pdf_structure_by_fonts("book.pdf", text)
+    assert len({node.char_offset for node in unindexed}) == HEADINGS
+
+
+def test_toc_nodes_anchor_by_page():
+    pages = ["Contents: Prologue, Epilogue", "Prologue\nIt began.", "Some text", "EPILOGUE\nIt ended."]
+    text = "\n".join(pages)
+    offsets = page_offsets(pages)
+    nodes = [
+        StructureNode(level=0, title="Prologue", char_offset=0, char_end=0, page=2),
+        StructureNode(level=0, title="Missing", char_offset=0, char_end=0, page=3),
+        StructureNode(level=0, title="Epilogue", char_offset=0, char_end=0, page=4),
+    ]
+
+    anchored = anchor_nodes(nodes, text, offsets)
+
+    assert [node.char_offset for node in anchored] == [offsets[1], offsets[2], offsets[3]]
+    assert anchored[0].char_end == offsets[1] + len("Prologue")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,70 @@
+"""
+Tests for the TTS text normalizer.
+
+Tests verify that:
+1. The compiled table reproduces the individual normalization steps
+2. Substitution counts are reported per rule
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from phase2_extraction import tts_normalizer  # noqa: E402
+
+SAMPLE = (
+    "OceanofPDF.com\n\n\n\nChapter  One\t\n"
+    "“Wait,” she said — it’s late…  Visit us at example.com\n\n"
+    "He paused ,then left .Nobody   followed.   \n"
+)
+
+
+def test_table_matches_step_by_step_normalization():
+    """Test that one table pass equals the four helpers applied in order."""
+    expected = SAMPLE
+    for step in (
+        tts_normalizer.normalize_spaces,
+        tts_normalizer.normalize_unicode,
+        tts_normalizer.remove_pdf_artifacts,
+        tts_normalizer.fix_punctuation_spacing,
+    ):
+        expected = step(expected)
+
+    normalized, stats = tts_normalizer.normalize_for_tts(SAMPLE)
+
+    assert normalized == expected
+    assert normalized == tts_normalizer.TTS_TABLE.apply_reference(SAMPLE)
+    assert "OceanofPDF" not in normalized and "  " not in normalized
+    assert "she said -- it's late" in normalized
+    assert stats["changes"][0] == "Collapsed 4 multiple-space instances"
+
+
+def test_rule_counts_are_reported():
+    """Test that stats expose substitution counts per rule."""
+    _, stats = tts_normalizer.normalize_for_tts(SAMPLE)
+    counts = stats["rule_counts"]
+
+    assert counts["tabs_to_spaces"] == 1
+    assert counts["collapse_newlines"] == 1
+    assert counts["oceanofpdf"] == 1
+    assert counts["visit_us_at"] == 1
+    assert counts["unicode_punctuation"] == 4  # NFKC has already expanded the ellipsis
+
+
+def test_validate_counts_non_ascii_share():
+    """Test the readiness check on normalized and raw text."""
+    ready, issues = tts_normalizer.validate_tts_readiness("Plain ascii text.")
+    assert ready and issues == []
+
+    ready, issues = tts_normalizer.validate_tts_readiness("éééé  a")
+    assert not ready
+    assert any("multiple-space" in issue for issue in issues)
+    assert any("non-ASCII content (57.1%)" in issue for issue in issues)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -7,14 +7,50 @@ Uses rule-based heuristics to classify text into genres:
 - Academic: Citations, formal language, lists
 - Memoir: First-person, anecdotes
 - Technical: Instructions, code, formulas
+
+Marker words and phrases are counted in one token pass with the shared
+``KeywordScorer``, and results are cached by text digest.
 """
 
 import re
 import logging
+import sys
+from pathlib import Path
 from typing import Dict, Optional, Tuple
 
+try:
+    from pipeline_common.keyword_scorer import KeywordScorer, cached_result, text_digest
+except ImportError:  # imported from phase3-chunking/src without the repo root on sys.path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+    from pipeline_common.keyword_scorer import KeywordScorer, cached_result, text_digest
+
 logger = logging.getLogger(__name__)
 
+SAMPLE_CHARS = 5000
+HEURISTICS_VERSION = "1"  # part of the cache key; bump when the scoring rules change
+
+# Counted case-insensitively on whole words, like the regexes they replace
+_MARKERS = KeywordScorer(
+    {
+        "first_person": ["I", "my", "me", "mine"],
+        "dialogue": ["said", "replied", "asked", "answered", "exclaimed", "whispered"],
+        "abstract": [
+            "being",
+            "existence",
+            "nature",
+            "essence",
+            "truth",
+            "virtue",
+            "wisdom",
+            "knowledge",
+            "reality",
+        ],
+        "formal": ["therefore", "thus", "however", "furthermore", "moreover", "consequently"],
+        "anecdote": ["remember", "recall", "once", "when I was", "looking back"],
+        "instruction": ["step", "first", "next", "then", "finally", "install", "configure", "run"],
+    }
+)
+
 
 def detect_genre(
     text: str, metadata: Optional[Dict] = None
@@ -39,7 +75,21 @@ def detect_genre(
         return "auto", 0.0, {}
 
     metadata = metadata or {}
+    meta_text = (
+        f"{metadata.get('title', '')} {metadata.get('author', '')}".lower()
+    )
+    sample = text[:SAMPLE_CHARS]
+    genre, confidence, scores = cached_result(
+        "phase3_detect",
+        text_digest(sample, meta_text, _MARKERS.signature, HEURISTICS_VERSION),
+        lambda: list(_detect_genre(sample, meta_text)),
+    )
+    return genre, confidence, dict(scores)
+
 
+def _detect_genre(
+    sample: str, meta_text: str
+) -> Tuple[str, float, Dict[str, float]]:
     # Initialize scores
     scores = {
         "philosophy": 0.0,
@@ -50,10 +100,6 @@ def detect_genre(
     }
 
     # 1. Metadata-based detection (keywords in title/author)
-    meta_text = (
-        f"{metadata.get('title', '')} {metadata.get('author', '')}".lower()
-    )
-
     # Philosophy indicators
     if any(
         term in meta_text
@@ -107,8 +153,7 @@ def detect_genre(
         logger.debug("Metadata suggests technical")
 
     # 2. Text-based analysis
-    # Sample text for efficiency (use first 5000 chars)
-    sample = text[:5000]
+    # Sample text for efficiency (first SAMPLE_CHARS chars)
     sentences = sample.split(".")
     sentences = [s.strip() for s in sentences if s.strip()]
 
@@ -121,21 +166,14 @@ def detect_genre(
     quote_count = sample.count('"') + sample.count('"') + sample.count('"')
     quote_ratio = quote_count / len(sample) if sample else 0
 
-    # Count specific markers
-    first_person_count = len(
-        re.findall(r"\b(I|my|me|mine)\b", sample, re.IGNORECASE)
-    )
+    # Count specific markers (one token pass for every word list)
+    markers = _MARKERS.score(sample)
+    first_person_count = markers["first_person"]
     first_person_ratio = (
         first_person_count / len(sample.split()) if sample else 0
     )
 
-    dialogue_tags = len(
-        re.findall(
-            r"\b(said|replied|asked|answered|exclaimed|whispered)\b",
-            sample,
-            re.IGNORECASE,
-        )
-    )
+    dialogue_tags = markers["dialogue"]
     dialogue_ratio = dialogue_tags / len(sentences) if sentences else 0
 
     citation_count = len(
@@ -158,13 +196,7 @@ def detect_genre(
         )
 
         # Distinguish philosophy from academic
-        abstract_terms = len(
-            re.findall(
-                r"\b(being|existence|nature|essence|truth|virtue|wisdom|knowledge|reality)\b",
-                sample,
-                re.IGNORECASE,
-            )
-        )
+        abstract_terms = markers["abstract"]
         if abstract_terms > 5:
             scores["philosophy"] += 0.2
             logger.debug("Abstract philosophical terms detected")
@@ -185,13 +217,7 @@ def detect_genre(
         scores["academic"] += 0.3
         logger.debug(f"Citations detected ({citation_ratio:.3f})")
 
-    formal_indicators = len(
-        re.findall(
-            r"\b(therefore|thus|however|furthermore|moreover|consequently)\b",
-            sample,
-            re.IGNORECASE,
-        )
-    )
+    formal_indicators = markers["formal"]
     if formal_indicators > 3:
         scores["academic"] += 0.15
         logger.debug("Formal academic language detected")
@@ -213,13 +239,7 @@ def detect_genre(
         )
 
     # Check for anecdotal style
-    anecdote_markers = len(
-        re.findall(
-            r"\b(remember|recall|once|when I was|looking back)\b",
-            sample,
-            re.IGNORECASE,
-        )
-    )
+    anecdote_markers = markers["anecdote"]
     if anecdote_markers > 2:
         scores["memoir"] += 0.15
         logger.debug("Anecdotal style detected")
@@ -231,13 +251,7 @@ def detect_genre(
             f"Code/formulas detected (code: {code_markers}, formulas: {formula_markers})"
         )
 
-    instruction_markers = len(
-        re.findall(
-            r"\b(step|first|next|then|finally|install|configure|run)\b",
-            sample,
-            re.IGNORECASE,
-        )
-    )
+    instruction_markers = markers["instruction"]
     if instruction_markers > 5:
         scores["technical"] += 0.2
         logger.debug("Instructional language detected")
@@ -17,6 +17,10 @@ def _load_pipeline_common() -> Tuple[Any, ...]:
     if str(project_root) not in sys.path:
         sys.path.insert(0, str(project_root))
 
+    from pipeline_common import startup_profile
+
+    startup_profile.enable_if_requested("phase3_chunking")
+
     from pipeline_common import (
         PipelineState,
         StateError,
@@ -24,6 +28,8 @@ def _load_pipeline_common() -> Tuple[Any, ...]:
         ensure_phase_and_file,
     )
     from pipeline_common.state_manager import StateTransaction
+    from pipeline_common.fingerprint import file_sha256
+    from pipeline_common.chunk_journal import ChunkJournal, streaming_enabled
     from pipeline_common.astromech_notify import (
         play_success_beep,
         play_alert_beep,
@@ -37,6 +43,9 @@ def _load_pipeline_common() -> Tuple[Any, ...]:
         StateTransaction,
         play_success_beep,
         play_alert_beep,
+        file_sha256,
+        ChunkJournal,
+        streaming_enabled,
     )
 
 
@@ -48,6 +57,9 @@ def _load_pipeline_common() -> Tuple[Any, ...]:
     StateTransaction,
     play_success_beep,
     play_alert_beep,
+    _file_sha256,
+    ChunkJournal,
+    streaming_enabled,
 ) = _load_pipeline_common()
 
 # Smart import: works both as script and as module
@@ -268,13 +280,9 @@ def ensure_chunk_metadata(
     record.chunk_metadata = build_chunk_metadata(chunks or [], chunk_paths)
 
 
-def compute_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
-    """Compute SHA256 for change detection and reuse checks."""
-    sha = hashlib.sha256()
-    with path.open("rb") as handle:
-        for block in iter(lambda: handle.read(chunk_size), b""):
-            sha.update(block)
-    return sha.hexdigest()
+def compute_sha256(path: Path) -> str:
+    """Compute SHA256 for change detection and reuse checks (cached by stat data)."""
+    return _file_sha256(path)
 
 
 def find_monorepo_root(start_path: Path) -> Path:
@@ -345,6 +353,49 @@ def derive_chunk_id_from_path(path: Path, index: int) -> str:
     return f"chunk_{index:04d}"
 
 
+def open_chunk_journal(json_path: str, file_id: str) -> Optional[Any]:
+    """Phase 3 stream journal when the orchestrator runs phases 3-5 streamed."""
+    if not streaming_enabled():
+        return None
+    return ChunkJournal.for_stage(json_path, file_id, "phase3")
+
+
+def journal_plan(
+    journal: Optional[Any], chunks: List[str], voice: Optional[str]
+) -> None:
+    """
+    Tell Phase 4 about the whole book before the first chunk lands.
+
+    Engine choice, the budget estimate and the voice are whole-book
+    decisions; without this line Phase 4 would make them from whatever
+    its first poll of the journal happened to return.
+    """
+    if journal is None:
+        return
+    journal.write_plan(
+        chunks=len(chunks),
+        total_chars=sum(len(chunk) for chunk in chunks),
+        voice=voice,
+    )
+
+
+def journal_chunk(
+    journal: Optional[Any], index: int, chunk_path: str, voice: Optional[str]
+) -> None:
+    """Hand one saved chunk file to Phase 4 (no-op when not streaming)."""
+    if journal is None:
+        return
+    path = Path(chunk_path)
+    journal.append(
+        {
+            "chunk_id": derive_chunk_id_from_path(path, index),
+            "index": index,
+            "path": str(path),
+            "voice": voice,
+        }
+    )
+
+
 def hash_text_content(text: str) -> str:
     """Hash cleaned text for reuse detection."""
     return hashlib.sha256(text.encode("utf-8")).hexdigest()
@@ -772,6 +823,21 @@ def run_phase3(
             existing_phase3.get("structure_mode_used", False),
             fallback_used=False,
         )
+        journal = open_chunk_journal(json_path, file_id)
+        if journal is not None:
+            journal_plan(
+                journal,
+                [Path(p).read_text(encoding="utf-8") for p in existing_paths],
+                next(iter((record.chunk_voice_overrides or {}).values()), None)
+                or record.suggested_voice,
+            )
+        for idx, chunk_path_str in enumerate(existing_paths):
+            journal_chunk(
+                journal,
+                idx,
+                chunk_path_str,
+                (record.chunk_voice_overrides or {}).get(chunk_ids[idx]),
+            )
         return record
 
     # Genre detection
@@ -971,9 +1037,25 @@ def run_phase3(
     if not chunks:
         raise ValueError("No chunks created from text")
 
+    # Voice is chosen before saving so streamed chunks carry it to Phase 4
+    selected_voice = select_voice(
+        profile_name=detected_genre,
+        file_id=file_id,
+        pipeline_data=pipeline_data,
+        cli_override=getattr(config, "voice_override", None),
+    )
+    journal = open_chunk_journal(json_path, file_id)
+    journal_plan(journal, chunks, selected_voice)
     chunk_paths = [
         str(ensure_absolute_path(p))
-        for p in save_chunks(str(text_path_abs), chunks, chunks_dir)
+        for p in save_chunks(
+            str(text_path_abs),
+            chunks,
+            chunks_dir,
+            on_saved=lambda idx, path: journal_chunk(
+                journal, idx, path, selected_voice
+            ),
+        )
     ]
     chunk_ids = [
         derive_chunk_id_from_path(Path(p), idx)
@@ -1010,12 +1092,6 @@ def run_phase3(
 
     status = "success" if not errors else "partial"
 
-    selected_voice = select_voice(
-        profile_name=detected_genre,
-        file_id=file_id,
-        pipeline_data=pipeline_data,
-        cli_override=getattr(config, "voice_override", None),
-    )
     chunk_voice_overrides = {}
     if selected_voice:
         for idx, chunk_path_str in enumerate(chunk_paths):
@@ -1410,7 +1486,7 @@ def load_config(config_path: str) -> Phase3Config:
     )
 
 
-def main() -> None:
+def main(argv: Optional[List[str]] = None) -> None:
     """Main entry point for Phase 3 chunking."""
     logger.info(f"Starting Phase 3 from cwd: {os.getcwd()}")
 
@@ -1467,8 +1543,11 @@ def main() -> None:
         action="store_true",
         help="Silence astromech notifications (beeps are ON by default)",
     )
+    from pipeline_common import startup_profile
+
+    startup_profile.add_argument(parser)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
@@ -4,13 +4,26 @@ import logging
 import time
 import os
 import re
-from typing import List, Tuple, Optional, Dict, Any, TYPE_CHECKING
-import ftfy
-import spacy
-import nltk
-import textstat
+import sys
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, TYPE_CHECKING
 from langdetect import DetectorFactory
 
+try:
+    from pipeline_common.lazy_import import lazy_module
+except ImportError:  # imported from phase3-chunking/src without the repo root on sys.path
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+    from pipeline_common.lazy_import import lazy_module
+
+# spaCy alone takes seconds to import; load these on first use
+ftfy = lazy_module("ftfy")
+spacy = lazy_module("spacy")
+textstat = lazy_module("textstat")
+try:
+    nltk = lazy_module("nltk")  # kept for callers that patch utils.nltk; punkt is no longer fetched at import
+except ImportError:
+    nltk = None
+
 if TYPE_CHECKING:
     from .models import ValidationConfig
 
@@ -104,13 +117,6 @@ def get_sentence_model(model_name: str = "all-mpnet-base-v2"):
     return _model
 
 
-# Download NLTK data if needed
-try:
-    nltk.data.find("tokenizers/punkt")
-except LookupError:
-    nltk.download("punkt", quiet=True)
-
-
 def predict_duration(text: str, method: str = "chars") -> float:
     """
     Predict speech duration for text.
@@ -1566,9 +1572,17 @@ def assess_readability(chunks: List[str]) -> List[float]:
 
 
 def save_chunks(
-    text_path: str, chunks: List[str], output_dir: str
+    text_path: str,
+    chunks: List[str],
+    output_dir: str,
+    on_saved: Optional[Callable[[int, str], None]] = None,
 ) -> List[str]:
-    """Save chunks to individual files and return ABSOLUTE paths."""
+    """
+    Save chunks to individual files and return ABSOLUTE paths.
+
+    ``on_saved(index, path)`` is called as each file is written, so a
+    streaming consumer can start on it before the rest are saved.
+    """
     if not chunks:
         logger.warning("No chunks to save")
         return []
@@ -1604,6 +1618,8 @@ def save_chunks(
         except Exception as e:
             logger.error(f"Failed to save chunk {i+1}: {e}")
             raise
+        if on_saved is not None:
+            on_saved(i, str(chunk_path_abs))
 
     logger.info(f"Saved {len(chunk_paths)} chunks to {output_dir_abs}")
     return chunk_paths
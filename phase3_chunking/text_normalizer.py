@@ -17,6 +17,8 @@ import logging
 import re
 from typing import Dict, List, Optional, Tuple
 
+from pipeline_common.text_rules import Keywords, Replace, RuleTable, Sub
+
 logger = logging.getLogger(__name__)
 
 # Try to import num2words for number expansion
@@ -183,6 +185,29 @@ def _basic_number_to_words(n: int) -> str:
 # Punctuation Normalization
 # ---------------------------------------------------------------------------
 
+# Rules marked streamable=False look across whitespace and so can span a
+# paragraph break.
+PUNCTUATION_RULES = [
+    # Em-dash to comma (preserves pause intent without confusing G2P)
+    Replace("dashes", {'—': ', ', '–': ', '}),  # En-dash too
+    # Ellipsis to period (or comma for mid-sentence)
+    # Mid-sentence ellipsis (followed by lowercase)
+    Sub("mid_sentence_ellipsis", r'\.\.\.(?=\s+[a-z])', ',', requires=('...',), streamable=False),
+    # End-of-sentence ellipsis
+    Sub("ellipsis", r'\.\.\.', '.', requires=('...',)),
+    Replace("unicode_ellipsis", {'…': '.'}),
+    # Multiple exclamation/question marks
+    Sub("repeated_exclamation", r'[!]{2,}', '!', requires=('!!',)),
+    Sub("repeated_question", r'[?]{2,}', '?', requires=('??',)),
+    Sub("mixed_exclamation_question", r'[!?]{2,}', '?!', requires=('!!', '!?', '?!', '??')),
+    # Clean up double spaces from substitutions
+    Sub("collapse_whitespace", r'\s{2,}', ' ', streamable=False),
+    Sub("space_before_comma", r'\s+,', ',', streamable=False),
+]
+
+PUNCTUATION_TABLE = RuleTable("punctuation", PUNCTUATION_RULES)
+
+
 def normalize_punctuation(text: str) -> str:
     """
     Normalize problematic punctuation for TTS engines.
@@ -197,27 +222,7 @@ def normalize_punctuation(text: str) -> str:
         "Well..." -> "Well."
         "He said—and I quote—" -> "He said, and I quote,"
     """
-    # Em-dash to comma (preserves pause intent without confusing G2P)
-    text = re.sub(r'—', ', ', text)
-    text = re.sub(r'–', ', ', text)  # En-dash too
-
-    # Ellipsis to period (or comma for mid-sentence)
-    # Mid-sentence ellipsis (followed by lowercase)
-    text = re.sub(r'\.\.\.(?=\s+[a-z])', ',', text)
-    # End-of-sentence ellipsis
-    text = re.sub(r'\.\.\.', '.', text)
-    text = re.sub(r'…', '.', text)  # Unicode ellipsis
-
-    # Multiple exclamation/question marks
-    text = re.sub(r'[!]{2,}', '!', text)
-    text = re.sub(r'[?]{2,}', '?', text)
-    text = re.sub(r'[!?]{2,}', '?!', text)
-
-    # Clean up double spaces from substitutions
-    text = re.sub(r'\s{2,}', ' ', text)
-    text = re.sub(r'\s+,', ',', text)  # Remove space before comma
-
-    return text
+    return PUNCTUATION_TABLE.apply(text)[0]
 
 
 # ---------------------------------------------------------------------------
@@ -293,6 +298,27 @@ ABBREVIATIONS = {
 # "St." before a name = "Saint", before a street type = "Street"
 SAINT_PATTERN = re.compile(r'\bSt\.\s+([A-Z][a-z]+)(?!\s+(?:Street|Ave|Avenue|Rd|Road|Blvd))')
 
+# All keys share the same lookahead, so two candidate matches can only overlap
+# when one key ends with the other ("est."/"St."), and the earlier key is the
+# longer one; one ordered alternation therefore replaces exactly what the
+# former key-by-key loop did.
+ABBREVIATION_KEYWORDS = Keywords(
+    "abbreviations",
+    ABBREVIATIONS,
+    suffix=r'(?=\s|$|[,;:\'")\]])',  # Word boundary aware replacement
+    flags=re.IGNORECASE,
+)
+
+# Context-aware: "St." before a name (not street)
+ABBREVIATION_TABLE = RuleTable(
+    "abbreviations",
+    [
+        Sub("saint", SAINT_PATTERN.pattern, r'Saint \1', requires=('St.',), streamable=False),
+        ABBREVIATION_KEYWORDS,
+    ],
+)
+ABBREVIATION_TABLE_NO_CONTEXT = RuleTable("abbreviations_no_context", [ABBREVIATION_KEYWORDS])
+
 
 def expand_abbreviations(text: str, context_aware: bool = True) -> str:
     """
@@ -305,19 +331,8 @@ def expand_abbreviations(text: str, context_aware: bool = True) -> str:
     Returns:
         Text with abbreviations expanded
     """
-    result = text
-
-    # Context-aware: "St." before a name (not street)
-    if context_aware:
-        result = SAINT_PATTERN.sub(r'Saint \1', result)
-
-    # Direct replacements
-    for abbrev, expansion in ABBREVIATIONS.items():
-        # Word boundary aware replacement
-        pattern = re.compile(re.escape(abbrev) + r'(?=\s|$|[,;:\'")\]])', re.IGNORECASE)
-        result = pattern.sub(expansion, result)
-
-    return result
+    table = ABBREVIATION_TABLE if context_aware else ABBREVIATION_TABLE_NO_CONTEXT
+    return table.apply(text)[0]
 
 
 # ---------------------------------------------------------------------------
@@ -458,14 +473,19 @@ def normalize_for_tts(
         text = expand_percentages(text)
         metrics["percentage_expansions"] = len(before) != len(text)
 
+    rule_counts: Dict[str, int] = {}
+
     if normalize_punct:
         before = text
-        text = normalize_punctuation(text)
+        text, counts = PUNCTUATION_TABLE.apply(text)
+        rule_counts.update(counts)
         metrics["punctuation_changes"] = before != text
 
     if expand_abbrevs:
         before = text
-        text = expand_abbreviations(text, context_aware=context_aware)
+        table = ABBREVIATION_TABLE if context_aware else ABBREVIATION_TABLE_NO_CONTEXT
+        text, counts = table.apply(text)
+        rule_counts.update(counts)
         metrics["abbreviation_expansions"] = before != text
 
     if expand_ordinal_numbers:
@@ -481,6 +501,7 @@ def normalize_for_tts(
     # Calculate total changes
     metrics["changes"] = sum(1 for k, v in metrics.items() if k != "changes" and v)
     metrics["text_changed"] = original != text
+    metrics["rule_counts"] = rule_counts
 
     if metrics["text_changed"]:
         logger.debug(
@@ -0,0 +1,105 @@
+"""Long-lived Phase 4 worker that keeps TTS models loaded between books.
+
+Phase 7 starts a few of these (one per slot its RAM budget allows) and feeds
+them one book at a time instead of launching a fresh Phase 4 per book, so
+XTTS/Kokoro weights and voice latents are loaded once per worker rather than
+once per book.
+
+Protocol: one JSON job per line on stdin, one JSON reply per line on the
+original stdout.  Everything Phase 4 prints (logs, tqdm, C-level noise) is
+redirected to stderr so it cannot corrupt the reply stream.  EOF on stdin
+shuts the worker down.
+
+    job   {"file_id": "...", "json_path": "...", "engine": "xtts", "voice": null,
+           "language": null, "workers": 2, "resume": true}
+    reply {"file_id": "...", "exit_code": 0, "duration_sec": 12.3, "error": null}
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import time
+import traceback
+from pathlib import Path
+from typing import Any, Dict, Optional, TextIO
+
+ROOT = Path(__file__).resolve().parent
+JOB_FIELDS = ("file_id", "json_path", "engine", "voice", "language", "workers", "resume")
+
+
+def _claim_reply_stream() -> TextIO:
+    """Keep the real stdout for replies and point fd 1 at stderr."""
+    sys.stdout.flush()
+    replies = os.fdopen(os.dup(1), "w", encoding="utf-8", buffering=1)
+    os.dup2(2, 1)
+    sys.stdout = sys.stderr
+    return replies
+
+
+def _import_phase4():
+    for path in (ROOT / "src", ROOT, ROOT.parent):
+        if str(path) not in sys.path:
+            sys.path.insert(0, str(path))
+    import main_multi_engine  # noqa: WPS433 - loaded once per worker
+
+    return main_multi_engine
+
+
+def run_job(phase4, manager: Any, job: Dict[str, Any]) -> Dict[str, Any]:
+    kwargs = {key: job[key] for key in JOB_FIELDS if job.get(key) is not None}
+    started = time.perf_counter()
+    error: Optional[str] = None
+    try:
+        exit_code = int(phase4.execute_phase4(engine_manager=manager, **kwargs))
+    except SystemExit as exc:  # argparse errors inside main()
+        exit_code = exc.code if isinstance(exc.code, int) else 1
+        error = f"Phase 4 exited: {exc.code}"
+    except Exception as exc:  # pylint: disable=broad-except
+        exit_code = 1
+        error = f"{type(exc).__name__}: {exc}"
+        traceback.print_exc()
+    return {
+        "file_id": job.get("file_id"),
+        "exit_code": exit_code,
+        "duration_sec": round(time.perf_counter() - started, 3),
+        "error": error,
+    }
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Phase 4 warm engine worker")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument(
+        "--engines",
+        nargs="*",
+        help="Engines to register (default: every engine whose deps import)",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    replies = _claim_reply_stream()
+    os.chdir(ROOT)  # Phase 4 resolves config.yaml relative to its own dir
+
+    phase4 = _import_phase4()
+    manager = phase4.build_engine_manager(args.device, engines=args.engines or None)
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+        try:
+            job = json.loads(line)
+        except json.JSONDecodeError as exc:
+            reply = {"file_id": None, "exit_code": 2, "duration_sec": 0.0, "error": f"bad job: {exc}"}
+        else:
+            reply = run_job(phase4, manager, job)
+        replies.write(json.dumps(reply) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,7 +16,16 @@ import re
 from collections import Counter
 from pathlib import Path
 from typing import Dict, Any, Optional, Tuple
-import numpy as np
+
+from pipeline_common.lazy_import import lazy_module
+from pipeline_common.transcript_cache import (
+    TranscriptStore,
+    audio_digest,
+    openai_whisper_key,
+    segments_from_openai_whisper,
+)
+
+np = lazy_module("numpy")
 
 logger = logging.getLogger(__name__)
 
@@ -63,7 +72,7 @@ class ASRValidator:
     - Prosody issues (WER spike in specific regions)
     """
 
-    def __init__(self, model_size: str = "base"):
+    def __init__(self, model_size: str = "base", transcript_store: Optional[TranscriptStore] = None):
         """
         Initialize ASR validator.
 
@@ -72,9 +81,12 @@ class ASRValidator:
                        - "tiny": Fast, less accurate (good for quick checks)
                        - "base": Balanced (recommended)
                        - "small": More accurate, slower
+            transcript_store: Shared transcript cache; defaults to the
+                       pipeline store (disable with PIPELINE_TRANSCRIPT_CACHE=0)
         """
         self.model_size = model_size
         self.model = None
+        self.transcript_store = transcript_store if transcript_store is not None else TranscriptStore.from_env()
         self.wer_warning_threshold = 0.20  # 20% WER = yellow flag
         self.wer_critical_threshold = 0.40  # 40% WER = red flag
 
@@ -120,26 +132,31 @@ class ASRValidator:
                 "confidence": float    # ASR confidence (0.0 - 1.0)
             }
         """
-        self._load_model()
-
-        if self.model is None:
-            # ASR not available, assume valid
-            return {
-                "valid": True,
-                "wer": 0.0,
-                "transcription": "",
-                "issues": ["ASR validation unavailable"],
-                "recommendation": "pass",
-                "confidence": 0.0
-            }
-
-        whisper = _get_whisper()
-        if whisper is None:
-            return self._unavailable_result()
+        # A Tier 2 (or earlier Tier 3) pass may already have transcribed this audio
+        result = self._cached_transcript(audio_path)
+
+        if result is None:
+            self._load_model()
+
+            if self.model is None:
+                # ASR not available, assume valid
+                return {
+                    "valid": True,
+                    "wer": 0.0,
+                    "transcription": "",
+                    "issues": ["ASR validation unavailable"],
+                    "recommendation": "pass",
+                    "confidence": 0.0
+                }
+
+            whisper = _get_whisper()
+            if whisper is None:
+                return self._unavailable_result()
 
         try:
             # Transcribe audio
-            result = self.model.transcribe(str(audio_path))
+            if result is None:
+                result = self._transcribe(audio_path)
             transcription = result["text"].strip()
             confidence = self._calculate_confidence(result)
 
@@ -192,6 +209,25 @@ class ASRValidator:
                 "pronunciation_feedback_words": [],
             }
 
+    def _cached_transcript(self, audio_path: Path) -> Optional[Dict[str, Any]]:
+        """Transcript of ``audio_path`` from the shared store, if any."""
+        if self.transcript_store is None:
+            return None
+        try:
+            return self.transcript_store.get(audio_digest(audio_path), openai_whisper_key(self.model_size))
+        except OSError:
+            return None
+
+    def _transcribe(self, audio_path: Path) -> Dict[str, Any]:
+        """Run Whisper and record the transcript in the shared store."""
+        result = segments_from_openai_whisper(self.model.transcribe(str(audio_path)))
+        if self.transcript_store is not None:
+            try:
+                self.transcript_store.put(audio_digest(audio_path), openai_whisper_key(self.model_size), result)
+            except OSError as exc:
+                logger.debug(f"Could not cache transcript for {audio_path}: {exc}")
+        return result
+
     def _find_mispronounced_words(self, reference: str, hypothesis: str) -> list[str]:
         """
         Identify substituted words that are likely mispronunciations.
@@ -18,12 +18,15 @@ from pathlib import Path
 from typing import Optional, Tuple, Dict, Any
 import numpy as np
 
+from pipeline_common.lazy_import import lazy_module
+from pipeline_common.loudness import master_in_place
+
 logger = logging.getLogger(__name__)
 
 # Try to import pyloudnorm for LUFS-based normalization
 PYLOUDNORM_AVAILABLE = False
 try:
-    import pyloudnorm as pyln
+    pyln = lazy_module("pyloudnorm")  # pulls in scipy.signal; loaded on first meter
     PYLOUDNORM_AVAILABLE = True
     logger.debug("✅ pyloudnorm available for LUFS-based mastering")
 except ImportError:
@@ -221,11 +224,17 @@ def master_audio_chunk(
     """
     Apply full ACX-compliant mastering chain to synthesized audio.
 
-    Chain:
+    Chain (shared with Phase 5 via ``pipeline_common.loudness``):
     1. Loudness normalization to target LUFS
     2. True peak limiting at max_peak_db
     3. Optional noise gate for XTTS room tone
 
+    Loudness gain and the peak ceiling are applied as a single in-place
+    multiply on a float32 buffer; output levels are derived from the one
+    input analysis unless the gate forces a re-measure.  The chain runs on a
+    float32 copy, so ``audio`` is left untouched if mastering fails midway
+    and callers can fall back to it.
+
     Args:
         audio: Input audio samples (numpy array)
         sample_rate: Audio sample rate
@@ -237,6 +246,56 @@ def master_audio_chunk(
     Returns:
         Tuple of (mastered_audio, metrics_dict)
     """
+    if audio.ndim != 1:
+        return _master_audio_chunk_legacy(
+            audio, sample_rate, target_lufs, max_peak_db, apply_gate, gate_threshold_db
+        )
+
+    input_noise_floor_db = calculate_noise_floor_db(audio)
+    result = master_in_place(
+        np.array(audio, dtype=np.float32, order="C"),
+        sample_rate,
+        target_lufs=target_lufs,
+        ceiling_db=max_peak_db,
+        gate_threshold_db=gate_threshold_db if apply_gate else None,
+    )
+    mastered = result.audio
+
+    metrics = {
+        "input_rms_db": result.input.rms_db,
+        "input_peak_db": result.input.peak_db,
+        "input_true_peak_db": result.input.true_peak_db,
+        "input_lufs": result.input.lufs,
+        "input_noise_floor_db": input_noise_floor_db,
+        "output_rms_db": result.output.rms_db,
+        "output_peak_db": result.output.peak_db,
+        "output_true_peak_db": result.output.true_peak_db,
+        "output_lufs": result.output.lufs,
+        "output_noise_floor_db": calculate_noise_floor_db(mastered),
+        "gain_db": result.gain_db,
+        "limiter_db": result.limiter_db,
+        "target_lufs": target_lufs,
+        "max_peak_db": max_peak_db,
+        "gate_applied": apply_gate,
+    }
+
+    logger.debug(
+        f"Mastering: LUFS {metrics['input_lufs']:.1f} -> {metrics['output_lufs']:.1f}, "
+        f"Peak {metrics['input_peak_db']:.1f} -> {metrics['output_peak_db']:.1f}dB"
+    )
+
+    return mastered, metrics
+
+
+def _master_audio_chunk_legacy(
+    audio: np.ndarray,
+    sample_rate: int,
+    target_lufs: float,
+    max_peak_db: float,
+    apply_gate: bool,
+    gate_threshold_db: float,
+) -> Tuple[np.ndarray, Dict[str, Any]]:
+    """Multi-channel path; the fused chain in pipeline_common is mono-only."""
     metrics = {
         "input_rms_db": calculate_rms_db(audio),
         "input_peak_db": calculate_peak_db(audio),
@@ -244,23 +303,11 @@ def master_audio_chunk(
         "input_noise_floor_db": calculate_noise_floor_db(audio),
     }
 
-    logger.debug(
-        f"Mastering input: RMS={metrics['input_rms_db']:.1f}dB, "
-        f"Peak={metrics['input_peak_db']:.1f}dB, "
-        f"LUFS={metrics['input_lufs']:.1f}"
-    )
-
-    # Step 1: Loudness normalization
     audio = apply_loudness_normalization(audio, sample_rate, target_lufs)
-
-    # Step 2: True peak limiting
     audio = apply_true_peak_limiter(audio, max_peak_db)
-
-    # Step 3: Optional noise gate
     if apply_gate:
         audio = apply_noise_gate(audio, gate_threshold_db)
 
-    # Calculate output metrics
     metrics.update({
         "output_rms_db": calculate_rms_db(audio),
         "output_peak_db": calculate_peak_db(audio),
@@ -270,13 +317,6 @@ def master_audio_chunk(
         "max_peak_db": max_peak_db,
         "gate_applied": apply_gate,
     })
-
-    logger.debug(
-        f"Mastering output: RMS={metrics['output_rms_db']:.1f}dB, "
-        f"Peak={metrics['output_peak_db']:.1f}dB, "
-        f"LUFS={metrics['output_lufs']:.1f}"
-    )
-
     return audio, metrics
 
 
@@ -5,7 +5,9 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
-import soundfile as sf
+from pipeline_common.lazy_import import lazy_module
+
+sf = lazy_module("soundfile")
 
 logger = logging.getLogger(__name__)
 
@@ -20,31 +20,44 @@ from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor
 from concurrent.futures import wait
 from dataclasses import dataclass
 from pathlib import Path, PureWindowsPath
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
-import numpy as np
-import soundfile as sf
-import yaml
+from pipeline_common import startup_profile
+
+startup_profile.enable_if_requested("phase4_tts")
+
+# Heavy modules load on first use, so --help and single-chunk retries stay fast
+from pipeline_common.lazy_import import lazy_module, optional_import  # noqa: E402
+
+np = lazy_module("numpy")
+sf = lazy_module("soundfile")
+yaml = lazy_module("yaml")
 
 try:
-    import psutil
+    psutil = lazy_module("psutil")
 except (
     ImportError
 ):  # psutil is optional; CPU guard will be disabled if missing
     psutil = None
 try:
-    from tqdm import tqdm
+    tqdm = lazy_module("tqdm")
 except ImportError:
     tqdm = None
 
-from pipeline_common import (
+from pipeline_common import (  # noqa: E402
     PipelineState,
     ensure_phase_and_file,
     ensure_phase_block,
 )
-from pipeline_common.astromech_notify import play_alert_beep, play_success_beep
-from pipeline_common.state_manager import StateTransaction
-from io_helpers import validate_audio_file
+from pipeline_common.astromech_notify import play_alert_beep, play_success_beep  # noqa: E402
+from pipeline_common.chunk_journal import (  # noqa: E402
+    POLL_INTERVAL,
+    ChunkJournal,
+    JournalReader,
+    streaming_enabled,
+)
+from pipeline_common.state_manager import StateTransaction  # noqa: E402
+from io_helpers import validate_audio_file  # noqa: E402
 
 # ASR validation (opt-in)
 try:
@@ -52,30 +65,25 @@ try:
 except ImportError:
     ASRValidator = None  # type: ignore
 
-# Llama rewriter for ASR-driven fixes (opt-in)
-try:
-    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-    from agents.llama_rewriter import LlamaRewriter
-except ImportError:
-    LlamaRewriter = None  # type: ignore
+# Llama agents (opt-in).  Importing any of them loads the whole agents
+# package, so they are resolved by optional_import() where they are used:
+#   LlamaRewriter       - ASR-driven text fixes
+#   LlamaPreValidator   - proactive text analysis
+#   LlamaChunkReviewer  - post-batch quality analysis
+#   LlamaPacingAgent    - dynamic pacing
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+_LLAMA_AGENT_MODULES = {
+    "LlamaRewriter": "agents.llama_rewriter",
+    "LlamaPreValidator": "agents.llama_pre_validator",
+    "LlamaChunkReviewer": "agents.llama_chunk_reviewer",
+    "LlamaPacingAgent": "agents.llama_pacing_agent",
+}
 
-# Llama pre-validator for proactive text analysis (opt-in)
-try:
-    from agents.llama_pre_validator import LlamaPreValidator
-except ImportError:
-    LlamaPreValidator = None  # type: ignore
 
-# Llama chunk reviewer for post-batch quality analysis (opt-in)
-try:
-    from agents.llama_chunk_reviewer import LlamaChunkReviewer
-except ImportError:
-    LlamaChunkReviewer = None  # type: ignore
+def _llama_agent(name: str) -> Any:
+    """Agent class ``name``, imported on first use; None if the agents package is unavailable."""
+    return optional_import(_LLAMA_AGENT_MODULES[name], name)
 
-# Llama pacing agent for dynamic pacing (opt-in)
-try:
-    from agents.llama_pacing_agent import LlamaPacingAgent
-except ImportError:
-    LlamaPacingAgent = None  # type: ignore
 
 # Audio mastering for ACX compliance (2026-01 addition)
 # Reference: TTS_VALIDATION_RESEARCH_FINDINGS.md
@@ -146,7 +154,8 @@ if not hasattr(StateTransaction, "update_phase"):
 # Add engines + shared utils to path
 sys.path.insert(0, str(MODULE_ROOT.parent))
 
-from engines.engine_manager import EngineManager  # noqa: E402
+if TYPE_CHECKING:  # imported in build_engine_manager(); engines pull in numpy and backends
+    from engines.engine_manager import EngineManager
 
 try:  # Import as package when executed via `python -m`
     from .utils import (
@@ -270,12 +279,20 @@ def load_pipeline_json(json_path: Path) -> Dict[str, Any]:
 
 
 def estimate_audio_seconds(
-    chunks: List[ChunkPayload], chars_per_min: int = DEFAULT_CHARS_PER_MINUTE
+    chunks: List[ChunkPayload],
+    chars_per_min: int = DEFAULT_CHARS_PER_MINUTE,
+    total_chars: Optional[int] = None,
 ) -> float:
-    """Estimate total audio length (seconds) from chunk text sizes."""
+    """Estimate total audio length (seconds) from chunk text sizes.
+
+    ``total_chars`` (the whole book, from Phase 3's streaming plan) wins
+    over the chunks when given, since a streamed ``chunks`` list is only
+    the first batch.
+    """
     if chars_per_min <= 0:
         chars_per_min = DEFAULT_CHARS_PER_MINUTE
-    total_chars = sum(len(c.text) for c in chunks)
+    if total_chars is None:
+        total_chars = sum(len(c.text) for c in chunks)
     return (total_chars / chars_per_min) * 60.0
 
 
@@ -285,12 +302,15 @@ def choose_engine_auto(
     rt_xtts: float = 3.2,
     rt_kokoro: float = 1.3,
     chars_per_min: int = DEFAULT_CHARS_PER_MINUTE,
+    total_chars: Optional[int] = None,
 ) -> Tuple[str, str]:
     """
     Heuristic engine selector: pick Kokoro when estimated XTTS wall time greatly exceeds Kokoro.
     Returns (engine_name, reason).
     """
-    est_audio = estimate_audio_seconds(chunks, chars_per_min=chars_per_min)
+    est_audio = estimate_audio_seconds(
+        chunks, chars_per_min=chars_per_min, total_chars=total_chars
+    )
     xtts_time = est_audio * rt_xtts
     kokoro_time = est_audio * rt_kokoro
 
@@ -371,6 +391,45 @@ def derive_chunk_id(path: Path, index: int) -> str:
     return f"chunk_{index:04d}"
 
 
+def build_chunk_payload(
+    raw_path: str,
+    index: int,
+    pipeline_json: Optional[Path] = None,
+    voice_overrides_map: Optional[Dict[str, str]] = None,
+    enable_g2p: bool = False,
+    normalize_numbers: bool = True,
+    custom_overrides: Optional[Dict[str, str]] = None,
+    pronunciation_lexicon: Optional[Dict[str, Any]] = None,
+) -> Optional[ChunkPayload]:
+    """Read and sanitize one chunk file; None when the file is empty."""
+    chunk_path = normalize_pipeline_path(raw_path, pipeline_json=pipeline_json)
+    if not chunk_path.exists():
+        raise FileNotFoundError(f"Chunk file not found: {raw_path}")
+
+    text = chunk_path.read_text(encoding="utf-8").strip()
+    if not text:
+        logger.warning("Chunk %s is empty: %s", index, chunk_path)
+        return None
+
+    chunk_id = derive_chunk_id(chunk_path, index)
+    sanitized = sanitize_text_for_tts(
+        text,
+        enable_g2p=enable_g2p,
+        normalize_numbers=normalize_numbers,
+        custom_overrides=custom_overrides,
+        pronunciation_lexicon=pronunciation_lexicon,
+    )
+    voice_override = None
+    if voice_overrides_map:
+        # Allow matching by chunk_id or file name (with/without extension)
+        voice_override = voice_overrides_map.get(chunk_id)
+        if not voice_override:
+            voice_override = voice_overrides_map.get(chunk_path.name)
+            if not voice_override:
+                voice_override = voice_overrides_map.get(chunk_path.stem)
+    return ChunkPayload(chunk_id, sanitized, chunk_path, voice_override, index)
+
+
 def collect_chunks(
     pipeline_data: Dict[str, Any],
     file_id: str,
@@ -415,38 +474,18 @@ def collect_chunks(
 
     chunk_payloads: List[ChunkPayload] = []
     for index, raw_path in enumerate(chunk_paths):
-        chunk_path = normalize_pipeline_path(
-            raw_path, pipeline_json=pipeline_json
-        )
-        if not chunk_path.exists():
-            raise FileNotFoundError(f"Chunk file not found: {raw_path}")
-
-        text = chunk_path.read_text(encoding="utf-8").strip()
-        if not text:
-            logger.warning("Chunk %s is empty: %s", index, chunk_path)
-            continue
-
-        chunk_id = derive_chunk_id(chunk_path, index)
-        sanitized = sanitize_text_for_tts(
-            text,
+        payload = build_chunk_payload(
+            raw_path,
+            index,
+            pipeline_json=pipeline_json,
+            voice_overrides_map=voice_overrides_map,
             enable_g2p=enable_g2p,
             normalize_numbers=normalize_numbers,
             custom_overrides=custom_overrides,
             pronunciation_lexicon=pronunciation_lexicon,
         )
-        voice_override = None
-        if voice_overrides_map:
-            # Allow matching by chunk_id or file name (with/without extension)
-            voice_override = voice_overrides_map.get(chunk_id)
-            if not voice_override:
-                voice_override = voice_overrides_map.get(chunk_path.name)
-                if not voice_override:
-                    voice_override = voice_overrides_map.get(chunk_path.stem)
-        chunk_payloads.append(
-            ChunkPayload(
-                chunk_id, sanitized, chunk_path, voice_override, index
-            )
-        )
+        if payload is not None:
+            chunk_payloads.append(payload)
 
     if chunk_index is not None:
         if chunk_index < 0 or chunk_index >= len(chunk_payloads):
@@ -471,6 +510,49 @@ def collect_chunks(
     return resolved, chunk_payloads
 
 
+def poll_streamed_chunks(
+    reader: JournalReader,
+    pipeline_json: Optional[Path] = None,
+    **payload_kwargs: Any,
+) -> List[ChunkPayload]:
+    """Chunks Phase 3 has journaled since the last poll (streaming mode)."""
+    payloads = []
+    for record in reader.poll():
+        voice = record.get("voice")
+        payload = build_chunk_payload(
+            record["path"],
+            int(record.get("index", 0)),
+            pipeline_json=pipeline_json,
+            voice_overrides_map={record["chunk_id"]: voice} if voice else None,
+            **payload_kwargs,
+        )
+        if payload is not None:
+            payloads.append(payload)
+    return payloads
+
+
+def journal_chunk_result(
+    journal: Optional[ChunkJournal], result: ChunkResult, chunk: ChunkPayload
+) -> None:
+    """Hand a WAV that passed validation to Phase 5 (streaming mode only)."""
+    if journal is None or not result.success or result.output_path is None:
+        return
+    rt_factor = result.rt_factor
+    journal.append(
+        {
+            "chunk_id": result.chunk_id,
+            "index": chunk.index,
+            "audio_path": str(result.output_path),
+            "text_len": result.text_len,
+            "est_dur": result.est_dur,
+            "engine": result.engine_used,
+            "rt_factor": float(rt_factor) if rt_factor is not None and np.isfinite(rt_factor) else None,
+            "validation_reason": result.validation_reason,
+            "validation_details": result.validation_details,
+        }
+    )
+
+
 def get_book_dir(file_id: str) -> Path:
     """Gets the dedicated directory for a book's metadata."""
     return PROJECT_ROOT / ".pipeline" / "books" / file_id
@@ -484,9 +566,13 @@ def select_voice(
     voices_config_path: Path,
     voices_config: Optional[Dict[str, Any]] = None,
     production_bible: Optional[Dict[str, Any]] = None,
+    phase3_voice: Optional[str] = None,
 ) -> Tuple[str, Optional[Path], Dict[str, Any]]:
     """Determine voice to use and return (voice_id, reference_path, engine_params).
 
+    ``phase3_voice`` is the voice Phase 3 announced in its streaming plan;
+    when streaming, pipeline.json has no Phase 3 entry for this run yet.
+
     Returns:
         Tuple of (voice_id, reference_path, engine_params)
         - For built-in voices: reference_path is None, voice name is in engine_params
@@ -523,7 +609,9 @@ def select_voice(
         selected_voice = production_bible["character_map"]["narrator"]["assigned_voice"]
         logger.info(f"Using Production Bible narrator voice: {selected_voice}")
     else:
-        selected_voice = get_selected_voice_from_phase3(str(pipeline_json), file_id)
+        selected_voice = phase3_voice or get_selected_voice_from_phase3(
+            str(pipeline_json), file_id
+        )
         if selected_voice:
             logger.info(f"Using Phase 3 selected voice: {selected_voice}")
 
@@ -912,9 +1000,9 @@ def synthesize_chunk_with_engine(
     pre_validator_auto_expand = getattr(validation_config, "pre_validator_auto_expand", True) if validation_config else True
     pre_validator_use_llm = getattr(validation_config, "pre_validator_use_llm", False) if validation_config else False
 
-    if pre_validator_enabled and LlamaPreValidator is not None:
+    if pre_validator_enabled and _llama_agent("LlamaPreValidator") is not None:
         try:
-            pre_validator = LlamaPreValidator()
+            pre_validator = _llama_agent("LlamaPreValidator")()
 
             # Quick pattern-based check first
             is_clean, issue_types = pre_validator.quick_check(synthesis_text)
@@ -989,9 +1077,9 @@ def synthesize_chunk_with_engine(
             and getattr(validation_config, "enable_llama_pacing_agent", False)
             and not os.environ.get("DISABLE_PACING_AGENT", "").lower() in ("1", "true", "yes")
         )
-        if pacing_agent_enabled and LlamaPacingAgent is not None:
+        if pacing_agent_enabled and _llama_agent("LlamaPacingAgent") is not None:
             try:
-                pacing_agent = LlamaPacingAgent()
+                pacing_agent = _llama_agent("LlamaPacingAgent")()
                 pacing_hint = pacing_agent.get_pacing_hint(synthesis_text)
             except Exception as exc:
                 logger.warning(
@@ -1753,7 +1841,7 @@ def synthesize_chunk_with_engine(
                     )
                     if (
                         asr_result["recommendation"] == "rewrite"
-                        and LlamaRewriter is not None
+                        and _llama_agent("LlamaRewriter") is not None
                         and llama_rewriter_enabled
                     ):
                         logger.info(
@@ -1761,7 +1849,7 @@ def synthesize_chunk_with_engine(
                             chunk.chunk_id
                         )
                         try:
-                            llama_rewriter = LlamaRewriter()
+                            llama_rewriter = _llama_agent("LlamaRewriter")()
                             rewrite_result = llama_rewriter.rewrite_from_asr_feedback(
                                 original_text=synthesis_text,  # Use synthesized text
                                 asr_transcription=asr_result["transcription"],
@@ -2121,9 +2209,9 @@ def update_phase4_summary(
         # LLM-powered chunk quality review (opt-in, runs after batch completes)
         chunk_review = None
         enable_chunk_review = not os.environ.get("DISABLE_CHUNK_REVIEWER", "").lower() in ("1", "true", "yes")
-        if enable_chunk_review and LlamaChunkReviewer is not None and failed > 0:
+        if enable_chunk_review and _llama_agent("LlamaChunkReviewer") is not None and failed > 0:
             try:
-                reviewer = LlamaChunkReviewer()
+                reviewer = _llama_agent("LlamaChunkReviewer")()
                 # Convert ChunkResult objects to dicts for reviewer
                 result_dicts = [
                     {
@@ -2270,6 +2358,8 @@ def build_engine_manager(
     device: str, engines: Optional[List[str]] = None
 ) -> EngineManager:
     """Build engine manager while skipping engines whose deps are unavailable."""
+    from engines.engine_manager import EngineManager
+
     manager = EngineManager(device=device)
 
     # Lazy import only requested engines to avoid dep conflicts
@@ -2311,7 +2401,16 @@ def build_engine_manager(
     return manager
 
 
-def main(argv: Optional[List[str]] = None) -> int:
+def main(
+    argv: Optional[List[str]] = None,
+    engine_manager: Optional[EngineManager] = None,
+) -> int:
+    """Run Phase 4 for one file.
+
+    ``engine_manager`` lets a long-lived caller (the Phase 7 engine worker)
+    hand in a manager whose models are already loaded, so consecutive books
+    reuse them instead of paying the load again.
+    """
     parser = argparse.ArgumentParser(
         description="Phase 4: Multi-Engine TTS Synthesis"
     )
@@ -2450,6 +2549,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         help="Override Tier 2 always-validate last N chunks.",
     )
 
+    startup_profile.add_argument(parser)
     args = parser.parse_args(argv)
 
     json_path = Path(args.json_path).resolve()
@@ -2563,16 +2663,48 @@ def main(argv: Optional[List[str]] = None) -> int:
     )
 
     pronunciation_lexicon = production_bible.get("pronunciation_lexicon")
-    resolved_file_id, chunks = collect_chunks(
-        pipeline_data,
-        args.file_id,
-        chunk_index=args.chunk_id,
-        pipeline_json=json_path,
+    payload_kwargs = dict(
         enable_g2p=enable_g2p,
         normalize_numbers=normalize_numbers,
         custom_overrides=custom_overrides,
         pronunciation_lexicon=pronunciation_lexicon,
     )
+
+    # Streaming mode: the orchestrator runs Phase 3 alongside us and hands
+    # over chunks through journals instead of pipeline.json
+    phase3_stream: Optional[JournalReader] = None
+    phase3_plan: Dict[str, Any] = {}
+    phase4_journal: Optional[ChunkJournal] = None
+    if streaming_enabled():
+        phase3_journal = ChunkJournal.for_stage(json_path, args.file_id, "phase3")
+        if args.chunk_id is None and phase3_journal.exists():
+            phase3_stream = phase3_journal.reader()
+        journal = ChunkJournal.for_stage(json_path, args.file_id, "phase4")
+        phase4_journal = journal if journal.exists() else None
+
+    if phase3_stream is not None:
+        logger.info("Streaming chunks from %s", phase3_stream.path)
+        resolved_file_id = args.file_id
+        chunks = poll_streamed_chunks(phase3_stream, json_path, **payload_kwargs)
+        while not chunks and not phase3_stream.sealed:
+            time.sleep(POLL_INTERVAL)
+            chunks = poll_streamed_chunks(phase3_stream, json_path, **payload_kwargs)
+        # Phase 3 writes its plan before the first chunk, so engine, budget
+        # and voice below are decided for the whole book, not this batch
+        phase3_plan = phase3_stream.plan or {}
+        if not phase3_plan:
+            logger.warning(
+                "Phase 3 journal has no plan; engine, budget and voice are decided from the first %d streamed chunk(s).",
+                len(chunks),
+            )
+    else:
+        resolved_file_id, chunks = collect_chunks(
+            pipeline_data,
+            args.file_id,
+            chunk_index=args.chunk_id,
+            pipeline_json=json_path,
+            **payload_kwargs,
+        )
     if not chunks:
         logger.error("No chunks discovered for %s", args.file_id)
         if (
@@ -2609,7 +2741,9 @@ def main(argv: Optional[List[str]] = None) -> int:
         )
     engine_selected = engine_requested
     est_audio_seconds = estimate_audio_seconds(
-        chunks, chars_per_min=chars_per_minute
+        chunks,
+        chars_per_min=chars_per_minute,
+        total_chars=phase3_plan.get("total_chars"),
     )
     if auto_engine_enabled:
         engine_selected, reason = choose_engine_auto(
@@ -2618,6 +2752,7 @@ def main(argv: Optional[List[str]] = None) -> int:
             rt_xtts=float(config.get("rt_xtts_factor", 3.2)),
             rt_kokoro=float(config.get("rt_kokoro_factor", 1.3)),
             chars_per_min=chars_per_minute,
+            total_chars=phase3_plan.get("total_chars"),
         )
         logger.info(
             "Auto-engine decision: %s (requested=%s, selected=%s)",
@@ -2696,6 +2831,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         voices_config_path,
         voices_config=voices_config,
         production_bible=production_bible,
+        phase3_voice=phase3_plan.get("voice"),
     )
     voice_assets = build_voice_assets(voices_config, voice_references)
 
@@ -2715,7 +2851,10 @@ def main(argv: Optional[List[str]] = None) -> int:
 
     # Lazy-load only needed engines for isolation
     engines_to_load = [engine_selected] if args.disable_fallback else None
-    manager = build_engine_manager(args.device, engines=engines_to_load)
+    if engine_manager is not None:
+        manager = engine_manager
+    else:
+        manager = build_engine_manager(args.device, engines=engines_to_load)
     manager.set_default_engine(engine_selected)
 
     language = args.language or config.get("language", "en")
@@ -2761,13 +2900,30 @@ def main(argv: Optional[List[str]] = None) -> int:
     cpu_high_streak = 0
     total_chunks = len(chunks)
     pending = list(chunks)
-    active_futures: Dict[Any, str] = {}
+    active_futures: Dict[Any, ChunkPayload] = {}
     progress = (
-        tqdm(total=total_chunks, desc="Synth", unit="chunk") if tqdm else None
+        tqdm.tqdm(total=total_chunks, desc="Synth", unit="chunk") if tqdm else None
     )
 
     with ThreadPoolExecutor(max_workers=workers) as executor:
-        while pending or active_futures:
+        while (
+            pending
+            or active_futures
+            or (phase3_stream is not None and not phase3_stream.sealed)
+        ):
+            if phase3_stream is not None and not phase3_stream.sealed:
+                streamed = poll_streamed_chunks(
+                    phase3_stream, json_path, **payload_kwargs
+                )
+                pending.extend(streamed)
+                if phase3_stream.sealed:
+                    # The chunk count is final once Phase 3 seals its journal
+                    total_chunks = len(results) + len(active_futures) + len(pending)
+                else:
+                    total_chunks += len(streamed)
+                if progress and streamed:
+                    progress.total = total_chunks
+                    progress.refresh()
             # Fill the queue up to the current allowed concurrency
             while pending and len(active_futures) < allowed_workers:
                 chunk = pending.pop(0)
@@ -2789,20 +2945,37 @@ def main(argv: Optional[List[str]] = None) -> int:
                     validation_config=validation_config,
                     validation_enabled=validation_enabled,
                     chunk_index=chunk.index,
-                    total_chunks=total_chunks,
+                    # Unknown while streaming, so tier 2 cannot skip the chunk
+                    total_chunks=(
+                        total_chunks
+                        if phase3_stream is None or phase3_stream.sealed
+                        else None
+                    ),
                     chars_per_minute=chars_per_minute,
                     production_bible=production_bible,
                 )
-                active_futures[future] = chunk.chunk_id
+                active_futures[future] = chunk
 
             if not active_futures:
+                if phase3_stream is not None and not phase3_stream.sealed:
+                    time.sleep(POLL_INTERVAL)
+                    continue
                 break
 
-            done, _ = wait(active_futures, return_when=FIRST_COMPLETED)
+            done, _ = wait(
+                active_futures,
+                timeout=(
+                    POLL_INTERVAL
+                    if phase3_stream is not None and not phase3_stream.sealed
+                    else None
+                ),
+                return_when=FIRST_COMPLETED,
+            )
             for future in done:
-                active_futures.pop(future, None)
+                chunk = active_futures.pop(future)
                 result = future.result()
                 results.append(result)
+                journal_chunk_result(phase4_journal, result, chunk)
                 if progress:
                     progress.update(1)
                 if total_chunks:
@@ -2925,6 +3098,9 @@ def main(argv: Optional[List[str]] = None) -> int:
     )
 
     exit_code = 0 if failed_count == 0 else 1
+    if phase3_stream is not None and phase3_stream.failed:
+        logger.error("Phase 3 failed while streaming; chunk list is incomplete.")
+        exit_code = 1
     if args.play_notification is not False and not args.silence_notifications:
         if exit_code == 0:
             play_success_beep(silence_mode=False)
@@ -2941,6 +3117,7 @@ def execute_phase4(
     language: Optional[str] = None,
     workers: Optional[int] = None,
     resume: bool = False,
+    engine_manager: Optional[EngineManager] = None,
 ) -> int:
     """
     Standardized callable entry point so orchestrators can invoke Phase 4.
@@ -2958,7 +3135,7 @@ def execute_phase4(
         argv.append(f"--workers={workers}")
     if resume:
         argv.append("--resume")
-    return main(argv)
+    return main(argv, engine_manager=engine_manager)
 
 
 if __name__ == "__main__":
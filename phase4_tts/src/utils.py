@@ -6,18 +6,21 @@
 import os
 import json
 import logging
-import librosa
-import requests
-import nltk
-from nltk.tokenize import sent_tokenize
 from pathlib import Path, PureWindowsPath
 from typing import Tuple, Optional, Dict, Any
-import numpy as np
-import soundfile as sf
 import re
 import unicodedata
 import difflib
 
+from pipeline_common.lazy_import import lazy_module
+
+# Loaded on first use: text helpers are imported by every Phase 4 entry point
+librosa = lazy_module("librosa")
+requests = lazy_module("requests")
+nltk = lazy_module("nltk")
+np = lazy_module("numpy")
+sf = lazy_module("soundfile")
+
 try:
     from .models import TTSConfig
 except ImportError:
@@ -568,7 +571,7 @@ def synthesize_chunk(
     split_threshold = getattr(config, "split_char_limit", 300)
     if config.enable_splitting and len(text) > split_threshold:
         ensure_punkt_tokenizer()
-        sentences = sent_tokenize(text)
+        sentences = nltk.tokenize.sent_tokenize(text)
         sub_chunks = []
         current = ""
         for sent in sentences:
@@ -44,18 +44,27 @@ import time
 import random
 from collections import Counter
 from typing import Any, Tuple, Dict, Optional, List
-import librosa
-import numpy as np
 from dataclasses import dataclass
 
+from pipeline_common.lazy_import import lazy_module
+from pipeline_common.transcript_cache import (
+    TranscriptStore,
+    openai_whisper_key,
+    segments_from_openai_whisper,
+)
+
 logger = logging.getLogger(__name__)
 
+# Audio/ML stacks are loaded on first use (the *_AVAILABLE flags only need
+# to know they are installed), so importing this module stays cheap
+librosa = lazy_module("librosa")
+np = lazy_module("numpy")
+
 # Try to import phonemizer for phoneme-based duration estimation
 # Reference: TTS_VALIDATION_RESEARCH_FINDINGS.md Phase 2
 PHONEMIZER_AVAILABLE = False
 try:
-    from phonemizer import phonemize
-    from phonemizer.backend import EspeakBackend
+    phonemizer = lazy_module("phonemizer")
     PHONEMIZER_AVAILABLE = True
     logger.info("✅ Phonemizer available - using phoneme-based duration estimation")
 except ImportError:
@@ -65,8 +74,8 @@ except ImportError:
 # Reference: TTS_VALIDATION_RESEARCH_FINDINGS.md Phase 2
 SILERO_VAD_AVAILABLE = False
 try:
-    import torch
-    from silero_vad import load_silero_vad, get_speech_timestamps
+    torch = lazy_module("torch")
+    silero_vad = lazy_module("silero_vad")
     SILERO_VAD_AVAILABLE = True
     logger.info("✅ Silero VAD available - using neural silence detection")
 except ImportError:
@@ -255,7 +264,7 @@ def detect_text_repetition(
 # Try to import Whisper (optional for Tier 2)
 WHISPER_AVAILABLE = False
 try:
-    import whisper
+    whisper = lazy_module("whisper")
 
     WHISPER_AVAILABLE = True
     logger.info("✅ Whisper available for Tier 2 validation")
@@ -299,6 +308,7 @@ class ValidationConfig:
     whisper_last_n: int = 10  # Always validate last 10 chunks
     max_wer: float = 0.10  # Max Word Error Rate (10%)
     chars_per_minute: int = 1050  # Shared speaking rate assumption
+    use_transcript_cache: bool = True  # Share transcripts with Tier 3 / Phase 5
 
     # Known error phrases to detect
     error_phrases: list = None
@@ -349,6 +359,19 @@ def get_whisper_model(model_name: str = "base"):
     return _whisper_model
 
 
+_transcript_store: Optional[TranscriptStore] = None
+_transcript_store_loaded = False
+
+
+def get_transcript_store() -> Optional[TranscriptStore]:
+    """Shared transcript cache (None when disabled via PIPELINE_TRANSCRIPT_CACHE)."""
+    global _transcript_store, _transcript_store_loaded
+    if not _transcript_store_loaded:
+        _transcript_store = TranscriptStore.from_env()
+        _transcript_store_loaded = True
+    return _transcript_store
+
+
 def get_audio_duration(audio_path: str) -> float:
     """Get duration of audio file in seconds."""
     try:
@@ -405,7 +428,7 @@ def count_phonemes(text: str, language: str = "en-us") -> int:
         # Use espeak backend for robust phoneme conversion
         # strip=True removes word boundaries
         # preserve_punctuation=False simplifies output
-        phonemes = phonemize(
+        phonemes = phonemizer.phonemize(
             text,
             language=language,
             backend='espeak',
@@ -625,7 +648,7 @@ def get_silero_vad_model():
     if _silero_vad_model is None and SILERO_VAD_AVAILABLE:
         try:
             logger.info("Loading Silero VAD model...")
-            _silero_vad_model = load_silero_vad()
+            _silero_vad_model = silero_vad.load_silero_vad()
             logger.info("✅ Silero VAD model loaded")
         except Exception as e:
             logger.error(f"Failed to load Silero VAD model: {e}")
@@ -678,7 +701,7 @@ def detect_unnatural_pauses_vad(
             return False, []
 
         # Detect speech timestamps
-        speech_timestamps = get_speech_timestamps(
+        speech_timestamps = silero_vad.get_speech_timestamps(
             audio_tensor,
             vad_model,
             threshold=threshold,
@@ -1152,15 +1175,23 @@ def tier2_validate(
     start = time.perf_counter()
 
     try:
-        # Load Whisper model
-        model = get_whisper_model(config.whisper_model)
+        def _run_whisper() -> Dict:
+            model = get_whisper_model(config.whisper_model)
+            logger.info(
+                f"Transcribing audio with Whisper {config.whisper_model}..."
+            )
+            return segments_from_openai_whisper(model.transcribe(audio_path))
 
-        # Transcribe audio
-        logger.info(
-            f"Transcribing audio with Whisper {config.whisper_model}..."
-        )
-        result = model.transcribe(audio_path)
-        transcription = result["text"]
+        store = get_transcript_store() if config.use_transcript_cache else None
+        if store is not None:
+            transcript, cache_hit = store.get_or_transcribe(
+                audio_path, openai_whisper_key(config.whisper_model), _run_whisper
+            )
+            if cache_hit:
+                logger.debug(f"Tier 2 reused cached transcript for {audio_path}")
+        else:
+            transcript = _run_whisper()
+        transcription = transcript["text"]
 
         # Calculate WER
         wer = calculate_word_error_rate(chunk_text, transcription)
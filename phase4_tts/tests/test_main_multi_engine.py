@@ -86,6 +86,29 @@ def test_collect_chunks_sanitizes_and_derives_ids(
     assert '"' in chunks[0].text  # smart quotes normalized
 
 
+def test_streamed_estimates_use_the_phase3_plan(tmp_path: Path) -> None:
+    """The first streamed batch should not stand in for the whole book."""
+    from pipeline_common.chunk_journal import ChunkJournal
+
+    chunk_file = tmp_path / "chunk_0001.txt"
+    chunk_file.write_text("A short opening line.", encoding="utf-8")
+    journal = ChunkJournal(tmp_path / "phase3.jsonl")
+    journal.reset()
+    journal.write_plan(chunks=400, total_chars=600_000, voice="am_adam")
+    journal.append({"chunk_id": "chunk_0001", "index": 0, "path": str(chunk_file)})
+
+    reader = journal.reader()
+    chunks = multi.poll_streamed_chunks(reader)
+    assert [chunk.chunk_id for chunk in chunks] == ["chunk_0001"]
+    assert reader.plan["voice"] == "am_adam"
+
+    whole_book = multi.estimate_audio_seconds(
+        chunks, chars_per_min=1000, total_chars=reader.plan["total_chars"]
+    )
+    assert whole_book == 36_000.0
+    assert multi.estimate_audio_seconds(chunks, chars_per_min=1000) < 2.0
+
+
 def test_update_phase4_summary_records_results(tmp_path: Path) -> None:
     """update_phase4_summary should create the phase4 section with per-chunk data."""
     pipeline_path = tmp_path / "pipeline.json"
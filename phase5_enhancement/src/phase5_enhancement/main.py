@@ -5,54 +5,67 @@ This version integrates automatic phrase removal before audio enhancement.
 """
 
 import argparse
+import itertools
+import json
 import logging
 import os
 import sys
 import time
 from pathlib import Path
-import numpy as np
-import librosa
-import soundfile as sf
-import noisereduce as nr
-import pyloudnorm as pln
-from pydub import AudioSegment
-from pydub.effects import compress_dynamic_range
-from mutagen.mp3 import MP3
-from mutagen.id3 import TIT2, TPE1
-from pydantic import ValidationError
-import yaml
-from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError
-import psutil
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, TimeoutError, wait
 import tempfile
 import shutil
 import threading
 from typing import Optional
 
+# Ensure repo root is importable so we can access pipeline_common regardless of cwd
+REPO_ROOT = Path(__file__).resolve().parents[3]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from pipeline_common import startup_profile  # noqa: E402
+
+startup_profile.enable_if_requested("phase5_enhancement")
+
+import numpy as np  # noqa: E402
+import yaml  # noqa: E402
+from pydantic import ValidationError  # noqa: E402
+
+from pipeline_common.lazy_import import lazy_module  # noqa: E402
+
+# Audio stacks load on first use (noisereduce alone pulls in scipy.signal)
+librosa = lazy_module("librosa")
+sf = lazy_module("soundfile")
+nr = lazy_module("noisereduce")
+mutagen_mp3 = lazy_module("mutagen.mp3")
+mutagen_id3 = lazy_module("mutagen.id3")
+psutil = lazy_module("psutil")
+
 try:
-    from rnnoise import RNNoise  # CPU RNNoise wrapper
+    rnnoise = lazy_module("rnnoise")  # CPU RNNoise wrapper
 except ImportError:
-    RNNoise = None
+    rnnoise = None
 try:
-    import torch
-    from silero_vad import (
-        load_silero_vad,
-        get_speech_timestamps,
-        collect_chunks,
-    )
+    torch = lazy_module("torch")
+    silero_vad = lazy_module("silero_vad")
 except ImportError:
-    load_silero_vad = None
+    silero_vad = None
     torch = None
 
-from .models import EnhancementConfig, AudioMetadata
-from .phrase_cleaner import PhraseCleaner, PhraseCleanerConfig
-from .io_utils import atomic_replace, ensure_absolute_path, validate_audio_file
-
-# Ensure repo root is importable so we can access pipeline_common regardless of cwd
-REPO_ROOT = Path(__file__).resolve().parents[3]
-if str(REPO_ROOT) not in sys.path:
-    sys.path.insert(0, str(REPO_ROOT))
+from .models import EnhancementConfig, AudioMetadata  # noqa: E402
+from .phrase_cleaner import PhraseCleaner, PhraseCleanerConfig  # noqa: E402
+from .io_utils import atomic_replace, ensure_absolute_path, validate_audio_file  # noqa: E402
 
 from pipeline_common import PipelineState, ensure_phase_and_file  # noqa: E402
+from pipeline_common.loudness import (  # noqa: E402
+    CompressorSettings,
+    LoudnessMetrics,
+    analyze as analyze_loudness,
+    linear_to_db,
+    master_in_place,
+)
+from pipeline_common.transcript_cache import TranscriptStore, audio_digest  # noqa: E402
+from pipeline_common.chunk_journal import POLL_INTERVAL, ChunkJournal, JournalReader, streaming_enabled  # noqa: E402
 from pipeline_common.astromech_notify import (  # noqa: E402
     play_success_beep,
     play_alert_beep,
@@ -144,63 +157,43 @@ def wait_for_throttle(throttle_event: Optional[threading.Event], chunk_label: st
         time.sleep(0.5)
 
 
-def normalize_volume(audio: np.ndarray, sr: int, headroom: float = 0.1) -> tuple[np.ndarray, float, float]:
-    """Normalize volume using pydub to even out audio levels.
+# Historical hard clip guard (0.95 linear) expressed as a limiter ceiling
+SAFETY_CEILING_DB = linear_to_db(0.95)
+
+
+def normalize_volume(
+    audio: np.ndarray,
+    sr: int,
+    headroom: float = 0.1,
+    metrics: Optional[LoudnessMetrics] = None,
+) -> tuple[np.ndarray, float, float]:
+    """Peak-normalize audio to ``headroom`` dB below full scale.
+
+    Runs on the float32 buffer in place via ``pipeline_common.loudness``
+    (no int16/pydub round-trip); always use the returned array.
 
     Args:
         audio: Input audio as numpy array (mono, float32, range [-1, 1])
         sr: Sample rate
-        headroom: Headroom to prevent clipping (0.0-1.0)
+        headroom: Headroom in dB to prevent clipping
+        metrics: Existing loudness analysis of ``audio`` to reuse
 
     Returns:
         Tuple of (normalized_audio, pre_rms, post_rms)
     """
-    try:
-        # Compute pre-normalization RMS
-        pre_rms = float(np.sqrt(np.mean(audio**2)))
-
-        # Skip if audio is silent or too short
-        if len(audio) == 0 or pre_rms < 1e-6:
-            logger.warning("Audio is silent or empty, skipping volume normalization")
-            return audio, pre_rms, pre_rms
-
-        # Convert numpy float32 [-1, 1] to int16 for pydub
-        audio_int16 = (audio * 32767).astype(np.int16)
-
-        # Create AudioSegment from raw audio data
-        audio_segment = AudioSegment(
-            audio_int16.tobytes(),
-            frame_rate=sr,
-            sample_width=2,  # 16-bit = 2 bytes
-            channels=1,  # Mono
-        )
-
-        # Normalize with headroom
-        normalized_segment = audio_segment.normalize(headroom=headroom)
-
-        # Convert back to numpy float32 [-1, 1]
-        normalized_array = np.array(normalized_segment.get_array_of_samples(), dtype=np.float32) / 32768.0
-
-        # Compute post-normalization RMS
-        post_rms = float(np.sqrt(np.mean(normalized_array**2)))
-
+    if len(audio) == 0:
+        logger.warning("Audio is silent or empty, skipping volume normalization")
+        return audio, 0.0, 0.0
+
+    result = master_in_place(audio, sr, peak_headroom_db=headroom, input_metrics=metrics)
+    pre_rms, post_rms = float(result.input.rms), float(result.output.rms)
+    if pre_rms < 1e-6:
+        logger.warning("Audio is silent or empty, skipping volume normalization")
+    else:
         logger.debug(
             f"Volume normalization: Pre-RMS={pre_rms:.4f}, " f"Post-RMS={post_rms:.4f}, Delta={post_rms - pre_rms:.4f}"
         )
-
-        return normalized_array, pre_rms, post_rms
-
-    except Exception as e:
-        logger.warning(f"Pydub volume normalization failed: {e}. " f"Falling back to librosa peak normalization.")
-        # Fallback: simple peak normalization
-        pre_rms = float(np.sqrt(np.mean(audio**2)))
-        peak = np.max(np.abs(audio))
-        if peak > 0:
-            normalized = audio * (0.95 / peak)  # Leave 5% headroom
-        else:
-            normalized = audio
-        post_rms = float(np.sqrt(np.mean(normalized**2)))
-        return normalized, pre_rms, post_rms
+    return result.audio, pre_rms, post_rms
 
 
 def reduce_noise(audio: np.ndarray, sr: int, reduction_factor: float = 0.8) -> np.ndarray:
@@ -268,7 +261,7 @@ _rnnoise_model = None
 def apply_rnnoise(audio: np.ndarray, sr: int, frame_seconds: float = 0.02) -> np.ndarray:
     """Apply RNNoise denoising with graceful fallback when unavailable."""
     global _rnnoise_model
-    if RNNoise is None:
+    if rnnoise is None:
         raise ImportError("rnnoise not installed")
 
     target_sr = 48000
@@ -277,7 +270,7 @@ def apply_rnnoise(audio: np.ndarray, sr: int, frame_seconds: float = 0.02) -> np
     )
 
     if _rnnoise_model is None:
-        _rnnoise_model = RNNoise()
+        _rnnoise_model = rnnoise.RNNoise()
 
     try:
         denoised = _rnnoise_model.filter(work_audio)
@@ -299,31 +292,16 @@ def apply_compression_and_limit(
     ceiling_db: float,
 ) -> np.ndarray:
     """
-    Apply gentle broadband compression then limiter using pydub.
-    Keeps processing CPU-only and light for the 5500U.
+    Apply gentle broadband compression then a true-peak ceiling.
+    Keeps processing CPU-only and light for the 5500U (float32, in place).
     """
-    audio_int16 = np.clip(audio * 32767.0, -32768, 32767).astype(np.int16)
-    seg = AudioSegment(
-        audio_int16.tobytes(),
-        frame_rate=sr,
-        sample_width=2,
-        channels=1,
-    )
-
-    seg = compress_dynamic_range(
-        seg,
-        threshold=threshold_db,
-        ratio=ratio,
-        attack=5.0,
-        release=50.0,
+    result = master_in_place(
+        audio,
+        sr,
+        ceiling_db=ceiling_db,
+        compressor=CompressorSettings(threshold_db=threshold_db, ratio=ratio, attack_ms=5.0, release_ms=50.0),
     )
-
-    current_peak_db = seg.max_dBFS
-    if current_peak_db > ceiling_db:
-        seg = seg.apply_gain(ceiling_db - current_peak_db)
-
-    samples = np.array(seg.get_array_of_samples()).astype(np.float32) / 32767.0
-    return samples
+    return result.audio
 
 
 _silero_vad_model = None
@@ -341,11 +319,11 @@ def analyze_silero_vad(
     """
     global _silero_vad_model
 
-    if load_silero_vad is None or torch is None:
+    if silero_vad is None or torch is None:
         raise ImportError("silero-vad not installed")
 
     if _silero_vad_model is None:
-        _silero_vad_model = load_silero_vad()
+        _silero_vad_model = silero_vad.load_silero_vad()
 
     # Silero expects 16 kHz mono float tensor
     if sr != 16000:
@@ -356,7 +334,7 @@ def analyze_silero_vad(
         work_sr = sr
 
     wav_tensor = torch.from_numpy(audio_16k.astype(np.float32))
-    speech_ts = get_speech_timestamps(
+    speech_ts = silero_vad.get_speech_timestamps(
         wav_tensor,
         _silero_vad_model,
         sampling_rate=work_sr,
@@ -440,20 +418,12 @@ def apply_matchering(
 
 
 def normalize_lufs(audio: np.ndarray, sr: int, target: float = -23.0) -> tuple[np.ndarray, float]:
+    """Normalize to ``target`` LUFS in place; returns (audio, measured_input_lufs)."""
     try:
-        if np.max(np.abs(audio)) < 1e-6:
+        result = master_in_place(audio, sr, target_lufs=target)
+        if result.input.peak < 1e-6:
             logger.warning("Silent audio, skipping LUFS normalization")
-            return audio, float("-inf")
-        meter = pln.Meter(sr)
-        audio_2d = audio.reshape(-1, 1) if audio.ndim == 1 else audio
-        loudness = meter.integrated_loudness(audio_2d)
-        if loudness == float("-inf") or np.isnan(loudness):
-            logger.warning("Invalid loudness, applying peak normalization")
-            peak = np.max(np.abs(audio))
-            normalized = audio * (0.5 / peak) if peak > 0 else audio
-            return normalized, loudness
-        normalized = pln.normalize.loudness(audio_2d, loudness, target)
-        return (normalized.flatten() if audio.ndim == 1 else normalized), loudness
+        return result.audio, result.input.lufs
     except Exception as e:
         logger.warning(f"LUFS failed: {e}, applying peak normalization")
         peak = np.max(np.abs(audio))
@@ -461,12 +431,18 @@ def normalize_lufs(audio: np.ndarray, sr: int, target: float = -23.0) -> tuple[n
         return normalized, float("-inf")
 
 
-def validate_audio_quality(audio: np.ndarray, sr: int, config: EnhancementConfig) -> tuple[float, float, float, bool]:
+def validate_audio_quality(
+    audio: np.ndarray,
+    sr: int,
+    config: EnhancementConfig,
+    metrics: Optional[LoudnessMetrics] = None,
+) -> tuple[float, float, float, bool]:
+    """Return (snr, rms, lufs, quality_good); ``metrics`` skips re-measuring level."""
     try:
-        rms = np.sqrt(np.mean(audio**2))
-        meter = pln.Meter(sr)
-        audio_2d = audio.reshape(-1, 1) if audio.ndim == 1 else audio
-        lufs = meter.integrated_loudness(audio_2d)
+        if metrics is None:
+            metrics = analyze_loudness(audio, sr)
+        rms = metrics.rms
+        lufs = metrics.lufs
         stft = librosa.stft(audio, hop_length=512)
         magnitude = np.abs(stft)
         freq_bins = magnitude.shape[0]
@@ -484,6 +460,34 @@ def validate_audio_quality(audio: np.ndarray, sr: int, config: EnhancementConfig
         return 0.0, 0.0, float("-inf"), False
 
 
+def master_enhanced_audio(
+    audio: np.ndarray,
+    sr: int,
+    config: EnhancementConfig,
+):
+    """
+    Fused compression -> LUFS gain -> peak ceiling for one enhanced chunk.
+
+    Replaces the separate compression, LUFS and clip-guard passes with one
+    ``master_in_place`` call; the returned result carries output metrics.
+    """
+    compressor = None
+    ceiling_db = SAFETY_CEILING_DB
+    if config.enable_compression:
+        compressor = CompressorSettings(
+            threshold_db=config.compressor_threshold_db,
+            ratio=config.compressor_ratio,
+        )
+        ceiling_db = min(ceiling_db, config.limiter_ceiling_db)
+    return master_in_place(
+        audio,
+        sr,
+        target_lufs=config.lufs_target,
+        ceiling_db=ceiling_db,
+        compressor=compressor,
+    )
+
+
 def process_large_chunk(audio: np.ndarray, sr: int, chunk_sec: int, func):
     """Split large audio into sub-chunks for processing"""
     chunk_samples = int(chunk_sec * sr)
@@ -530,7 +534,14 @@ def enhance_chunk(
             logger.info(f"[CLEANUP] Running phrase cleanup on chunk {metadata.chunk_id}...")
             wait_for_throttle(throttle_event, f"{metadata.chunk_id}-cleanup")
             cleaned_audio, sr, cleanup_meta = phrase_cleaner.clean_audio(
-                wav_path, chunk_index=chunk_index, is_final_pass=False
+                wav_path,
+                chunk_index=chunk_index,
+                is_final_pass=False,
+                expected_duration=metadata.est_dur,
+                chunk_row={
+                    "validation_reason": metadata.phase4_validation_reason,
+                    "validation_details": metadata.phase4_validation_details,
+                },
             )
 
             # Update metadata with cleanup results
@@ -539,7 +550,8 @@ def enhance_chunk(
             metadata.cleanup_processing_time = cleanup_meta.get("processing_time", 0.0)
 
             if cleaned_audio is not None:
-                # Phrase was removed - use cleaned audio
+                # Phrase was removed - use cleaned audio (timeline shifted)
+                metadata.timing_preserved = False
                 logger.info(f"[OK] Removed {metadata.phrases_removed} phrase(s) from chunk {metadata.chunk_id}")
                 audio = cleaned_audio
                 # Update sample rate from cleaner
@@ -563,8 +575,14 @@ def enhance_chunk(
             raise ValueError("Empty audio file")
 
         # ===== STEP 3: VOLUME NORMALIZATION =====
+        # One level analysis feeds both the peak normalization and the
+        # pre-enhancement metrics below.
+        audio = audio.astype(np.float32, copy=False)
+        level = analyze_loudness(audio, sr)
         if config.enable_volume_normalization:
-            audio, vol_rms_pre, vol_rms_post = normalize_volume(audio, sr, config.volume_norm_headroom)
+            staged = master_in_place(audio, sr, peak_headroom_db=config.volume_norm_headroom, input_metrics=level)
+            audio, level = staged.audio, staged.output
+            vol_rms_pre, vol_rms_post = float(staged.input.rms), float(staged.output.rms)
             metadata.rms_volume_norm_pre = vol_rms_pre
             metadata.rms_volume_norm_post = vol_rms_post
             logger.info(f"Volume normalized chunk {metadata.chunk_id}: " f"RMS {vol_rms_pre:.4f} -> {vol_rms_post:.4f}")
@@ -572,7 +590,7 @@ def enhance_chunk(
             logger.debug(f"Volume normalization disabled for chunk {metadata.chunk_id}")
 
         # ===== STEP 4: PRE-ENHANCEMENT METRICS =====
-        snr_pre, rms_pre, lufs_pre, _ = validate_audio_quality(audio, sr, config)
+        snr_pre, rms_pre, lufs_pre, _ = validate_audio_quality(audio, sr, config, metrics=level)
         metadata.snr_pre = float(snr_pre)
         metadata.rms_pre = float(rms_pre)
         metadata.lufs_pre = float(lufs_pre)
@@ -650,27 +668,16 @@ def enhance_chunk(
                     enhanced = reduce_noise(audio, sr, config.noise_reduction_factor)
                 logger.debug(f"Applied noisereduce to chunk {metadata.chunk_id}")
 
-            # Optional broadband compression + limiter
-            if config.enable_compression:
-                try:
-                    enhanced = apply_compression_and_limit(
-                        enhanced,
-                        sr,
-                        config.compressor_threshold_db,
-                        config.compressor_ratio,
-                        config.limiter_ceiling_db,
-                    )
-                except Exception as exc:
-                    logger.warning(f"Compression/limiter failed: {exc}")
-
-            # Normalization
-            enhanced, lufs_post = normalize_lufs(enhanced, sr, config.lufs_target)
-
-            # Safety: Hard limit to prevent clipping
-            peak = np.max(np.abs(enhanced))
-            if peak > 0.95:
-                logger.warning(f"Clipping detected (peak={peak:.3f}), applying limiter")
-                enhanced = enhanced * (0.95 / peak)
+            # Fused compression + LUFS normalization + peak ceiling (in place,
+            # so never operate on the unprocessed source buffer itself)
+            if enhanced is audio:
+                enhanced = audio.copy()
+            mastered = master_enhanced_audio(enhanced, sr, config)
+            enhanced = mastered.audio
+            post_level = mastered.output
+            lufs_post = post_level.lufs
+            if mastered.limiter_db < 0.0:
+                logger.debug(f"Peak ceiling applied to chunk {metadata.chunk_id} ({mastered.limiter_db:.2f} dB)")
 
             if config.enable_silero_vad:
                 try:
@@ -683,6 +690,8 @@ def enhance_chunk(
                     metadata.speech_ratio_post = speech_ratio_post
                     if config.trim_silence_with_vad and trimmed_audio is not None and len(trimmed_audio) > 0:
                         enhanced = trimmed_audio.astype(np.float32)
+                        post_level = None
+                        metadata.timing_preserved = False
                         logger.info(f"Trimmed non-speech sections via VAD for chunk {metadata.chunk_id}")
                     if speech_seconds_post < config.silero_vad_min_speech or speech_ratio_post < 0.5:
                         logger.warning(
@@ -693,7 +702,9 @@ def enhance_chunk(
                     logger.warning(f"Silero VAD post-check failed: {exc}")
 
             # Post metrics
-            snr_post, rms_post, _, quality_good_temp = validate_audio_quality(enhanced, sr, config)
+            snr_post, rms_post, _, quality_good_temp = validate_audio_quality(
+                enhanced, sr, config, metrics=post_level
+            )
             quality_good = True  # [PATCHED] Force acceptance of all chunks
 
             if quality_good or not config.quality_validation_enabled:
@@ -709,15 +720,14 @@ def enhance_chunk(
             else:
                 # Fallback: skip noise reduction, just normalize
                 logger.warning("All retries failed, using fallback (no noise reduction)")
-                enhanced, lufs_post = normalize_lufs(audio, sr, config.lufs_target)
-
-                # Safety: Hard limit to prevent clipping
-                peak = np.max(np.abs(enhanced))
-                if peak > 0.95:
-                    logger.warning(f"Clipping detected in fallback (peak={peak:.3f}), applying limiter")
-                    enhanced = enhanced * (0.95 / peak)
+                fallback = master_in_place(
+                    audio.copy(), sr, target_lufs=config.lufs_target, ceiling_db=SAFETY_CEILING_DB
+                )
+                enhanced, lufs_post = fallback.audio, fallback.output.lufs
 
-                snr_post, rms_post, _, quality_good = validate_audio_quality(enhanced, sr, config)
+                snr_post, rms_post, _, quality_good = validate_audio_quality(
+                    enhanced, sr, config, metrics=fallback.output
+                )
 
                 # CRITICAL: Accept ALL chunks when quality validation is disabled!
                 if quality_good or not config.quality_validation_enabled:
@@ -747,6 +757,19 @@ def enhance_chunk(
         return metadata, np.array([], dtype=np.float32)
 
 
+def link_enhanced_transcripts(store: TranscriptStore, source_path: Path, enhanced_path: Path) -> None:
+    """
+    Point the enhanced chunk's transcript entry at its Phase 4 source.
+
+    Only valid when enhancement kept the timeline (no phrase removal or VAD
+    trimming); subtitles can then reuse the validation/cleanup transcripts.
+    """
+    try:
+        store.link(audio_digest(enhanced_path), audio_digest(source_path), reason="phase5_enhanced")
+    except OSError as exc:
+        logger.debug(f"Could not link transcripts for {enhanced_path.name}: {exc}")
+
+
 def concatenate_with_crossfades(
     chunks: list[np.ndarray],
     sr: int,
@@ -820,11 +843,65 @@ def concatenate_with_crossfades(
     return combined
 
 
+def build_chunk_offset_table(
+    chunk_paths: list[Path],
+    batch_size: int,
+    crossfade_sec: float,
+) -> list[dict]:
+    """
+    Map each enhanced chunk to its start/end in the concatenated audiobook.
+
+    Mirrors the batch concatenation below: chunks inside a batch are joined
+    back-to-back by the concat demuxer, and each batch boundary is an
+    ``acrossfade`` that overlaps ``crossfade_sec`` seconds.
+    """
+    table = []
+    cursor = 0.0
+    for idx, path in enumerate(chunk_paths):
+        if idx and batch_size > 0 and idx % batch_size == 0:
+            cursor -= crossfade_sec
+        duration = float(sf.info(str(path)).duration)
+        table.append(
+            {
+                "index": idx,
+                "chunk_id": extract_chunk_number_from_filename(str(path)),
+                "enhanced_path": serialize_path_for_pipeline(Path(path)),
+                "start": round(cursor, 6),
+                "end": round(cursor + duration, 6),
+                "duration": round(duration, 6),
+            }
+        )
+        cursor += duration
+    return table
+
+
+def write_chunk_offset_table(
+    output_path: Path,
+    chunks: list[dict],
+    crossfade_sec: float,
+    batch_size: int,
+    timing_preserved: bool = True,
+) -> Path:
+    """Persist the offset table next to the final audiobook (atomic replace)."""
+    payload = {
+        "version": 1,
+        "crossfade_sec": crossfade_sec,
+        "batch_size": batch_size,
+        "timing_preserved": timing_preserved,
+        "total_duration": chunks[-1]["end"] if chunks else 0.0,
+        "chunks": chunks,
+    }
+    temp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    temp_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    atomic_replace(output_path, temp_path)
+    return output_path
+
+
 def embed_metadata(mp3_path: str, config: EnhancementConfig):
     try:
-        audio = MP3(mp3_path)
-        audio["TIT2"] = TIT2(encoding=3, text=config.audiobook_title)
-        audio["TPE1"] = TPE1(encoding=3, text=config.audiobook_author)
+        audio = mutagen_mp3.MP3(mp3_path)
+        audio["TIT2"] = mutagen_id3.TIT2(encoding=3, text=config.audiobook_title)
+        audio["TPE1"] = mutagen_id3.TPE1(encoding=3, text=config.audiobook_author)
         audio.save()
         logger.info(f"Embedded metadata: '{config.audiobook_title}' by {config.audiobook_author}")
     except Exception as e:
@@ -870,6 +947,41 @@ def _normalize_file_key(value: str | None) -> str | None:
     return "".join(ch for ch in value.lower() if ch.isalnum())
 
 
+def audio_metadata_from_phase4(config: EnhancementConfig, wav_path: str, row: dict) -> Optional[AudioMetadata]:
+    """AudioMetadata for one Phase 4 WAV and its per-chunk record; None if the file is missing."""
+    chunk_num = extract_chunk_number_from_filename(wav_path)
+    if Path(wav_path).is_absolute():
+        abs_wav = Path(wav_path)
+    else:
+        abs_wav = Path(config.input_dir) / Path(wav_path).name
+
+    logger.info(f"Looking for audio at: {abs_wav}")
+    if not abs_wav.exists():
+        logger.warning(f"Audio file not found: {abs_wav}")
+        return None
+    logger.info(f"[OK] Added chunk {chunk_num}")
+    return AudioMetadata(
+        chunk_id=chunk_num,
+        wav_path=str(abs_wav),
+        text_len=row.get("text_len"),
+        est_dur=row.get("est_dur"),
+        engine=row.get("engine"),
+        rt_factor=row.get("rt_factor"),
+        phase4_validation_reason=row.get("validation_reason"),
+        phase4_validation_details=row.get("validation_details"),
+    )
+
+
+def poll_streamed_chunks(config: EnhancementConfig, reader: JournalReader) -> list[AudioMetadata]:
+    """WAVs Phase 4 has journaled since the last poll (streaming mode)."""
+    chunks = []
+    for record in reader.poll():
+        chunk = audio_metadata_from_phase4(config, record["audio_path"], record)
+        if chunk is not None:
+            chunks.append(chunk)
+    return chunks
+
+
 def get_audio_chunks_from_json(
     config: EnhancementConfig,
 ) -> list[AudioMetadata]:
@@ -900,6 +1012,15 @@ def get_audio_chunks_from_json(
             status = data.get("status", "pending")
             logger.info(f"File ID '{file_id}' status: {status}")
 
+            # Phase 4 per-chunk records feed the cleanup triage (est_dur, validation flags)
+            phase4_rows = {}
+            for row in data.get("chunks") or []:
+                ref = row.get("audio_path") or str(row.get("chunk_id", ""))
+                try:
+                    phase4_rows[extract_chunk_number_from_filename(ref)] = row
+                except Exception:
+                    continue
+
             if status not in ["success", "complete", "partial"]:
                 logger.warning(f"Skipping file_id {file_id} with status: {status}")
                 continue
@@ -907,19 +1028,9 @@ def get_audio_chunks_from_json(
             for idx, wav_path in enumerate(chunk_audio_paths):
                 chunk_num = extract_chunk_number_from_filename(wav_path)
                 logger.info(f"Processing chunk (filename={chunk_num}, array_idx={idx}): {wav_path}")
-
-                if Path(wav_path).is_absolute():
-                    abs_wav = Path(wav_path)
-                else:
-                    abs_wav = Path(config.input_dir) / Path(wav_path).name
-
-                logger.info(f"Looking for audio at: {abs_wav}")
-
-                if abs_wav.exists():
-                    chunks.append(AudioMetadata(chunk_id=chunk_num, wav_path=str(abs_wav)))
-                    logger.info(f"[OK] Added chunk {chunk_num}")
-                else:
-                    logger.warning(f"Audio file not found: {abs_wav}")
+                chunk = audio_metadata_from_phase4(config, wav_path, phase4_rows.get(chunk_num) or {})
+                if chunk is not None:
+                    chunks.append(chunk)
 
         logger.info(f"Found {len(chunks)} completed audio chunks from pipeline.json")
         return sorted(chunks, key=lambda x: x.chunk_id)
@@ -1037,6 +1148,7 @@ def main(argv: Optional[list[str]] = None):
         action="store_true",
         help="Silence astromech notifications (beeps are ON by default)",
     )
+    startup_profile.add_argument(parser)
     args = parser.parse_args(argv)
 
     try:
@@ -1095,6 +1207,8 @@ def main(argv: Optional[list[str]] = None):
         # Per-title output/input directories
         config.output_dir = str(Path(config.output_dir.format(file_id=target_file_id)).resolve())
         config.input_dir = str((Path(config.input_dir) / target_file_id).resolve())
+        # The orchestrator names stream journals by its own file_id, not the title
+        stream_file_id = args.file_id or os.environ.get("PHASE5_FILE_ID") or target_file_id
         # Keep downstream helpers aligned to the target file id
         config.audiobook_title = target_file_id
         os.environ["PHASE5_FILE_ID"] = target_file_id
@@ -1109,6 +1223,7 @@ def main(argv: Optional[list[str]] = None):
 
         # ===== INITIALIZE PHRASE CLEANER (NEW) =====
         phrase_cleaner = None
+        transcript_store = TranscriptStore.from_env()
         if config.enable_phrase_cleanup and getattr(config, "cleanup_scope", "all") != "none":
             logger.info("Initializing phrase cleaner...")
             cleaner_config = PhraseCleanerConfig(
@@ -1116,6 +1231,8 @@ def main(argv: Optional[list[str]] = None):
                 target_phrases=config.cleanup_target_phrases,
                 model_size=config.cleanup_whisper_model,
                 save_transcripts=config.cleanup_save_transcripts,
+                triage_mode=config.cleanup_triage,
+                triage_audit_every=config.cleanup_triage_audit_every,
             )
             phrase_cleaner = PhraseCleaner(cleaner_config)
             logger.info(f"[OK] Phrase cleaner initialized (model: " f"{config.cleanup_whisper_model})")
@@ -1131,7 +1248,22 @@ def main(argv: Optional[list[str]] = None):
 
         try:
             # ===== LOAD CHUNKS =====
-            if args.chunk_id is not None:
+            # Streaming mode: Phase 4 is still running and journals each WAV
+            # once it passes validation; only the final concat waits for it
+            phase4_stream: Optional[JournalReader] = None
+            if (
+                args.chunk_id is None
+                and streaming_enabled()
+                and os.environ.get("PHASE5_CONCAT_ONLY") != "1"
+            ):
+                journal = ChunkJournal.for_stage(config.pipeline_json, stream_file_id, "phase4")
+                if journal.exists():
+                    phase4_stream = journal.reader()
+                    logger.info("Streaming audio chunks from %s", journal.path)
+
+            if phase4_stream is not None:
+                chunks = poll_streamed_chunks(config, phase4_stream)
+            elif args.chunk_id is not None:
                 chunk_path = Path(config.input_dir) / (f"chunk_{args.chunk_id}.wav")
                 if not chunk_path.exists():
                     logger.error(f"Chunk file not found: {chunk_path}")
@@ -1141,14 +1273,23 @@ def main(argv: Optional[list[str]] = None):
             else:
                 chunks = get_audio_chunks_from_json(config)
 
-            if not chunks:
+            if not chunks and phase4_stream is None:
                 logger.error("No audio chunks found to process")
                 if not args.silence_notifications:
                     play_alert_beep(silence_mode=False)
                 return 1
 
             # ===== RESUME LOGIC =====
-            if args.chunk_id is None and config.resume_on_failure:
+            resume_ids: set = set()
+            resume_enabled = args.chunk_id is None and config.resume_on_failure
+
+            def already_enhanced(chunk: AudioMetadata) -> bool:
+                # Also skip if enhanced WAV already exists on disk
+                return chunk.chunk_id in resume_ids or (
+                    Path(config.output_dir) / f"enhanced_{chunk.chunk_id:04d}.wav"
+                ).exists()
+
+            if resume_enabled:
                 state = PipelineState(config.pipeline_json, validate_on_read=False)
                 pipeline = state.read(validate=False)
 
@@ -1166,13 +1307,8 @@ def main(argv: Optional[list[str]] = None):
                     if target_file_id in wav_path or target_file_id in enhanced_path:
                         legacy_chunks.append(c)
 
-                existing_ids = {c["chunk_id"] for c in phase5_existing + legacy_chunks if c.get("status") == "complete"}
-
-                # Also skip if enhanced WAV already exists on disk
-                output_dir = Path(config.output_dir)
-                disk_existing = {c.chunk_id for c in chunks if (output_dir / f"enhanced_{c.chunk_id:04d}.wav").exists()}
-                existing_all = existing_ids.union(disk_existing)
-                chunks = [c for c in chunks if c.chunk_id not in existing_all]
+                resume_ids = {c["chunk_id"] for c in phase5_existing + legacy_chunks if c.get("status") == "complete"}
+                chunks = [c for c in chunks if not already_enhanced(c)]
                 logger.info(
                     "Resume enabled: %d chunks remain unprocessed",
                     len(chunks),
@@ -1240,67 +1376,96 @@ def main(argv: Optional[list[str]] = None):
                 logger.info(f"Processing {len(chunks)} audio chunks...")
 
                 with ThreadPoolExecutor(max_workers=config.max_workers) as executor:
-                    # Submit all chunks with phrase_cleaner
-                    futures = {
-                        executor.submit(
-                            enhance_chunk,
-                            chunk,
-                            config,
-                            temp_dir,
-                            phrase_cleaner,
-                            throttle_event,
-                            idx,
-                        ): chunk
-                        for idx, chunk in enumerate(chunks, start=1)
-                    }
-
-                    for future in as_completed(futures):
-                        try:
-                            metadata, enhanced_audio = future.result(timeout=config.processing_timeout)
-                        except TimeoutError:
-                            metadata = futures[future]
-                            metadata.status = "failed"
-                            metadata.error_message = "Processing timeout"
-                            enhanced_audio = np.array([], dtype=np.float32)
-                            logger.error(f"Timeout for chunk {metadata.chunk_id}")
-
-                        processed_metadata.append(metadata)
-                        if metadata.cleanup_status and metadata.cleanup_status not in {
-                            "disabled",
-                            "skipped",
-                        }:
-                            cleanup_operations += 1
-
-                        # Log cleanup results if applicable
-                        if metadata.cleanup_status:
-                            if metadata.cleanup_status == "cleaned":
-                                logger.info(
-                                    f"[CLEANUP] Chunk {metadata.chunk_id}: "
-                                    f"Removed {metadata.phrases_removed} phrase(s) "
-                                    f"in {metadata.cleanup_processing_time:.1f}s"
+                    futures = {}
+                    order = itertools.count(1)
+
+                    def submit(batch: list[AudioMetadata]) -> None:
+                        # Submit chunks with phrase_cleaner
+                        for chunk in batch:
+                            future = executor.submit(
+                                enhance_chunk,
+                                chunk,
+                                config,
+                                temp_dir,
+                                phrase_cleaner,
+                                throttle_event,
+                                next(order),
+                            )
+                            futures[future] = chunk
+
+                    submit(chunks)
+                    while futures or (phase4_stream is not None and not phase4_stream.sealed):
+                        if phase4_stream is not None and not phase4_stream.sealed:
+                            streamed = poll_streamed_chunks(config, phase4_stream)
+                            if resume_enabled:
+                                streamed = [c for c in streamed if not already_enhanced(c)]
+                            submit(streamed)
+                        if not futures:
+                            time.sleep(POLL_INTERVAL)
+                            continue
+                        streaming = phase4_stream is not None and not phase4_stream.sealed
+                        done, _ = wait(
+                            futures,
+                            timeout=POLL_INTERVAL if streaming else None,
+                            return_when=FIRST_COMPLETED,
+                        )
+                        for future in done:
+                            chunk = futures.pop(future)
+                            try:
+                                metadata, enhanced_audio = future.result(timeout=config.processing_timeout)
+                            except TimeoutError:
+                                metadata = chunk
+                                metadata.status = "failed"
+                                metadata.error_message = "Processing timeout"
+                                enhanced_audio = np.array([], dtype=np.float32)
+                                logger.error(f"Timeout for chunk {metadata.chunk_id}")
+
+                            processed_metadata.append(metadata)
+                            if metadata.cleanup_status and metadata.cleanup_status not in {
+                                "disabled",
+                                "skipped",
+                                "triaged_clean",
+                            }:
+                                cleanup_operations += 1
+
+                            # Log cleanup results if applicable
+                            if metadata.cleanup_status:
+                                if metadata.cleanup_status == "cleaned":
+                                    logger.info(
+                                        f"[CLEANUP] Chunk {metadata.chunk_id}: "
+                                        f"Removed {metadata.phrases_removed} phrase(s) "
+                                        f"in {metadata.cleanup_processing_time:.1f}s"
+                                    )
+                                elif metadata.cleanup_status == "error":
+                                    logger.warning(
+                                        "[WARNING] Chunk %s: Cleanup error, continuing",
+                                        metadata.chunk_id,
+                                    )
+
+                            if metadata.status.startswith("complete") and len(enhanced_audio) > 0:
+                                enhanced_path = Path(config.output_dir) / f"enhanced_{metadata.chunk_id:04d}.wav"
+                                sf.write(
+                                    enhanced_path,
+                                    enhanced_audio,
+                                    config.sample_rate,
+                                    format="WAV",
+                                    subtype="PCM_24",
                                 )
-                            elif metadata.cleanup_status == "error":
-                                logger.warning(
-                                    "[WARNING] Chunk %s: Cleanup error, continuing",
+                                metadata.enhanced_path = str(enhanced_path)
+                                enhanced_paths.append(enhanced_path)
+                                if transcript_store is not None and metadata.timing_preserved:
+                                    link_enhanced_transcripts(transcript_store, Path(metadata.wav_path), enhanced_path)
+                                logger.info(
+                                    "[OK] Saved enhanced chunk %s: %s",
                                     metadata.chunk_id,
+                                    enhanced_path,
                                 )
 
-                        if metadata.status.startswith("complete") and len(enhanced_audio) > 0:
-                            enhanced_path = Path(config.output_dir) / f"enhanced_{metadata.chunk_id:04d}.wav"
-                            sf.write(
-                                enhanced_path,
-                                enhanced_audio,
-                                config.sample_rate,
-                                format="WAV",
-                                subtype="PCM_24",
-                            )
-                            metadata.enhanced_path = str(enhanced_path)
-                            enhanced_paths.append(enhanced_path)
-                            logger.info(
-                                "[OK] Saved enhanced chunk %s: %s",
-                                metadata.chunk_id,
-                                enhanced_path,
-                            )
+            if phase4_stream is not None and phase4_stream.failed:
+                logger.error("Phase 4 failed while streaming; enhanced chunks are kept for resume, skipping concat.")
+                if not args.silence_notifications:
+                    play_alert_beep(silence_mode=False)
+                return 1
 
             # If nothing was processed this run but resume is enabled, fall back to cached enhanced files
             if not enhanced_paths and config.resume_on_failure:
@@ -1330,6 +1495,7 @@ def main(argv: Optional[list[str]] = None):
 
             # ===== CONCATENATION =====
             final_output_path = None
+            offsets_path = None
             if enhanced_paths and not args.skip_concatenation:
                 enhanced_paths = sorted(enhanced_paths)
                 logger.info(
@@ -1385,6 +1551,8 @@ def main(argv: Optional[list[str]] = None):
                         float(getattr(config, "crossfade_max_sec", 0.1)),
                     )
                     current = batch_files[0]
+                    chunk_offsets = build_chunk_offset_table(enhanced_paths, batch_size, crossfade_sec)
+                    offsets_timing_preserved = True
 
                     for merge_idx, next_batch in enumerate(batch_files[1:], start=1):
                         merged_out = temp_session / f"merged_{merge_idx:04d}.wav"
@@ -1437,6 +1605,7 @@ def main(argv: Optional[list[str]] = None):
                                 subtype="PCM_24",
                             )
                             current = cleaned_path
+                            offsets_timing_preserved = False
                             logger.info(
                                 "Final cleanup removed %s phrase(s); re-normalized and updated merged WAV.",
                                 final_cleanup_meta.get("phrases_removed", 0),
@@ -1451,6 +1620,14 @@ def main(argv: Optional[list[str]] = None):
                     mp3_dir = output_dir / "mp3"
                     mp3_dir.mkdir(parents=True, exist_ok=True)
                     mp3_path = ensure_absolute_path(mp3_dir / "audiobook.mp3")
+                    # Sidecar offset table lets subtitles align per chunk
+                    offsets_path = write_chunk_offset_table(
+                        mp3_dir / "audiobook_offsets.json",
+                        chunk_offsets,
+                        crossfade_sec,
+                        batch_size,
+                        timing_preserved=offsets_timing_preserved,
+                    )
                     temp_mp3 = mp3_path.with_suffix(".mp3.tmp")
                     reuse_final = False
                     if config.resume_on_failure and mp3_path.exists():
@@ -1580,6 +1757,11 @@ def main(argv: Optional[list[str]] = None):
                     "chunks_with_phrases": chunks_with_phrases,
                     "cleanup_errors": cleanup_errors,
                     "cleanup_runs": cleanup_operations,
+                    "cleanup_triage": (
+                        phrase_cleaner.triage_stats.as_metrics()
+                        if phrase_cleaner is not None and phrase_cleaner.triage is not None
+                        else None
+                    ),
                 },
                 "summary": summary_block,
                 "artifacts": {
@@ -1587,6 +1769,7 @@ def main(argv: Optional[list[str]] = None):
                     "final_output": (
                         serialize_path_for_pipeline(Path(final_output_path)) if final_output_path else None
                     ),
+                    "chunk_offsets": (serialize_path_for_pipeline(offsets_path) if offsets_path else None),
                 },
                 "errors": [m.error_message for m in processed_metadata if m.error_message],
                 "timestamps": {
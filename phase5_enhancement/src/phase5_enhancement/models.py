@@ -81,7 +81,7 @@ class EnhancementConfig(BaseModel):
     )
     enable_volume_normalization: bool = Field(
         default=True,
-        description="Enable pydub volume normalization before processing",
+        description="Enable peak volume normalization before processing",
     )
     volume_norm_headroom: float = Field(
         default=0.1,
@@ -238,6 +238,18 @@ class EnhancementConfig(BaseModel):
         default=False,
         description="Save SRT transcripts during cleanup for debugging",
     )
+    cleanup_triage: Literal["off", "on", "shadow"] = Field(
+        default="on",
+        description=(
+            "Acoustic pre-filter before cleanup ASR: 'on' transcribes only suspicious chunks, "
+            "'shadow' transcribes all chunks but records triage precision/recall"
+        ),
+    )
+    cleanup_triage_audit_every: int = Field(
+        default=20,
+        ge=0,
+        description="Also transcribe every Nth triaged-clean chunk to measure triage recall (0 = never)",
+    )
 
     # Advanced Audio Mastering (NEW)
     enable_deepfilternet: bool = Field(
@@ -370,6 +382,11 @@ class AudioMetadata(BaseModel):
     )
     phrases_removed: Optional[int] = None
     cleanup_processing_time: Optional[float] = None
+    phase4_validation_reason: Optional[str] = None
+    phase4_validation_details: Optional[dict] = None
+    # False once cleanup/VAD trimming cut audio, so source-chunk
+    # transcripts no longer line up with the enhanced file
+    timing_preserved: bool = True
 
 
 class ProcessingResult(BaseModel):
@@ -427,6 +444,12 @@ class SubtitleConfig:
     enable_drift_correction: bool = True
     drift_correction_threshold: float = 1.0  # Correct if drift >1 sec
 
+    # Chunk-parallel mode: align each enhanced chunk against its Phase 3 text
+    mode: Literal["whole_book", "chunks"] = "whole_book"
+    chunk_offsets_path: Optional[Path] = None  # Defaults to <audio>_offsets.json
+    chunk_alignment: Literal["asr", "proportional"] = "asr"
+    chunk_workers: int = 2
+
     def __post_init__(self):
         """Ensure paths are Path objects."""
         self.audio_path = Path(self.audio_path)
@@ -435,3 +458,5 @@ class SubtitleConfig:
             self.reference_text_path = Path(self.reference_text_path)
         if self.pipeline_json:
             self.pipeline_json = Path(self.pipeline_json)
+        if self.chunk_offsets_path:
+            self.chunk_offsets_path = Path(self.chunk_offsets_path)
@@ -5,6 +5,7 @@ Integrated audio phrase detection and removal for Phase 5.
 Detects and removes unwanted TTS phrases before enhancement.
 """
 
+import importlib
 import logging
 import threading
 import time
@@ -12,8 +13,29 @@ from pathlib import Path
 from typing import ClassVar, Dict, List, Literal, Optional, Tuple
 
 import numpy as np
-from faster_whisper import WhisperModel
-from pydub import AudioSegment
+import soundfile as sf
+
+from .phrase_triage import PhraseTriage, TriageStats, TriageThresholds
+
+try:
+    from pipeline_common.lazy_import import lazy_module
+except ImportError:  # standalone use outside the pipeline checkout
+    lazy_module = importlib.import_module
+
+# CTranslate2 and pydub load when the cleaner first transcribes or splices
+faster_whisper = lazy_module("faster_whisper")
+pydub = lazy_module("pydub")
+
+try:
+    from pipeline_common.transcript_cache import (
+        TranscriptKey,
+        TranscriptStore,
+        audio_digest,
+        segments_from_faster_whisper,
+    )
+except ImportError:  # standalone use outside the pipeline checkout
+    TranscriptKey = TranscriptStore = audio_digest = None
+    segments_from_faster_whisper = None
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +56,12 @@ class PhraseCleanerConfig:
             "none", "first_n_chunks", "all", "final_only"
         ] = "all",
         cleanup_first_n: int = 3,
+        use_transcript_cache: bool = True,
+        reuse_foreign_transcripts: bool = True,
+        transcript_store: Optional[TranscriptStore] = None,
+        triage_mode: Literal["off", "on", "shadow"] = "on",
+        triage_audit_every: int = 20,
+        triage_thresholds: Optional[TriageThresholds] = None,
     ):
         self.enabled = enabled
         self.target_phrases = target_phrases or [
@@ -49,6 +77,18 @@ class PhraseCleanerConfig:
         self.save_transcripts = save_transcripts
         self.cleanup_scope = cleanup_scope
         self.cleanup_first_n = cleanup_first_n
+        # Reuse Phase 4 validation transcripts of the same audio; foreign
+        # (other backend/options) transcripts are accepted because phrase
+        # matching only needs segment text and times.
+        self.use_transcript_cache = use_transcript_cache
+        self.reuse_foreign_transcripts = reuse_foreign_transcripts
+        self.transcript_store = transcript_store
+        # Acoustic triage: "on" skips ASR on chunks that look clean (auditing
+        # every Nth one), "shadow" transcribes everything but still records
+        # how the triage would have decided.
+        self.triage_mode = triage_mode
+        self.triage_audit_every = triage_audit_every
+        self.triage_thresholds = triage_thresholds
 
 
 class PhraseCleaner:
@@ -57,7 +97,7 @@ class PhraseCleaner:
     Integrated into Phase 5 enhancement pipeline.
     """
 
-    _MODEL_CACHE: ClassVar[dict[tuple[str, str, str], WhisperModel]] = {}
+    _MODEL_CACHE: ClassVar[dict[tuple[str, str, str], "faster_whisper.WhisperModel"]] = {}
     _CACHE_LOCK: ClassVar[threading.Lock] = threading.Lock()
 
     def __init__(self, config: PhraseCleanerConfig):
@@ -66,6 +106,29 @@ class PhraseCleaner:
         self.target_phrases = [
             p.lower().strip() for p in config.target_phrases
         ]
+        self.triage = (
+            PhraseTriage(config.triage_thresholds)
+            if config.triage_mode != "off"
+            else None
+        )
+        self.triage_stats = TriageStats()
+        self._triage_clean_seen = 0
+        self._triage_lock = threading.Lock()
+        self.transcript_store = None
+        self.transcript_key = None
+        if TranscriptStore is not None and config.use_transcript_cache:
+            self.transcript_store = config.transcript_store or TranscriptStore.from_env()
+            self.transcript_key = TranscriptKey(
+                "faster-whisper",
+                config.model_size,
+                {
+                    "beam_size": 5,
+                    "word_timestamps": True,
+                    "vad_filter": True,
+                    "language": "en",
+                    "compute_type": config.compute_type,
+                },
+            )
 
         if config.enabled:
             logger.info(
@@ -81,12 +144,12 @@ class PhraseCleaner:
     @classmethod
     def _get_or_load_model(
         cls, model_size: str, device: str, compute_type: str
-    ) -> WhisperModel:
+    ) -> "faster_whisper.WhisperModel":
         """Load Whisper once and reuse it to avoid repeated GPU/CPU initialization."""
         cache_key = (model_size, device, compute_type)
         with cls._CACHE_LOCK:
             if cache_key not in cls._MODEL_CACHE:
-                cls._MODEL_CACHE[cache_key] = WhisperModel(
+                cls._MODEL_CACHE[cache_key] = faster_whisper.WhisperModel(
                     model_size, device=device, compute_type=compute_type
                 )
             return cls._MODEL_CACHE[cache_key]
@@ -112,6 +175,8 @@ class PhraseCleaner:
         *,
         chunk_index: Optional[int] = None,
         is_final_pass: bool = False,
+        expected_duration: Optional[float] = None,
+        chunk_row: Optional[Dict] = None,
     ) -> Tuple[Optional[np.ndarray], int, Dict]:
         """
         Clean audio file by removing target phrases.
@@ -120,6 +185,8 @@ class PhraseCleaner:
             audio_path: Path to audio file
             chunk_index: 1-based index of the chunk in the current batch (for scope control)
             is_final_pass: True when running after final concatenation
+            expected_duration: Phase 4 ``est_dur`` for the chunk (triage signal)
+            chunk_row: Phase 4 chunk record with validation flags (triage signal)
 
         Returns:
             Tuple of (cleaned_audio_array, sample_rate, metadata)
@@ -142,11 +209,30 @@ class PhraseCleaner:
         start_time = time.perf_counter()
 
         try:
+            decision = None
+            if self.triage is not None and not is_final_pass:
+                decision = self._triage(audio_path, expected_duration, chunk_row)
+                if not self._should_transcribe(decision):
+                    self.triage_stats.record(decision, transcribed=False, phrase_found=None)
+                    elapsed = time.perf_counter() - start_time
+                    return (
+                        None,
+                        0,
+                        {
+                            "status": "triaged_clean",
+                            "processing_time": elapsed,
+                            "scope": self.config.cleanup_scope,
+                            "triage": decision.as_dict(),
+                        },
+                    )
+
             # Transcribe audio
             segments = self._transcribe(audio_path)
 
             # Find target phrases
             matches = self._find_phrases(segments)
+            if decision is not None:
+                self.triage_stats.record(decision, transcribed=True, phrase_found=bool(matches))
 
             if not matches:
                 elapsed = time.perf_counter() - start_time
@@ -199,6 +285,33 @@ class PhraseCleaner:
                 },
             )
 
+    def _triage(
+        self,
+        audio_path: Path,
+        expected_duration: Optional[float],
+        chunk_row: Optional[Dict],
+    ):
+        audio, sr = sf.read(str(audio_path), dtype="float32", always_2d=False)
+        if audio.ndim > 1:
+            audio = audio.mean(axis=1)
+        decision = self.triage.assess(audio, sr, expected_duration, chunk_row)
+        if decision.suspicious:
+            logger.debug(
+                f"Triage flagged {audio_path.name}: {', '.join(decision.reasons)}"
+            )
+        return decision
+
+    def _should_transcribe(self, decision) -> bool:
+        """Suspicious chunks always go to ASR; clean ones only when audited."""
+        if decision.suspicious or self.config.triage_mode == "shadow":
+            return True
+        every = self.config.triage_audit_every
+        if every <= 0:
+            return False
+        with self._triage_lock:
+            self._triage_clean_seen += 1
+            return self._triage_clean_seen % every == 0
+
     def _transcribe(self, audio_path: Path) -> List[Dict]:
         """Transcribe audio with word-level timestamps."""
         if not self.model:
@@ -206,23 +319,28 @@ class PhraseCleaner:
                 "Phrase cleaner is disabled or model failed to load."
             )
 
-        segments, info = self.model.transcribe(
-            str(audio_path),
-            beam_size=5,
-            word_timestamps=True,
-            vad_filter=True,
-            language="en",
-        )
-
-        segments_list = []
-        for segment in segments:
-            segments_list.append(
-                {
-                    "start": segment.start,
-                    "end": segment.end,
-                    "text": segment.text,
-                }
+        transcript = self._cached_transcript(audio_path)
+        if transcript is None:
+            segments, info = self.model.transcribe(
+                str(audio_path),
+                beam_size=5,
+                word_timestamps=True,
+                vad_filter=True,
+                language="en",
             )
+            transcript = self._normalize_segments(segments)
+            if self.transcript_store is not None:
+                try:
+                    self.transcript_store.put(
+                        audio_digest(audio_path), self.transcript_key, transcript
+                    )
+                except OSError as exc:
+                    logger.debug(f"Could not cache transcript for {audio_path.name}: {exc}")
+
+        segments_list = [
+            {"start": seg["start"], "end": seg["end"], "text": seg["text"]}
+            for seg in transcript["segments"]
+        ]
 
         # Save transcript if enabled
         if self.config.save_transcripts:
@@ -230,6 +348,34 @@ class PhraseCleaner:
 
         return segments_list
 
+    @staticmethod
+    def _normalize_segments(segments) -> Dict:
+        if segments_from_faster_whisper is not None:
+            return segments_from_faster_whisper(segments)
+        return {
+            "segments": [
+                {"start": seg.start, "end": seg.end, "text": seg.text}
+                for seg in segments
+            ]
+        }
+
+    def _cached_transcript(self, audio_path: Path) -> Optional[Dict]:
+        """Transcript of this audio from an earlier stage, if one is stored."""
+        if self.transcript_store is None:
+            return None
+        try:
+            digest = audio_digest(audio_path)
+        except OSError:
+            return None
+        hit = self.transcript_store.get(digest, self.transcript_key)
+        if hit is None and self.config.reuse_foreign_transcripts:
+            hit = self.transcript_store.find(digest)
+        if hit is not None:
+            logger.debug(
+                f"Reusing {hit.get('backend')}/{hit.get('model')} transcript for {audio_path.name}"
+            )
+        return hit
+
     def _save_transcript(self, audio_path: Path, segments: List[Dict]):
         """Save SRT transcript for debugging."""
         transcript_path = (
@@ -281,14 +427,14 @@ class PhraseCleaner:
     ) -> Tuple[np.ndarray, int]:
         """Remove segments from audio and return as numpy array."""
         # Load audio with pydub
-        audio = AudioSegment.from_file(str(audio_path))
+        audio = pydub.AudioSegment.from_file(str(audio_path))
         sr = audio.frame_rate
 
         # Sort segments by start time
         segments = sorted(segments_to_remove, key=lambda x: x["start"])
 
         # Build clean audio
-        result = AudioSegment.empty()
+        result = pydub.AudioSegment.empty()
         last_end_ms = 0
 
         for segment in segments:
@@ -0,0 +1,216 @@
+"""
+Phase 5: acoustic triage for phrase cleanup.
+
+The unwanted TTS phrase ("You need to add some text for me to talk") shows
+up as an extra ~2-3 s utterance, usually isolated at the head or tail of a
+chunk, which also pushes the chunk past its Phase 4 expected duration.  This
+module scores those cheap signals so Whisper only runs on suspicious chunks:
+
+- duration overrun vs the Phase 4 ``est_dur`` (``predict_expected_duration``)
+- energy-VAD speech islands: an isolated, phrase-length island at an edge
+- trailing-island energy relative to the body of the chunk
+- Phase 4 validation flags (error phrase, duration mismatch, high WER, ...)
+
+``TriageStats`` compares triage decisions with transcription outcomes so the
+thresholds can be tuned: every suspicious chunk is transcribed anyway, and a
+sample of triaged-clean chunks is audited (``shadow`` mode audits all).
+Misses found in the sample are scaled up to all triaged-clean chunks before
+recall is computed, since true positives are counted over every chunk.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+FRAME_SEC = 0.02
+PHASE4_SUSPICIOUS_REASONS = {
+    "duration_mismatch",
+    "error_phrase_detected",
+    "high_wer",
+    "silence_gap",
+    "unnatural_pauses_vad",
+    "smart_retry_failed",
+}
+
+
+@dataclass
+class TriageThresholds:
+    """Tunable triage thresholds (defaults sized for the ~2.5 s phrase)."""
+
+    duration_ratio: float = 1.15
+    duration_margin_sec: float = 1.5
+    island_gap_sec: float = 0.6
+    island_min_sec: float = 1.2
+    island_max_sec: float = 4.5
+    edge_window_sec: float = 6.0
+    tail_energy_db: float = 4.0
+    vad_floor_db: float = -35.0
+    min_pause_sec: float = 0.25
+
+
+@dataclass
+class TriageDecision:
+    """Outcome of one chunk's triage."""
+
+    suspicious: bool
+    reasons: List[str] = field(default_factory=list)
+    signals: Dict[str, Any] = field(default_factory=dict)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {"suspicious": self.suspicious, "reasons": list(self.reasons), "signals": dict(self.signals)}
+
+
+def speech_islands(audio: np.ndarray, sr: int, floor_db: float = -35.0, min_pause_sec: float = 0.25) -> List[tuple]:
+    """
+    Energy-VAD speech islands as (start_sec, end_sec, rms_db).
+
+    Frames within ``floor_db`` of the loudest frame count as speech; pauses
+    shorter than ``min_pause_sec`` are bridged.
+    """
+    frame = max(1, int(sr * FRAME_SEC))
+    n_frames = len(audio) // frame
+    if n_frames == 0:
+        return []
+    frames = np.asarray(audio[: n_frames * frame], dtype=np.float32).reshape(n_frames, frame)
+    energy = np.sqrt(np.mean(frames.astype(np.float64) ** 2, axis=1)) + 1e-12
+    energy_db = 20.0 * np.log10(energy)
+    voiced = energy_db > (energy_db.max() + floor_db)
+
+    # Bridge short pauses so syllable gaps don't split words into islands
+    max_gap = int(min_pause_sec / FRAME_SEC)
+    idx = np.flatnonzero(voiced)
+    if idx.size == 0:
+        return []
+    breaks = np.flatnonzero(np.diff(idx) > max_gap + 1)
+    starts = np.concatenate(([idx[0]], idx[breaks + 1]))
+    ends = np.concatenate((idx[breaks], [idx[-1]])) + 1
+    islands = []
+    for s, e in zip(starts, ends):
+        rms = float(np.sqrt(np.mean(energy[s:e] ** 2)))
+        islands.append((s * FRAME_SEC, e * FRAME_SEC, 20.0 * np.log10(rms)))
+    return islands
+
+
+def phase4_flags(chunk_row: Optional[Dict[str, Any]]) -> List[str]:
+    """Phase 4 validation outcomes that make a chunk worth transcribing."""
+    if not chunk_row:
+        return []
+    flags = []
+    reason = chunk_row.get("validation_reason")
+    if isinstance(reason, str) and (reason in PHASE4_SUSPICIOUS_REASONS or reason.startswith("asr_")):
+        flags.append(f"phase4_{reason}")
+    details = chunk_row.get("validation_details") or {}
+    if isinstance(details, dict) and details.get("detected_phrase"):
+        flags.append("phase4_detected_phrase")
+    return flags
+
+
+class PhraseTriage:
+    """Decide from cheap acoustic signals whether a chunk needs ASR."""
+
+    def __init__(self, thresholds: Optional[TriageThresholds] = None):
+        self.thresholds = thresholds or TriageThresholds()
+
+    def assess(
+        self,
+        audio: np.ndarray,
+        sr: int,
+        expected_duration: Optional[float] = None,
+        chunk_row: Optional[Dict[str, Any]] = None,
+    ) -> TriageDecision:
+        t = self.thresholds
+        duration = len(audio) / sr if sr else 0.0
+        reasons = phase4_flags(chunk_row)
+        signals: Dict[str, Any] = {"duration": round(duration, 3)}
+
+        if expected_duration:
+            ratio = duration / expected_duration
+            signals["duration_ratio"] = round(ratio, 3)
+            if ratio > t.duration_ratio and duration - expected_duration > t.duration_margin_sec:
+                reasons.append("duration_overrun")
+
+        islands = speech_islands(audio, sr, t.vad_floor_db, t.min_pause_sec)
+        signals["speech_islands"] = len(islands)
+        if len(islands) >= 2:
+            body_db = float(np.median([db for _, _, db in islands[:-1]]))
+            tail_start, tail_end, tail_db = islands[-1]
+            head_start, head_end, _ = islands[0]
+            signals["tail_energy_delta_db"] = round(tail_db - body_db, 2)
+            if self._isolated(tail_end - tail_start, tail_start - islands[-2][1]) and (
+                duration - tail_start <= t.edge_window_sec
+            ):
+                reasons.append("isolated_tail_island")
+                if abs(tail_db - body_db) >= t.tail_energy_db:
+                    reasons.append("tail_energy_shift")
+            if self._isolated(head_end - head_start, islands[1][0] - head_end) and head_end <= t.edge_window_sec:
+                reasons.append("isolated_head_island")
+
+        return TriageDecision(suspicious=bool(reasons), reasons=reasons, signals=signals)
+
+    def _isolated(self, island_sec: float, gap_sec: float) -> bool:
+        t = self.thresholds
+        return gap_sec >= t.island_gap_sec and t.island_min_sec <= island_sec <= t.island_max_sec
+
+
+class TriageStats:
+    """Thread-safe confusion counts of triage decisions vs transcription results."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.screened = 0
+        self.skipped = 0
+        self.true_positive = 0
+        self.false_positive = 0
+        self.false_negative = 0
+        self.true_negative = 0
+        self.reasons: Dict[str, int] = {}
+
+    def record(self, decision: TriageDecision, transcribed: bool, phrase_found: Optional[bool]) -> None:
+        with self._lock:
+            self.screened += 1
+            for reason in decision.reasons:
+                self.reasons[reason] = self.reasons.get(reason, 0) + 1
+            if not transcribed:
+                self.skipped += 1
+                return
+            if decision.suspicious:
+                if phrase_found:
+                    self.true_positive += 1
+                else:
+                    self.false_positive += 1
+            elif phrase_found:
+                self.false_negative += 1
+            else:
+                self.true_negative += 1
+
+    def as_metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            flagged = self.true_positive + self.false_positive
+            audited = self.false_negative + self.true_negative
+            # Only 1 in audit_every clean chunks is transcribed: scale the
+            # sampled misses to every clean chunk (factor 1 in shadow mode)
+            clean = audited + self.skipped
+            false_negative_est = self.false_negative * clean / audited if audited else None
+            positives = self.true_positive + (false_negative_est or 0.0)
+            recall_known = audited > 0 or clean == 0
+            return {
+                "screened": self.screened,
+                "asr_skipped": self.skipped,
+                "suspicious": flagged,
+                "audited_clean": audited,
+                "true_positive": self.true_positive,
+                "false_positive": self.false_positive,
+                "false_negative": self.false_negative,
+                "false_negative_estimate": (
+                    round(false_negative_est, 2) if false_negative_est is not None else None
+                ),
+                "true_negative": self.true_negative,
+                "precision": (self.true_positive / flagged) if flagged else None,
+                # None when no clean chunk was audited: misses cannot be estimated
+                "recall": (self.true_positive / positives) if positives and recall_known else None,
+                "reasons": dict(self.reasons),
+            }
@@ -0,0 +1,400 @@
+"""
+Chunk-parallel subtitle alignment.
+
+Instead of one Whisper pass over the whole audiobook, each enhanced chunk is
+aligned on its own against the text Phase 3 already produced for it, on a
+worker pool.  Local timestamps are shifted by the chunk's start in the final
+audiobook using the offset table Phase 5 writes next to ``audiobook.mp3``
+(which already accounts for crossfade overlap at batch seams).
+
+Alignment modes per chunk:
+- ``asr``: short Whisper pass with word timestamps; the known text is
+  anchored onto recognised words and unmatched words are interpolated.
+- ``proportional``: no ASR; words are spread over the chunk duration by
+  character weight (TTS pacing is near-uniform).
+
+Either way the subtitle text is the known chunk text, not free ASR output.
+ASR word timings are looked up in the shared transcript store first; enhanced
+chunks that kept their timeline resolve to the transcripts Phase 4 validation
+or Phase 5 cleanup already produced for the source chunk.
+"""
+
+import hashlib
+import json
+import logging
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_RE = re.compile(r"\S+")
+_NORMALIZE_RE = re.compile(r"[^a-z0-9']+")
+_CHUNK_NUM_RES = (re.compile(r"_chunk_(\d+)"), re.compile(r"chunk_(\d+)"), re.compile(r"(\d+)"))
+_SENTENCE_END = (".", "!", "?", '."', '!"', '?"', ".'", ".)")
+_PAUSE_WEIGHTS = {",": 3, ";": 4, ":": 4, ".": 6, "!": 6, "?": 6}
+
+Segment = Dict[str, Any]
+WordTimes = List[Dict[str, Any]]
+
+
+@dataclass
+class ChunkSpan:
+    """One enhanced chunk and its position in the final audiobook."""
+
+    index: int
+    chunk_id: int
+    audio_path: Path
+    start: float
+    end: float
+    duration: float
+
+
+def chunk_number(path: str) -> Optional[int]:
+    """Chunk number from names like ``book_chunk_001.txt`` / ``enhanced_0001.wav``."""
+    name = Path(path).name
+    for pattern in _CHUNK_NUM_RES:
+        match = pattern.search(name)
+        if match:
+            return int(match.group(1))
+    return None
+
+
+def default_offsets_path(audio_path: Path) -> Path:
+    """Sidecar written by Phase 5 concatenation (``audiobook_offsets.json``)."""
+    audio_path = Path(audio_path)
+    return audio_path.with_name(f"{audio_path.stem}_offsets.json")
+
+
+def load_chunk_spans(offsets_path: Path) -> Tuple[List[ChunkSpan], Dict[str, Any]]:
+    """Read the Phase 5 offset table; returns (spans, table metadata)."""
+    with open(offsets_path, "r", encoding="utf-8") as f:
+        table = json.load(f)
+    spans = [
+        ChunkSpan(
+            index=int(item["index"]),
+            chunk_id=int(item["chunk_id"]),
+            audio_path=Path(item["enhanced_path"]),
+            start=float(item["start"]),
+            end=float(item["end"]),
+            duration=float(item["duration"]),
+        )
+        for item in table.get("chunks", [])
+    ]
+    meta = {k: v for k, v in table.items() if k != "chunks"}
+    return sorted(spans, key=lambda s: s.index), meta
+
+
+def load_chunk_texts(pipeline_json: Path, file_id: str) -> Dict[int, str]:
+    """Map chunk number -> Phase 3 chunk text for ``file_id``."""
+    from pipeline_common import PipelineState
+
+    pipeline_json = Path(pipeline_json)
+    state = PipelineState(pipeline_json, validate_on_read=False)
+    data = state.read(validate=False)
+    entry = (data.get("phase3", {}).get("files", {}) or {}).get(file_id) or {}
+    chunk_paths = entry.get("chunk_paths") or entry.get("artifacts", {}).get("chunk_paths") or []
+
+    roots = [pipeline_json.parent, pipeline_json.parent / "phase3-chunking"]
+    texts: Dict[int, str] = {}
+    for position, raw in enumerate(chunk_paths, start=1):
+        path = Path(raw)
+        if not path.is_absolute() and not path.exists():
+            path = next((root / raw for root in roots if (root / raw).exists()), path)
+        if not path.exists():
+            logger.debug("Chunk text not found: %s", raw)
+            continue
+        number = chunk_number(str(path))
+        texts[number if number is not None else position] = path.read_text(encoding="utf-8").strip()
+    return texts
+
+
+def _normalize_token(token: str) -> str:
+    return _NORMALIZE_RE.sub("", token.lower())
+
+
+def _token_weight(token: str) -> float:
+    return len(token) + 1 + _PAUSE_WEIGHTS.get(token[-1:], 0)
+
+
+def _spread(tokens: List[str], start: float, end: float) -> WordTimes:
+    """Distribute ``tokens`` over [start, end] by character weight."""
+    if not tokens:
+        return []
+    weights = [_token_weight(t) for t in tokens]
+    total = sum(weights)
+    span = max(0.0, end - start)
+    words = []
+    cursor = start
+    for token, weight in zip(tokens, weights):
+        step = span * weight / total
+        words.append({"word": token, "start": cursor, "end": cursor + step, "probability": None})
+        cursor += step
+    return words
+
+
+def proportional_word_times(text: str, duration: float) -> WordTimes:
+    """Word timings for ``text`` spread uniformly (by characters) over ``duration``."""
+    return _spread(_TOKEN_RE.findall(text), 0.0, duration)
+
+
+def anchor_word_times(text: str, asr_words: WordTimes, duration: float) -> Tuple[WordTimes, float]:
+    """
+    Anchor the known ``text`` onto recognised ASR words.
+
+    Reference words matched to an ASR word take its timing; runs of
+    unmatched words are interpolated between the neighbouring anchors.
+    Returns (word_times, anchored_fraction).
+    """
+    tokens = _TOKEN_RE.findall(text)
+    if not tokens:
+        return [], 0.0
+    if not asr_words:
+        return _spread(tokens, 0.0, duration), 0.0
+
+    ref_norm = [_normalize_token(t) for t in tokens]
+    asr_norm = [_normalize_token(str(w.get("word", ""))) for w in asr_words]
+    anchors: Dict[int, Dict[str, Any]] = {}
+    matcher = SequenceMatcher(None, ref_norm, asr_norm, autojunk=False)
+    for block in matcher.get_matching_blocks():
+        for offset in range(block.size):
+            ref_idx, asr_idx = block.a + offset, block.b + offset
+            if ref_norm[ref_idx]:
+                anchors[ref_idx] = asr_words[asr_idx]
+
+    words: WordTimes = []
+    pending: List[str] = []
+    previous_end = 0.0
+    for idx, token in enumerate(tokens):
+        anchor = anchors.get(idx)
+        if anchor is None:
+            pending.append(token)
+            continue
+        start = max(previous_end, float(anchor["start"]))
+        words.extend(_spread(pending, previous_end, start))
+        pending = []
+        end = max(start, float(anchor["end"]))
+        words.append({"word": token, "start": start, "end": end, "probability": anchor.get("probability")})
+        previous_end = end
+    words.extend(_spread(pending, previous_end, max(previous_end, duration)))
+    return words, len(anchors) / len(tokens)
+
+
+def group_words(words: WordTimes, max_chars: int) -> List[Segment]:
+    """Group timed words into subtitle-sized segments, breaking at sentence ends."""
+    segments: List[Segment] = []
+    current: WordTimes = []
+    length = 0
+    for word in words:
+        token = word["word"]
+        if current and length + 1 + len(token) > max_chars:
+            segments.append(_segment_from_words(current))
+            current, length = [], 0
+        current.append(word)
+        length += len(token) + (1 if length else 0)
+        if token.endswith(_SENTENCE_END):
+            segments.append(_segment_from_words(current))
+            current, length = [], 0
+    if current:
+        segments.append(_segment_from_words(current))
+    return segments
+
+
+def _segment_from_words(words: WordTimes) -> Segment:
+    return {
+        "start": words[0]["start"],
+        "end": words[-1]["end"],
+        "text": " ".join(w["word"] for w in words),
+        "no_speech_prob": 0.0,
+        "words": [dict(w, word=f" {w['word']}") for w in words],
+    }
+
+
+def offset_segments(segments: List[Segment], span: ChunkSpan) -> List[Segment]:
+    """Shift chunk-local timestamps to audiobook time, clamped to the chunk span."""
+    shifted = []
+    for seg in segments:
+        new_seg = dict(seg)
+        new_seg["start"] = min(span.end, span.start + seg["start"])
+        new_seg["end"] = min(span.end, span.start + seg["end"])
+        new_seg["chunk_index"] = span.index
+        if seg.get("words"):
+            new_seg["words"] = [
+                dict(
+                    w,
+                    start=min(span.end, span.start + w["start"]),
+                    end=min(span.end, span.start + w["end"]),
+                )
+                for w in seg["words"]
+            ]
+        shifted.append(new_seg)
+    return shifted
+
+
+class ChunkSubtitleAligner:
+    """Align every chunk against its known text on a thread pool and merge."""
+
+    def __init__(
+        self,
+        model: Any = None,
+        workers: int = 2,
+        alignment: str = "asr",
+        language: str = "en",
+        beam_size: int = 5,
+        max_chars: int = 84,
+        transcript_store: Any = None,
+        model_name: str = "",
+    ):
+        self.model = model
+        self.transcript_store = transcript_store
+        self.model_name = model_name
+        self.workers = max(1, int(workers))
+        self.alignment = alignment if model is not None else "proportional"
+        self.language = language
+        self.beam_size = beam_size
+        self.max_chars = max_chars
+
+    def _transcript_key(self, prompt: str) -> Any:
+        from pipeline_common.transcript_cache import TranscriptKey
+
+        options = {
+            "language": self.language,
+            "beam_size": self.beam_size,
+            "temperature": 0.0,
+            "word_timestamps": True,
+            "initial_prompt": hashlib.sha1(prompt[:200].encode("utf-8")).hexdigest()[:12] if prompt else None,
+        }
+        return TranscriptKey("faster-whisper", self.model_name, options)
+
+    def _cached_words(self, audio_path: Path, prompt: str) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """(audio digest, stored transcript with word timings) for this chunk, if any."""
+        if self.transcript_store is None:
+            return None, None
+        from pipeline_common.transcript_cache import audio_digest
+
+        try:
+            digest = audio_digest(audio_path)
+        except OSError:
+            return None, None
+        hit = self.transcript_store.get(digest, self._transcript_key(prompt))
+        if hit is None:
+            hit = self.transcript_store.find(digest, require_words=True)
+        return digest, hit
+
+    def _asr_words(self, audio_path: Path, prompt: str) -> Tuple[WordTimes, List[Segment]]:
+        digest, cached = self._cached_words(audio_path, prompt)
+        if cached is not None and cached.get("words"):
+            words = [dict(w) for w in cached["words"]]
+            segments = [
+                {
+                    "start": seg["start"],
+                    "end": seg["end"],
+                    "text": seg["text"].strip(),
+                    "no_speech_prob": seg.get("no_speech_prob") or 0.0,
+                    "words": [
+                        dict(w, word=f" {w['word']}") for w in words if seg["start"] <= w["start"] < seg["end"]
+                    ],
+                }
+                for seg in cached.get("segments") or []
+            ]
+            return words, segments
+
+        segments_iter, _ = self.model.transcribe(
+            str(audio_path),
+            language=self.language,
+            beam_size=self.beam_size,
+            temperature=0.0,
+            word_timestamps=True,
+            initial_prompt=prompt[:200] or None,
+        )
+        words: WordTimes = []
+        segments: List[Segment] = []
+        for segment in segments_iter:
+            seg_words = [
+                {"word": w.word.strip(), "start": w.start, "end": w.end, "probability": w.probability}
+                for w in (getattr(segment, "words", None) or [])
+            ]
+            words.extend(seg_words)
+            segments.append(
+                {
+                    "start": segment.start,
+                    "end": segment.end,
+                    "text": segment.text.strip(),
+                    "no_speech_prob": segment.no_speech_prob,
+                    "words": [dict(w, word=f" {w['word']}") for w in seg_words],
+                }
+            )
+        if digest is not None:
+            transcript = {
+                "text": " ".join(seg["text"] for seg in segments),
+                "segments": [{k: v for k, v in seg.items() if k != "words"} for seg in segments],
+                "words": words,
+            }
+            try:
+                self.transcript_store.put(digest, self._transcript_key(prompt), transcript)
+            except OSError as exc:
+                logger.debug("Could not cache transcript for %s: %s", audio_path, exc)
+        return words, segments
+
+    def align_chunk(self, span: ChunkSpan, text: Optional[str]) -> Tuple[List[Segment], Dict[str, Any]]:
+        """Return (audiobook-time segments, per-chunk stats) for one chunk."""
+        stats: Dict[str, Any] = {"index": span.index, "chunk_id": span.chunk_id, "method": self.alignment}
+        if not text:
+            if self.model is None:
+                stats["method"] = "missing_text"
+                return [], stats
+            _, segments = self._asr_words(span.audio_path, "")
+            stats["method"] = "asr_free"
+            return offset_segments(segments, span), stats
+
+        if self.alignment == "asr":
+            asr_words, _ = self._asr_words(span.audio_path, text)
+            words, anchored = anchor_word_times(text, asr_words, span.duration)
+            stats["anchored_fraction"] = round(anchored, 4)
+        else:
+            words = proportional_word_times(text, span.duration)
+        return offset_segments(group_words(words, self.max_chars), span), stats
+
+    def _safe_align(self, span: ChunkSpan, text: Optional[str]) -> Tuple[List[Segment], Dict[str, Any]]:
+        try:
+            return self.align_chunk(span, text)
+        except Exception as exc:  # noqa: BLE001 - one bad chunk must not sink the book
+            logger.warning("Chunk %s alignment failed (%s); using proportional timing", span.chunk_id, exc)
+            words = proportional_word_times(text or "", span.duration)
+            stats = {"index": span.index, "chunk_id": span.chunk_id, "method": "proportional_fallback"}
+            return offset_segments(group_words(words, self.max_chars), span), stats
+
+    def run(
+        self,
+        spans: List[ChunkSpan],
+        texts: Dict[int, str],
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> Tuple[List[Segment], Dict[str, Any]]:
+        """Align all chunks; segments come back merged in chunk order."""
+        results: List[Tuple[List[Segment], Dict[str, Any]]] = [([], {})] * len(spans)
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = {
+                pool.submit(self._safe_align, span, texts.get(span.chunk_id)): pos for pos, span in enumerate(spans)
+            }
+            for done, future in enumerate(as_completed(futures), start=1):
+                results[futures[future]] = future.result()
+                if progress:
+                    progress(done, len(spans))
+
+        merged: List[Segment] = []
+        methods: Dict[str, int] = {}
+        anchored = []
+        for segments, stats in results:
+            merged.extend(segments)
+            methods[stats.get("method", "unknown")] = methods.get(stats.get("method", "unknown"), 0) + 1
+            if "anchored_fraction" in stats:
+                anchored.append(stats["anchored_fraction"])
+        metrics = {
+            "chunk_count": len(spans),
+            "chunk_methods": methods,
+            "avg_anchored_fraction": (sum(anchored) / len(anchored)) if anchored else None,
+        }
+        return merged, metrics
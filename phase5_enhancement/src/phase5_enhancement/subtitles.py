@@ -18,7 +18,9 @@ from faster_whisper import WhisperModel
 from pydub import AudioSegment
 
 from pipeline_common import PipelineState
+from pipeline_common.transcript_cache import TranscriptStore
 
+from .ffmpeg_utils import run_ffmpeg
 from .models import SubtitleConfig
 from .subtitle_aligner import align_timestamps, detect_drift
 from .subtitle_validator import (
@@ -28,6 +30,12 @@ from .subtitle_validator import (
     format_vtt,
 )
 from .subtitle_karaoke import KaraokeGenerator
+from .subtitle_chunks import (
+    ChunkSubtitleAligner,
+    default_offsets_path,
+    load_chunk_spans,
+    load_chunk_texts,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -54,10 +62,30 @@ def serialize_path_for_pipeline(path: Path) -> str:
 
 @lru_cache(maxsize=3)
 def _load_whisper_model(
-    model_size: str, device: str, compute_type: str
+    model_size: str, device: str, compute_type: str, num_workers: int = 1
 ) -> WhisperModel:
     """Cache Whisper models to avoid repeated downloads/initialization."""
-    return WhisperModel(model_size, device=device, compute_type=compute_type)
+    return WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        num_workers=num_workers,
+    )
+
+
+def _probe_duration(path: Path) -> float:
+    """Audio duration from container headers; full decode only as a fallback."""
+    try:
+        from mutagen import File as MutagenFile
+
+        audio_info = MutagenFile(str(path))
+        length = getattr(audio_info.info, "length", 0) if audio_info else 0
+        if length and length > 0:
+            return float(length)
+    except Exception as exc:
+        logger.debug(f"mutagen duration probe failed for {path}: {exc}")
+    audio = AudioSegment.from_file(str(path))
+    return len(audio) / 1000.0  # Convert to seconds
 
 
 class SubtitleGenerator:
@@ -71,9 +99,54 @@ class SubtitleGenerator:
         self.segments = []
         self.metrics = {}
         self._phase_start_ts: Optional[float] = None
+        self.chunk_spans = []
+        self.chunk_metrics: Dict[str, Any] = {}
+
+    def _use_chunk_mode(self) -> bool:
+        """Chunk mode needs a timing-preserving offset table from Phase 5."""
+        if self.config.mode != "chunks":
+            return False
+        offsets_path = self.config.chunk_offsets_path or default_offsets_path(
+            self.config.audio_path
+        )
+        if not offsets_path.exists():
+            logger.warning(
+                f"Chunk offset table not found ({offsets_path}); using whole-book transcription"
+            )
+            return False
+        spans, meta = load_chunk_spans(offsets_path)
+        if not spans or not meta.get("timing_preserved", True):
+            logger.warning(
+                "Offset table is empty or final audio was edited after concat; "
+                "using whole-book transcription"
+            )
+            return False
+        self.chunk_spans = spans
+        self.audio_duration = float(
+            meta.get("total_duration") or spans[-1].end
+        )
+        return True
 
     def initialize(self):
         """Initialize Whisper model and validate inputs."""
+        chunk_mode = self._use_chunk_mode()
+        if chunk_mode:
+            # Duration comes from the offset table; no need to decode the book
+            self.config.output_dir.mkdir(parents=True, exist_ok=True)
+            logger.info(
+                f"Chunk mode: {len(self.chunk_spans)} chunks, "
+                f"{self.audio_duration/60:.1f} minutes, alignment={self.config.chunk_alignment}"
+            )
+            if self.config.chunk_alignment == "asr":
+                self.model = _load_whisper_model(
+                    self.config.model_size,
+                    self.config.device,
+                    self.config.compute_type,
+                    max(1, self.config.chunk_workers),
+                )
+            return
+
+        self.chunk_spans = []
         logger.info(f"Initializing Whisper model: {self.config.model_size}")
         start = time.perf_counter()
 
@@ -88,8 +161,7 @@ class SubtitleGenerator:
         logger.info(f"Model loaded in {load_time:.2f}s")
 
         # Get audio duration
-        audio = AudioSegment.from_file(str(self.config.audio_path))
-        self.audio_duration = len(audio) / 1000.0  # Convert to seconds
+        self.audio_duration = _probe_duration(self.config.audio_path)
         logger.info(
             f"Audio duration: {self.audio_duration:.2f}s ({self.audio_duration/60:.1f} minutes)"
         )
@@ -97,88 +169,155 @@ class SubtitleGenerator:
         # Create output directory
         self.config.output_dir.mkdir(parents=True, exist_ok=True)
 
+    def _checkpoint_fingerprint(self) -> Dict[str, Any]:
+        """Identify the audio + options a checkpoint belongs to."""
+        stat = self.config.audio_path.stat()
+        return {
+            "audio_size": stat.st_size,
+            "audio_mtime_ns": stat.st_mtime_ns,
+            "model_size": self.config.model_size,
+            "word_timestamps": bool(self.enable_karaoke),
+        }
+
+    def _load_checkpoint(self, path: Path) -> Tuple[List[Dict], float]:
+        """Return (segments, last_end) from a matching checkpoint, else ([], 0)."""
+        if not (self.config.enable_checkpoints and path.exists()):
+            return [], 0.0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                checkpoint_data = json.load(f)
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.warning(f"Ignoring unreadable checkpoint {path}: {exc}")
+            return [], 0.0
+        fingerprint = checkpoint_data.get("fingerprint")
+        if fingerprint is not None and fingerprint != self._checkpoint_fingerprint():
+            logger.warning(
+                "Checkpoint was made for different audio or options; starting over"
+            )
+            return [], 0.0
+        segments = checkpoint_data.get("segments", [])
+        last_end = float(checkpoint_data.get("last_end", 0.0))
+        logger.info(f"Resuming from checkpoint: {path} ({last_end:.2f}s)")
+        return segments, last_end
+
+    def _slice_audio(self, start: float) -> Path:
+        """Decode the audiobook from ``start`` seconds into a temp 16 kHz mono WAV."""
+        fd, tmp_name = tempfile.mkstemp(
+            suffix=".wav",
+            prefix=f"{self.config.file_id}_resume_",
+            dir=str(self.config.output_dir),
+        )
+        os.close(fd)
+        run_ffmpeg(
+            [
+                "ffmpeg",
+                "-y",
+                "-loglevel",
+                "error",
+                "-ss",
+                f"{start:.3f}",
+                "-i",
+                str(self.config.audio_path),
+                "-ac",
+                "1",
+                "-ar",
+                "16000",
+                tmp_name,
+            ],
+            "subtitle resume slice",
+        )
+        return Path(tmp_name)
+
     def transcribe(self) -> List[Dict[str, Any]]:
-        """Transcribe audio with checkpoint support."""
+        """Transcribe audio with checkpoint support.
+
+        On resume only the audio after the checkpoint's ``last_end`` is
+        decoded (ffmpeg input seek); new segments are shifted by that offset
+        and appended, so no work is repeated and nothing is duplicated.
+        """
         logger.info("Starting transcription...")
         start = time.perf_counter()
 
-        segments_data = []
         checkpoint_path = (
             self.config.output_dir / f"{self.config.file_id}_checkpoint.json"
         )
+        segments_data, last_end = self._load_checkpoint(checkpoint_path)
 
-        # Resume from checkpoint if exists
-        if self.config.enable_checkpoints and checkpoint_path.exists():
-            logger.info(f"Resuming from checkpoint: {checkpoint_path}")
-            with open(checkpoint_path, "r", encoding="utf-8") as f:
-                checkpoint_data = json.load(f)
-                segments_data = checkpoint_data["segments"]
-                last_end = checkpoint_data["last_end"]
-                logger.info(f"Resuming from {last_end:.2f}s")
-
-        # Transcribe with faster-whisper
-        # Enable word-level timestamps for karaoke mode
-        segments_iter, info = self.model.transcribe(
-            str(self.config.audio_path),
-            language=self.config.language,
-            beam_size=self.config.beam_size,
-            temperature=self.config.temperature,
-            vad_filter=True,  # Voice Activity Detection
-            vad_parameters=dict(min_silence_duration_ms=500, threshold=0.5),
-            word_timestamps=self.enable_karaoke,  # Enable word-level timestamps for karaoke
-        )
+        source = self.config.audio_path
+        sliced_path: Optional[Path] = None
+        if last_end > 0:
+            sliced_path = self._slice_audio(last_end)
+            source = sliced_path
 
-        logger.info(
-            f"Detected language: {info.language} (confidence: {info.language_probability:.2f})"
-        )
+        try:
+            # Transcribe with faster-whisper
+            # Enable word-level timestamps for karaoke mode
+            segments_iter, info = self.model.transcribe(
+                str(source),
+                language=self.config.language,
+                beam_size=self.config.beam_size,
+                temperature=self.config.temperature,
+                vad_filter=True,  # Voice Activity Detection
+                vad_parameters=dict(min_silence_duration_ms=500, threshold=0.5),
+                word_timestamps=self.enable_karaoke,  # Enable word-level timestamps for karaoke
+            )
 
-        # Process segments
-        checkpoint_counter = 0
-        for segment in segments_iter:
-            segment_data = {
-                "start": segment.start,
-                "end": segment.end,
-                "text": segment.text.strip(),
-                "no_speech_prob": segment.no_speech_prob,
-            }
+            logger.info(
+                f"Detected language: {info.language} (confidence: {info.language_probability:.2f})"
+            )
 
-            # Capture word-level timestamps for karaoke mode
-            if (
-                self.enable_karaoke
-                and hasattr(segment, "words")
-                and segment.words
-            ):
-                segment_data["words"] = [
-                    {
-                        "word": word.word,
-                        "start": word.start,
-                        "end": word.end,
-                        "probability": word.probability,
-                    }
-                    for word in segment.words
-                ]
-                logger.debug(
-                    f"Captured {len(segment_data['words'])} words at {segment.start:.2f}s"
-                )
+            # Process segments
+            checkpoint_counter = 0
+            for segment in segments_iter:
+                seg_start = segment.start + last_end
+                seg_end = segment.end + last_end
+                segment_data = {
+                    "start": seg_start,
+                    "end": seg_end,
+                    "text": segment.text.strip(),
+                    "no_speech_prob": segment.no_speech_prob,
+                }
 
-            # Handle silence/non-speech
-            if (
-                segment.no_speech_prob > 0.8
-                and (segment.end - segment.start) > 3.0
-            ):
-                segment_data["text"] = "[pause]"
-                logger.debug(f"Detected silence at {segment.start:.2f}s")
-
-            segments_data.append(segment_data)
-
-            # Checkpoint every N seconds
-            if self.config.enable_checkpoints:
-                checkpoint_counter += segment.end - segment.start
-                if checkpoint_counter >= self.config.checkpoint_interval:
-                    self._save_checkpoint(
-                        checkpoint_path, segments_data, segment.end
+                # Capture word-level timestamps for karaoke mode
+                if (
+                    self.enable_karaoke
+                    and hasattr(segment, "words")
+                    and segment.words
+                ):
+                    segment_data["words"] = [
+                        {
+                            "word": word.word,
+                            "start": word.start + last_end,
+                            "end": word.end + last_end,
+                            "probability": word.probability,
+                        }
+                        for word in segment.words
+                    ]
+                    logger.debug(
+                        f"Captured {len(segment_data['words'])} words at {seg_start:.2f}s"
                     )
-                    checkpoint_counter = 0
+
+                # Handle silence/non-speech
+                if (
+                    segment.no_speech_prob > 0.8
+                    and (segment.end - segment.start) > 3.0
+                ):
+                    segment_data["text"] = "[pause]"
+                    logger.debug(f"Detected silence at {seg_start:.2f}s")
+
+                segments_data.append(segment_data)
+
+                # Checkpoint every N seconds
+                if self.config.enable_checkpoints:
+                    checkpoint_counter += segment.end - segment.start
+                    if checkpoint_counter >= self.config.checkpoint_interval:
+                        self._save_checkpoint(
+                            checkpoint_path, segments_data, seg_end
+                        )
+                        checkpoint_counter = 0
+        finally:
+            if sliced_path is not None:
+                sliced_path.unlink(missing_ok=True)
 
         duration = time.perf_counter() - start
         logger.info(
@@ -192,20 +331,73 @@ class SubtitleGenerator:
         self.segments = segments_data
         return segments_data
 
+    def transcribe_chunks(self) -> List[Dict[str, Any]]:
+        """Align each enhanced chunk against its known text in parallel."""
+        logger.info(
+            f"Aligning {len(self.chunk_spans)} chunks with "
+            f"{self.config.chunk_workers} worker(s)..."
+        )
+        start = time.perf_counter()
+
+        texts: Dict[int, str] = {}
+        if self.config.pipeline_json:
+            try:
+                texts = load_chunk_texts(
+                    self.config.pipeline_json, self.config.file_id
+                )
+            except Exception as exc:
+                logger.warning(f"Could not load Phase 3 chunk texts: {exc}")
+        if not texts:
+            logger.warning(
+                "No chunk texts available; falling back to per-chunk ASR text"
+            )
+
+        aligner = ChunkSubtitleAligner(
+            model=self.model,
+            workers=self.config.chunk_workers,
+            alignment=self.config.chunk_alignment,
+            language=self.config.language,
+            beam_size=self.config.beam_size,
+            max_chars=self.config.max_chars,
+            transcript_store=TranscriptStore.from_env(),
+            model_name=self.config.model_size,
+        )
+
+        def _progress(done: int, total: int) -> None:
+            if done == total or done % 50 == 0:
+                logger.info(f"Aligned {done}/{total} chunks")
+
+        segments_data, chunk_metrics = aligner.run(
+            self.chunk_spans, texts, progress=_progress
+        )
+        chunk_metrics["alignment_time"] = time.perf_counter() - start
+        self.chunk_metrics = chunk_metrics
+        logger.info(
+            f"Chunk alignment complete: {len(segments_data)} segments in "
+            f"{chunk_metrics['alignment_time']:.2f}s ({chunk_metrics['chunk_methods']})"
+        )
+
+        self.segments = segments_data
+        return segments_data
+
     def _save_checkpoint(
         self, path: Path, segments: List[Dict], last_end: float
     ):
-        """Save checkpoint for resume."""
-        with open(path, "w", encoding="utf-8") as f:
+        """Save checkpoint for resume (atomic: temp file + replace)."""
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
             json.dump(
                 {
                     "segments": segments,
                     "last_end": last_end,
                     "timestamp": time.time(),
+                    "fingerprint": self._checkpoint_fingerprint(),
                 },
                 f,
-                indent=2,
             )
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
         logger.debug(f"Checkpoint saved at {last_end:.2f}s")
 
     def process_segments(self) -> List[Dict[str, Any]]:
@@ -552,7 +744,10 @@ class SubtitleGenerator:
             self.initialize()
 
             # Transcribe (captures word-level data for karaoke)
-            raw_segments = self.transcribe()
+            if self.chunk_spans:
+                raw_segments = self.transcribe_chunks()
+            else:
+                raw_segments = self.transcribe()
 
             # Process for display (optimizes for subtitle readability)
             processed_segments = self.process_segments()
@@ -561,6 +756,9 @@ class SubtitleGenerator:
             final_segments, metrics = self.align_and_validate(
                 processed_segments
             )
+            metrics["mode"] = "chunks" if self.chunk_spans else "whole_book"
+            if self.chunk_metrics:
+                metrics["chunk_alignment"] = self.chunk_metrics
             self.metrics = metrics
 
             # Save outputs (use raw_segments for karaoke to preserve word data)
@@ -683,6 +881,30 @@ def main():
         default=None,
         help="Optional path to pipeline.json for Phase 5.5 status recording",
     )
+    parser.add_argument(
+        "--mode",
+        choices=["whole_book", "chunks"],
+        default="whole_book",
+        help="chunks = align each enhanced chunk against its Phase 3 text in parallel",
+    )
+    parser.add_argument(
+        "--chunk-offsets",
+        type=Path,
+        default=None,
+        help="Phase 5 offset table (default: <audio>_offsets.json)",
+    )
+    parser.add_argument(
+        "--chunk-alignment",
+        choices=["asr", "proportional"],
+        default="asr",
+        help="Per-chunk timing source in chunk mode (proportional skips ASR)",
+    )
+    parser.add_argument(
+        "--chunk-workers",
+        type=int,
+        default=2,
+        help="Parallel chunk alignment workers",
+    )
 
     args = parser.parse_args()
 
@@ -703,6 +925,10 @@ def main():
         enable_checkpoints=not args.no_checkpoints,
         enable_drift_correction=not args.no_drift_correction,
         pipeline_json=args.pipeline_json,
+        mode=args.mode,
+        chunk_offsets_path=args.chunk_offsets,
+        chunk_alignment=args.chunk_alignment,
+        chunk_workers=args.chunk_workers,
     )
 
     # Generate subtitles
@@ -0,0 +1,93 @@
+"""Tests for the acoustic phrase-cleanup triage."""
+
+import numpy as np
+import pytest
+
+from src.phase5_enhancement.phrase_triage import (
+    PhraseTriage,
+    TriageDecision,
+    TriageStats,
+    phase4_flags,
+    speech_islands,
+)
+
+SR = 16000
+
+
+def _speech(seconds, amplitude=0.3):
+    t = np.arange(int(SR * seconds)) / SR
+    # 4 Hz syllable envelope on a 180 Hz carrier, never fully silent
+    envelope = 0.6 + 0.4 * np.abs(np.sin(2 * np.pi * 4 * t))
+    return (amplitude * envelope * np.sin(2 * np.pi * 180 * t)).astype(np.float32)
+
+
+def _silence(seconds):
+    return np.zeros(int(SR * seconds), dtype=np.float32)
+
+
+def test_speech_islands_bridge_short_pauses():
+    audio = np.concatenate([_speech(2.0), _silence(0.1), _speech(1.0), _silence(1.0), _speech(2.5)])
+    islands = speech_islands(audio, SR)
+    assert len(islands) == 2
+    assert islands[1][0] == pytest.approx(4.1, abs=0.05)
+
+
+def test_clean_chunk_is_not_suspicious():
+    audio = np.concatenate([_speech(6.0), _silence(0.3), _speech(6.0), _silence(0.2)])
+    decision = PhraseTriage().assess(audio, SR, expected_duration=12.0)
+    assert not decision.suspicious
+    assert decision.signals["speech_islands"] == 2  # sentence pause, but no phrase-length edge island
+
+
+def test_isolated_tail_phrase_and_overrun_are_flagged():
+    audio = np.concatenate([_speech(10.0), _silence(0.9), _speech(2.5, amplitude=0.6), _silence(0.2)])
+    decision = PhraseTriage().assess(audio, SR, expected_duration=10.0)
+    assert decision.suspicious
+    assert {"duration_overrun", "isolated_tail_island", "tail_energy_shift"} <= set(decision.reasons)
+
+
+def test_phase4_flags_force_transcription():
+    row = {"validation_reason": "valid", "validation_details": {"detected_phrase": "need some text"}}
+    assert phase4_flags(row) == ["phase4_detected_phrase"]
+    assert phase4_flags({"validation_reason": "asr_rewrite"}) == ["phase4_asr_rewrite"]
+    decision = PhraseTriage().assess(_speech(5.0), SR, expected_duration=5.0, chunk_row={"validation_reason": "high_wer"})
+    assert decision.reasons == ["phase4_high_wer"]
+
+
+def test_stats_precision_and_recall():
+    stats = TriageStats()
+    flagged = TriageDecision(suspicious=True, reasons=["duration_overrun"])
+    clean = TriageDecision(suspicious=False)
+    stats.record(flagged, transcribed=True, phrase_found=True)
+    stats.record(flagged, transcribed=True, phrase_found=False)
+    stats.record(clean, transcribed=True, phrase_found=True)  # audited miss
+    stats.record(clean, transcribed=False, phrase_found=None)
+
+    metrics = stats.as_metrics()
+    assert metrics["screened"] == 4
+    assert metrics["asr_skipped"] == 1
+    assert metrics["precision"] == pytest.approx(0.5)
+    # One audited clean chunk stands for two: the miss counts twice
+    assert metrics["false_negative_estimate"] == pytest.approx(2.0)
+    assert metrics["recall"] == pytest.approx(1 / 3)
+    assert metrics["reasons"] == {"duration_overrun": 2}
+
+
+def test_recall_scales_sampled_misses_to_all_clean_chunks():
+    flagged = TriageDecision(suspicious=True, reasons=["duration_overrun"])
+    clean = TriageDecision(suspicious=False)
+
+    sampled = TriageStats()  # "on" mode, audit_every=10: 9 of 10 clean chunks skipped
+    shadow = TriageStats()  # every chunk transcribed
+    for index in range(130):
+        missed = index % 13 == 0  # 10 real misses, one of them in the audit sample
+        for stats in (sampled, shadow):
+            audited = stats is shadow or index % 10 == 0
+            stats.record(clean, transcribed=audited, phrase_found=missed if audited else None)
+    for stats in (sampled, shadow):
+        for _ in range(10):
+            stats.record(flagged, transcribed=True, phrase_found=True)
+
+    assert shadow.as_metrics()["recall"] == pytest.approx(0.5)
+    assert sampled.as_metrics()["recall"] == pytest.approx(0.5)  # 10 / (10 + 1 * 130 / 13)
+    assert TriageStats().as_metrics()["recall"] is None
@@ -2,6 +2,8 @@
 Unit tests for Phase 5.5 subtitle generation.
 """
 
+import json
+
 import pytest
 
 from src.phase5_enhancement.subtitle_aligner import (
@@ -105,3 +107,200 @@ def test_empty_segments():
 
     vtt = format_vtt(empty)
     assert vtt.startswith("WEBVTT")
+
+
+# --- Chunk-parallel alignment -------------------------------------------
+
+from src.phase5_enhancement.subtitle_chunks import (  # noqa: E402
+    ChunkSpan,
+    ChunkSubtitleAligner,
+    anchor_word_times,
+    group_words,
+    load_chunk_spans,
+    proportional_word_times,
+)
+
+
+def _span(index, start, duration):
+    return ChunkSpan(
+        index=index,
+        chunk_id=index + 1,
+        audio_path=f"enhanced_{index + 1:04d}.wav",
+        start=start,
+        end=start + duration,
+        duration=duration,
+    )
+
+
+def test_proportional_word_times_cover_duration():
+    words = proportional_word_times("One two three. Four five.", 10.0)
+    assert [w["word"] for w in words] == ["One", "two", "three.", "Four", "five."]
+    assert words[0]["start"] == 0.0
+    assert words[-1]["end"] == pytest.approx(10.0)
+
+
+def test_anchor_word_times_uses_asr_timing_and_known_text():
+    asr = [
+        {"word": "the", "start": 0.5, "end": 0.7, "probability": 0.9},
+        {"word": "quick", "start": 0.8, "end": 1.1, "probability": 0.9},
+        {"word": "fax", "start": 1.2, "end": 1.5, "probability": 0.4},
+        {"word": "jumps", "start": 1.6, "end": 2.0, "probability": 0.9},
+    ]
+    words, anchored = anchor_word_times("The quick fox jumps.", asr, 2.5)
+    assert [w["word"] for w in words] == ["The", "quick", "fox", "jumps."]
+    assert words[1]["start"] == 0.8
+    # Unmatched "fox" is interpolated between its anchored neighbours
+    assert 1.1 <= words[2]["start"] < words[2]["end"] <= 1.6
+    assert anchored == pytest.approx(0.75)
+
+
+def test_group_words_breaks_on_sentence_and_length():
+    words = proportional_word_times("Short one. " + "word " * 30, 20.0)
+    segments = group_words(words, max_chars=40)
+    assert segments[0]["text"] == "Short one."
+    assert all(len(seg["text"]) <= 40 for seg in segments)
+
+
+def test_chunk_aligner_offsets_and_orders_segments():
+    spans = [_span(0, 0.0, 4.0), _span(1, 3.95, 6.0)]  # 0.05s crossfade overlap
+    texts = {1: "First chunk text.", 2: "Second chunk. Has two sentences."}
+    aligner = ChunkSubtitleAligner(model=None, workers=2, alignment="proportional")
+
+    segments, metrics = aligner.run(spans, texts)
+
+    assert [seg["chunk_index"] for seg in segments] == [0, 1, 1]
+    assert segments[1]["start"] == pytest.approx(3.95)
+    assert segments[-1]["end"] == pytest.approx(9.95)
+    assert all(a["start"] <= b["start"] for a, b in zip(segments, segments[1:]))
+    assert metrics["chunk_methods"] == {"proportional": 2}
+
+
+def test_chunk_aligner_reuses_source_transcript_for_enhanced_chunk(tmp_path):
+    from pipeline_common.transcript_cache import TranscriptKey, TranscriptStore, audio_digest
+
+    source = tmp_path / "chunk_0001.wav"
+    enhanced = tmp_path / "enhanced_0001.wav"
+    source.write_bytes(b"phase4 audio")
+    enhanced.write_bytes(b"phase5 audio")
+    store = TranscriptStore(tmp_path / "transcripts")
+    words = [
+        {"word": "Known", "start": 0.2, "end": 0.6, "probability": 0.9},
+        {"word": "text.", "start": 0.7, "end": 1.0, "probability": 0.9},
+    ]
+    store.put(
+        audio_digest(source),
+        TranscriptKey("faster-whisper", "base", {"word_timestamps": True}),
+        {"text": "Known text.", "segments": [{"start": 0.2, "end": 1.0, "text": "Known text."}], "words": words},
+    )
+    store.link(audio_digest(enhanced), audio_digest(source))
+
+    model = _FakeModel([])
+    span = ChunkSpan(index=0, chunk_id=1, audio_path=enhanced, start=10.0, end=12.0, duration=2.0)
+    aligner = ChunkSubtitleAligner(model=model, alignment="asr", transcript_store=store, model_name="small")
+
+    segments, metrics = aligner.run([span], {1: "Known text."})
+
+    assert model.calls == []
+    assert segments[0]["start"] == pytest.approx(10.2)
+    assert metrics["avg_anchored_fraction"] == pytest.approx(1.0)
+
+
+def test_load_chunk_spans(tmp_path):
+    table = {
+        "version": 1,
+        "crossfade_sec": 0.05,
+        "timing_preserved": True,
+        "total_duration": 9.95,
+        "chunks": [
+            {"index": 1, "chunk_id": 2, "enhanced_path": "b.wav", "start": 3.95, "end": 9.95, "duration": 6.0},
+            {"index": 0, "chunk_id": 1, "enhanced_path": "a.wav", "start": 0.0, "end": 4.0, "duration": 4.0},
+        ],
+    }
+    path = tmp_path / "audiobook_offsets.json"
+    path.write_text(json.dumps(table), encoding="utf-8")
+
+    spans, meta = load_chunk_spans(path)
+
+    assert [s.chunk_id for s in spans] == [1, 2]
+    assert meta["timing_preserved"] is True
+
+
+# --- Resumable transcription --------------------------------------------
+
+
+class _FakeWord:
+    def __init__(self, word, start, end):
+        self.word, self.start, self.end, self.probability = word, start, end, 0.9
+
+
+class _FakeSegment:
+    def __init__(self, start, end, text):
+        self.start, self.end, self.text, self.no_speech_prob = start, end, text, 0.0
+        self.words = [_FakeWord(text, start, end)]
+
+
+class _FakeInfo:
+    language = "en"
+    language_probability = 1.0
+
+
+class _FakeModel:
+    def __init__(self, segments):
+        self.segments = segments
+        self.calls = []
+
+    def transcribe(self, path, **kwargs):
+        self.calls.append(path)
+        return iter(self.segments), _FakeInfo()
+
+
+def _generator(tmp_path, segments):
+    pytest.importorskip("faster_whisper")
+    from src.phase5_enhancement.models import SubtitleConfig
+    from src.phase5_enhancement.subtitles import SubtitleGenerator
+
+    audio = tmp_path / "book.mp3"
+    audio.write_bytes(b"fake audio")
+    config = SubtitleConfig(audio_path=audio, output_dir=tmp_path / "subs", file_id="book")
+    config.output_dir.mkdir()
+    generator = SubtitleGenerator(config, enable_karaoke=True)
+    generator.model = _FakeModel(segments)
+    return generator
+
+
+def test_transcribe_resumes_from_checkpoint_offset(tmp_path, monkeypatch):
+    generator = _generator(tmp_path, [_FakeSegment(0.0, 2.0, "later"), _FakeSegment(2.0, 4.0, "end")])
+    checkpoint = generator.config.output_dir / "book_checkpoint.json"
+    generator._save_checkpoint(checkpoint, [{"start": 0.0, "end": 100.0, "text": "earlier"}], 100.0)
+
+    sliced = tmp_path / "slice.wav"
+    sliced.write_bytes(b"")
+    requested = []
+
+    def fake_slice(start):
+        requested.append(start)
+        return sliced
+
+    monkeypatch.setattr(generator, "_slice_audio", fake_slice)
+    segments = generator.transcribe()
+
+    assert requested == [100.0]
+    assert generator.model.calls == [str(sliced)]
+    assert [seg["text"] for seg in segments] == ["earlier", "later", "end"]
+    assert segments[1]["start"] == 100.0 and segments[2]["end"] == 104.0
+    assert segments[2]["words"][0]["start"] == 102.0
+    assert not sliced.exists() and not checkpoint.exists()
+
+
+def test_checkpoint_for_other_audio_is_ignored(tmp_path):
+    generator = _generator(tmp_path, [_FakeSegment(0.0, 1.0, "fresh")])
+    checkpoint = generator.config.output_dir / "book_checkpoint.json"
+    checkpoint.write_text(
+        json.dumps({"segments": [{"text": "stale"}], "last_end": 50.0, "fingerprint": {"audio_size": -1}}),
+        encoding="utf-8",
+    )
+
+    segments = generator.transcribe()
+
+    assert generator.model.calls == [str(generator.config.audio_path)]
+    assert [seg["text"] for seg in segments] == ["fresh"]
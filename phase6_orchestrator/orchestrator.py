@@ -10,6 +10,7 @@ Production-ready orchestrator - runs phases 1-5 sequentially with:
 """
 
 import argparse
+import copy
 import json
 import logging
 import os
@@ -19,10 +20,11 @@ import subprocess
 import sys
 import time
 import yaml
-import hashlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Resolve project roots for cross-phase imports
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -32,9 +34,28 @@ for _path in (PROJECT_ROOT, PHASE1_SRC):
     if _path.exists() and str(_path) not in sys.path:
         sys.path.insert(0, str(_path))
 
+from pipeline_common import startup_profile  # noqa: E402
+
+startup_profile.enable_if_requested("phase6_orchestrator")
+
 # Add parent directory to path for pipeline_common
 from pipeline_common import PipelineState, StateError, ensure_phase_and_file
+from pipeline_common import fingerprint
+from pipeline_common.chunk_journal import STREAM_ENV, ChunkJournal, streaming_enabled
+from pipeline_common.meta_dag import RECORD_DIR, MetaContext, MetaPhase, MetaRunReport, RecordStore, run_meta_phases
+from pipeline_common.phase_runner import (
+    LOCK_FILES,
+    PHASE_ENTRIES,
+    default_runner,
+    dependency_conflicts,
+    phase_argv,
+    record_venv_fingerprint,
+    venv_is_current,
+    venv_stamp_path,
+)
 from pipeline_common.policy_engine import PolicyEngine
+from pipeline_common.preflight import PreflightCheck, PreflightService
+from pipeline_common.process_runner import ProgressEvent, phase_log_path, run_streaming
 from pydantic import BaseModel, Field, ValidationError, ConfigDict
 from autonomy.profiles import export_profiles, reset_profiles
 from autonomy.trace_recorder import begin_run_trace, finalize_trace, record_event
@@ -60,11 +81,11 @@ from introspection.summary import build_introspection_summary
 # Lazy import for LlamaReasoner to avoid import errors if agents not available
 _LLAMA_REASONER = None
 _LLAMA_DIRECTOR = None
-_LAST_PHASE_ERROR = ""  # Stores last error output for AI analysis
 
 # Lazy import for ErrorRegistry (self-repair tracking)
 _ERROR_REGISTRY = None
 _DEAD_CHUNK_REPAIR = None
+_FAILURE_CLASSIFIER = None
 
 # Experiment state (reset after each run to avoid leakage)
 _ACTIVE_EXPERIMENT = None
@@ -196,6 +217,22 @@ def _get_dead_chunk_repair(
     return _DEAD_CHUNK_REPAIR if _DEAD_CHUNK_REPAIR else None
 
 
+def _get_failure_classifier() -> Optional[Any]:
+    """Lazy-load FailureClassifier (self-repair signatures) for retry decisions."""
+    global _FAILURE_CLASSIFIER
+    if _FAILURE_CLASSIFIER is None:
+        try:
+            from self_repair.failure_classifier import FailureClassifier
+            _FAILURE_CLASSIFIER = FailureClassifier(registry=_get_error_registry())
+        except ImportError:
+            logger.debug("FailureClassifier not available (self_repair module not found)")
+            _FAILURE_CLASSIFIER = False
+        except Exception as e:
+            logger.debug(f"FailureClassifier init failed: {e}")
+            _FAILURE_CLASSIFIER = False
+    return _FAILURE_CLASSIFIER if _FAILURE_CLASSIFIER else None
+
+
 def _get_llama_reasoner() -> Optional[Any]:
     """Lazy-load LlamaReasoner to avoid import errors."""
     global _LLAMA_REASONER
@@ -389,10 +426,43 @@ def ensure_ollama_ready(model: str = "llama3.1:8b-instruct-q4_K_M") -> dict:
     return status
 
 
-def _store_phase_error(error_text: str) -> None:
-    """Store error text for later AI analysis."""
-    global _LAST_PHASE_ERROR
-    _LAST_PHASE_ERROR = error_text
+@dataclass
+class PhaseOutcome:
+    """
+    What a phase run returns: truthy on success, and on failure the error
+    text and exit code for retry classification and AI analysis.
+
+    Travels with the call rather than through module state, so phases
+    running side by side (streaming mode) cannot see each other's errors.
+    """
+
+    success: bool
+    error: str = ""
+    exit_code: Optional[int] = None
+
+    def __bool__(self) -> bool:
+        return self.success
+
+
+def phase_failed(error_text: str, exit_code: Optional[int] = None) -> PhaseOutcome:
+    return PhaseOutcome(False, error_text or "", exit_code)
+
+
+def _phase_log(file_id: str, phase: Any) -> Path:
+    """Rotating per-book, per-phase log that phase subprocess output streams into."""
+    return phase_log_path(file_id, phase, root=PROJECT_ROOT)
+
+
+def _progress_tracker(phase_label: str) -> Callable[[ProgressEvent], None]:
+    """Count parsed progress lines (chunks done, last RTF) into RUN_SUMMARY as they arrive."""
+    progress = RUN_SUMMARY["phase_progress"].setdefault(phase_label, {})
+
+    def on_event(event: ProgressEvent) -> None:
+        progress[event.kind] = progress.get(event.kind, 0) + 1
+        if event.rtf is not None:
+            progress["last_rtf"] = event.rtf
+
+    return on_event
 
 
 def _analyze_failure_with_llm(phase_num: int, file_id: str, error_output: Optional[str] = None) -> None:
@@ -401,14 +471,9 @@ def _analyze_failure_with_llm(phase_num: int, file_id: str, error_output: Option
     Args:
         phase_num: The phase that failed
         file_id: The file being processed
-        error_output: The actual error text from the failure. If not provided,
-                     falls back to _LAST_PHASE_ERROR global, but callers should
-                     prefer passing explicit error context.
+        error_output: The error text the failed phase returned (``PhaseOutcome.error``)
     """
-    global _LAST_PHASE_ERROR
-
-    # Use provided error or fall back to stored error
-    error_text = error_output or _LAST_PHASE_ERROR
+    error_text = error_output
     if not error_text or len(error_text.strip()) < 10:
         logger.info("AI failure analysis skipped: insufficient error context for Phase %d", phase_num)
         return
@@ -481,12 +546,6 @@ logger = logging.getLogger(__name__)
 # Initialize Rich console
 console = Console() if RICH_AVAILABLE else None
 
-# Prefer Phase 1 hashing helper for reuse decisions when available
-try:
-    from phase1_validation.utils import compute_sha256 as _phase1_compute_sha256
-except Exception:
-    _phase1_compute_sha256 = None
-
 ARCHIVE_ROOT = PROJECT_ROOT / "audiobooks"
 PHASE4_AUDIO_DIR: Optional[Path] = None
 _ORCHESTRATOR_CONFIG: Optional["OrchestratorConfig"] = None
@@ -497,6 +556,8 @@ RUN_SUMMARY: Dict[str, Any] = {
     "chunk_integrity_passed": None,
     "backup_subtitles_used": False,
     "budget_exceeded": False,
+    "phase_progress": {},
+    "preflight": {},
 }
 POLICY_RUNTIME_DIR = Path(".pipeline") / "policy_runtime"
 
@@ -1064,6 +1125,10 @@ class OrchestratorConfig(BaseModel):
     strict_chunk_integrity: bool = True
     max_tts_workers: int = 1
     per_chunk_fallback: bool = True
+    streaming_phases: bool = False  # Overlap Phases 3-5 through chunk journals
+    phase_execution: str = "auto"  # auto | in_process | subprocess (how Phases 1, 2, 3 and 5 launch)
+    meta_phase_workers: int = 4  # Threads for independent post-run meta phases (P-AD); 1 runs them in order
+    preflight_budget_sec: float = 20.0  # Startup wait for parallel preflight checks; slower ones finish in background
     tts_engines: TTSEngineConfig = Field(default_factory=TTSEngineConfig)
     prefer_shell_tts_execution: bool = False
     global_time_budget_sec: Optional[int] = None
@@ -1179,31 +1244,18 @@ def print_panel(content: str, title: str = "", style: str = "") -> None:
         print("=" * 60 + "\n")
 
 
-def compute_sha256(path: Path, chunk_size: int = 1024 * 1024) -> str:
-    """Compute SHA256 for reuse decisions."""
-    if _phase1_compute_sha256:
-        return _phase1_compute_sha256(path)
-    sha = hashlib.sha256()
-    with path.open("rb") as handle:
-        for block in iter(lambda: handle.read(chunk_size), b""):
-            sha.update(block)
-    return sha.hexdigest()
+def compute_sha256(path: Path) -> str:
+    """Compute SHA256 for reuse decisions (same digest Phase 1 records, cached by stat data)."""
+    return fingerprint.file_sha256(path)
 
 
 def compute_chunk_text_hash(chunk_paths: List[str]) -> str:
-    """Hash concatenated chunk text to enable Phase 4 reuse decisions."""
-    sha = hashlib.sha256()
-    for raw_path in chunk_paths:
-        path = Path(raw_path)
-        if not path.is_absolute():
-            path = path.resolve()
-        if not path.exists():
-            continue
-        try:
-            sha.update(path.read_bytes())
-        except Exception as exc:  # best-effort hashing
-            logger.warning("Could not hash %s for reuse check: %s", path, exc)
-    return sha.hexdigest()
+    """Hash concatenated chunk text to enable Phase 4 reuse decisions.
+
+    Unreadable or missing chunks are skipped (best-effort); an unchanged
+    chunk set is answered from the fingerprint index without reading it.
+    """
+    return fingerprint.concat_sha256(chunk_paths)
 
 
 def play_sound(success: bool = True) -> None:
@@ -1348,7 +1400,7 @@ def concat_phase5_from_existing(phase_dir: Path, file_id: str, pipeline_json: Pa
     # Update pipeline.json
     try:
         state = PipelineState(pipeline_json, validate_on_read=False)
-        with state.transaction() as txn:
+        with state.transaction(file_id=file_id) as txn:
             phase5 = txn.data.setdefault("phase5", {"status": "partial", "files": {}})
             files = phase5.setdefault("files", {})
             entry = files.get(file_id, {})
@@ -1445,6 +1497,124 @@ def get_clean_env_for_poetry() -> Dict[str, str]:
     return env
 
 
+def ensure_phase_venv(phase_label: str, phase_dir: Path) -> bool:
+    """
+    Install a phase's Poetry venv unless it was built from the current lock files.
+
+    The fingerprint (hash of poetry.lock + pyproject.toml) is recorded inside
+    .venv after each successful install, so an unchanged phase costs one file
+    read instead of Poetry checks, and a changed lock file triggers a reinstall.
+    When the run's preflight already probed this venv, its cached answer is used.
+
+    A .venv built before fingerprints existed is trusted and stamped as is,
+    and a failed reinstall over an existing .venv only warns: the phase runs
+    in the venv it already has.  Only a missing .venv that cannot be
+    installed fails the phase.
+    """
+    checked = preflight_result(f"venv:{phase_dir.name}")
+    if checked["ok"] if checked is not None else venv_is_current(phase_dir):
+        logger.info(f"{phase_label} venv matches its lock files")
+        return True
+
+    stamp = venv_stamp_path(phase_dir)
+    has_venv = stamp.parent.is_dir()
+    if has_venv and not stamp.exists():
+        logger.info(f"{phase_label} venv has no lock fingerprint yet; recording the current one")
+        record_venv_fingerprint(phase_dir)
+        return True
+
+    def install_failed(message: str, detail: str = "") -> bool:
+        if has_venv:
+            logger.warning(f"{message}; continuing with the existing {phase_label} venv")
+            if detail:
+                logger.debug(detail)
+            return True
+        logger.error(message)
+        if detail:
+            logger.error(detail)
+        return False
+
+    reason = "lock files changed" if has_venv else "no venv"
+    logger.info(f"Installing dependencies for {phase_label} ({reason})...")
+    try:
+        # Configure Poetry to use in-project venv
+        subprocess.run(
+            ["poetry", "config", "virtualenvs.in-project", "true", "--local"],
+            cwd=str(phase_dir),
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+        result = subprocess.run(
+            ["poetry", "install", "--no-root"],
+            cwd=str(phase_dir),
+            env=get_clean_env_for_poetry(),
+            capture_output=True,
+            text=True,
+            timeout=300,
+        )
+        if result.returncode != 0:
+            detail = "\n".join(
+                f"{name}: {text}" for name, text in (("STDOUT", result.stdout), ("STDERR", result.stderr)) if text
+            )
+            return install_failed(f"Poetry install failed (exit {result.returncode})", detail)
+    except subprocess.TimeoutExpired:
+        return install_failed("Poetry install timeout (300s)")
+    except Exception as e:
+        return install_failed(f"Poetry install error: {e}")
+
+    record_venv_fingerprint(phase_dir)
+    logger.info("Dependencies installed successfully")
+    return True
+
+
+def use_in_process(phase_num: int, phase_dir: Path, config: Optional[OrchestratorConfig] = None) -> bool:
+    """
+    Whether to import and call a phase here instead of `poetry run`.
+
+    "auto" does so only when this interpreter satisfies the phase's
+    poetry.lock; "in_process" skips that check.  Phase 4 and Phase 3b always
+    run as subprocesses, and so does everything while streaming, because
+    in-process runs are serialised and streamed phases run side by side.
+    """
+    mode = (config or get_orchestrator_config()).phase_execution
+    if mode == "subprocess" or phase_num not in PHASE_ENTRIES or phase_dir.name == "phase3b-xtts-chunking":
+        return False
+    if streaming_enabled():
+        return False
+    if mode == "in_process":
+        return True
+    checked = preflight_result(f"deps:{phase_dir.name}")
+    conflicts = checked["conflicts"] if checked is not None else dependency_conflicts(phase_dir)
+    if conflicts:
+        logger.info(
+            f"Phase {phase_num}: {len(conflicts)} locked dependencies differ here "
+            f"(e.g. {conflicts[0]}); running in its own venv"
+        )
+        return False
+    return True
+
+
+def run_phase_in_process(
+    phase_num: int,
+    phase_dir: Path,
+    file_id: str,
+    pipeline_json: Path,
+    phase_config: Dict[str, Any],
+) -> bool:
+    """Run a phase through the shared in-process runner (modules stay imported between runs)."""
+    argv = phase_argv(phase_num, file_id, pipeline_json, phase_config)
+    logger.info(f"Phase {phase_num} in-process: {PHASE_ENTRIES[phase_num].module} {' '.join(argv)}")
+    result = default_runner().run(phase_num, phase_dir, file_id, pipeline_json, phase_config)
+    duration = result["duration"]
+    if not result["success"]:
+        logger.error(f"Phase {phase_num} FAILED (exit {result['exit_code']}) in {duration:.1f}s")
+        logger.error(f"Error: {result['error'][-500:]}")
+        return phase_failed(result["error"], result["exit_code"])
+    logger.info(f"Phase {phase_num} SUCCESS in {duration:.1f}s (in-process, {'warm' if result['warm'] else 'cold'})")
+    return True
+
+
 def check_conda_environment(env_name: str) -> Tuple[bool, Optional[str]]:
     """
     Check if Conda environment exists and is accessible.
@@ -1505,6 +1675,122 @@ def check_conda_environment(env_name: str) -> Tuple[bool, Optional[str]]:
         return False, f"Conda check failed: {str(e)}"
 
 
+_PREFLIGHT: Optional[PreflightService] = None
+DEFAULT_LLM_MODEL = "llama3.1:8b-instruct-q4_K_M"
+
+
+def get_preflight() -> PreflightService:
+    """Process-wide preflight service (outcomes shared with other runs via .pipeline/preflight)."""
+    global _PREFLIGHT
+    if _PREFLIGHT is None:
+        _PREFLIGHT = PreflightService.from_env()
+    return _PREFLIGHT
+
+
+def preflight_result(name: str) -> Optional[Dict[str, Any]]:
+    """Result of a registered preflight check (waiting for it if still running), else None."""
+    service = get_preflight()
+    if name not in service.checks:
+        return None
+    return service.result(name)
+
+
+def _conda_env_name() -> Optional[str]:
+    return os.environ.get("PHASE4_CONDA_ENV") or os.environ.get("CONDA_DEFAULT_ENV")
+
+
+def _ollama_check(model: str) -> Dict[str, Any]:
+    status = dict(ensure_ollama_ready(model=model))
+    return {**status, "ok": bool(status.get("available"))}
+
+
+def _conda_check(env_name: str) -> Dict[str, Any]:
+    ready, error = check_conda_environment(env_name)
+    return {"ok": ready, "env": env_name, "message": error}
+
+
+def _voices_check(path: Path) -> Dict[str, Any]:
+    if not path.exists():
+        return {"ok": True, "engines": {}}
+    with open(path, "r", encoding="utf-8") as f:
+        voices = json.load(f).get("voices", {})
+    return {"ok": True, "engines": {vid: cfg.get("engine") for vid, cfg in voices.items() if cfg.get("engine")}}
+
+
+def _engine_registry_check(path: Path) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        engines = sorted((yaml.safe_load(f) or {}).get("engines") or {})
+    return {"ok": bool(engines), "engines": engines, "message": None if engines else f"No engines in {path}"}
+
+
+def start_preflight(config: OrchestratorConfig, phases: List[int], llm: bool = True) -> Dict[str, Any]:
+    """
+    Run the environment and dependency checks this run needs, side by side.
+
+    Outcomes are cached by ``PreflightService`` with a short TTL and the
+    stat of their input files (config.yaml, poetry.lock/pyproject.toml, the
+    venv stamp, voices.json, engine_registry.yaml), so later phases, later
+    runs and the other books of a Phase 7 batch reuse them instead of
+    shelling out to conda/poetry/ollama again.
+    """
+    service = get_preflight()
+    config_path = Path(__file__).with_name("config.yaml")
+    names: List[str] = []
+
+    def add(check: PreflightCheck) -> None:
+        service.register(check)
+        names.append(check.name)
+
+    llm_config = getattr(config, "llm", None) or {}
+    if llm and llm_config.get("enable", True):
+        model = llm_config.get("model", DEFAULT_LLM_MODEL)
+        add(PreflightCheck("ollama", lambda: _ollama_check(model), inputs=[config_path], salt=model))
+
+    env_name = _conda_env_name()
+    if 4 in phases and config.prefer_shell_tts_execution and env_name:
+        add(PreflightCheck("conda", lambda: _conda_check(env_name), salt=env_name))
+
+    voices_path = PROJECT_ROOT / "configs" / "voices.json"
+    add(PreflightCheck("voices", lambda: _voices_check(voices_path), inputs=[voices_path]))
+
+    for phase_num in phases:
+        phase_dir = find_phase_dir(phase_num)
+        if phase_dir is None:
+            continue
+        lock_files = [phase_dir / name for name in LOCK_FILES]
+        if phase_num == 4:
+            registry = phase_dir / "engine_registry.yaml"
+            add(PreflightCheck("engine_registry", lambda p=registry: _engine_registry_check(p), inputs=[registry]))
+            continue
+        add(
+            PreflightCheck(
+                f"venv:{phase_dir.name}",
+                lambda d=phase_dir: {"ok": venv_is_current(d)},
+                inputs=[*lock_files, venv_stamp_path(phase_dir)],
+            )
+        )
+        if config.phase_execution == "auto" and phase_num in PHASE_ENTRIES:
+            add(
+                PreflightCheck(
+                    f"deps:{phase_dir.name}",
+                    lambda d=phase_dir: {"ok": True, "conflicts": dependency_conflicts(d)},
+                    inputs=lock_files,
+                    salt=sys.executable,
+                )
+            )
+
+    service.run_all(names, budget_sec=config.preflight_budget_sec)
+    summary = RUN_SUMMARY["preflight"] = service.summary()
+    timings = ", ".join(
+        f"{name} {info['duration_sec']:.2f}s" + ("" if info["source"] == "run" else f" ({info['source']})")
+        for name, info in summary["results"].items()
+    )
+    logger.info(f"Preflight: {len(names)} checks in {summary['wall_sec']:.2f}s [{timings}]")
+    if summary["over_budget"]:
+        logger.info(f"Preflight still running in background: {', '.join(summary['over_budget'])}")
+    return summary
+
+
 def collect_file_phase_view(data: Dict[str, Any], file_id: str) -> Dict[str, Any]:
     """Return a phase-indexed view of the pipeline for a given file_id."""
     phases = {}
@@ -1772,7 +2058,7 @@ def cleanup_partial_outputs(file_id: str, chunk_id: Optional[str], phase_dir: Pa
 
     try:
         state = PipelineState(pipeline_json, validate_on_read=False)
-        with state.transaction() as txn:
+        with state.transaction(file_id=file_id) as txn:
             file_key, entry = _find_phase_file_entry(txn.data, "phase4", file_id)
             if entry and chunk_id and chunk_id in entry:
                 entry.pop(chunk_id, None)
@@ -1867,7 +2153,7 @@ def record_phase4_metadata(
     """Augment phase4 metadata with reuse-friendly fields."""
     try:
         state = PipelineState(pipeline_json, validate_on_read=False)
-        with state.transaction() as txn:
+        with state.transaction(file_id=file_id) as txn:
             phase4 = txn.data.get("phase4", {}) or {}
             files = phase4.get("files", {}) or {}
             file_key, entry = _find_phase_file_entry(txn.data, "phase4", file_id)
@@ -1933,9 +2219,16 @@ def run_phase_with_retry(
     if phase_num == 8:
         return run_phase_reasoning_stub(file_id, pipeline_json, state)
 
+    verdict = None
+    retry_pause = 2.0
+    attempts_made = 0
+    success: Any = False
     for attempt in range(max_retries + 1):
         if attempt > 0:
             logger.info(f"Retry attempt {attempt}/{max_retries} for Phase {phase_num}")
+            retry_extra: Dict[str, Any] = {"attempt": attempt}
+            if verdict is not None:
+                retry_extra.update({"failure_label": verdict.label, "failure_category": verdict.category})
             retry_ctx = _build_policy_context(
                 phase_label,
                 file_id,
@@ -1943,7 +2236,7 @@ def run_phase_with_retry(
                 status="retry",
                 event="phase_retry",
                 state=state,
-                extra={"attempt": attempt},
+                extra=retry_extra,
             )
             _policy_call(policy_engine, "record_retry", retry_ctx)
 
@@ -1971,7 +2264,7 @@ def run_phase_with_retry(
                             logger.info(f"🤖 PolicyEngine: Auto-switching to secondary engine {secondary} (voice variant)")
                             current_engine = secondary
 
-            time.sleep(2)  # Brief pause before retry
+            time.sleep(retry_pause)
             if phase_num == 4:
                 phase_dir = find_phase_dir(4)
                 if phase_dir:
@@ -1980,6 +2273,7 @@ def run_phase_with_retry(
         # On retries (attempt > 0), always enable resume to skip valid chunks
         # This prevents re-synthesizing chunks that already have good audio
         effective_resume = resume_enabled or (attempt > 0)
+        attempts_made += 1
         success = run_phase(
             phase_num,
             file_path,
@@ -1996,15 +2290,169 @@ def run_phase_with_retry(
 
         if success:
             return True
+        if attempt == max_retries:
+            break
+
+        # Only retry failures that can go away on their own (OOM, timeouts, busy resources)
+        classifier = _get_failure_classifier()
+        if classifier is None:
+            continue
+        verdict = classifier.classify(getattr(success, "error", ""), getattr(success, "exit_code", None))
+        from self_repair.failure_classifier import retry_delay
+
+        pause = retry_delay(verdict, attempt + 1)
+        if pause is None:
+            logger.error(
+                f"Phase {phase_num} failure is deterministic ({verdict.category}: {verdict.reason}); not retrying"
+            )
+            break
+        retry_pause = pause
+        logger.info(f"Phase {phase_num} failure looks {verdict.label} ({verdict.category}); retrying in {pause:.1f}s")
 
-    logger.error(f"Phase {phase_num} failed after {max_retries + 1} attempts")
+    logger.error(f"Phase {phase_num} failed after {attempts_made} attempt(s)")
 
     # Analyze failure with AI if available
-    _analyze_failure_with_llm(phase_num, file_id)
+    _analyze_failure_with_llm(phase_num, file_id, getattr(success, "error", None))
 
     return False
 
 
+# Streaming mode: Phases 3, 4 and 5 run side by side.  Each producer journals
+# finished chunks (see pipeline_common.chunk_journal) and its consumer picks
+# them up, so only Phase 5's final concat waits for the whole book.
+STREAMABLE_PHASES = (3, 4, 5)
+STREAM_STAGES = {3: "phase3", 4: "phase4"}  # producer phase -> journal it writes
+
+
+def is_streaming_from(pipeline_json: Path, file_id: str, phase_num: int) -> bool:
+    """True when ``phase_num`` is running concurrently and streaming its chunks."""
+    return streaming_enabled() and ChunkJournal.for_stage(
+        pipeline_json, file_id, STREAM_STAGES[phase_num]
+    ).exists()
+
+
+def plan_streaming_phases(
+    phases_to_run: List[int],
+    state: PipelineState,
+    file_id: str,
+    resume_enabled: bool,
+) -> List[int]:
+    """
+    Phases to run side by side: the pending part of 3-4-5, if it is
+    contiguous and at least two phases long; otherwise an empty list.
+    """
+    pending = [
+        phase_num
+        for phase_num in STREAMABLE_PHASES
+        if phase_num in phases_to_run
+        and not (resume_enabled and check_phase_status(state, phase_num, file_id) == "success")
+    ]
+    if len(pending) < 2 or pending != list(range(pending[0], pending[-1] + 1)):
+        return []
+    return pending
+
+
+def _backfill_phase3_journal(journal: ChunkJournal, file_id: str, pipeline_json: Path) -> None:
+    """Journal every chunk Phase 3 recorded (reuse and Phase 3b do not stream)."""
+    state = PipelineState(pipeline_json, validate_on_read=False)
+    entry = state.read().get("phase3", {}).get("files", {}).get(file_id) or {}
+    voices = entry.get("chunk_voice_overrides") or {}
+    for index, chunk_path in enumerate(entry.get("chunk_paths") or []):
+        match = re.search(r"chunk[_-]?(\d+)", Path(chunk_path).stem, flags=re.IGNORECASE)
+        chunk_id = f"chunk_{int(match.group(1)):04d}" if match else f"chunk_{index:04d}"
+        journal.append(
+            {"chunk_id": chunk_id, "index": index, "path": chunk_path, "voice": voices.get(chunk_id)}
+        )
+
+
+class StreamingPhases:
+    """
+    Runs a planned group of Phases 3-5 concurrently.
+
+    ``start`` resets the group's journals and launches every phase;
+    ``result(phase_num)`` blocks until that phase is done, so the caller's
+    per-phase bookkeeping stays in order.  A producer's journal is sealed
+    when the phase (retries and per-chunk fallback included) finishes, so
+    consumers never wait on a dead producer.
+    """
+
+    def __init__(
+        self,
+        phases: List[int],
+        file_id: str,
+        pipeline_json: Path,
+        run: Callable[[int], bool],
+        strict_chunk_integrity: bool = True,
+    ):
+        self.phases = list(phases)
+        self.file_id = file_id
+        self.pipeline_json = pipeline_json
+        self._run = run
+        self._strict = strict_chunk_integrity
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._futures: Dict[int, Future] = {}
+        self._previous_env: Optional[str] = None
+
+    def start(self) -> "StreamingPhases":
+        self._previous_env = os.environ.get(STREAM_ENV)
+        os.environ[STREAM_ENV] = "1"
+        for phase_num, stage in STREAM_STAGES.items():
+            journal = ChunkJournal.for_stage(self.pipeline_json, self.file_id, stage)
+            # Only journals whose producer and consumer both run this time
+            if phase_num in self.phases and phase_num + 1 in self.phases:
+                journal.reset()
+            else:
+                journal.remove()
+        logger.info("Streaming Phases %s concurrently", ", ".join(map(str, self.phases)))
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.phases), thread_name_prefix="stream-phase"
+        )
+        self._futures = {
+            phase_num: self._executor.submit(self._run_and_seal, phase_num)
+            for phase_num in self.phases
+        }
+        return self
+
+    def _run_and_seal(self, phase_num: int) -> bool:
+        stage = STREAM_STAGES.get(phase_num)
+        journal = ChunkJournal.for_stage(self.pipeline_json, self.file_id, stage) if stage else None
+        if journal is not None and not journal.exists():
+            journal = None  # its consumer is not part of this group
+        success = False
+        try:
+            success = self._run(phase_num)
+            if success and phase_num == 3 and journal is not None:
+                # Reused chunks and Phase 3b do not stream; hand over the full list
+                _backfill_phase3_journal(journal, self.file_id, self.pipeline_json)
+            if success and phase_num == 4 and journal is not None and self._strict:
+                # Phase 5 skipped its own precheck; gate the concat here instead
+                phase4_dir = find_phase_dir(4)
+                success = bool(phase4_dir) and verify_phase4_chunk_integrity(
+                    self.file_id, self.pipeline_json, phase4_dir
+                )
+                RUN_SUMMARY["chunk_integrity_passed"] = success
+        except Exception as exc:
+            logger.error("Streamed Phase %s ERROR: %s", phase_num, exc)
+            success = False
+        finally:
+            if journal is not None:
+                journal.seal("complete" if success else "failed")
+        return success
+
+    def result(self, phase_num: int) -> bool:
+        return bool(self._futures[phase_num].result())
+
+    def close(self) -> None:
+        """Wait for every phase in the group and restore the environment."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self._previous_env is None:
+            os.environ.pop(STREAM_ENV, None)
+        else:
+            os.environ[STREAM_ENV] = self._previous_env
+
+
 def run_phase(
     phase_num: int,
     file_path: Path,
@@ -2032,7 +2480,8 @@ def run_phase(
         tts_engine: Optional TTS engine override (xtts or kokoro)
 
     Returns:
-        True if successful, False otherwise
+        True if successful; False, or a falsy PhaseOutcome carrying the
+        error text and exit code, otherwise
     """
     config = get_orchestrator_config()
     # Determine engine early (needed for Phase 3 routing)
@@ -2070,11 +2519,15 @@ def run_phase(
     # Special handling for Phase 4 (Multi-Engine TTS)
     if phase_num == 4:
         logger.info(f"Phase 4: Using TTS engine: {engine}")
-        resolved_id, chunk_paths = load_phase3_chunks(file_id, pipeline_json)
-        chunk_hash = compute_chunk_text_hash(chunk_paths)
-        if should_reuse_phase4(resolved_id, pipeline_json, phase_dir, engine, chunk_hash, config):
-            RUN_SUMMARY["phase4_reused"] = True
-            return True
+        if is_streaming_from(pipeline_json, file_id, 3):
+            # Phase 3 is still writing chunks: nothing to reuse or hash yet
+            resolved_id, chunk_hash = file_id, None
+        else:
+            resolved_id, chunk_paths = load_phase3_chunks(file_id, pipeline_json)
+            chunk_hash = compute_chunk_text_hash(chunk_paths)
+            if should_reuse_phase4(resolved_id, pipeline_json, phase_dir, engine, chunk_hash, config):
+                RUN_SUMMARY["phase4_reused"] = True
+                return True
         RUN_SUMMARY["phase4_reused"] = False
         # Route to appropriate Phase 4 implementation
         if engine not in {"xtts", "kokoro"}:
@@ -2094,7 +2547,12 @@ def run_phase(
             resume_enabled=resume_enabled,
         )
 
-    if phase_num == 5 and config.strict_chunk_integrity:
+    # While streaming, Phase 4 checks integrity before sealing its journal
+    if (
+        phase_num == 5
+        and config.strict_chunk_integrity
+        and not is_streaming_from(pipeline_json, file_id, 4)
+    ):
         phase4_dir = find_phase_dir(4)
         if not phase4_dir:
             logger.error("Cannot verify chunk integrity: Phase 4 directory missing.")
@@ -2160,73 +2618,30 @@ def run_phase_standard(
         start_time = time.perf_counter()
         phase3b_timeout = 18000  # 5 hours for Phase 3b sentence splitting
         try:
-            result = subprocess.run(
+            result = run_streaming(
                 cmd,
                 cwd=str(phase_dir),
-                capture_output=True,
-                text=True,
-                encoding="utf-8",
-                errors="replace",
                 timeout=phase3b_timeout,
+                log_path=_phase_log(file_id, "3b"),
             )
             duration = time.perf_counter() - start_time
             if result.returncode != 0:
                 logger.error(f"Phase {phase_num} FAILED (exit {result.returncode}) in {duration:.1f}s")
                 logger.error(f"Error: {result.stderr[-500:]}")
-                _store_phase_error(result.stderr)
-                return False
+                return phase_failed(result.stderr, result.returncode)
             logger.info(f"Phase {phase_num} SUCCESS in {duration:.1f}s")
             return True
         except subprocess.TimeoutExpired:
             logger.error(f"Phase {phase_num} TIMEOUT ({phase3b_timeout}s)")
-            _store_phase_error(f"Phase {phase_num} timeout after {phase3b_timeout} seconds")
-            return False
+            return phase_failed(f"Phase {phase_num} timeout after {phase3b_timeout} seconds")
         except Exception as e:
             logger.error(f"Phase {phase_num} ERROR: {e}")
-            _store_phase_error(str(e))
-            return False
-
-    # Check for venv and install if needed
-    venv_dir = phase_dir / ".venv"
-    if not venv_dir.exists():
-        logger.info(f"Installing dependencies for Phase {phase_num}...")
-        try:
-            # Configure Poetry to use in-project venv
-            subprocess.run(
-                [
-                    "poetry",
-                    "config",
-                    "virtualenvs.in-project",
-                    "true",
-                    "--local",
-                ],
-                cwd=str(phase_dir),
-                capture_output=True,
-                text=True,
-                timeout=10,
-            )
+            return phase_failed(str(e))
 
-            # Install dependencies
-            result = subprocess.run(
-                ["poetry", "install", "--no-root"],
-                cwd=str(phase_dir),
-                capture_output=True,
-                text=True,
-                timeout=300,
-            )
-            if result.returncode != 0:
-                logger.error(f"Poetry install failed: {result.stderr}")
-                logger.error(f"Poetry stdout: {result.stdout}")
-                return False
-            logger.info("Dependencies installed successfully")
-        except subprocess.TimeoutExpired:
-            logger.error("Poetry install timeout (300s)")
-            return False
-        except Exception as e:
-            logger.error(f"Poetry install error: {e}")
-            return False
-    else:
-        logger.info(f"Phase {phase_num} venv already exists")
+    # Phase 5 prepares its own environment (and may only need a concat)
+    in_process = phase_num != 5 and use_in_process(phase_num, phase_dir)
+    if phase_num != 5 and not in_process and not ensure_phase_venv(f"Phase {phase_num}", phase_dir):
+        return False
 
     # Special handling for Phase 5 (needs config.yaml update)
     if phase_num == 5:
@@ -2281,41 +2696,25 @@ def run_phase_standard(
             return False
 
         # Use relative path from phase directory (critical for Poetry venv resolution)
-        entry_points = {
-            1: "phase1_validation.validation",
-            2: "phase2_extraction.ingest",
-            3: "phase3_chunking.main",
-        }
-        module_entry = entry_points.get(phase_num)
-        if module_entry:
-            cmd = ["poetry", "run", "python", "-m", module_entry]
+        entry = PHASE_ENTRIES.get(phase_num)
+        if entry:
+            cmd = ["poetry", "run", "python", "-m", entry.module]
         else:
             script_relative = main_script.relative_to(phase_dir)
             cmd = ["poetry", "run", "python", str(script_relative)]
 
-    # Add phase-specific arguments
-    if phase_num == 1:
-        cmd.extend([f"--file={file_path}", f"--json_path={pipeline_json}"])
-    elif phase_num == 2:
-        cmd.extend(
-            [
-                f"--file={file_path}",
-                f"--file_id={file_id}",
-                f"--json_path={pipeline_json}",
-            ]
-        )
-    elif phase_num == 3:
-        config_path = custom_phase3_config or (phase_dir / "config.yaml")
-        cmd.extend(
-            [
-                f"--file_id={file_id}",
-                f"--json_path={pipeline_json}",
-                f"--config={config_path}",
-            ]
-        )
+    # Phase-specific arguments (same argv for both execution modes)
+    phase_config: Dict[str, Any] = {"file": file_path}
+    if phase_num == 3:
+        phase_config["config"] = custom_phase3_config or (phase_dir / "config.yaml")
         # BUGFIX: Pass voice selection to Phase 3 so chunk voice_overrides are set correctly
-        if voice_id:
-            cmd.append(f"--voice={voice_id}")
+        phase_config["voice"] = voice_id
+
+    if in_process:
+        return run_phase_in_process(phase_num, phase_dir, file_id, pipeline_json, phase_config)
+
+    if phase_num in PHASE_ENTRIES:
+        cmd.extend(phase_argv(phase_num, file_id, pipeline_json, phase_config))
 
     logger.info(f"Command: {' '.join(cmd)}")
 
@@ -2333,15 +2732,12 @@ def run_phase_standard(
             py_paths.append(existing_py_path)
         env["PYTHONPATH"] = os.pathsep.join(py_paths)
         phase_timeout = 18000  # 5 hours for phases 2/3
-        result = subprocess.run(
+        result = run_streaming(
             cmd,
             cwd=str(phase_dir),
             env=env,  # Clean environment for Poetry virtualenv detection
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
             timeout=phase_timeout,
+            log_path=_phase_log(file_id, phase_num),
         )
 
         duration = time.perf_counter() - start_time
@@ -2349,20 +2745,17 @@ def run_phase_standard(
         if result.returncode != 0:
             logger.error(f"Phase {phase_num} FAILED (exit {result.returncode}) in {duration:.1f}s")
             logger.error(f"Error: {result.stderr[-500:]}")  # Last 500 chars
-            _store_phase_error(result.stderr)
-            return False
+            return phase_failed(result.stderr, result.returncode)
 
         logger.info(f"Phase {phase_num} SUCCESS in {duration:.1f}s")
         return True
 
     except subprocess.TimeoutExpired:
         logger.error(f"Phase {phase_num} TIMEOUT ({phase_timeout}s)")
-        _store_phase_error(f"Phase {phase_num} timeout after {phase_timeout} seconds")
-        return False
+        return phase_failed(f"Phase {phase_num} timeout after {phase_timeout} seconds")
     except Exception as e:
         logger.error(f"Phase {phase_num} ERROR: {e}")
-        _store_phase_error(str(e))
-        return False
+        return phase_failed(str(e))
 
 
 def run_phase4_multi_engine(
@@ -2426,8 +2819,12 @@ def run_phase4_multi_engine(
         force_resume: bool = False,  # Force --resume for retry scenarios
     ) -> List[str]:
         runner = [sys.executable]
-        env_name = os.environ.get("PHASE4_CONDA_ENV") or os.environ.get("CONDA_DEFAULT_ENV")
-        if cfg.prefer_shell_tts_execution and env_name:
+        env_name = _conda_env_name()
+        conda_check = preflight_result("conda") if cfg.prefer_shell_tts_execution and env_name else None
+        if conda_check is not None and not conda_check["ok"]:
+            logger.warning(f"Conda env '{env_name}' unusable, running TTS with plain python: {conda_check['message']}")
+            runner = ["python"]
+        elif cfg.prefer_shell_tts_execution and env_name:
             runner = ["conda", "run", "-n", env_name, "python"]
         elif cfg.prefer_shell_tts_execution:
             runner = ["python"]
@@ -2517,7 +2914,7 @@ def run_phase4_multi_engine(
                 try:
                     # Persist an explicit empty list to ease backward-compatibility
                     state = PipelineState(pipeline_json, validate_on_read=False)
-                    with state.transaction() as txn:
+                    with state.transaction(file_id=file_id) as txn:
                         phase4 = txn.data.get("phase4", {}) or {}
                         files = phase4.get("files", {}) or {}
                         files.setdefault(file_id, {})
@@ -2591,7 +2988,7 @@ def run_phase4_multi_engine(
             # The caller should check logs if Phase 4 claims success but audio is missing
             return []
 
-    def run_cmd(cmd: List[str]) -> subprocess.CompletedProcess:
+    def run_cmd(cmd: List[str]):
         start_time = time.perf_counter()
         env = os.environ.copy()
         phase_src = phase_dir / "src"
@@ -2604,18 +3001,22 @@ def run_phase4_multi_engine(
             py_paths.append(existing_py)
         env["PYTHONPATH"] = os.pathsep.join(py_paths)
         phase4_timeout = cfg.get_phase_timeout(4)
+        if phase4_timeout and is_streaming_from(pipeline_json, file_id, 3):
+            # Started alongside Phase 3, so the budget covers both
+            phase3_timeout = cfg.get_phase_timeout(3)
+            phase4_timeout = phase4_timeout + phase3_timeout if phase3_timeout else None
 
-        # Stream output to console in real-time so we can see "Skipping chunk_XXXX" logs
+        # Echo to console in real-time so we can see "Skipping chunk_XXXX" logs;
+        # the full output goes to the phase log, only a tail stays in memory
         logger.info("Phase 4 command: %s", " ".join(cmd))
-        result = subprocess.run(
+        result = run_streaming(
             cmd,
             cwd=str(Path(phase_dir).resolve()),
             env=env,
-            capture_output=False,  # Don't capture - let it stream to console
-            text=True,
-            encoding="utf-8",
-            errors="replace",
             timeout=phase4_timeout,
+            log_path=_phase_log(file_id, 4),
+            on_event=_progress_tracker("phase4"),
+            echo=True,
         )
         duration = time.perf_counter() - start_time
         if result.returncode != 0:
@@ -2641,7 +3042,7 @@ def run_phase4_multi_engine(
             # Only clear state if no audio files exist (true fresh run)
             if not existing_audio:
                 state = PipelineState(pipeline_json, validate_on_read=False)
-                with state.transaction() as txn:
+                with state.transaction(file_id=file_id) as txn:
                     phase4 = txn.data.get("phase4", {}) or {}
                     files = phase4.get("files", {}) or {}
                     if file_id in files:
@@ -2739,6 +3140,12 @@ def run_phase4_multi_engine(
             success = True
     if success:
         logger.info("Phase 4 SUCCESS with %s", engine)
+        if chunk_hash is None and streaming_enabled():
+            # Streamed from Phase 3: hash the final chunk set for future reuse checks
+            try:
+                chunk_hash = compute_chunk_text_hash(load_phase3_chunks(file_id, pipeline_json)[1])
+            except Exception as exc:
+                logger.warning("Could not hash streamed Phase 3 chunks: %s", exc)
         record_phase4_metadata(file_id, pipeline_json, chunk_hash)
         return True
 
@@ -2767,7 +3174,9 @@ def run_phase4_multi_engine(
                     registry.add_attempt(chunk_id, attempt)
             logger.info("🔧 Failures logged to ErrorRegistry for future analysis")
 
-    return False
+    if result.returncode != 0:
+        return phase_failed(result.stderr, result.returncode)
+    return phase_failed(f"Phase 4 chunks failed after all fallbacks: {', '.join(failed_chunks)}")
 
 
 def verify_phase4_chunk_integrity(file_id: str, pipeline_json: Path, phase4_dir: Path) -> bool:
@@ -2875,7 +3284,7 @@ def _record_optional_phase_status(
 ) -> None:
     """Persist status for optional phases without impacting core execution."""
     try:
-        with state.transaction() as txn:
+        with state.transaction(file_id=file_id) as txn:
             phase_block, file_entry = ensure_phase_and_file(txn.data, phase_key, file_id)
             file_entry["status"] = status
             now = datetime.utcnow().isoformat() + "Z"
@@ -3521,47 +3930,9 @@ def run_phase5_with_config_update(phase_dir: Path, file_id: str, pipeline_json:
 
     Phase 5 reads pipeline.json path from config.yaml, not command-line args.
     """
-    # Ensure Poetry uses local venv and install dependencies
-    logger.info("Configuring Phase 5 environment...")
-
-    # Step 1: Configure Poetry to use in-project venv
-    try:
-        subprocess.run(
-            ["poetry", "config", "virtualenvs.in-project", "true", "--local"],
-            cwd=str(phase_dir),
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-    except Exception as e:
-        logger.warning(f"Could not configure Poetry (non-fatal): {e}")
-
-    # Step 2: Ensure dependencies are installed (idempotent - fast if already installed)
-    venv_dir = phase_dir / ".venv"
-    if venv_dir.exists():
-        logger.info("Phase 5 venv detected; skipping Poetry dependency install.")
-    else:
-        logger.info("Verifying Phase 5 dependencies...")
-        try:
-            result = subprocess.run(
-                ["poetry", "install", "--no-root"],
-                cwd=str(phase_dir),
-                env=get_clean_env_for_poetry(),  # Use clean environment for Poetry
-                capture_output=True,
-                text=True,
-                timeout=300,
-            )
-            if result.returncode != 0:
-                logger.error(f"Poetry install failed (exit {result.returncode})")
-                if result.stdout:
-                    logger.error(f"STDOUT: {result.stdout}")
-                if result.stderr:
-                    logger.error(f"STDERR: {result.stderr}")
-                return False
-            logger.info("Dependencies verified/installed successfully")
-        except Exception as e:
-            logger.error(f"Poetry install error: {e}")
-            return False
+    in_process = use_in_process(5, phase_dir)
+    if not in_process and not ensure_phase_venv("Phase 5", phase_dir):
+        return False
 
     config_path = phase_dir / "src" / "phase5_enhancement" / "config.yaml"
 
@@ -3645,21 +4016,23 @@ def run_phase5_with_config_update(phase_dir: Path, file_id: str, pipeline_json:
         logger.error(f"Failed to update Phase 5 config.yaml: {e}")
         return False
 
+    phase_config = {"config": "config.yaml"}
+    if in_process:
+        return run_phase_in_process(5, phase_dir, file_id, pipeline_json, phase_config)
+
     # Build command - Phase 5 only accepts --config, --chunk_id, --skip_concatenation
     # Run as module (not script) because main.py uses relative imports
-    cmd = [
-        "poetry",
-        "run",
-        "python",
-        "-m",
-        "phase5_enhancement.main",
-        "--config=config.yaml",
-    ]
+    cmd = ["poetry", "run", "python", "-m", PHASE_ENTRIES[5].module]
+    cmd.extend(phase_argv(5, file_id, pipeline_json, phase_config))
 
     logger.info(f"Command: {' '.join(cmd)}")
 
     # Execute
     phase5_timeout = 1800  # 30 minutes for Phase 5 enhancement
+    if is_streaming_from(pipeline_json, file_id, 4):
+        # Running alongside Phase 4, so Phase 5 cannot finish before it does
+        phase4_timeout = get_orchestrator_config().get_phase_timeout(4)
+        phase5_timeout = phase5_timeout + phase4_timeout if phase4_timeout else None
     start_time = time.perf_counter()
     try:
         env = get_clean_env_for_poetry()
@@ -3672,15 +4045,13 @@ def run_phase5_with_config_update(phase_dir: Path, file_id: str, pipeline_json:
             env["PYTHONPATH"] = os.pathsep.join(py_paths)
             logger.info(f"Phase 5 PYTHONPATH override: {env['PYTHONPATH']}")
 
-        result = subprocess.run(
+        result = run_streaming(
             cmd,
             cwd=str(phase_dir),
             env=env,  # Clean environment for Poetry virtualenv detection
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
             timeout=phase5_timeout,
+            log_path=_phase_log(file_id, 5),
+            on_event=_progress_tracker("phase5"),
         )
 
         duration = time.perf_counter() - start_time
@@ -3688,20 +4059,17 @@ def run_phase5_with_config_update(phase_dir: Path, file_id: str, pipeline_json:
         if result.returncode != 0:
             logger.error(f"Phase 5 FAILED (exit {result.returncode}) in {duration:.1f}s")
             logger.error(f"Error: {result.stderr[-1000:]}")
-            _store_phase_error(result.stderr)
-            return False
+            return phase_failed(result.stderr, result.returncode)
 
         logger.info(f"Phase 5 SUCCESS in {duration:.1f}s")
         return True
 
     except subprocess.TimeoutExpired:
         logger.error(f"Phase 5 TIMEOUT ({phase5_timeout}s)")
-        _store_phase_error(f"Phase 5 timeout after {phase5_timeout} seconds")
-        return False
+        return phase_failed(f"Phase 5 timeout after {phase5_timeout} seconds")
     except Exception as e:
         logger.error(f"Phase 5 ERROR: {e}")
-        _store_phase_error(str(e))
-        return False
+        return phase_failed(str(e))
 
 
 def _timestamp_to_seconds(timestamp: str, separator: str = ",") -> float:
@@ -3887,6 +4255,13 @@ def run_phase5_5_subtitles(
         ]
         cmd.extend(["--pipeline-json", str(pipeline_json)])
 
+        # Phase 5 writes a chunk offset table next to the audiobook; when present,
+        # align chunks in parallel against their known text instead of whole-book ASR.
+        offsets_path = audiobook_path.with_name(f"{audiobook_path.stem}_offsets.json")
+        if offsets_path.exists():
+            cmd.extend(["--mode", "chunks", "--chunk-offsets", str(offsets_path)])
+            logger.info(f"Phase 5.5: Using chunk-parallel alignment ({offsets_path.name})")
+
         # Add reference text if available for WER calculation
         if text_file and Path(text_file).exists():
             cmd.extend(["--reference-text", str(text_file)])
@@ -3901,15 +4276,12 @@ def run_phase5_5_subtitles(
         # Execute subtitle generation
         phase55_timeout = 3600  # 60 minutes for Phase 5.5 subtitle generation
         start_time = time.perf_counter()
-        result = subprocess.run(
+        result = run_streaming(
             cmd,
             cwd=str(phase5_dir),
             env=get_clean_env_for_poetry(),  # Clean environment for Poetry virtualenv detection
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
             timeout=phase55_timeout,
+            log_path=_phase_log(file_id, "5_5"),
         )
 
         duration = time.perf_counter() - start_time
@@ -3919,7 +4291,7 @@ def run_phase5_5_subtitles(
             logger.error(f"Error: {result.stderr[-1000:]}")
 
             try:
-                with state.transaction(operation="phase5_5_fail") as txn:
+                with state.transaction(operation="phase5_5_fail", file_id=file_id) as txn:
                     phase_block, file_entry = ensure_phase_and_file(txn.data, "phase5_5", file_id)
                     file_entry.update(
                         {
@@ -3969,7 +4341,7 @@ def run_phase5_5_subtitles(
             RUN_SUMMARY["backup_subtitles_used"] = True
             metrics["backup_alignment"] = True
 
-        with state.transaction(operation="phase5_5_success") as txn:
+        with state.transaction(operation="phase5_5_success", file_id=file_id) as txn:
             phase_block, file_entry = ensure_phase_and_file(txn.data, "phase5_5", file_id)
             file_entry.update(
                 {
@@ -4132,6 +4504,23 @@ def _run_lexicon_updater() -> None:
     logger.info("Lexicon updater hook called (no-op).")
 
 
+def _phase_retry_budget(retry_overrides: Dict[str, Any], phase_label: str, max_retries: int) -> int:
+    """Retry budget for a phase, honouring policy overrides."""
+    phase_retry_config = retry_overrides.get(phase_label, {})
+    retry_budget = phase_retry_config.get("suggested_retries", max_retries)
+    try:
+        retry_budget = int(retry_budget)
+    except (TypeError, ValueError):
+        retry_budget = max_retries
+    if retry_budget != max_retries:
+        logger.info(
+            "Policy override: %s retry budget -> %s",
+            phase_label,
+            retry_budget,
+        )
+    return retry_budget
+
+
 def run_pipeline(
     file_path: Path,
     voice_id: Optional[str] = None,
@@ -4198,14 +4587,15 @@ def run_pipeline(
     # Initialize Ollama/LLM for AI-powered features (LlamaChunker, LlamaReasoner, etc.)
     # This checks: ollama package installed, server running, model available
     # Non-blocking - pipeline continues even if Ollama unavailable
+    # The preflight runs it alongside the venv/dependency/registry checks.
     llm_config = getattr(orchestrator_config, "llm", None) or {}
+    start_preflight(orchestrator_config, phases or orchestrator_config.phases_to_run, llm=True)
     if llm_config.get("enable", True):
-        llm_model = llm_config.get("model", "llama3.1:8b-instruct-q4_K_M")
-        ollama_status = ensure_ollama_ready(model=llm_model)
-        if ollama_status["available"]:
-            logger.info(f"🤖 LLM features enabled: {ollama_status['model']}")
+        ollama_status = get_preflight().get("ollama")
+        if ollama_status.ok:
+            logger.info(f"🤖 LLM features enabled: {ollama_status.result['model']}")
         else:
-            logger.warning(f"🤖 LLM features disabled: {ollama_status['message']}")
+            logger.warning(f"🤖 LLM features disabled: {ollama_status.error}")
     else:
         logger.info("🤖 LLM features disabled in config")
 
@@ -4401,21 +4791,21 @@ def run_pipeline(
     elif voice_id:
         logger.info(f"Using manual voice selection: {voice_id}")
 
-        # Auto-detect engine from voice configuration
+        # Auto-detect engine from voice configuration (loaded by the preflight)
         try:
-            voices_config_path = PROJECT_ROOT / "configs" / "voices.json"
-            if voices_config_path.exists():
-                import json
-                with open(voices_config_path, 'r', encoding='utf-8') as f:
-                    voices_data = json.load(f)
-                voice_config = voices_data.get("voices", {}).get(voice_id, {})
-                voice_engine = voice_config.get("engine")
+            voices = preflight_result("voices") or {}
+            if voices.get("ok"):
+                voice_engine = voices["engines"].get(voice_id)
                 if voice_engine and voice_engine != tts_engine:
                     logger.info(f"Auto-detected engine '{voice_engine}' for voice '{voice_id}' (overriding default '{tts_engine}')")
                     tts_engine = voice_engine
         except Exception as e:
             logger.warning(f"Could not auto-detect engine for voice '{voice_id}': {e}")
 
+    registry = preflight_result("engine_registry")
+    if registry and registry["ok"] and tts_engine not in registry["engines"]:
+        logger.warning(f"TTS engine '{tts_engine}' is not in the Phase 4 engine registry ({', '.join(registry['engines'])})")
+
     # Predictive Failure Analysis
     try:
         from agents.predictive_failure_agent import PredictiveFailureAgent
@@ -4441,6 +4831,7 @@ def run_pipeline(
     # Run phases
     policy_phase_timers: Dict[str, float] = {}
     completed_phases = []
+    streamer: Optional[StreamingPhases] = None
 
     try:
         # Add Phase 0 (Audiobook Director) if auto_mode is enabled
@@ -4464,18 +4855,37 @@ def run_pipeline(
 
         # Filter out phase 0 so we don't try to run it in the main loop
         phases_to_run = sorted([p for p in phases if p != 0])
+        stream_group: List[int] = []
+        if orchestrator_config.streaming_phases:
+            stream_group = plan_streaming_phases(phases_to_run, state, file_id, resume_enabled)
 
-        for phase_num in phases_to_run:
-            if cancel_event and cancel_event.is_set():
-                logger.warning("Pipeline cancelled by user request.")
-                break
+        def run_with_retry(num: int) -> bool:
+            return run_phase_with_retry(
+                num,
+                file_path,
+                file_id,
+                pipeline_json,
+                state=state,
+                max_retries=_phase_retry_budget(phase_retry_overrides, f"phase{num}", max_retries),
+                voice_id=voice_id,
+                pipeline_mode=pipeline_mode,
+                tts_engine=tts_engine,
+                policy_engine=policy_engine,
+                runtime_overrides=runtime_overrides,
+                resume_enabled=resume_enabled,
+            )
+
+        for phase_num in phases_to_run:
+            if cancel_event and cancel_event.is_set():
+                logger.warning("Pipeline cancelled by user request.")
+                break
             # Call progress callback if provided
             if progress_callback:
                 progress_callback(phase_num, 0.0, f"Starting Phase {phase_num}...")
 
-            # Check resume status (phase-first view)
+            # Check resume status (phase-first view); streamed phases were checked up front
             resume_status: Optional[str] = None
-            if resume_enabled:
+            if resume_enabled and phase_num not in stream_group:
                 resume_status = check_phase_status(state, phase_num, file_id)
                 if resume_status == "success":
                     logger.info(f"Skipping Phase {phase_num} (already completed)")
@@ -4501,33 +4911,18 @@ def run_pipeline(
             )
             _policy_call(policy_engine, "record_phase_start", start_ctx)
 
-            phase_retry_config = phase_retry_overrides.get(phase_label, {})
-            retry_budget = phase_retry_config.get("suggested_retries", max_retries)
-            try:
-                retry_budget = int(retry_budget)
-            except (TypeError, ValueError):
-                retry_budget = max_retries
-            if retry_budget != max_retries:
-                logger.info(
-                    "Policy override: %s retry budget -> %s",
-                    phase_label,
-                    retry_budget,
-                )
-
-            success = run_phase_with_retry(
-                phase_num,
-                file_path,
-                file_id,
-                pipeline_json,
-                state=state,
-                max_retries=retry_budget,
-                voice_id=voice_id,
-                pipeline_mode=pipeline_mode,
-                tts_engine=tts_engine,
-                policy_engine=policy_engine,
-                runtime_overrides=runtime_overrides,
-                resume_enabled=resume_enabled,
-            )
+            if phase_num in stream_group:
+                if streamer is None:
+                    streamer = StreamingPhases(
+                        stream_group,
+                        file_id,
+                        pipeline_json,
+                        run_with_retry,
+                        strict_chunk_integrity=orchestrator_config.strict_chunk_integrity,
+                    ).start()
+                success = streamer.result(phase_num)
+            else:
+                success = run_with_retry(phase_num)
 
             if not success:
                 failure_duration = _pop_phase_duration(policy_phase_timers, phase_label)
@@ -4714,6 +5109,8 @@ def run_pipeline(
 
     finally:
         # This block will run whether the pipeline succeeded, failed, or was cancelled.
+        if streamer is not None:
+            streamer.close()
         logger.info("Running post-pipeline cleanup and finalization...")
         _run_lexicon_updater()
         
@@ -4750,6 +5147,732 @@ def run_pipeline(
     }
 
 
+def _meta_option(section: Any, key: str, default: Any = None) -> Any:
+    """Read ``key`` from a config block that may be a dict or a model."""
+    if isinstance(section, dict):
+        return section.get(key, default)
+    return getattr(section, key, default)
+
+
+# Run-summary keys each meta phase's kernels read (everything else they see
+# falls back to defaults), so unrelated summary fields do not defeat skipping.
+PHASE_SUMMARY_KEYS = ("phase1", "phase2", "phase3", "phase4", "phase5", "phase6")
+SELF_EVALUATION_SUMMARY_KEYS = ("health", "repairs")
+SELF_EVAL_REPORT_SUMMARY_KEYS = (
+    "coherence", "alignment", "stability", "efficiency",  # self_eval_kernel
+    "phase_success", "consistency", "llm_quality", "chunk_flow",  # cross_phase_fusion
+)
+REVIEW_SUMMARY_KEYS = ("coherence", "stability", "quality")
+AUDIT_SUMMARY_KEYS = ("tts_quality", "chunk_flow", "reasoning_clarity", "engine_stability")
+SELF_HEAL_SUMMARY_KEYS = ("run_id", "failures", "breakpoints")
+ADAPTIVE_SUMMARY_KEYS = (
+    "memory", "stability", "budget", "consistency", "integration", "research", "self_eval", "retro",
+    "health", "audit", "schema_validation", "harmonizer", "ui_signals", "meta_agent",
+    "future_guardrails", "activation_safety",
+)
+
+RESEARCH_COLLECT_FLAGS = (
+    "collect_phase_metrics",
+    "collect_failure_patterns",
+    "collect_engine_stats",
+    "collect_chunk_stats",
+    "collect_memory_signals",
+    "collect_policy_signals",
+)
+
+
+def build_meta_phases(
+    orchestrator_config: OrchestratorConfig,
+    file_id: str,
+    policy_engine: Optional[PolicyEngine] = None,
+) -> List[MetaPhase]:
+    """
+    The enabled post-run meta phases (P research through AB adaptive), in
+    their historical order, each declaring the paths and run-summary keys it
+    reads and the report directories it writes.  ``ctx`` holds read-only
+    copies of just the declared summary keys (and the state, for phases
+    that ``uses_state``); ``run_meta_phases`` works out what can overlap.
+    """
+    phases: List[MetaPhase] = []
+
+    def run_id_or_file_id() -> str:
+        run_id = None
+        try:
+            run_id = policy_engine.run_id if policy_engine else None
+        except Exception:
+            run_id = None
+        return run_id or file_id or datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+
+    # Phase P research
+    research_cfg = getattr(orchestrator_config, "research", None)
+
+    def research(ctx: MetaContext) -> Dict[str, Any]:
+        from phaseP_research.research_config import ResearchConfig
+        from phaseP_research.research_collector import ResearchCollector
+        from phaseP_research.research_analyzer import ResearchAnalyzer
+        from phaseP_research.research_reporter import ResearchReporter
+        from phaseP_research.init import initialize_research_state
+
+        cfg_kwargs = {"enable_research": True}
+        cfg_kwargs.update({flag: bool(_meta_option(research_cfg, flag, False)) for flag in RESEARCH_COLLECT_FLAGS})
+        rcfg = ResearchConfig(**cfg_kwargs)
+        run_state = ctx.state
+        try:
+            initialize_research_state(Path(".pipeline") / "research")
+        except Exception:
+            pass
+        # Observations per phase (read-only)
+        try:
+            from phaseP_research.observation_hooks import record_phase_observation
+
+            for phase_key, pdata in run_state.items():
+                if not isinstance(pdata, dict) or not phase_key.startswith("phase"):
+                    continue
+                observation_payload = {
+                    "input_size": pdata.get("input_size") or pdata.get("metrics", {}).get("files_processed") if isinstance(pdata.get("metrics"), dict) else None,
+                    "output_size": pdata.get("metrics", {}).get("files_processed") if isinstance(pdata.get("metrics"), dict) else None,
+                    "metadata": {
+                        "status": pdata.get("status"),
+                    },
+                }
+                record_phase_observation(phase_key, observation_payload, rcfg)
+        except Exception:
+            pass
+        raw = ResearchCollector(rcfg).collect(run_state)
+        analysis = ResearchAnalyzer().analyze(raw)
+        ResearchReporter().write_report(analysis)
+
+        research_signals = {"raw": raw, "analysis": analysis}
+
+        # Quality gate (informational only)
+        try:
+            if _meta_option(research_cfg, "enable_quality_gate", False):
+                from phaseP_research.quality_gate import (
+                    evaluate_quality_gate,
+                    write_quality_gate,
+                )
+
+                qg_result = evaluate_quality_gate(research_signals, run_state)
+                write_quality_gate(qg_result)
+        except Exception:
+            pass
+
+        # Research feedback loop (append-only)
+        try:
+            if _meta_option(research_cfg, "enable_feedback_loop", False):
+                from phaseP_research.feedback_loop import update_research_feedback
+
+                update_research_feedback({}, research_signals)
+        except Exception:
+            pass
+
+        # Safety verification (informational)
+        try:
+            if _meta_option(research_cfg, "enable_safety_verification", False):
+                from phaseP_research.safety_verification import verify_research_outputs
+
+                verify_research_outputs(research_signals)
+        except Exception:
+            pass
+
+        # Research lifecycle controller (opt-in)
+        try:
+            if _meta_option(research_cfg, "enable_lifecycle", False):
+                from phaseP_research.research_runner import ResearchRunner
+
+                runner = ResearchRunner(research_cfg)
+                runner.begin_run()
+                evidence = runner.ingest_evidence(run_state, [])
+                patterns = runner.extract_patterns(evidence)
+                runner.write_report({"raw": raw, "analysis": analysis, "patterns": patterns})
+        except Exception:
+            pass
+        return analysis
+
+    phases.append(
+        MetaPhase("research", research, writes=(".pipeline/research",), uses_state=True, params=research_cfg)
+    )
+
+    # Phase Q self-evaluation
+    phaseq_cfg = getattr(orchestrator_config, "phaseQ_self_evaluation", None) or getattr(orchestrator_config, "phaseQ_self_eval", None)
+    if _meta_option(phaseq_cfg, "enable", False):
+        output_dir = _meta_option(phaseq_cfg, "output_dir", ".pipeline/self_evaluation")
+
+        def self_evaluation(ctx: MetaContext) -> None:
+            try:
+                from phaseQ_self_evaluation import metrics_engine, report_writer
+
+                Path(output_dir).mkdir(parents=True, exist_ok=True)
+                long_horizon_state = {}
+                metrics = metrics_engine.compute_metrics(dict(ctx.summary), long_horizon_state)
+                run_id = policy_engine.run_id if policy_engine else datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+                report_writer.write_report(run_id, metrics, output_dir)
+            except Exception as exc:
+                try:
+                    (Path(output_dir) / "errors.log").write_text(str(exc), encoding="utf-8")
+                except Exception:
+                    pass
+                raise
+
+        phases.append(
+            MetaPhase(
+                "self_evaluation",
+                self_evaluation,
+                writes=(output_dir,),
+                summary_keys=SELF_EVALUATION_SUMMARY_KEYS,
+                params=phaseq_cfg,
+            )
+        )
+
+    # Phase Q Steps 5-7: meta-evaluator and reflection
+    meta_cfg = getattr(orchestrator_config, "phaseQ_self_eval", None)
+    if _meta_option(meta_cfg, "enable_meta_evaluator", False) and _meta_option(meta_cfg, "enable_reflection_writer", False):
+        reflection_dir = _meta_option(meta_cfg, "output_dir", ".pipeline/self_eval")
+
+        def self_eval_reflection(ctx: MetaContext) -> None:
+            from phaseQ_self_eval import q_meta_evaluator, reflection_writer
+
+            aggregated_signals = {
+                "research": ctx.results["research"],
+                "forecasting": {},
+                "stability": {},
+                "rewards": {},
+                "planner": {},
+            }
+            meta_result = q_meta_evaluator.evaluate_meta(aggregated_signals)
+            if meta_result is not None:
+                reflection_writer.write_reflection(meta_result, Path(reflection_dir))
+
+        phases.append(
+            MetaPhase(
+                "self_eval_reflection",
+                self_eval_reflection,
+                writes=(str(Path(reflection_dir) / "reflections"),),
+                needs=("research",),
+                params=meta_cfg,
+            )
+        )
+
+    # Phase Q reporting (autonomy.self_eval)
+    autonomy_cfg = getattr(orchestrator_config, "autonomy", None)
+    self_eval_cfg = getattr(autonomy_cfg, "self_eval", None) if autonomy_cfg else None
+    if _meta_option(self_eval_cfg, "enable", False):
+
+        def self_eval_report(ctx: MetaContext) -> None:
+            from phaseQ_self_eval import cross_phase_fusion, rating_explainer, self_eval_kernel, self_eval_reporter
+
+            run_summary = dict(ctx.summary)
+            kernel_result = self_eval_kernel.evaluate_run({"metrics": run_summary})
+            fusion_result = cross_phase_fusion.fuse_phase_outputs(run_summary)
+            explanation = rating_explainer.explain_rating(kernel_result.get("dimensions", {}), kernel_result.get("overall_rating", 0.0))
+            out_path = self_eval_reporter.write_self_eval_report(
+                run_id_or_file_id(),
+                kernel_result,
+                kernel_result.get("overall_rating"),
+                fusion_result,
+                explanation,
+                output_dir=None,
+            )
+            logger.info("Phase Q self-eval: rating=%s", kernel_result.get("overall_rating"))
+            logger.debug("Phase Q self-eval written to %s", out_path)
+
+        phases.append(
+            MetaPhase(
+                "self_eval_report",
+                self_eval_report,
+                writes=(".pipeline/self_eval/reports",),
+                summary_keys=SELF_EVAL_REPORT_SUMMARY_KEYS,
+                params=self_eval_cfg,
+            )
+        )
+
+    # Phase R retrospective intelligence
+    phase_r_cfg = getattr(orchestrator_config, "phaseR", None)
+    if _meta_option(phase_r_cfg, "enable", False):
+
+        def retro(ctx: MetaContext) -> None:
+            from phaseR_retro import init_state, research_runner
+
+            init_state.ensure_research_state(Path(".pipeline"))
+            run_id = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+            research_runner.begin_run(run_id)
+            evidence = research_runner.ingest_evidence(run_id)
+            derived = research_runner.extract_patterns(run_id, evidence)
+            research_runner.write_report(run_id, evidence, derived)
+
+        phases.append(
+            MetaPhase(
+                "retro",
+                retro,
+                reads=(
+                    ".pipeline/policy_logs",
+                    ".pipeline/benchmark_history",
+                    ".pipeline/research/observations",
+                    ".pipeline/self_eval/reports",
+                    ".pipeline/error_registry.json",
+                ),
+                writes=(".pipeline/research",),
+                params=phase_r_cfg,
+            )
+        )
+
+    # Phase S review
+    phase_s_cfg = getattr(orchestrator_config, "phaseS", None)
+    if _meta_option(phase_s_cfg, "enable", False):
+
+        def review(ctx: MetaContext) -> None:
+            from phaseS_review import review_kernel, review_aggregator, review_reporter
+
+            run_id = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+            review = review_kernel.review_run(dict(ctx.summary))
+            aggregate = review_aggregator.aggregate_reviews([review])
+            review_reporter.write_review_report(run_id, review, aggregate, base_dir=Path(".pipeline/review/reports"))
+
+        phases.append(
+            MetaPhase(
+                "review",
+                review,
+                writes=(".pipeline/review/reports",),
+                summary_keys=REVIEW_SUMMARY_KEYS,
+                params=phase_s_cfg,
+            )
+        )
+
+    # Phase T consistency
+    consistency_cfg = getattr(orchestrator_config, "consistency", None)
+    if _meta_option(consistency_cfg, "enable", False):
+
+        def consistency(ctx: MetaContext) -> None:
+            from phaseT_consistency import consistency_checker, drift_monitor, health_reporter, schema_registry
+
+            result = consistency_checker.check_consistency(dict(ctx.summary), schema_registry)
+            drift = drift_monitor.detect_system_drift(Path(".pipeline"))
+            health_reporter.write_consistency_report(run_id=run_id_or_file_id(), consistency=result, drift=drift)
+
+        phases.append(
+            MetaPhase(
+                "consistency",
+                consistency,
+                reads=(
+                    ".pipeline/error_registry.json",
+                    ".pipeline/policy_logs",
+                    ".pipeline/benchmark_history",
+                    ".pipeline/self_eval/reports",
+                    ".pipeline/research/patterns",
+                    ".pipeline/research/retro_reports",
+                ),
+                writes=(".pipeline/consistency/reports",),
+                summary_keys=PHASE_SUMMARY_KEYS,
+                params=consistency_cfg,
+            )
+        )
+
+    # Phase T audit
+    phase_t_cfg = getattr(orchestrator_config, "phaseT", None)
+    if _meta_option(phase_t_cfg, "enable", False):
+
+        def audit(ctx: MetaContext) -> None:
+            from phaseT_audit import audit_kernel, eval_synthesizer, risk_classifier, audit_reporter
+
+            ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+            run_summary = dict(ctx.summary)
+            kernel_out = audit_kernel.evaluate_run(run_summary, run_summary)
+            synthesized = eval_synthesizer.synthesize_evaluation(kernel_out, run_summary)
+            risk = risk_classifier.classify(synthesized)
+            report = {
+                "id": ts,
+                "run_id": run_id_or_file_id(),
+                "kernel": kernel_out,
+                "synthesized": synthesized,
+                "risk": risk,
+                "created_at": ts,
+                "notes": "Phase T audit",
+            }
+            audit_reporter.write_audit_report(report)
+
+        phases.append(
+            MetaPhase(
+                "audit",
+                audit,
+                writes=(".pipeline/audit/reports",),
+                summary_keys=AUDIT_SUMMARY_KEYS,
+                params=phase_t_cfg,
+            )
+        )
+
+    # Phase U safety-integrity
+    phase_u_cfg = getattr(orchestrator_config, "phaseU", None)
+    if _meta_option(phase_u_cfg, "enable", False):
+
+        def integrity(ctx: MetaContext) -> None:
+            from phaseU_integrity import consistency_unifier, integrity_kernel, integrity_reporter, signal_hub
+
+            signals = signal_hub.collect_signals(run_id_or_file_id(), base_dir=".pipeline")
+            result = integrity_kernel.evaluate_integrity(
+                dict(ctx.summary),
+                signals["signals"].get("readiness"),
+                signals["signals"].get("stability"),
+                signals["signals"].get("drift"),
+                signals["signals"].get("self_eval"),
+                signals["signals"].get("retrospection"),
+                signals["signals"].get("review"),
+                signals["signals"].get("audit"),
+            )
+            unified = consistency_unifier.unify(signals, result)
+            integrity_reporter.write_integrity_report(unified, base_dir=".pipeline/safety_integrity/reports/")
+
+        phases.append(
+            MetaPhase(
+                "integrity",
+                integrity,
+                reads=(
+                    ".pipeline/readiness/readiness.json",
+                    ".pipeline/stability_profiles/latest.json",
+                    ".pipeline/drift/drift.json",
+                    ".pipeline/self_eval/reports/latest.json",
+                    ".pipeline/research/retro_reports/latest.json",
+                    ".pipeline/review/reports/latest.json",
+                    ".pipeline/audit/reports/latest.json",
+                    ".pipeline/policy_logs/latest.json",
+                    ".pipeline/policy_runtime/last_run_summary.json",
+                    ".pipeline/engine_capabilities.json",
+                ),
+                writes=(".pipeline/safety_integrity/reports",),
+                summary_keys=(),  # evaluate_integrity ignores its run_summary argument
+                params=phase_u_cfg,
+            )
+        )
+
+    # Phase V migrations (non-destructive; applying writes snapshots next to the state)
+    phase_v_cfg = getattr(orchestrator_config, "phaseV", None)
+    if _meta_option(phase_v_cfg, "enable", False):
+        dry_run = bool(_meta_option(phase_v_cfg, "dry_run", True))
+
+        def migrations(ctx: MetaContext) -> None:
+            from phaseV_migrations import migration_reporter, migration_runner
+
+            plan = migration_runner.plan_migrations(phase_v_cfg, base_dir=Path(".pipeline"))
+            migration_reporter.write_plan_report(plan, base_dir=Path(".pipeline/migrations"))
+            if not dry_run:
+                result = migration_runner.apply_migrations(phase_v_cfg, base_dir=Path(".pipeline"))
+                migration_reporter.write_apply_report(result, base_dir=Path(".pipeline/migrations"))
+
+        phases.append(
+            MetaPhase(
+                "migrations",
+                migrations,
+                writes=(".pipeline/migrations",) if dry_run else (".pipeline",),
+                params=phase_v_cfg,
+                cacheable=dry_run,
+            )
+        )
+
+    # Phase W global consistency
+    phase_w_cfg = getattr(orchestrator_config, "phaseW", None)
+    if _meta_option(phase_w_cfg, "enable", False):
+        schema_keys = PHASE_SUMMARY_KEYS
+
+        def global_consistency(ctx: MetaContext) -> None:
+            from phaseW_global import cross_phase_consistency, global_analyzer, schema_linter, w_reporter
+
+            # Collect schemas best-effort from run summary; degrade gracefully.
+            phase_schemas = {key: ctx.summary.get(key) for key in schema_keys}
+            lint = schema_linter.lint_schemas(phase_schemas)
+            consistency = cross_phase_consistency.analyze_consistency(phase_schemas)
+            global_info = global_analyzer.global_analysis(lint, consistency)
+            report_payload = {
+                "lint": lint,
+                "consistency": consistency,
+                "global_analysis": global_info,
+                "notes": "Phase W global consistency layer",
+            }
+            w_reporter.write_phaseW_report(report_payload, base_dir=Path(".pipeline/phaseW/reports"))
+
+        phases.append(
+            MetaPhase(
+                "global_consistency",
+                global_consistency,
+                writes=(".pipeline/phaseW/reports",),
+                summary_keys=schema_keys,
+                params=phase_w_cfg,
+            )
+        )
+
+    # Phase X meta-evaluator
+    phase_x_cfg = getattr(orchestrator_config, "phaseX", None)
+    if _meta_option(phase_x_cfg, "enable", False):
+        max_depth = int(_meta_option(phase_x_cfg, "max_depth", 3))
+
+        def meta_evaluator(ctx: MetaContext) -> None:
+            from phaseX_meta import meta_kernel, meta_fusion, meta_ranking, meta_reporter
+
+            # Load best-effort signals from prior phases (if present in RUN_SUMMARY)
+            inputs = {
+                "self_eval": ctx.summary.get("phaseQ"),
+                "retro": ctx.summary.get("phaseR"),
+                "review": ctx.summary.get("phaseS"),
+            }
+            kernel_out = meta_kernel.evaluate_signal_layers(inputs)
+            fusion_out = meta_fusion.fuse_meta_context(kernel_out)
+            ranking_out = meta_ranking.rank_meta_findings(kernel_out, fusion_out, max_depth=max_depth)
+            report = {
+                "id": datetime.utcnow().strftime("%Y%m%d_%H%M%S"),
+                "timestamp": datetime.utcnow().strftime("%Y%m%d_%H%M%S"),
+                "kernel": kernel_out,
+                "fusion": fusion_out,
+                "ranking": ranking_out,
+                "summary": "Phase X meta-evaluator report",
+            }
+            meta_reporter.write_meta_report(report, base_dir=Path(".pipeline/meta/reports"))
+
+        phases.append(
+            MetaPhase(
+                "meta_evaluator",
+                meta_evaluator,
+                writes=(".pipeline/meta/reports",),
+                summary_keys=("phaseQ", "phaseR", "phaseS"),
+                params=phase_x_cfg,
+            )
+        )
+
+    # Phase Y self-healing (no auto-actions)
+    phase_y_cfg = getattr(orchestrator_config, "phaseY", None)
+    if _meta_option(phase_y_cfg, "enable", False):
+
+        def self_heal(ctx: MetaContext) -> None:
+            run_summary = dict(ctx.summary)
+            try:
+                from phaseY_self_opt import y_kernel, y_suggester, y_reporter  # type: ignore
+
+                # If optional module exists, use it.
+                fused = y_kernel.evaluate_run(run_summary)
+                suggestions = y_suggester.generate_suggestions(fused)
+                ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+                report_payload = {
+                    "id": ts,
+                    "timestamp": ts,
+                    "run_id": run_summary.get("run_id", ""),
+                    "analysis": fused,
+                    "suggestions": suggestions,
+                }
+                y_reporter.write_phaseY_report(report_payload, base_dir=Path(".pipeline/phaseY/reports"))
+            except Exception:
+                # Fallback to existing self_heal implementations (informational only)
+                from phaseY_self_heal import heal_kernel, heal_classifier, heal_suggester, heal_reporter
+
+                kernel = heal_kernel.compute_heal_signals(run_summary)
+                classification = heal_classifier.classify(kernel)
+                suggestions = heal_suggester.suggest_corrections(run_summary, classification)
+                ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+                report = {
+                    "id": ts,
+                    "timestamp": ts,
+                    "run_id": run_summary.get("run_id", ""),
+                    "kernel": kernel,
+                    "classification": classification,
+                    "suggestions": suggestions,
+                    "overall_severity": kernel.get("signals", {}).get("severity", "low") if isinstance(kernel, dict) else "low",
+                    "notes": "Phase Y self-heal report (informational only; no automatic actions).",
+                }
+                heal_reporter.write_heal_report(report, base_dir=Path(".pipeline/phaseY/reports"))
+
+        phases.append(
+            MetaPhase(
+                "self_heal",
+                self_heal,
+                writes=(".pipeline/phaseY/reports",),
+                summary_keys=SELF_HEAL_SUMMARY_KEYS,
+                params=phase_y_cfg,
+            )
+        )
+
+    # Phase Z meta diagnostics (also probes installed dependencies, so never cached)
+    phase_z_cfg = getattr(orchestrator_config, "phaseZ", None)
+    if _meta_option(phase_z_cfg, "enable", False):
+
+        def meta_diagnostics(ctx: MetaContext) -> None:
+            from phaseZ_meta import dependency_scanner, invariant_checker, meta_kernel, meta_reporter, phase_health_summarizer
+
+            kernel = meta_kernel.analyze_full_pipeline()
+            inv = invariant_checker.check_invariants(kernel)
+            deps = dependency_scanner.scan_dependencies()
+            health = phase_health_summarizer.summarize_health()
+            meta_reporter.write_meta_report(kernel, inv, deps, health, base_dir=Path(".pipeline/meta/reports"))
+
+        phases.append(
+            MetaPhase(
+                "meta_diagnostics",
+                meta_diagnostics,
+                reads=(
+                    *(f".pipeline/phase{num}.json" for num in range(1, 7)),
+                    ".pipeline/test_results/latest.json",
+                    ".pipeline/drift/drift.json",
+                    ".pipeline/review/reports/latest.json",
+                    ".pipeline/research/retro_reports/latest.json",
+                    ".pipeline/research/patterns/latest.json",
+                    ".pipeline/predictive/latest.json",
+                    ".pipeline/self_eval/reports/latest.json",
+                ),
+                writes=(".pipeline/meta/reports",),
+                cacheable=False,
+            )
+        )
+
+    # Phase AC policy compiler
+    phase_ac_cfg = getattr(orchestrator_config, "phaseAC", None)
+    if _meta_option(phase_ac_cfg, "enable", False):
+
+        def policy_compiler(ctx: MetaContext) -> None:
+            from phaseAC_policy_compiler import compiler, merger, conflict_resolver, profile_writer
+
+            base_profile = compiler.compile_policy_profile(orchestrator_config, base_dir=Path(".pipeline"))
+            merged = merger.merge_policies([base_profile])
+            resolved = conflict_resolver.resolve_conflicts(merged)
+            profile_writer.write_policy_profile(resolved, base_dir=Path(".pipeline/policy_profiles"))
+
+        phases.append(
+            MetaPhase(
+                "policy_compiler",
+                policy_compiler,
+                writes=(".pipeline/policy_profiles",),
+                params=orchestrator_config,
+            )
+        )
+
+    # Phase AD capability catalog (scans the repository, so never cached)
+    phase_ad_cfg = getattr(orchestrator_config, "phaseAD", None)
+    if _meta_option(phase_ad_cfg, "enable", False):
+
+        def capability_catalog(ctx: MetaContext) -> None:
+            from phaseAD_catalog import capability_scanner, catalog_builder, catalog_reporter
+
+            scanned = capability_scanner.scan_capabilities()
+            catalog = catalog_builder.build_catalog(scanned)
+            catalog_reporter.write_catalog(catalog, base_dir=Path(".pipeline/capability_catalog"))
+
+        phases.append(
+            MetaPhase(
+                "capability_catalog",
+                capability_catalog,
+                writes=(".pipeline/capability_catalog",),
+                cacheable=False,
+            )
+        )
+
+    # Phase AB Adaptive Brain (no auto-apply)
+    phase_ab_cfg = getattr(orchestrator_config, "phaseAB", None)
+    if _meta_option(phase_ab_cfg, "enable", False):
+
+        def adaptive(ctx: MetaContext) -> None:
+            from uuid import uuid4
+            from phaseAB_adaptive import ab_kernel, ab_fusion, ab_classifier, ab_recommender, ab_reporter
+
+            raw_signals = ab_kernel.evaluate_all_sources(dict(ctx.summary), base_dir=".pipeline")
+            fused = ab_fusion.fuse_signals(raw_signals)
+            assessment = ab_classifier.classify_state(fused)
+            actions = ab_recommender.recommend_actions(fused, assessment)
+            report = {
+                "id": str(uuid4()),
+                "timestamp": datetime.utcnow().isoformat() + "Z",
+                "signals": fused,
+                "unified_assessment": assessment,
+                "recommended_actions": actions,
+                "safe_to_apply": False,
+                "safety_envelope_version": "phaseAB_v1",
+            }
+            ab_reporter.write_ab_summary(report, base_dir=".pipeline/ab")
+
+        phases.append(
+            MetaPhase(
+                "adaptive",
+                adaptive,
+                reads=tuple(
+                    f".pipeline/{name}"
+                    for name in (
+                        "stability_profiles",
+                        "consistency",
+                        "integration",
+                        "research",
+                        "self_eval",
+                        "retro",
+                        "health",
+                        "policy_runtime/safety_events",
+                        "schema",
+                        "harmonizer",
+                        "ui",
+                        "meta",
+                        "future_guardrails",
+                        "autonomy/final_safety",
+                    )
+                ),
+                writes=(".pipeline/ab",),
+                summary_keys=ADAPTIVE_SUMMARY_KEYS,
+                params=phase_ab_cfg,
+            )
+        )
+
+    # Capabilities switchboard (read-only coordination for safe phases)
+    capabilities_cfg = getattr(orchestrator_config, "capabilities", None)
+    if isinstance(capabilities_cfg, dict) and capabilities_cfg.get("enable_safe_modes"):
+
+        def capabilities(ctx: MetaContext) -> None:
+            # Informational only; the individual phases already gate themselves.
+            capabilities_report = {
+                "capabilities": capabilities_cfg,
+                "notes": "Safe modes coordination (read-only).",
+            }
+            cap_dir = Path(".pipeline") / "capabilities" / "reports"
+            cap_dir.mkdir(parents=True, exist_ok=True)
+            ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+            cap_path = cap_dir / f"capabilities_{ts}.json"
+            cap_path.write_text(json.dumps(capabilities_report, indent=2), encoding="utf-8")
+
+        phases.append(
+            MetaPhase(
+                "capabilities",
+                capabilities,
+                writes=(".pipeline/capabilities/reports",),
+                params=capabilities_cfg,
+            )
+        )
+
+    return phases
+
+
+def run_post_run_meta_phases(
+    orchestrator_config: OrchestratorConfig,
+    pipeline_json: Path,
+    file_id: str,
+    policy_engine: Optional[PolicyEngine] = None,
+) -> MetaRunReport:
+    """
+    Run the enabled meta phases as a DAG over one snapshot of the run.
+
+    pipeline.json is read once here and RUN_SUMMARY copied once; phases
+    whose declared inputs are unchanged since their last run are skipped.
+    The report's wall time is the post-run overhead, logged and kept in
+    ``.pipeline/meta_dag/last_run.json`` apart from the pipeline duration.
+    """
+    try:
+        state = PipelineState(pipeline_json, validate_on_read=False).read(validate=False)
+    except Exception:
+        state = {}
+    phases = build_meta_phases(orchestrator_config, file_id, policy_engine)
+    report = run_meta_phases(
+        phases,
+        copy.deepcopy(RUN_SUMMARY),
+        state,
+        workers=orchestrator_config.meta_phase_workers,
+        store=RecordStore(),
+    )
+    for name, entry in report.phases.items():
+        if entry["status"] in ("failed", "blocked"):
+            logger.debug("Meta phase %s %s: %s", name, entry["status"], entry.get("error"))
+    logger.info(f"Post-run meta phases: {report.summary_line()}")
+    _write_json_safely(RECORD_DIR / "last_run.json", {"file_id": file_id, **report.to_dict()})
+    return report
+
+
 def main():
     """Main orchestrator entry point."""
     global _SUPERVISED_OVERRIDES, _AUTONOMOUS_OVERRIDES, _RUN_TRACE
@@ -4827,9 +5950,19 @@ Examples:
         action="store_true",
         help="Enable Phase 0: Run the Audiobook Director to create a Production Bible before starting the pipeline.",
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Run Phases 3-5 concurrently, handing chunks over as they finish (streaming_phases in config.yaml)",
+    )
+    startup_profile.add_argument(parser)
 
     args = parser.parse_args()
 
+    if args.profile_startup:
+        # Phase subprocesses inherit the environment, so they profile their startup too
+        os.environ[startup_profile.ENABLE_ENV] = "1"
+
     if args.export_reference:
         from tools.book_generator import export_reference_bundle
 
@@ -4883,6 +6016,7 @@ Examples:
 
     # Display header (use -> instead of → for Windows compatibility)
     phases_to_run = args.phases or orchestrator_config.phases_to_run
+    start_preflight(orchestrator_config, phases_to_run, llm=False)
     phase_display = " -> ".join(map(str, phases_to_run))
     header = f"""
 Audiobook Pipeline - Phase 6 Orchestrator
@@ -4917,6 +6051,24 @@ Pipeline Mode: {pipeline_mode}
     if args.voice:
         print_status(f"[cyan]Voice Override: {args.voice}[/cyan]")
 
+    stream_group: List[int] = []
+    if args.stream or orchestrator_config.streaming_phases:
+        stream_group = plan_streaming_phases(phases_to_run, state, file_id, resume_enabled)
+    streamer: Optional[StreamingPhases] = None
+
+    def run_with_retry(num: int) -> bool:
+        return run_phase_with_retry(
+            num,
+            file_path,
+            file_id,
+            pipeline_json,
+            state=state,
+            max_retries=args.max_retries,
+            voice_id=args.voice,
+            pipeline_mode=pipeline_mode,
+            policy_engine=policy_engine,
+        )
+
     for phase_idx, phase_num in enumerate(phases_to_run):
         phase_name = f"Phase {phase_num}"
 
@@ -4928,9 +6080,9 @@ Pipeline Mode: {pipeline_mode}
                 mark_phase_skipped(pipeline_json, phase_to_skip)
             break
 
-        # Check resume status
+        # Check resume status (streamed phases were checked up front)
         resume_status: Optional[str] = None
-        if resume_enabled:
+        if resume_enabled and phase_num not in stream_group:
             resume_status = check_phase_status(state, phase_num, file_id)
             if resume_status == "success":
                 print_status(f"[green]OK Skipping {phase_name} (already completed)[/green]")
@@ -4955,17 +6107,18 @@ Pipeline Mode: {pipeline_mode}
         )
         _policy_call(policy_engine, "record_phase_start", start_ctx)
 
-        success = run_phase_with_retry(
-            phase_num,
-            file_path,
-            file_id,
-            pipeline_json,
-            state=state,
-            max_retries=args.max_retries,
-            voice_id=args.voice,
-            pipeline_mode=pipeline_mode,
-            policy_engine=policy_engine,
-        )
+        if phase_num in stream_group:
+            if streamer is None:
+                streamer = StreamingPhases(
+                    stream_group,
+                    file_id,
+                    pipeline_json,
+                    run_with_retry,
+                    strict_chunk_integrity=orchestrator_config.strict_chunk_integrity,
+                ).start()
+            success = streamer.result(phase_num)
+        else:
+            success = run_with_retry(phase_num)
 
         if not success:
             failure_duration = _pop_phase_duration(policy_phase_timers, phase_label)
@@ -4983,6 +6136,8 @@ Pipeline Mode: {pipeline_mode}
             _policy_call(policy_engine, "record_failure", failure_ctx)
             _log_policy_advice(policy_engine, failure_ctx, phase_label, file_id)
             play_sound(success=False)
+            if streamer is not None:
+                streamer.close()
             print_panel(
                 f"Pipeline aborted at {phase_name}\n\n"
                 f"Check logs above for details.\n"
@@ -5013,6 +6168,9 @@ Pipeline Mode: {pipeline_mode}
             archive_final_audiobook(file_id, pipeline_json)
         completed_phases.append(phase_num)
 
+    if streamer is not None:
+        streamer.close()
+
     if RUN_SUMMARY["budget_exceeded"]:
         print_panel(
             "Global time budget exceeded, stopping execution.",
@@ -5626,6 +6784,7 @@ Pipeline Mode: {pipeline_mode}
 
     # Calculate duration
     duration = time.perf_counter() - overall_start
+    RUN_SUMMARY["preflight"] = preflight = get_preflight().summary()
 
     # Display summary (use -> instead of → for Windows compatibility)
     phases_display = " -> ".join(map(str, completed_phases))
@@ -5647,6 +6806,7 @@ TTS workers used: {RUN_SUMMARY.get("tts_workers_used") or 1}
 Chunk integrity:  {chunk_integrity_display}
 Backup subtitles: {"yes" if RUN_SUMMARY.get("backup_subtitles_used") else "no"}
 Time budget hit:  { "yes" if RUN_SUMMARY.get("budget_exceeded") else "no"}
+Preflight:        {preflight.get("wall_sec", 0.0):.2f}s startup, {len(preflight["results"])} checks, {preflight["cache_hits"]} cached
 
 Output Location:
 - Chunks: phase3-chunking/chunks/
@@ -5670,7 +6830,7 @@ Next Steps:
             metadata={"file_id": file_id, "phases": completed_phases},
         )
 
-    # Optional Phase P research hook (opt-in, non-blocking)
+    # Optional post-run meta phases P-AD (opt-in, non-blocking; gated on research)
     try:
         research_cfg = getattr(orchestrator_config, "research", None)
         research_enabled = False
@@ -5679,585 +6839,7 @@ Next Steps:
         else:
             research_enabled = bool(getattr(research_cfg, "enable", False))
         if research_enabled:
-            from phaseP_research.research_config import ResearchConfig
-            from phaseP_research.research_collector import ResearchCollector
-            from phaseP_research.research_analyzer import ResearchAnalyzer
-            from phaseP_research.research_reporter import ResearchReporter
-            from phaseP_research.init import initialize_research_state
-
-            cfg_kwargs = {
-                "enable_research": research_enabled,
-                "collect_phase_metrics": bool(getattr(research_cfg, "collect_phase_metrics", False))
-                if not isinstance(research_cfg, dict)
-                else bool(research_cfg.get("collect_phase_metrics")),
-                "collect_failure_patterns": bool(getattr(research_cfg, "collect_failure_patterns", False))
-                if not isinstance(research_cfg, dict)
-                else bool(research_cfg.get("collect_failure_patterns")),
-                "collect_engine_stats": bool(getattr(research_cfg, "collect_engine_stats", False))
-                if not isinstance(research_cfg, dict)
-                else bool(research_cfg.get("collect_engine_stats")),
-                "collect_chunk_stats": bool(getattr(research_cfg, "collect_chunk_stats", False))
-                if not isinstance(research_cfg, dict)
-                else bool(research_cfg.get("collect_chunk_stats")),
-                "collect_memory_signals": bool(getattr(research_cfg, "collect_memory_signals", False))
-                if not isinstance(research_cfg, dict)
-                else bool(research_cfg.get("collect_memory_signals")),
-                "collect_policy_signals": bool(getattr(research_cfg, "collect_policy_signals", False))
-                if not isinstance(research_cfg, dict)
-                else bool(research_cfg.get("collect_policy_signals")),
-            }
-            rcfg = ResearchConfig(**cfg_kwargs)
-            try:
-                state = PipelineState(pipeline_json, validate_on_read=False)
-                run_state = state.read(validate=False)
-            except Exception:
-                run_state = {}
-            try:
-                initialize_research_state(Path(".pipeline") / "research")
-            except Exception:
-                pass
-            # Observations per phase (read-only)
-            try:
-                from phaseP_research.observation_hooks import record_phase_observation
-
-                for phase_key, pdata in run_state.items():
-                    if not isinstance(pdata, dict) or not phase_key.startswith("phase"):
-                        continue
-                    observation_payload = {
-                        "input_size": pdata.get("input_size") or pdata.get("metrics", {}).get("files_processed") if isinstance(pdata.get("metrics"), dict) else None,
-                        "output_size": pdata.get("metrics", {}).get("files_processed") if isinstance(pdata.get("metrics"), dict) else None,
-                        "metadata": {
-                            "status": pdata.get("status"),
-                        },
-                    }
-                    record_phase_observation(phase_key, observation_payload, rcfg)
-            except Exception:
-                pass
-            raw = ResearchCollector(rcfg).collect(run_state)
-            analysis = ResearchAnalyzer().analyze(raw)
-            ResearchReporter().write_report(analysis)
-
-            research_signals = {"raw": raw, "analysis": analysis}
-            ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-
-            # Quality gate (informational only)
-            try:
-                enable_qg = False
-                if isinstance(research_cfg, dict):
-                    enable_qg = bool(research_cfg.get("enable_quality_gate"))
-                else:
-                    enable_qg = bool(getattr(research_cfg, "enable_quality_gate", False))
-                if enable_qg:
-                    from phaseP_research.quality_gate import (
-                        evaluate_quality_gate,
-                        write_quality_gate,
-                    )
-
-                    qg_result = evaluate_quality_gate(research_signals, run_state)
-                    write_quality_gate(qg_result)
-            except Exception:
-                pass
-
-            # Research feedback loop (append-only)
-            try:
-                enable_feedback = False
-                if isinstance(research_cfg, dict):
-                    enable_feedback = bool(research_cfg.get("enable_feedback_loop"))
-                else:
-                    enable_feedback = bool(getattr(research_cfg, "enable_feedback_loop", False))
-                if enable_feedback:
-                    from phaseP_research.feedback_loop import update_research_feedback
-
-                    update_research_feedback({}, research_signals)
-            except Exception:
-                pass
-
-            # Safety verification (informational)
-            try:
-                enable_safety = False
-                if isinstance(research_cfg, dict):
-                    enable_safety = bool(research_cfg.get("enable_safety_verification"))
-                else:
-                    enable_safety = bool(getattr(research_cfg, "enable_safety_verification", False))
-                if enable_safety:
-                    from phaseP_research.safety_verification import verify_research_outputs
-
-                    verify_research_outputs(research_signals)
-            except Exception:
-                pass
-
-            # Research lifecycle controller (opt-in)
-            try:
-                enable_lifecycle = False
-                if isinstance(research_cfg, dict):
-                    enable_lifecycle = bool(research_cfg.get("enable_lifecycle"))
-                else:
-                    enable_lifecycle = bool(getattr(research_cfg, "enable_lifecycle", False))
-                if enable_lifecycle:
-                    from phaseP_research.research_runner import ResearchRunner
-
-                    runner = ResearchRunner(research_cfg)
-                    runner.begin_run()
-                    evidence = runner.ingest_evidence(run_state, [])
-                    patterns = runner.extract_patterns(evidence)
-                    runner.write_report({"raw": raw, "analysis": analysis, "patterns": patterns})
-            except Exception:
-                pass
-            except Exception:
-                pass
-
-            # Phase Q self-evaluation (opt-in, informational)
-            try:
-                phaseq_cfg = getattr(orchestrator_config, "phaseQ_self_evaluation", None) or getattr(orchestrator_config, "phaseQ_self_eval", None)
-                phaseq_enabled = False
-                output_dir = ".pipeline/self_evaluation"
-                if isinstance(phaseq_cfg, dict):
-                    phaseq_enabled = bool(phaseq_cfg.get("enable"))
-                    output_dir = phaseq_cfg.get("output_dir", output_dir)
-                else:
-                    phaseq_enabled = bool(getattr(phaseq_cfg, "enable", False))
-                    output_dir = getattr(phaseq_cfg, "output_dir", output_dir)
-                if phaseq_enabled:
-                    try:
-                        from phaseQ_self_evaluation import metrics_engine, report_writer
-                        errors_log = Path(output_dir) / "errors.log"
-                        Path(output_dir).mkdir(parents=True, exist_ok=True)
-                        long_horizon_state = {}
-                        metrics = metrics_engine.compute_metrics(RUN_SUMMARY, long_horizon_state)
-                        run_id = policy_engine.run_id if policy_engine else datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-                        report_writer.write_report(run_id, metrics, output_dir)
-                    except Exception as exc:
-                        try:
-                            (Path(output_dir) / "errors.log").write_text(str(exc), encoding="utf-8")
-                        except Exception:
-                            pass
-            except Exception:
-                pass
-
-            # Phase Q Steps 5-7: meta-evaluator and reflection (opt-in)
-            try:
-                meta_cfg = getattr(orchestrator_config, "phaseQ_self_eval", None)
-                if isinstance(meta_cfg, dict):
-                    enable_meta = bool(meta_cfg.get("enable_meta_evaluator"))
-                    enable_reflect = bool(meta_cfg.get("enable_reflection_writer"))
-                    out_dir = meta_cfg.get("output_dir", ".pipeline/self_eval")
-                else:
-                    enable_meta = bool(getattr(meta_cfg, "enable_meta_evaluator", False))
-                    enable_reflect = bool(getattr(meta_cfg, "enable_reflection_writer", False))
-                    out_dir = getattr(meta_cfg, "output_dir", ".pipeline/self_eval")
-
-                meta_result = None
-                if enable_meta:
-                    try:
-                        from phaseQ_self_eval import q_meta_evaluator
-                        aggregated_signals = {
-                            "research": analysis,
-                            "forecasting": {},
-                            "stability": {},
-                            "rewards": {},
-                            "planner": {},
-                        }
-                        meta_result = q_meta_evaluator.evaluate_meta(aggregated_signals)
-                    except Exception:
-                        meta_result = None
-
-                if enable_reflect and meta_result is not None:
-                    try:
-                        from phaseQ_self_eval import reflection_writer
-                        reflection_writer.write_reflection(meta_result, Path(out_dir))
-                    except Exception:
-                        pass
-            except Exception:
-                pass
-
-            # Phase Q reporting (opt-in, read-only)
-            try:
-                autonomy_cfg = getattr(orchestrator_config, "autonomy", None)
-                self_eval_cfg = getattr(autonomy_cfg, "self_eval", None) if autonomy_cfg else None
-                if isinstance(self_eval_cfg, dict):
-                    self_eval_enabled = bool(self_eval_cfg.get("enable"))
-                else:
-                    self_eval_enabled = bool(getattr(self_eval_cfg, "enable", False))
-                if self_eval_enabled:
-                    from phaseQ_self_eval import cross_phase_fusion, rating_explainer, self_eval_kernel, self_eval_reporter
-
-                    run_id = None
-                    try:
-                        run_id = policy_engine.run_id if policy_engine else None
-                    except Exception:
-                        run_id = None
-                    run_id = run_id or file_id or datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-
-                    kernel_result = self_eval_kernel.evaluate_run({"metrics": RUN_SUMMARY})
-                    fusion_result = cross_phase_fusion.fuse_phase_outputs(RUN_SUMMARY)
-                    explanation = rating_explainer.explain_rating(kernel_result.get("dimensions", {}), kernel_result.get("overall_rating", 0.0))
-                    out_path = self_eval_reporter.write_self_eval_report(
-                        run_id,
-                        kernel_result,
-                        kernel_result.get("overall_rating"),
-                        fusion_result,
-                        explanation,
-                        output_dir=None,
-                    )
-                    logger.info("Phase Q self-eval: rating=%s", kernel_result.get("overall_rating"))
-                    logger.debug("Phase Q self-eval written to %s", out_path)
-            except Exception:
-                pass
-
-            # Phase R retrospective intelligence (opt-in, read-only)
-            try:
-                phase_r_cfg = getattr(orchestrator_config, "phaseR", None)
-                if isinstance(phase_r_cfg, dict):
-                    phase_r_enabled = bool(phase_r_cfg.get("enable"))
-                else:
-                    phase_r_enabled = bool(getattr(phase_r_cfg, "enable", False))
-                if phase_r_enabled:
-                    from phaseR_retro import init_state, research_runner
-
-                    init_state.ensure_research_state(Path(".pipeline"))
-                    run_id = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-                    research_runner.begin_run(run_id)
-                    evidence = research_runner.ingest_evidence(run_id)
-                    derived = research_runner.extract_patterns(run_id, evidence)
-                    research_runner.write_report(run_id, evidence, derived)
-            except Exception:
-                pass
-
-            # Phase S review (opt-in, read-only)
-            try:
-                phase_s_cfg = getattr(orchestrator_config, "phaseS", None)
-                if isinstance(phase_s_cfg, dict):
-                    phase_s_enabled = bool(phase_s_cfg.get("enable"))
-                else:
-                    phase_s_enabled = bool(getattr(phase_s_cfg, "enable", False))
-                if phase_s_enabled:
-                    from phaseS_review import review_kernel, review_aggregator, review_reporter
-
-                    ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-                    run_id = ts
-                    review = review_kernel.review_run(RUN_SUMMARY)
-                    aggregate = review_aggregator.aggregate_reviews([review])
-                    review_reporter.write_review_report(run_id, review, aggregate, base_dir=Path(".pipeline/review/reports"))
-            except Exception:
-                pass
-
-            # Phase T consistency (opt-in, read-only)
-            try:
-                consistency_cfg = getattr(orchestrator_config, "consistency", None)
-                if isinstance(consistency_cfg, dict):
-                    consistency_enabled = bool(consistency_cfg.get("enable"))
-                else:
-                    consistency_enabled = bool(getattr(consistency_cfg, "enable", False))
-                if consistency_enabled:
-                    from phaseT_consistency import consistency_checker, drift_monitor, health_reporter, schema_registry
-
-                    run_id = None
-                    try:
-                        run_id = policy_engine.run_id if policy_engine else None
-                    except Exception:
-                        run_id = None
-                    run_id = run_id or file_id or datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-                    consistency = consistency_checker.check_consistency(RUN_SUMMARY, schema_registry)
-                    drift = drift_monitor.detect_system_drift(Path(".pipeline"))
-                    health_reporter.write_consistency_report(run_id=run_id, consistency=consistency, drift=drift)
-            except Exception:
-                pass
-
-            # Phase T audit (opt-in, read-only)
-            try:
-                phase_t_cfg = getattr(orchestrator_config, "phaseT", None)
-                if isinstance(phase_t_cfg, dict):
-                    phase_t_enabled = bool(phase_t_cfg.get("enable"))
-                else:
-                    phase_t_enabled = bool(getattr(phase_t_cfg, "enable", False))
-                if phase_t_enabled:
-                    from phaseT_audit import audit_kernel, eval_synthesizer, risk_classifier, audit_reporter
-
-                    ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-                    run_id = None
-                    try:
-                        run_id = policy_engine.run_id if policy_engine else None
-                    except Exception:
-                        run_id = None
-                    run_id = run_id or file_id or ts
-                    kernel_out = audit_kernel.evaluate_run(RUN_SUMMARY, RUN_SUMMARY)
-                    synthesized = eval_synthesizer.synthesize_evaluation(kernel_out, RUN_SUMMARY)
-                    risk = risk_classifier.classify(synthesized)
-                    report = {
-                        "id": ts,
-                        "run_id": run_id,
-                        "kernel": kernel_out,
-                        "synthesized": synthesized,
-                        "risk": risk,
-                        "created_at": ts,
-                        "notes": "Phase T audit",
-                    }
-                    audit_reporter.write_audit_report(report)
-            except Exception:
-                pass
-
-            # Phase U safety-integrity (opt-in, read-only)
-            try:
-                phase_u_cfg = getattr(orchestrator_config, "phaseU", None)
-                if isinstance(phase_u_cfg, dict):
-                    phase_u_enabled = bool(phase_u_cfg.get("enable"))
-                else:
-                    phase_u_enabled = bool(getattr(phase_u_cfg, "enable", False))
-                if phase_u_enabled:
-                    from phaseU_integrity import consistency_unifier, integrity_kernel, integrity_reporter, signal_hub
-
-                    run_id = None
-                    try:
-                        run_id = policy_engine.run_id if policy_engine else None
-                    except Exception:
-                        run_id = None
-                    run_id = run_id or file_id or datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-                    signals = signal_hub.collect_signals(run_id, base_dir=".pipeline")
-                    integrity = integrity_kernel.evaluate_integrity(
-                        RUN_SUMMARY,
-                        signals["signals"].get("readiness"),
-                        signals["signals"].get("stability"),
-                        signals["signals"].get("drift"),
-                        signals["signals"].get("self_eval"),
-                        signals["signals"].get("retrospection"),
-                        signals["signals"].get("review"),
-                        signals["signals"].get("audit"),
-                    )
-                    unified = consistency_unifier.unify(signals, integrity)
-                    integrity_reporter.write_integrity_report(unified, base_dir=".pipeline/safety_integrity/reports/")
-            except Exception:
-                pass
-
-            # Phase V migrations (opt-in, non-destructive)
-            try:
-                phase_v_cfg = getattr(orchestrator_config, "phaseV", None)
-                if isinstance(phase_v_cfg, dict):
-                    phase_v_enabled = bool(phase_v_cfg.get("enable"))
-                    dry_run = bool(phase_v_cfg.get("dry_run", True))
-                else:
-                    phase_v_enabled = bool(getattr(phase_v_cfg, "enable", False))
-                    dry_run = bool(getattr(phase_v_cfg, "dry_run", True))
-                if phase_v_enabled:
-                    from phaseV_migrations import migration_reporter, migration_runner
-
-                    plan = migration_runner.plan_migrations(phase_v_cfg, base_dir=Path(".pipeline"))
-                    migration_reporter.write_plan_report(plan, base_dir=Path(".pipeline/migrations"))
-                    if not dry_run:
-                        result = migration_runner.apply_migrations(phase_v_cfg, base_dir=Path(".pipeline"))
-                        migration_reporter.write_apply_report(result, base_dir=Path(".pipeline/migrations"))
-            except Exception:
-                pass
-
-            # Phase W global consistency (opt-in, read-only)
-            try:
-                phase_w_cfg = getattr(orchestrator_config, "phaseW", None)
-                if isinstance(phase_w_cfg, dict):
-                    phase_w_enabled = bool(phase_w_cfg.get("enable"))
-                else:
-                    phase_w_enabled = bool(getattr(phase_w_cfg, "enable", False))
-                if phase_w_enabled:
-                    from phaseW_global import cross_phase_consistency, global_analyzer, schema_linter, w_reporter
-
-                    # Collect schemas best-effort from run summary; degrade gracefully.
-                    phase_schemas = {
-                        "phase1": RUN_SUMMARY.get("phase1") if isinstance(RUN_SUMMARY, dict) else None,
-                        "phase2": RUN_SUMMARY.get("phase2") if isinstance(RUN_SUMMARY, dict) else None,
-                        "phase3": RUN_SUMMARY.get("phase3") if isinstance(RUN_SUMMARY, dict) else None,
-                        "phase4": RUN_SUMMARY.get("phase4") if isinstance(RUN_SUMMARY, dict) else None,
-                        "phase5": RUN_SUMMARY.get("phase5") if isinstance(RUN_SUMMARY, dict) else None,
-                        "phase6": RUN_SUMMARY.get("phase6") if isinstance(RUN_SUMMARY, dict) else None,
-                    }
-                    lint = schema_linter.lint_schemas(phase_schemas)
-                    consistency = cross_phase_consistency.analyze_consistency(phase_schemas)
-                    global_info = global_analyzer.global_analysis(lint, consistency)
-                    report_payload = {
-                        "lint": lint,
-                        "consistency": consistency,
-                        "global_analysis": global_info,
-                        "notes": "Phase W global consistency layer",
-                    }
-                    w_reporter.write_phaseW_report(report_payload, base_dir=Path(".pipeline/phaseW/reports"))
-            except Exception:
-                pass
-
-            # Phase X meta-evaluator (opt-in, read-only)
-            try:
-                phase_x_cfg = getattr(orchestrator_config, "phaseX", None)
-                if isinstance(phase_x_cfg, dict):
-                    phase_x_enabled = bool(phase_x_cfg.get("enable"))
-                    max_depth = int(phase_x_cfg.get("max_depth", 3))
-                else:
-                    phase_x_enabled = bool(getattr(phase_x_cfg, "enable", False))
-                    max_depth = int(getattr(phase_x_cfg, "max_depth", 3))
-                if phase_x_enabled:
-                    from phaseX_meta import meta_kernel, meta_fusion, meta_ranking, meta_reporter
-
-                    # Load best-effort signals from prior phases (if present in RUN_SUMMARY or elsewhere)
-                    inputs = {
-                        "self_eval": RUN_SUMMARY.get("phaseQ") if isinstance(RUN_SUMMARY, dict) else {},
-                        "retro": RUN_SUMMARY.get("phaseR") if isinstance(RUN_SUMMARY, dict) else {},
-                        "review": RUN_SUMMARY.get("phaseS") if isinstance(RUN_SUMMARY, dict) else {},
-                    }
-                    kernel_out = meta_kernel.evaluate_signal_layers(inputs)
-                    fusion_out = meta_fusion.fuse_meta_context(kernel_out)
-                    ranking_out = meta_ranking.rank_meta_findings(kernel_out, fusion_out, max_depth=max_depth)
-                    report = {
-                        "id": datetime.utcnow().strftime("%Y%m%d_%H%M%S"),
-                        "timestamp": datetime.utcnow().strftime("%Y%m%d_%H%M%S"),
-                        "kernel": kernel_out,
-                        "fusion": fusion_out,
-                        "ranking": ranking_out,
-                        "summary": "Phase X meta-evaluator report",
-                    }
-                    meta_reporter.write_meta_report(report, base_dir=Path(".pipeline/meta/reports"))
-            except Exception:
-                pass
-
-            # Phase Y self-healing (opt-in, read-only; no auto-actions)
-            try:
-                phase_y_cfg = getattr(orchestrator_config, "phaseY", None)
-                if isinstance(phase_y_cfg, dict):
-                    phase_y_enabled = bool(phase_y_cfg.get("enable"))
-                else:
-                    phase_y_enabled = bool(getattr(phase_y_cfg, "enable", False))
-                if phase_y_enabled:
-                    try:
-                        from phaseY_self_opt import y_kernel, y_suggester, y_reporter  # type: ignore
-                        # If optional module exists, use it.
-                        fused = y_kernel.evaluate_run(RUN_SUMMARY if isinstance(RUN_SUMMARY, dict) else {})
-                        suggestions = y_suggester.generate_suggestions(fused)
-                        ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-                        report_payload = {
-                            "id": ts,
-                            "timestamp": ts,
-                            "run_id": RUN_SUMMARY.get("run_id", "") if isinstance(RUN_SUMMARY, dict) else "",
-                            "analysis": fused,
-                            "suggestions": suggestions,
-                        }
-                        y_reporter.write_phaseY_report(report_payload, base_dir=Path(".pipeline/phaseY/reports"))
-                    except Exception:
-                        # Fallback to existing self_heal implementations (informational only)
-                        from phaseY_self_heal import heal_kernel, heal_classifier, heal_suggester, heal_reporter
-
-                        kernel = heal_kernel.compute_heal_signals(RUN_SUMMARY if isinstance(RUN_SUMMARY, dict) else {})
-                        classification = heal_classifier.classify(kernel)
-                        suggestions = heal_suggester.suggest_corrections(
-                            RUN_SUMMARY if isinstance(RUN_SUMMARY, dict) else {}, classification
-                        )
-                        ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-                        report = {
-                            "id": ts,
-                            "timestamp": ts,
-                            "run_id": RUN_SUMMARY.get("run_id", "") if isinstance(RUN_SUMMARY, dict) else "",
-                            "kernel": kernel,
-                            "classification": classification,
-                            "suggestions": suggestions,
-                            "overall_severity": kernel.get("signals", {}).get("severity", "low") if isinstance(kernel, dict) else "low",
-                            "notes": "Phase Y self-heal report (informational only; no automatic actions).",
-                        }
-                        heal_reporter.write_heal_report(report, base_dir=Path(".pipeline/phaseY/reports"))
-            except Exception:
-                pass
-
-            # Phase Z meta diagnostics (opt-in, read-only)
-            try:
-                phase_z_cfg = getattr(orchestrator_config, "phaseZ", None)
-                if isinstance(phase_z_cfg, dict):
-                    phase_z_enabled = bool(phase_z_cfg.get("enable"))
-                else:
-                    phase_z_enabled = bool(getattr(phase_z_cfg, "enable", False))
-                if phase_z_enabled:
-                    from phaseZ_meta import dependency_scanner, invariant_checker, meta_kernel, meta_reporter, phase_health_summarizer
-
-                    kernel = meta_kernel.analyze_full_pipeline()
-                    inv = invariant_checker.check_invariants(kernel)
-                    deps = dependency_scanner.scan_dependencies()
-                    health = phase_health_summarizer.summarize_health()
-                    meta_reporter.write_meta_report(kernel, inv, deps, health, base_dir=Path(".pipeline/meta/reports"))
-            except Exception:
-                pass
-
-            # Phase AC policy compiler (opt-in, read-only)
-            try:
-                phase_ac_cfg = getattr(orchestrator_config, "phaseAC", None)
-                if isinstance(phase_ac_cfg, dict):
-                    phase_ac_enabled = bool(phase_ac_cfg.get("enable"))
-                else:
-                    phase_ac_enabled = bool(getattr(phase_ac_cfg, "enable", False))
-                if phase_ac_enabled:
-                    from phaseAC_policy_compiler import compiler, merger, conflict_resolver, profile_writer
-
-                    base_profile = compiler.compile_policy_profile(orchestrator_config, base_dir=Path(".pipeline"))
-                    merged = merger.merge_policies([base_profile])
-                    resolved = conflict_resolver.resolve_conflicts(merged)
-                    profile_writer.write_policy_profile(resolved, base_dir=Path(".pipeline/policy_profiles"))
-            except Exception:
-                pass
-
-            # Phase AD capability catalog (opt-in, read-only)
-            try:
-                phase_ad_cfg = getattr(orchestrator_config, "phaseAD", None)
-                if isinstance(phase_ad_cfg, dict):
-                    phase_ad_enabled = bool(phase_ad_cfg.get("enable"))
-                else:
-                    phase_ad_enabled = bool(getattr(phase_ad_cfg, "enable", False))
-                if phase_ad_enabled:
-                    from phaseAD_catalog import capability_scanner, catalog_builder, catalog_reporter
-
-                    scanned = capability_scanner.scan_capabilities()
-                    catalog = catalog_builder.build_catalog(scanned)
-                    catalog_reporter.write_catalog(catalog, base_dir=Path(".pipeline/capability_catalog"))
-            except Exception:
-                pass
-
-            # Phase AB Adaptive Brain (opt-in, read-only, no auto-apply)
-            try:
-                phase_ab_cfg = getattr(orchestrator_config, "phaseAB", None)
-                if isinstance(phase_ab_cfg, dict):
-                    phase_ab_enabled = bool(phase_ab_cfg.get("enable"))
-                else:
-                    phase_ab_enabled = bool(getattr(phase_ab_cfg, "enable", False))
-                if phase_ab_enabled:
-                    from uuid import uuid4
-                    from phaseAB_adaptive import ab_kernel, ab_fusion, ab_classifier, ab_recommender, ab_reporter
-
-                    raw_signals = ab_kernel.evaluate_all_sources(RUN_SUMMARY if isinstance(RUN_SUMMARY, dict) else {}, base_dir=".pipeline")
-                    fused = ab_fusion.fuse_signals(raw_signals)
-                    assessment = ab_classifier.classify_state(fused)
-                    actions = ab_recommender.recommend_actions(fused, assessment)
-                    report = {
-                        "id": str(uuid4()),
-                        "timestamp": datetime.utcnow().isoformat() + "Z",
-                        "signals": fused,
-                        "unified_assessment": assessment,
-                        "recommended_actions": actions,
-                        "safe_to_apply": False,
-                        "safety_envelope_version": "phaseAB_v1",
-                    }
-                    ab_reporter.write_ab_summary(report, base_dir=".pipeline/ab")
-            except Exception:
-                pass
-
-            # Capabilities switchboard (read-only coordination for safe phases)
-            try:
-                capabilities_cfg = getattr(orchestrator_config, "capabilities", None)
-                if isinstance(capabilities_cfg, dict):
-                    cap_enabled = bool(capabilities_cfg.get("enable_safe_modes"))
-                else:
-                    cap_enabled = False
-                if cap_enabled:
-                    # This block is informational only; the individual phases already gate themselves.
-                    capabilities_report = {
-                        "capabilities": capabilities_cfg if isinstance(capabilities_cfg, dict) else {},
-                        "notes": "Safe modes coordination (read-only).",
-                    }
-                    cap_dir = Path(".pipeline") / "capabilities" / "reports"
-                    cap_dir.mkdir(parents=True, exist_ok=True)
-                    ts = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-                    cap_path = cap_dir / f"capabilities_{ts}.json"
-                    cap_path.write_text(json.dumps(capabilities_report, indent=2), encoding="utf-8")
-            except Exception:
-                pass
+            run_post_run_meta_phases(orchestrator_config, pipeline_json, file_id, policy_engine)
 
             # Placeholder notices for phases A, B, C, AE, and AF (no implemented modules yet)
             try:
@@ -0,0 +1,335 @@
+"""
+Resource-aware admission control for Phase 7.
+
+``AdmissionController`` keeps one token budget of CPU cores and resident
+memory for the whole batch.  Every book stage reserves its declared cost
+before it launches, and waits (is deferred) while the budget is spent.
+
+The CPU/memory monitor feeds measured load back in through ``observe()``:
+
+- CPU above ``cpu_threshold`` or available RAM below ``memory_floor_gb``
+  holds all new admissions until the pressure clears.
+- With ``suspend_on_pressure``, memory pressure also suspends the
+  lowest-priority running stage (its whole process tree, via psutil, which
+  maps to SIGSTOP/SIGCONT on POSIX and thread suspension on Windows).  One
+  process is suspended per sample and at least one is always left running.
+  Suspended stages are resumed, highest priority first, once available RAM
+  is back above the floor with some margin.
+
+Every deferral, hold, suspension and resume is recorded in ``decisions`` and
+summarized into the batch summary.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Sequence
+
+import psutil
+import trio
+from pipeline_common.process_runner import OutputCapture, ProgressEvent
+
+from .models import BatchConfig
+
+logger = logging.getLogger(__name__)
+
+GB = 1024**3
+RAM_BUDGET_FRACTION = 0.75
+MEMORY_RESUME_MARGIN = 1.5  # resume once available RAM is this multiple of the floor
+MAX_RECORDED_DECISIONS = 200
+_EPSILON = 1e-9
+
+
+@dataclass(frozen=True)
+class ResourceBudget:
+    """CPU cores and RAM the whole batch may use at once."""
+
+    cpu: float
+    ram_gb: float
+
+    @classmethod
+    def from_config(cls, config: BatchConfig) -> "ResourceBudget":
+        cpu = config.cpu_budget or max(1, (os.cpu_count() or 2) - 1)
+        ram_gb = config.ram_budget_gb
+        if ram_gb is None:
+            ram_gb = psutil.virtual_memory().total / GB * RAM_BUDGET_FRACTION
+        return cls(cpu=float(cpu), ram_gb=float(ram_gb))
+
+
+@dataclass
+class TrackedProcess:
+    pid: int
+    label: str
+    priority: int
+    started: float
+    suspended: bool = False
+
+
+def _process_tree(pid: int) -> List[psutil.Process]:
+    try:
+        root = psutil.Process(pid)
+        return [root, *root.children(recursive=True)]
+    except psutil.Error:
+        return []
+
+
+def _signal_tree(pid: int, suspend: bool) -> bool:
+    tree = _process_tree(pid)
+    for proc in tree:
+        try:
+            if suspend:
+                proc.suspend()
+            else:
+                proc.resume()
+        except psutil.Error:
+            continue
+    return bool(tree)
+
+
+async def drain_into(stream: Any, name: str, capture: OutputCapture) -> None:
+    """Feed a trio receive stream into ``capture`` line by line until EOF."""
+    async with stream:
+        while True:
+            data = await stream.receive_some()
+            if not data:
+                break
+            capture.feed(name, data)
+    capture.finish(name)
+
+
+class AdmissionController:
+    """Admits stage work while its declared cost fits the shared budget.
+
+    ``resident`` reservations (a warm engine's model memory) count against
+    the budget but do not keep the controller busy: when no active work is
+    admitted, the next request runs even if it overshoots or the machine is
+    under pressure, so the batch always makes progress.  Nothing is admitted
+    past a waiting request of higher priority.
+    """
+
+    def __init__(
+        self,
+        budget: ResourceBudget,
+        cpu_threshold: Optional[float] = None,
+        memory_floor_gb: Optional[float] = None,
+        suspend_on_pressure: bool = False,
+    ) -> None:
+        self.budget = budget
+        self.cpu_threshold = cpu_threshold
+        self.memory_floor_gb = memory_floor_gb
+        self.suspend_on_pressure = suspend_on_pressure
+        self.cpu_used = 0.0
+        self.ram_used = 0.0
+        self.active = 0
+        self.peak_cpu = 0.0
+        self.peak_ram = 0.0
+        self.cpu_hot = False
+        self.memory_low = False
+        self.decisions: List[Dict[str, Any]] = []
+        self._running: Dict[int, TrackedProcess] = {}
+        self._waiting: Dict[int, int] = {}
+        self._changed = trio.Event()
+        self._epoch = time.monotonic()
+
+    @classmethod
+    def from_config(cls, config: BatchConfig) -> "AdmissionController":
+        return cls(
+            ResourceBudget.from_config(config),
+            cpu_threshold=config.cpu_threshold,
+            memory_floor_gb=config.memory_floor_gb,
+            suspend_on_pressure=config.suspend_on_pressure,
+        )
+
+    @property
+    def held(self) -> bool:
+        return self.cpu_hot or self.memory_low
+
+    def _record(self, action: str, **details: Any) -> None:
+        entry = {"t": round(time.monotonic() - self._epoch, 3), "action": action, **details}
+        self.decisions.append(entry)
+        log = logger.debug if action == "deferred" else logger.info
+        log("[ADMIT] %s %s", action, details)
+
+    def _notify(self) -> None:
+        self._changed.set()
+        self._changed = trio.Event()
+
+    def _blocker(self, cpu: float, ram_gb: float, priority: int) -> Optional[str]:
+        """Why a request cannot be admitted right now, or None if it can."""
+        if any(n and p > priority for p, n in self._waiting.items()):
+            return "priority"
+        if self.active == 0:
+            return None
+        if self.cpu_hot:
+            return "cpu_pressure"
+        if self.memory_low:
+            return "memory_pressure"
+        if self.cpu_used + cpu > self.budget.cpu + _EPSILON:
+            return "cpu_budget"
+        if self.ram_used + ram_gb > self.budget.ram_gb + _EPSILON:
+            return "ram_budget"
+        return None
+
+    @asynccontextmanager
+    async def reserve(
+        self,
+        cpu: float,
+        ram_gb: float,
+        priority: int = 0,
+        resident: bool = False,
+        label: str = "",
+    ) -> AsyncIterator[None]:
+        self._waiting[priority] = self._waiting.get(priority, 0) + 1
+        waited_from: Optional[float] = None
+        reason: Optional[str] = None
+        try:
+            while True:
+                blocker = self._blocker(cpu, ram_gb, priority)
+                if blocker is None:
+                    break
+                if waited_from is None:
+                    waited_from, reason = time.monotonic(), blocker
+                await self._changed.wait()
+        finally:
+            self._waiting[priority] -= 1
+            self._notify()
+        if waited_from is not None:
+            self._record(
+                "deferred",
+                label=label,
+                reason=reason,
+                waited_sec=round(time.monotonic() - waited_from, 3),
+            )
+        self.cpu_used += cpu
+        self.ram_used += ram_gb
+        self.active += 0 if resident else 1
+        self.peak_cpu = max(self.peak_cpu, self.cpu_used)
+        self.peak_ram = max(self.peak_ram, self.ram_used)
+        try:
+            yield
+        finally:
+            self.cpu_used -= cpu
+            self.ram_used -= ram_gb
+            self.active -= 0 if resident else 1
+            self._notify()
+
+    async def run_process(
+        self,
+        command: Sequence[str],
+        label: str = "",
+        priority: int = 0,
+        log_path: Optional[Path] = None,
+        on_event: Optional[Callable[[ProgressEvent], None]] = None,
+        **options: Any,
+    ) -> subprocess.CompletedProcess:
+        """Like ``trio.run_process`` with captured output, but suspendable.
+
+        Output streams into the rotating ``log_path``; only the last lines
+        of each stream are kept and returned as ``stdout``/``stderr``.
+        """
+        capture = OutputCapture(log_path, on_event=on_event)
+        process = await trio.lowlevel.open_process(
+            list(command),
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            **options,
+        )
+        self._running[process.pid] = TrackedProcess(
+            process.pid, label, priority, time.monotonic()
+        )
+        try:
+            async with trio.open_nursery() as nursery:
+                nursery.start_soon(drain_into, process.stdout, "stdout", capture)
+                nursery.start_soon(drain_into, process.stderr, "stderr", capture)
+                await process.wait()
+        finally:
+            capture.close()
+            tracked = self._running.pop(process.pid, None)
+            if process.returncode is None:
+                if tracked is not None and tracked.suspended:
+                    _signal_tree(process.pid, suspend=False)
+                process.kill()
+                with trio.CancelScope(shield=True):
+                    await process.wait()
+            self._notify()
+        return subprocess.CompletedProcess(
+            list(command),
+            process.returncode,
+            capture.stdout_tail.encode("utf-8"),
+            capture.stderr_tail.encode("utf-8"),
+        )
+
+    def observe(self, cpu_percent: float, available_gb: float) -> None:
+        """Feed one monitor sample: hold, release, suspend or resume."""
+        if self.cpu_threshold is not None:
+            hot = cpu_percent > self.cpu_threshold
+            if hot != self.cpu_hot:
+                self.cpu_hot = hot
+                self._record(
+                    "hold" if hot else "release",
+                    reason="cpu_pressure",
+                    cpu_percent=round(cpu_percent, 1),
+                )
+        if self.memory_floor_gb is not None:
+            if available_gb < self.memory_floor_gb:
+                if not self.memory_low:
+                    self.memory_low = True
+                    self._record(
+                        "hold", reason="memory_pressure", available_gb=round(available_gb, 2)
+                    )
+                if self.suspend_on_pressure:
+                    self._suspend_one(available_gb)
+            elif available_gb >= self.memory_floor_gb * MEMORY_RESUME_MARGIN:
+                if not self._resume_one(available_gb) and self.memory_low:
+                    self.memory_low = False
+                    self._record(
+                        "release", reason="memory_pressure", available_gb=round(available_gb, 2)
+                    )
+        if self._running and all(p.suspended for p in self._running.values()):
+            self._resume_one(available_gb)  # never leave the batch fully stopped
+        self._notify()
+
+    def _suspend_one(self, available_gb: float) -> None:
+        running = [p for p in self._running.values() if not p.suspended]
+        if len(running) < 2:
+            return
+        victim = min(running, key=lambda p: (p.priority, -p.started))
+        if _signal_tree(victim.pid, suspend=True):
+            victim.suspended = True
+            self._record(
+                "suspend",
+                label=victim.label,
+                pid=victim.pid,
+                available_gb=round(available_gb, 2),
+            )
+
+    def _resume_one(self, available_gb: float) -> bool:
+        suspended = [p for p in self._running.values() if p.suspended]
+        if not suspended:
+            return False
+        chosen = max(suspended, key=lambda p: (p.priority, -p.started))
+        _signal_tree(chosen.pid, suspend=False)
+        chosen.suspended = False
+        self._record(
+            "resume", label=chosen.label, pid=chosen.pid, available_gb=round(available_gb, 2)
+        )
+        return True
+
+    def summary(self) -> Dict[str, Any]:
+        counts = Counter(d["action"] for d in self.decisions)
+        deferred_sec = sum(d.get("waited_sec", 0.0) for d in self.decisions)
+        return {
+            "budget": {"cpu": self.budget.cpu, "ram_gb": round(self.budget.ram_gb, 2)},
+            "peak": {"cpu": self.peak_cpu, "ram_gb": round(self.peak_ram, 2)},
+            "counts": dict(counts),
+            "deferred_sec": round(deferred_sec, 3),
+            "decisions": self.decisions[-MAX_RECORDED_DECISIONS:],
+        }
@@ -38,6 +38,13 @@ def _non_negative_float(value: str) -> float:
     return fvalue
 
 
+def _positive_float(value: str) -> float:
+    fvalue = float(value)
+    if fvalue <= 0:
+        raise argparse.ArgumentTypeError("Value must be > 0")
+    return fvalue
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Phase 7 batch driver (Phase 6 orchestrator wrapper)",
@@ -102,6 +109,21 @@ def build_parser() -> argparse.ArgumentParser:
         type=_positive_int,
         help="Per-phase timeout (forwarded downstream)",
     )
+    parser.add_argument(
+        "--scheduler",
+        choices=["shared_engines", "per_book"],
+        help="shared_engines pools warm TTS workers; per_book runs Phase 6 per file",
+    )
+    parser.add_argument(
+        "--cpu-budget",
+        type=_positive_float,
+        help="Cores the whole batch may use (shared_engines)",
+    )
+    parser.add_argument(
+        "--ram-budget-gb",
+        type=_positive_float,
+        help="RAM in GB the whole batch may use (shared_engines)",
+    )
     parser.set_defaults(resume=None)
     return parser
 
@@ -134,6 +156,13 @@ def apply_overrides(
         updates["phases"] = args.phases
     if args.phase_timeout is not None:
         updates["phase_timeout"] = args.phase_timeout
+    # Budget flags are newer than most callers' Namespaces
+    if getattr(args, "scheduler", None):
+        updates["scheduler"] = args.scheduler
+    if getattr(args, "cpu_budget", None) is not None:
+        updates["cpu_budget"] = args.cpu_budget
+    if getattr(args, "ram_budget_gb", None) is not None:
+        updates["ram_budget_gb"] = args.ram_budget_gb
 
     return config.model_copy(update=updates)
 
@@ -4,6 +4,7 @@ import logging
 import subprocess
 import sys
 import time
+from contextlib import nullcontext
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -12,11 +13,14 @@ import psutil
 import trio
 import yaml
 from pipeline_common import PipelineState
+from pipeline_common.state_shards import migrate_to_shards
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from .admission import GB, AdmissionController
 from .models import BatchConfig, BatchMetadata, BatchSummary, Phase6Result
+from .scheduler import run_shared_engine_batch
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -194,6 +198,7 @@ async def process_single_file(
     orchestrator: Path,
     semaphore: trio.Semaphore,
     existing_records: Dict[str, Any],
+    admission: Optional[AdmissionController] = None,
 ) -> BatchMetadata:
     file_id = file_path.stem
     if config.resume and file_id in existing_records:
@@ -223,16 +228,34 @@ async def process_single_file(
 
     logger.info("[START] %s", file_id)
 
+    # A whole book loads its own engine, so it reserves a model's worth of RAM
+    reservation = (
+        admission.reserve(
+            1, config.engine_ram_gb + config.stage_ram_gb, label=file_id
+        )
+        if admission is not None
+        else nullcontext()
+    )
     start_perf = time.perf_counter()
-    async with semaphore:
+    async with semaphore, reservation:
         try:
-            result = await trio.run_process(
-                cmd,
-                capture_stdout=True,
-                capture_stderr=True,
-                check=False,
-                stdin=subprocess.DEVNULL,
-            )
+            if admission is not None:
+                result = await admission.run_process(
+                    cmd,
+                    file_id,
+                    log_path=Path(config.log_file).resolve().parent
+                    / "books"
+                    / file_id
+                    / "phase6.log",
+                )
+            else:
+                result = await trio.run_process(
+                    cmd,
+                    capture_stdout=True,
+                    capture_stderr=True,
+                    check=False,
+                    stdin=subprocess.DEVNULL,
+                )
             duration = time.perf_counter() - start_perf
             stdout_text = (result.stdout or b"").decode(
                 "utf-8", errors="replace"
@@ -277,26 +300,24 @@ async def process_single_file(
 
 
 async def monitor_cpu_usage(
-    config: BatchConfig, cpu_readings: List[float], stop_event: trio.Event
+    config: BatchConfig,
+    cpu_readings: List[float],
+    stop_event: trio.Event,
+    admission: Optional[AdmissionController] = None,
 ) -> None:
-    throttling = False
+    """Sample load and feed it to admission control.
+
+    Throttling happens in the controller: new book stages are held while CPU
+    or memory is under pressure, and running ones may be suspended.
+    """
+    psutil.cpu_percent(interval=None)  # prime the non-blocking sampler
     while not stop_event.is_set():
-        await trio.sleep(1)
-        cpu = psutil.cpu_percent(interval=0.1)
+        held = admission is not None and admission.held
+        await trio.sleep(config.throttle_delay if held else 1)
+        cpu = psutil.cpu_percent(interval=None)
         cpu_readings.append(cpu)
-
-        if cpu > config.cpu_threshold:
-            if not throttling:
-                logger.warning(
-                    "[CPU] High load detected (%.1f%%). Throttling for %ss...",
-                    cpu,
-                    config.throttle_delay,
-                )
-                throttling = True
-            await trio.sleep(config.throttle_delay)
-        elif throttling:
-            logger.info("[CPU] Load normalized. Resuming full concurrency.")
-            throttling = False
+        if admission is not None:
+            admission.observe(cpu, psutil.virtual_memory().available / GB)
 
 
 def render_reports(
@@ -325,6 +346,14 @@ def render_reports(
     summary_table.add_row("Duration (s)", f"{summary.duration_sec:.2f}")
     if summary.avg_cpu_usage is not None:
         summary_table.add_row("Avg CPU (%)", f"{summary.avg_cpu_usage:.1f}")
+    if summary.admission:
+        counts = summary.admission.get("counts", {})
+        summary_table.add_row(
+            "Deferred / Suspended",
+            f"{counts.get('deferred', 0)} "
+            f"({summary.admission.get('deferred_sec', 0.0):.1f}s) / "
+            f"{counts.get('suspend', 0)}",
+        )
     color = status_colors.get(summary.status, "white")
     summary_table.add_row("Status", f"[{color}]{summary.status}[/{color}]")
 
@@ -397,6 +426,8 @@ def persist_batch_state(
         "artifacts": [str(artifact) for artifact in summary.artifacts],
         "files": files_payload,
     }
+    if summary.admission:
+        run_entry["admission"] = summary.admission
     with state.transaction(operation="batch_run") as txn:
         runs = txn.data.setdefault("batch_runs", [])
         existing_index = next(
@@ -421,6 +452,11 @@ async def run_batch(
 ) -> Tuple[BatchSummary, List[BatchMetadata]]:
     orchestrator = find_orchestrator()
     pipeline_path = Path(config.pipeline_json)
+    if config.state_sharding and not config.dry_run:
+        layout = migrate_to_shards(
+            pipeline_path, per_phase=config.state_shard_per_phase
+        )
+        logger.info("Pipeline state sharded under %s", layout.directory)
     pipeline = load_pipeline_state(pipeline_path)
     input_files = discover_input_files(config)
 
@@ -471,21 +507,45 @@ async def run_batch(
     cpu_readings: List[float] = []
     metadata_list: List[BatchMetadata] = []
     semaphore = trio.Semaphore(config.max_workers)
+    admission = AdmissionController.from_config(config)
     stop_event = trio.Event()
     started_at = utcnow()
 
     async with trio.open_nursery() as nursery:
-        nursery.start_soon(monitor_cpu_usage, config, cpu_readings, stop_event)
+        nursery.start_soon(
+            monitor_cpu_usage, config, cpu_readings, stop_event, admission
+        )
 
         async def run_and_record(file_path: Path) -> None:
             m = await process_single_file(
-                file_path, config, orchestrator, semaphore, existing_records
+                file_path,
+                config,
+                orchestrator,
+                semaphore,
+                existing_records,
+                admission,
             )
             metadata_list.append(m)
 
-        async with trio.open_nursery() as work_nursery:
+        if config.scheduler == "shared_engines":
+            pending: List[Path] = []
             for file_path in input_files:
-                work_nursery.start_soon(run_and_record, file_path)
+                existing = existing_records.get(file_path.stem)
+                if config.resume and existing and existing.get("status") == "success":
+                    logger.info("[SKIP] %s already completed in previous run", file_path.stem)
+                    metadata_list.append(metadata_from_existing(file_path, existing))
+                else:
+                    pending.append(file_path)
+            if pending:
+                metadata_list.extend(
+                    await run_shared_engine_batch(
+                        pending, config, orchestrator, admission
+                    )
+                )
+        else:
+            async with trio.open_nursery() as work_nursery:
+                for file_path in input_files:
+                    work_nursery.start_soon(run_and_record, file_path)
 
         stop_event.set()
 
@@ -497,6 +557,7 @@ async def run_batch(
         completed_at=completed_at,
         avg_cpu=avg_cpu,
     )
+    summary.admission = admission.summary()
     summary.artifacts.append(Path(config.log_file).as_posix())
 
     persist_batch_state(pipeline_path, summary, metadata_list)
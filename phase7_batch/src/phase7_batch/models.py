@@ -3,7 +3,7 @@ from __future__ import annotations
 import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Literal, Optional
 
 from pydantic import (
     AliasChoices,
@@ -47,6 +47,33 @@ class BatchConfig(BaseModel):
     batch_size: Optional[int] = Field(default=None, ge=1)
     phase_timeout: int = Field(default=600, ge=1)
     dry_run: bool = Field(default=False)
+    # "per_book" runs one orchestrator per book; "shared_engines" pipelines
+    # books through stage-level budgets and a pool of warm Phase 4 workers.
+    # shared_engines calls Phase 4 directly and so loses the orchestrator's
+    # Phase 4 handling:
+    # - no Conda runner: workers use engine_python, not the Phase 4 Conda env
+    # - no reuse check: Phase 4 runs for every book (resume skips finished chunks)
+    # - no record_phase4_metadata: no chunk hash/engine for later reuse checks
+    # - no secondary-engine fallback: chunks that fail on the primary engine fail the book
+    scheduler: Literal["shared_engines", "per_book"] = Field(default="per_book")
+    # Per-job limit for shared engine workers (None: the orchestrator's
+    # phase_timeouts.phase4).
+    phase4_timeout: Optional[int] = Field(default=None, ge=1)
+    cpu_budget: Optional[float] = Field(default=None, gt=0)
+    ram_budget_gb: Optional[float] = Field(default=None, gt=0)
+    engine_ram_gb: float = Field(default=4.0, gt=0)
+    stage_ram_gb: float = Field(default=1.0, ge=0)
+    tts_engine: Optional[str] = Field(default=None)
+    tts_device: str = Field(default="cpu")
+    engine_python: Optional[str] = Field(default=None)
+    # Admission control: hold new stages below this much free RAM and, if
+    # enabled, suspend the lowest-priority running stage until it recovers.
+    memory_floor_gb: Optional[float] = Field(default=2.0, ge=0)
+    suspend_on_pressure: bool = Field(default=False)
+    # Split pipeline.json into per-book shards before the batch so books
+    # only lock their own state (see pipeline_common.state_shards).
+    state_sharding: bool = Field(default=False)
+    state_shard_per_phase: bool = Field(default=False)
 
     @field_validator("pipeline_json", "input_dir", "log_file", mode="before")
     @classmethod
@@ -117,6 +144,7 @@ class BatchSummary(BaseModel):
     avg_cpu_usage: Optional[float] = None
     errors: List[str] = Field(default_factory=list)
     artifacts: List[str] = Field(default_factory=list)
+    admission: Dict[str, Any] = Field(default_factory=dict)
     started_at: str
     completed_at: str
 
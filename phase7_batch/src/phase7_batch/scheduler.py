@@ -0,0 +1,490 @@
+"""
+Shared-engine batch scheduler for Phase 7.
+
+The per-book runner launches a whole Phase 6 orchestrator for every book, so
+each book in flight loads its own XTTS/Kokoro models and starts its own
+Phase 4 thread pool.  This scheduler splits every book into three stages:
+
+1. early   - Phases 1-3 through the orchestrator, for every queued book at once
+2. synth   - Phase 4 for all books, fed to a small pool of long-lived engine
+             workers (``phase4_tts/engine_worker.py``) that keep models loaded
+3. finish  - Phase 5 through the orchestrator, per book, as soon as that
+             book's audio is done
+
+How much of each stage runs at once is decided by one CPU/RAM budget shared
+by all stages (``AdmissionController``) instead of a per-book worker count.  Later
+stages are admitted ahead of earlier ones so finished audio never queues
+behind books that have not been chunked yet.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import trio
+import yaml
+from pipeline_common.process_runner import OutputCapture, ProgressEvent
+
+from .admission import AdmissionController, ResourceBudget, drain_into
+from .models import BatchConfig, BatchMetadata, Phase6Result
+
+logger = logging.getLogger(__name__)
+
+EARLY, SYNTH, FINISH = "early", "synthesis", "finish"
+STAGE_PRIORITY = {EARLY: 0, SYNTH: 1, FINISH: 2}
+PHASE4_THREAD_CAP = 3  # main_multi_engine clamps chunk threads to this
+TAIL_LINES = 20
+WORKER_EXIT_GRACE_SEC = 10.0
+DEFAULT_PHASE4_TIMEOUT_SEC = 28800  # orchestrator PhaseTimeouts.phase4
+
+
+def _iso_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _tail(data: Optional[bytes]) -> str:
+    text = (data or b"").decode("utf-8", errors="replace")
+    return "\n".join(text.splitlines()[-TAIL_LINES:])
+
+
+@dataclass(frozen=True)
+class EnginePlan:
+    """Size of the warm engine pool derived from the budget."""
+
+    workers: int
+    threads: int  # Phase 4 chunk threads inside each worker
+
+
+def plan_engine_pool(
+    budget: ResourceBudget, config: BatchConfig, books: int
+) -> EnginePlan:
+    # Leave room for one early/finish stage next to the resident models.
+    by_ram = int((budget.ram_gb - config.stage_ram_gb) // config.engine_ram_gb)
+    workers = max(1, min(books, by_ram, int(budget.cpu)))
+    threads = max(1, min(PHASE4_THREAD_CAP, int(budget.cpu // workers)))
+    return EnginePlan(workers=workers, threads=threads)
+
+
+class EngineWorker:
+    """One ``engine_worker.py`` process: JSON jobs in, JSON replies out.
+
+    Phase 4's own output (stderr) streams through an ``OutputCapture`` into
+    the worker's rotating log; progress lines are handed to ``on_event``
+    together with the ``file_id`` of the job in flight.
+    """
+
+    def __init__(
+        self,
+        command: Sequence[str],
+        cwd: Path,
+        env: Dict[str, str],
+        log_path: Path,
+        nursery: trio.Nursery,
+        on_event: Optional[Callable[[str, ProgressEvent], None]] = None,
+    ) -> None:
+        self.command = list(command)
+        self.cwd = cwd
+        self.env = env
+        self.log_path = log_path
+        self.alive = False
+        self.jobs_served = 0
+        self.current_file_id: Optional[str] = None
+        self._nursery = nursery
+        self._on_event = on_event
+        self._process: Optional[trio.Process] = None
+        self._capture: Optional[OutputCapture] = None
+        self._buffer = b""
+        self._drained = trio.Event()
+
+    async def _drain_stderr(self) -> None:
+        try:
+            await drain_into(self._process.stderr, "stderr", self._capture)
+        finally:
+            self._drained.set()
+
+    def _dispatch(self, event: ProgressEvent) -> None:
+        if self._on_event is not None and self.current_file_id is not None:
+            self._on_event(self.current_file_id, event)
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process is not None else None
+
+    async def __aenter__(self) -> "EngineWorker":
+        self._capture = OutputCapture(self.log_path, on_event=self._dispatch)
+        self._process = await trio.lowlevel.open_process(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=str(self.cwd),
+            env=self.env,
+        )
+        self._nursery.start_soon(self._drain_stderr)
+        self.alive = True
+        logger.info("[ENGINE] worker pid %s started", self._process.pid)
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        process = self._process
+        self.alive = False
+        try:
+            if process is not None:
+                with trio.CancelScope(shield=True):
+                    try:
+                        await process.stdin.aclose()
+                    except trio.BrokenResourceError:
+                        pass
+                    with trio.move_on_after(WORKER_EXIT_GRACE_SEC):
+                        await process.wait()
+                    if process.returncode is None:
+                        process.kill()
+                        await process.wait()
+                    with trio.move_on_after(WORKER_EXIT_GRACE_SEC):
+                        await self._drained.wait()
+        finally:
+            self._capture.close()
+
+    def tail(self) -> str:
+        return self._capture.tail("stderr", TAIL_LINES) if self._capture else ""
+
+    def abort(self) -> None:
+        """Kill a worker whose job overran; ``__aexit__`` reaps it."""
+        self.alive = False
+        if self._process is not None and self._process.returncode is None:
+            self._process.kill()
+
+    async def _read_line(self) -> Optional[bytes]:
+        while b"\n" not in self._buffer:
+            chunk = await self._process.stdout.receive_some()
+            if not chunk:
+                return None
+            self._buffer += chunk
+        line, _, self._buffer = self._buffer.partition(b"\n")
+        return line
+
+    async def run(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        # Kept until the next job: stderr can trail the reply on stdout.
+        self.current_file_id = payload.get("file_id")
+        try:
+            await self._process.stdin.send_all((json.dumps(payload) + "\n").encode("utf-8"))
+            line = await self._read_line()
+        except (trio.BrokenResourceError, trio.ClosedResourceError):
+            line = None
+        if line is None:
+            self.alive = False
+            return {
+                "file_id": payload.get("file_id"),
+                "exit_code": None,
+                "error": f"Engine worker exited (see {self.log_path})",
+                "stderr_tail": self.tail(),
+            }
+        self.jobs_served += 1
+        reply = json.loads(line)
+        if reply.get("exit_code") != 0:
+            reply.setdefault("stderr_tail", self.tail())
+        return reply
+
+
+@dataclass
+class SynthJob:
+    payload: Dict[str, Any]
+    done: trio.Event = field(default_factory=trio.Event)
+    result: Dict[str, Any] = field(default_factory=dict)
+    worker_pid: Optional[int] = None
+
+
+@dataclass
+class StageResult:
+    stage: str
+    exit_code: Optional[int]
+    duration_sec: float
+    stdout_tail: str = ""
+    stderr_tail: str = ""
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.exit_code == 0
+
+
+def resolve_engine_python(config: BatchConfig, phase4_dir: Path) -> str:
+    """Interpreter for engine workers: explicit, the engine's venv, or ours."""
+    if config.engine_python:
+        return config.engine_python
+    if config.tts_engine:
+        env_dir = phase4_dir / ".engine_envs" / config.tts_engine
+        python = env_dir / ("Scripts/python.exe" if os.name == "nt" else "bin/python")
+        if python.exists():
+            return str(python)
+    return sys.executable
+
+
+def resolve_phase4_timeout(config: BatchConfig, orchestrator: Path) -> int:
+    """Per-job Phase 4 limit: explicit, else what the orchestrator would apply."""
+    if config.phase4_timeout:
+        return config.phase4_timeout
+    try:
+        with open(orchestrator.resolve().parent / "config.yaml", "r", encoding="utf-8") as fh:
+            data = yaml.safe_load(fh) or {}
+    except (OSError, yaml.YAMLError):
+        return DEFAULT_PHASE4_TIMEOUT_SEC
+    # Same precedence as OrchestratorConfig.get_phase_timeout
+    timeout = data.get("phase_timeout") or (data.get("phase_timeouts") or {}).get("phase4")
+    return int(timeout or DEFAULT_PHASE4_TIMEOUT_SEC)
+
+
+class SharedEngineScheduler:
+    """Runs a batch as early / synth / finish stages under one budget."""
+
+    def __init__(
+        self,
+        config: BatchConfig,
+        orchestrator: Path,
+        admission: Optional[AdmissionController] = None,
+        worker_command: Optional[Sequence[str]] = None,
+    ) -> None:
+        self.config = config
+        self.orchestrator = orchestrator
+        self.admission = admission or AdmissionController.from_config(config)
+        self.budget = self.admission.budget
+        self.phase4_dir = orchestrator.resolve().parent.parent / "phase4_tts"
+        self.worker_command = list(worker_command or self._default_worker_command())
+        self.phase4_timeout = resolve_phase4_timeout(config, orchestrator)
+        phases = config.phases or [1, 2, 3, 4, 5]
+        self.early_phases = [p for p in phases if p < 4]
+        self.synth = 4 in phases
+        self.finish_phases = [p for p in phases if p > 4]
+        self.plan = EnginePlan(workers=1, threads=1)
+        self.worker_pids: List[int] = []
+        self.log_dir = Path(config.log_file).resolve().parent
+        self.progress: Dict[str, Dict[str, Any]] = {}
+
+    def _record_progress(self, file_id: str, event: ProgressEvent) -> None:
+        progress = self.progress.setdefault(file_id, {})
+        progress[event.kind] = progress.get(event.kind, 0) + 1
+        if event.rtf is not None:
+            progress["last_rtf"] = event.rtf
+        logger.debug("[PROGRESS] %s %s %s", file_id, event.kind, event.chunk_id or "")
+
+    def _stage_log(self, file_id: str, stage: str) -> Path:
+        return self.log_dir / "books" / file_id / f"{stage}.log"
+
+    def _default_worker_command(self) -> List[str]:
+        return [
+            resolve_engine_python(self.config, self.phase4_dir),
+            str(self.phase4_dir / "engine_worker.py"),
+            f"--device={self.config.tts_device}",
+        ]
+
+    def _worker_env(self) -> Dict[str, str]:
+        env = os.environ.copy()
+        paths = [str(self.phase4_dir / "src"), str(self.phase4_dir.parent)]
+        if env.get("PYTHONPATH"):
+            paths.append(env["PYTHONPATH"])
+        env["PYTHONPATH"] = os.pathsep.join(paths)
+        env.setdefault("PYTHONUNBUFFERED", "1")
+        return env
+
+    async def run(self, files: Sequence[Path]) -> List[BatchMetadata]:
+        self.plan = plan_engine_pool(self.budget, self.config, len(files))
+        logger.info(
+            "[SCHED] %d book(s); budget %.1f CPU / %.1f GB; %d engine worker(s) x %d thread(s)",
+            len(files),
+            self.budget.cpu,
+            self.budget.ram_gb,
+            self.plan.workers,
+            self.plan.threads,
+        )
+        results: List[BatchMetadata] = []
+        send, receive = trio.open_memory_channel(0)
+        async with trio.open_nursery() as nursery:
+            if self.synth:
+                for index in range(self.plan.workers):
+                    nursery.start_soon(self._serve_engine, index, receive.clone())
+            await receive.aclose()
+            async with send:
+                for file_path in files:
+                    nursery.start_soon(self._run_book, file_path, send.clone(), results)
+        logger.info(
+            "[SCHED] peak reserved %.1f CPU / %.1f GB", self.admission.peak_cpu, self.admission.peak_ram
+        )
+        return results
+
+    async def _serve_engine(self, index: int, receive: trio.MemoryReceiveChannel) -> None:
+        log_path = self.log_dir / f"engine_worker_{index}.log"
+
+        async def next_job() -> Optional[SynthJob]:
+            try:
+                return await receive.receive()
+            except trio.EndOfChannel:
+                return None
+
+        async with receive:
+            job = await next_job()
+            while job is not None:
+                # Model memory stays reserved while the worker lives; CPU only
+                # while it is synthesizing.
+                async with self.admission.reserve(
+                    0,
+                    self.config.engine_ram_gb,
+                    STAGE_PRIORITY[SYNTH],
+                    resident=True,
+                    label=f"engine_worker_{index}",
+                ), trio.open_nursery() as nursery, EngineWorker(
+                    self.worker_command,
+                    self.phase4_dir,
+                    self._worker_env(),
+                    log_path,
+                    nursery,
+                    on_event=self._record_progress,
+                ) as worker:
+                    self.worker_pids.append(worker.pid)
+                    while job is not None and worker.alive:
+                        async with self.admission.reserve(
+                            self.plan.threads,
+                            0,
+                            STAGE_PRIORITY[SYNTH],
+                            label=f"{job.payload['file_id']}:{SYNTH}",
+                        ):
+                            job.worker_pid = worker.pid
+                            with trio.move_on_after(self.phase4_timeout) as scope:
+                                job.result = await worker.run(job.payload)
+                            if scope.cancelled_caught:
+                                worker.abort()
+                                job.result = {
+                                    "file_id": job.payload["file_id"],
+                                    "exit_code": None,
+                                    "error": f"Phase 4 timed out after {self.phase4_timeout}s",
+                                    "stderr_tail": worker.tail(),
+                                }
+                        job.done.set()
+                        job = await next_job()
+
+    def _orchestrator_command(self, file_path: Path, phases: Sequence[int]) -> List[str]:
+        cmd = [
+            sys.executable,
+            str(self.orchestrator),
+            str(file_path),
+            f"--pipeline-json={self.config.pipeline_json}",
+            "--phases",
+            *[str(p) for p in phases],
+        ]
+        if not self.config.resume:
+            cmd.append("--no-resume")
+        return cmd
+
+    async def _orchestrate(self, stage: str, file_path: Path, phases: Sequence[int]) -> StageResult:
+        label = f"{file_path.stem}:{stage}"
+        priority = STAGE_PRIORITY[stage]
+        async with self.admission.reserve(1, self.config.stage_ram_gb, priority, label=label):
+            start = time.perf_counter()
+            try:
+                result = await self.admission.run_process(
+                    self._orchestrator_command(file_path, phases),
+                    label,
+                    priority,
+                    log_path=self._stage_log(file_path.stem, stage),
+                    on_event=lambda event: self._record_progress(file_path.stem, event),
+                )
+            except Exception as exc:  # pragma: no cover - safety net
+                return StageResult(
+                    stage, None, time.perf_counter() - start, error=f"Subprocess error: {exc}"
+                )
+        return StageResult(
+            stage,
+            result.returncode,
+            time.perf_counter() - start,
+            stdout_tail=_tail(result.stdout),
+            stderr_tail=_tail(result.stderr),
+        )
+
+    async def _synthesize(self, file_id: str, send: trio.MemorySendChannel) -> StageResult:
+        job = SynthJob(
+            payload={
+                "file_id": file_id,
+                "json_path": str(Path(self.config.pipeline_json).resolve()),
+                "engine": self.config.tts_engine,
+                "workers": self.plan.threads,
+                "resume": self.config.resume,
+            }
+        )
+        start = time.perf_counter()
+        await send.send(job)
+        await job.done.wait()
+        reply = job.result
+        return StageResult(
+            SYNTH,
+            reply.get("exit_code"),
+            time.perf_counter() - start,
+            stderr_tail=reply.get("stderr_tail") or "",
+            error=reply.get("error"),
+        )
+
+    async def _run_book(
+        self, file_path: Path, send: trio.MemorySendChannel, results: List[BatchMetadata]
+    ) -> None:
+        file_id = file_path.stem
+        metadata = BatchMetadata(
+            file_id=file_id,
+            status="running",
+            started_at=_iso_now(),
+            source_path=file_path.as_posix(),
+        )
+        logger.info("[START] %s", file_id)
+        start = time.perf_counter()
+        stages: List[StageResult] = []
+
+        async with send:
+            if self.early_phases:
+                stages.append(await self._orchestrate(EARLY, file_path, self.early_phases))
+            if self.synth and all(s.ok for s in stages):
+                stages.append(await self._synthesize(file_id, send))
+        if self.finish_phases and all(s.ok for s in stages):
+            stages.append(await self._orchestrate(FINISH, file_path, self.finish_phases))
+
+        duration = time.perf_counter() - start
+        failed = next((s for s in stages if not s.ok), None)
+        last = failed or (stages[-1] if stages else None)
+        metadata.completed_at = _iso_now()
+        metadata.duration_sec = duration
+        metadata.phase6 = Phase6Result(
+            exit_code=last.exit_code if last else 0,
+            stdout_tail=last.stdout_tail if last else None,
+            stderr_tail=last.stderr_tail if last else None,
+            metrics={
+                "scheduler": "shared_engines",
+                "stages": {s.stage: round(s.duration_sec, 3) for s in stages},
+                "progress": self.progress.get(file_id, {}),
+            },
+        )
+        if failed is None:
+            metadata.status = "success"
+            logger.info("[SUCCESS] %s in %.2fs", file_id, duration)
+        else:
+            metadata.status = "failed"
+            metadata.error_message = failed.error or (
+                f"{failed.stage} stage exited with code {failed.exit_code}"
+            )
+            if failed.stderr_tail:
+                metadata.errors.append(failed.stderr_tail)
+            logger.error("[FAIL] %s: %s", file_id, metadata.error_message)
+        results.append(metadata)
+
+
+async def run_shared_engine_batch(
+    files: Sequence[Path],
+    config: BatchConfig,
+    orchestrator: Path,
+    admission: Optional[AdmissionController] = None,
+) -> List[BatchMetadata]:
+    return await SharedEngineScheduler(config, orchestrator, admission=admission).run(files)
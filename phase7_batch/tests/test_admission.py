@@ -0,0 +1,129 @@
+import sys
+
+import psutil
+import pytest
+import trio
+
+from phase7_batch.admission import AdmissionController, ResourceBudget
+
+BURN_MARKER = "phase7-admission-burner"
+BURNER = [
+    sys.executable,
+    "-c",
+    f"import time  # {BURN_MARKER}\nend = time.time() + 0.4\nwhile time.time() < end: pass",
+]
+SLEEPER = [sys.executable, "-c", "import time; time.sleep(30)"]
+
+
+def _live_burners():
+    count = 0
+    for child in psutil.Process().children(recursive=True):
+        try:
+            if BURN_MARKER in " ".join(child.cmdline()):
+                count += 1
+        except psutil.Error:
+            continue
+    return count
+
+
+def test_cpu_budget_caps_concurrent_cpu_burning_children():
+    admission = AdmissionController(ResourceBudget(cpu=2, ram_gb=100))
+    samples = []
+
+    async def book(index):
+        async with admission.reserve(1, 0.5, label=f"book{index}"):
+            result = await admission.run_process(BURNER, f"book{index}")
+            assert result.returncode == 0
+
+    async def sample(done):
+        while not done.is_set():
+            samples.append(_live_burners())
+            await trio.sleep(0.02)
+
+    async def main():
+        done = trio.Event()
+        async with trio.open_nursery() as outer:
+            outer.start_soon(sample, done)
+            async with trio.open_nursery() as nursery:
+                for index in range(6):
+                    nursery.start_soon(book, index)
+            done.set()
+
+    trio.run(main)
+    assert max(samples) == 2
+    summary = admission.summary()
+    assert summary["peak"] == {"cpu": 2, "ram_gb": 1.0}
+    assert summary["counts"]["deferred"] == 4
+    assert {d["reason"] for d in summary["decisions"]} == {"cpu_budget"}
+    assert summary["deferred_sec"] > 0.4
+
+
+def test_cpu_pressure_holds_new_admissions():
+    admission = AdmissionController(ResourceBudget(cpu=8, ram_gb=100), cpu_threshold=85)
+    admitted = []
+
+    async def main():
+        async with admission.reserve(1, 1, label="running"):
+            admission.observe(cpu_percent=97.0, available_gb=50)
+            async with trio.open_nursery() as nursery:
+
+                async def late():
+                    async with admission.reserve(1, 1, label="late"):
+                        admitted.append(trio.current_time())
+
+                nursery.start_soon(late)
+                await trio.sleep(0.1)
+                assert admitted == []
+                admission.observe(cpu_percent=40.0, available_gb=50)
+
+    trio.run(main)
+    assert len(admitted) == 1
+    actions = [(d["action"], d.get("reason")) for d in admission.decisions]
+    assert actions == [
+        ("hold", "cpu_pressure"),
+        ("release", "cpu_pressure"),
+        ("deferred", "cpu_pressure"),
+    ]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="status check is POSIX-only")
+def test_memory_pressure_suspends_lowest_priority_stage():
+    admission = AdmissionController(
+        ResourceBudget(cpu=8, ram_gb=100), memory_floor_gb=1.0, suspend_on_pressure=True
+    )
+
+    def status(label):
+        pid = next(p.pid for p in admission._running.values() if p.label == label)
+        return psutil.Process(pid).status()
+
+    async def main():
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(admission.run_process, SLEEPER, "b1:early", 0)
+            nursery.start_soon(admission.run_process, SLEEPER, "b2:finish", 2)
+            while len(admission._running) < 2:
+                await trio.sleep(0.01)
+
+            admission.observe(cpu_percent=10, available_gb=0.5)
+            admission.observe(cpu_percent=10, available_gb=0.5)  # keeps one running
+            await trio.sleep(0.1)
+            assert status("b1:early") == psutil.STATUS_STOPPED
+            assert status("b2:finish") != psutil.STATUS_STOPPED
+            assert admission.held
+
+            admission.observe(cpu_percent=10, available_gb=1.2)  # inside hysteresis
+            assert status("b1:early") == psutil.STATUS_STOPPED
+            admission.observe(cpu_percent=10, available_gb=4.0)
+            await trio.sleep(0.1)
+            assert status("b1:early") != psutil.STATUS_STOPPED
+            admission.observe(cpu_percent=10, available_gb=4.0)
+            assert not admission.held
+            nursery.cancel_scope.cancel()
+
+    trio.run(main)
+    assert admission._running == {}
+    assert [(d["action"], d.get("label")) for d in admission.decisions] == [
+        ("hold", None),
+        ("suspend", "b1:early"),
+        ("resume", "b1:early"),
+        ("release", None),
+    ]
@@ -0,0 +1,176 @@
+import json
+import sys
+import textwrap
+
+import pytest
+import trio
+
+from phase7_batch.admission import AdmissionController, ResourceBudget
+from phase7_batch.models import BatchConfig
+from phase7_batch.scheduler import (
+    EARLY,
+    FINISH,
+    SYNTH,
+    EnginePlan,
+    SharedEngineScheduler,
+    plan_engine_pool,
+)
+
+FAKE_ORCHESTRATOR = textwrap.dedent(
+    """
+    import json, os, sys, time
+    from pathlib import Path
+
+    book = Path(sys.argv[1]).stem
+    phases = sys.argv[sys.argv.index("--phases") + 1:]
+    start = time.time()
+    time.sleep(0.5 if book.startswith("late") else 0.05)
+    with open(os.environ["FAKE_EVENTS"], "a") as fh:
+        fh.write(json.dumps({"kind": "orchestrator", "book": book, "phases": phases,
+                             "start": start, "end": time.time()}) + "\\n")
+    sys.exit(3 if book.startswith("broken") else 0)
+    """
+)
+
+FAKE_ENGINE_WORKER = textwrap.dedent(
+    """
+    import json, os, sys, time
+
+    events = os.environ["FAKE_EVENTS"]
+    with open(events, "a") as fh:  # stands in for loading the TTS model
+        fh.write(json.dumps({"kind": "load", "pid": os.getpid()}) + "\\n")
+    for line in sys.stdin:
+        job = json.loads(line)
+        start = time.time()
+        time.sleep(30 if job["file_id"].startswith("hang") else 0.05)
+        print(f"Chunk {job['file_id']}_0001 via 'fake': wall 0.05s, audio 0.10s, RT x0.50",
+              file=sys.stderr, flush=True)
+        with open(events, "a") as fh:
+            fh.write(json.dumps({"kind": "synth", "pid": os.getpid(), "book": job["file_id"],
+                                 "threads": job["workers"], "start": start, "end": time.time()}) + "\\n")
+        print(json.dumps({"file_id": job["file_id"], "exit_code": 0, "error": None}), flush=True)
+    """
+)
+
+
+@pytest.fixture
+def harness(tmp_path, monkeypatch):
+    orchestrator = tmp_path / "phase6_orchestrator" / "orchestrator.py"
+    orchestrator.parent.mkdir()
+    (tmp_path / "phase4_tts").mkdir()  # engine workers run from here
+    orchestrator.write_text(FAKE_ORCHESTRATOR)
+    worker = tmp_path / "fake_engine_worker.py"
+    worker.write_text(FAKE_ENGINE_WORKER)
+    events = tmp_path / "events.jsonl"
+    monkeypatch.setenv("FAKE_EVENTS", str(events))
+
+    def run(books, budget, **overrides):
+        inputs = []
+        for name in books:
+            path = tmp_path / f"{name}.pdf"
+            path.write_text("book")
+            inputs.append(path)
+        config = BatchConfig(
+            pipeline_json=str(tmp_path / "pipeline.json"),
+            log_file=str(tmp_path / "batch.log"),
+            phases=[1, 2, 3, 4, 5],
+            engine_ram_gb=4.0,
+            stage_ram_gb=1.0,
+            **overrides,
+        )
+        scheduler = SharedEngineScheduler(
+            config,
+            orchestrator,
+            admission=AdmissionController(budget),
+            worker_command=[sys.executable, str(worker)],
+        )
+        results = trio.run(scheduler.run, inputs)
+        log = [json.loads(line) for line in events.read_text().splitlines()]
+        return scheduler, {m.file_id: m for m in results}, log
+
+    return run
+
+
+def test_plan_engine_pool_follows_budget():
+    config = BatchConfig(engine_ram_gb=4.0, stage_ram_gb=1.0)
+    assert plan_engine_pool(ResourceBudget(cpu=8, ram_gb=13), config, books=10) == EnginePlan(3, 2)
+    assert plan_engine_pool(ResourceBudget(cpu=8, ram_gb=64), config, books=2) == EnginePlan(2, 3)
+    # Too little RAM for even one model still gets one worker.
+    assert plan_engine_pool(ResourceBudget(cpu=2, ram_gb=3), config, books=5) == EnginePlan(1, 2)
+
+
+def test_pool_admits_within_budget_and_by_priority():
+    order = []
+
+    async def main():
+        pool = AdmissionController(ResourceBudget(cpu=2, ram_gb=100))
+
+        async def job(name, priority, delay):
+            await trio.sleep(delay)
+            async with pool.reserve(1, 1, priority):
+                order.append(name)
+                await trio.sleep(0.05)
+
+        async with trio.open_nursery() as nursery:
+            nursery.start_soon(job, "a", 0, 0)
+            nursery.start_soon(job, "b", 0, 0)
+            nursery.start_soon(job, "early", 0, 0.01)
+            nursery.start_soon(job, "finish", 2, 0.02)
+        assert pool.peak_cpu == 2
+        assert pool.cpu_used == 0 and pool.active == 0
+
+    trio.run(main)
+    # "early" queued first, but the finish-stage request overtakes it.
+    assert sorted(order[:2]) == ["a", "b"]
+    assert order[2:] == ["finish", "early"]
+
+
+def test_books_share_a_bounded_pool_of_warm_workers(harness, tmp_path):
+    books = ["b1", "b2", "b3", "b4", "b5"]
+    log_dir = tmp_path
+    scheduler, results, log = harness(books, ResourceBudget(cpu=4, ram_gb=9))
+
+    assert all(results[b].status == "success" for b in books)
+    loads = [e for e in log if e["kind"] == "load"]
+    synths = [e for e in log if e["kind"] == "synth"]
+    # RAM fits two models: five books reuse two model loads.
+    assert len(loads) == 2 == len(set(scheduler.worker_pids))
+    assert sorted(e["book"] for e in synths) == books
+    assert {e["pid"] for e in synths} <= {e["pid"] for e in loads}
+    assert {e["threads"] for e in synths} == {2}
+    assert scheduler.admission.peak_ram <= 9
+
+    for book in books:
+        runs = {tuple(e["phases"]): e for e in log if e.get("book") == book and e["kind"] == "orchestrator"}
+        synth = next(e for e in synths if e["book"] == book)
+        assert runs[("1", "2", "3")]["end"] <= synth["start"]
+        assert synth["end"] <= runs[("5",)]["start"]
+        assert set(results[book].phase6.metrics["stages"]) == {EARLY, SYNTH, FINISH}
+        assert results[book].phase6.metrics["progress"] == {"chunk_done": 1, "last_rtf": 0.5}
+
+    worker_logs = "".join(p.read_text() for p in log_dir.glob("engine_worker_*.log"))
+    assert worker_logs.count("via 'fake'") == len(books)
+
+
+def test_failed_early_stage_skips_synthesis(harness):
+    _, results, log = harness(["broken", "fine"], ResourceBudget(cpu=2, ram_gb=9))
+
+    assert results["broken"].status == "failed"
+    assert results["broken"].phase6.exit_code == 3
+    assert "early stage exited with code 3" in results["broken"].error_message
+    assert results["fine"].status == "success"
+    assert [e["book"] for e in log if e["kind"] == "synth"] == ["fine"]
+
+
+def test_phase4_job_timeout_kills_worker(harness):
+    # "late" finishes its early stage after "hang" holds the only worker
+    scheduler, results, log = harness(["hang", "late"], ResourceBudget(cpu=2, ram_gb=5), phase4_timeout=1)
+
+    assert scheduler.phase4_timeout == 1
+    assert results["hang"].status == "failed"
+    assert "Phase 4 timed out after 1s" in results["hang"].error_message
+    assert results["late"].status == "success"
+    # The overrunning worker was killed and replaced rather than reused.
+    hung_pid, late_pid = scheduler.worker_pids
+    assert hung_pid != late_pid
+    assert [e["pid"] for e in log if e["kind"] == "synth"] == [late_pid]
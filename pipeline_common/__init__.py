@@ -1,31 +1,77 @@
 """Shared utilities for the audiobook pipeline."""
 
-from .adapter import adapt_payload, upgrade_pipeline_file
-from .astromech_notify import play_alert_beep, play_success_beep
-from .state_manager import (
-    PipelineState,
-    StateError,
-    StateLockError,
-    StateReadError,
-    StateTransactionError,
-    StateValidationError,
-    StateWriteError,
-)
-from .policy_engine import PolicyEngine
-from .schema import (
-    CANONICAL_JSON_SCHEMA,
-    CANONICAL_SCHEMA_VERSION,
-    PHASE_KEYS,
-    VALID_PHASE_STATUSES,
-    canonicalize_state,
-    validate_pipeline_schema,
-)
-from .phase_utils import (
-    ensure_phase_block,
-    ensure_phase_file_entry,
-    ensure_phase_files,
-    ensure_phase_and_file,
-)
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+# Public name -> submodule.  Resolved on first access (PEP 562) so that
+# ``from pipeline_common import startup_profile`` or ``lazy_import`` does
+# not pay for pydantic models and the policy engine.
+_EXPORTS = {
+    "adapt_payload": "adapter",
+    "upgrade_pipeline_file": "adapter",
+    "play_alert_beep": "astromech_notify",
+    "play_success_beep": "astromech_notify",
+    "PipelineState": "state_manager",
+    "StateError": "state_manager",
+    "StateLockError": "state_manager",
+    "StateReadError": "state_manager",
+    "StateTransactionError": "state_manager",
+    "StateValidationError": "state_manager",
+    "StateWriteError": "state_manager",
+    "PolicyEngine": "policy_engine",
+    "CANONICAL_JSON_SCHEMA": "schema",
+    "CANONICAL_SCHEMA_VERSION": "schema",
+    "PHASE_KEYS": "schema",
+    "VALID_PHASE_STATUSES": "schema",
+    "canonicalize_state": "schema",
+    "validate_pipeline_schema": "schema",
+    "ensure_phase_block": "phase_utils",
+    "ensure_phase_file_entry": "phase_utils",
+    "ensure_phase_files": "phase_utils",
+    "ensure_phase_and_file": "phase_utils",
+}
+
+if TYPE_CHECKING:
+    from .adapter import adapt_payload, upgrade_pipeline_file
+    from .astromech_notify import play_alert_beep, play_success_beep
+    from .state_manager import (
+        PipelineState,
+        StateError,
+        StateLockError,
+        StateReadError,
+        StateTransactionError,
+        StateValidationError,
+        StateWriteError,
+    )
+    from .policy_engine import PolicyEngine
+    from .schema import (
+        CANONICAL_JSON_SCHEMA,
+        CANONICAL_SCHEMA_VERSION,
+        PHASE_KEYS,
+        VALID_PHASE_STATUSES,
+        canonicalize_state,
+        validate_pipeline_schema,
+    )
+    from .phase_utils import (
+        ensure_phase_block,
+        ensure_phase_file_entry,
+        ensure_phase_files,
+        ensure_phase_and_file,
+    )
+
+
+def __getattr__(name):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
+
 
 __version__ = "1.0.1"
 
@@ -0,0 +1,175 @@
+"""
+Append-only chunk journals for streaming Phases 3 → 4 → 5.
+
+Run sequentially, Phase 4 waits for Phase 3 to publish its whole chunk
+list and Phase 5 waits for every Phase 4 WAV.  In streaming mode
+(``PIPELINE_STREAMING=1``, set by the orchestrator's ``--stream``) each
+producer also appends one JSON line per finished chunk to a journal next
+to ``pipeline.json``::
+
+    .pipeline/stream/<file_id>/phase3.jsonl   chunk text files, in order
+    .pipeline/stream/<file_id>/phase4.jsonl   WAVs that passed tier-1 validation
+
+and the consumer polls it, so TTS starts on the first chunk and
+enhancement on the first WAV.  A final ``{"_seal": "complete" | "failed"}``
+line tells consumers the producer is done; only Phase 5's concat waits
+for it.  Every line is flushed and fsynced before the next chunk starts,
+and readers ignore a torn last line, so a crash loses at most the chunk
+in flight.  Records are keyed by ``chunk_id``; readers drop duplicates,
+which keeps resume per chunk.
+
+A producer that knows the whole book up front (Phase 3 chunks in memory
+before saving anything) writes a ``{"_plan": {...}}`` line first - chunk
+count, total characters, the voice it picked - so the consumer can make
+whole-book decisions (engine, budget, voice) without waiting for the
+seal.  Readers expose it as ``plan`` rather than as a record.  Stdlib only.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+STREAM_ENV = "PIPELINE_STREAMING"
+DISABLE_VALUES = {"", "0", "off", "false", "none", "disabled"}
+JOURNAL_DIR = Path(".pipeline") / "stream"
+SEAL_KEY = "_seal"
+PLAN_KEY = "_plan"
+POLL_INTERVAL = 0.5
+
+
+def streaming_enabled() -> bool:
+    """True when the orchestrator asked the phases to stream chunks."""
+    return os.environ.get(STREAM_ENV, "").strip().lower() not in DISABLE_VALUES
+
+
+def journal_path(pipeline_json: Union[Path, str], file_id: str, stage: str) -> Path:
+    """``<pipeline.json dir>/.pipeline/stream/<file_id>/<stage>.jsonl``."""
+    return Path(pipeline_json).resolve().parent / JOURNAL_DIR / file_id / f"{stage}.jsonl"
+
+
+class ChunkJournal:
+    """Writer side of one stage's journal; safe to share between threads."""
+
+    def __init__(self, path: Union[Path, str]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_stage(cls, pipeline_json: Union[Path, str], file_id: str, stage: str) -> "ChunkJournal":
+        return cls(journal_path(pipeline_json, file_id, stage))
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    def reset(self) -> None:
+        """Start an empty, unsealed journal (called before the producer runs)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            self.path.write_bytes(b"")
+
+    def remove(self) -> None:
+        with self._lock:
+            self.path.unlink(missing_ok=True)
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Durably append one record (one line, flushed and fsynced)."""
+        line = (json.dumps(record, default=str, ensure_ascii=False) + "\n").encode("utf-8")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+            try:
+                os.write(fd, line)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+    def write_plan(self, **plan: Any) -> None:
+        """Record whole-book facts for consumers; write it before the first chunk."""
+        self.append({PLAN_KEY: plan})
+
+    def seal(self, status: str = "complete", total: Optional[int] = None) -> None:
+        """Mark the producer finished; consumers stop waiting after this line."""
+        self.append({SEAL_KEY: status, "total": total})
+
+    def reader(self) -> "JournalReader":
+        return JournalReader(self.path)
+
+
+class JournalReader:
+    """
+    Incremental, non-blocking reader.
+
+    ``poll()`` returns the records appended since the last call, skipping
+    ``chunk_id`` values already seen.  ``sealed`` turns true once the seal
+    line has been read; ``status`` is then ``"complete"`` or ``"failed"``.
+    ``plan`` holds the producer's ``_plan`` line once it has been read.
+    """
+
+    def __init__(self, path: Union[Path, str]):
+        self.path = Path(path)
+        self.sealed = False
+        self.status: Optional[str] = None
+        self.total: Optional[int] = None
+        self.plan: Optional[Dict[str, Any]] = None
+        self._offset = 0
+        self._seen: set = set()
+
+    @property
+    def failed(self) -> bool:
+        return self.sealed and self.status != "complete"
+
+    def poll(self) -> List[Dict[str, Any]]:
+        if self.sealed:
+            return []
+        try:
+            with self.path.open("rb") as handle:
+                handle.seek(self._offset)
+                data = handle.read()
+        except FileNotFoundError:
+            return []
+        # Only whole lines; a torn tail is re-read on the next poll
+        end = data.rfind(b"\n") + 1
+        self._offset += end
+        records = []
+        for raw in data[:end].splitlines():
+            if not raw.strip():
+                continue
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                continue
+            if SEAL_KEY in record:
+                self.sealed = True
+                self.status = record[SEAL_KEY]
+                self.total = record.get("total")
+                break
+            if PLAN_KEY in record:
+                self.plan = dict(record[PLAN_KEY] or {})
+                continue
+            key = record.get("chunk_id")
+            if key is not None:
+                if key in self._seen:
+                    continue
+                self._seen.add(key)
+            records.append(record)
+        return records
+
+    def follow(self, interval: float = POLL_INTERVAL, timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """Yield records until the journal is sealed (or ``timeout`` seconds pass idle)."""
+        idle_since = time.monotonic()
+        while True:
+            records = self.poll()
+            for record in records:
+                yield record
+            if self.sealed:
+                return
+            if records:
+                idle_since = time.monotonic()
+            elif timeout is not None and time.monotonic() - idle_since > timeout:
+                raise TimeoutError(f"No progress on {self.path} for {timeout:.0f}s")
+            time.sleep(interval)
@@ -0,0 +1,330 @@
+"""
+Stat-keyed SHA-256 fingerprints shared by every phase.
+
+Input books and chunk sets used to be re-hashed on every launch: Phase 1
+validation, Phase 2/3 reuse checks and the orchestrator's Phase 4 reuse
+check (``compute_chunk_text_hash`` over every chunk file) each read the
+full bytes again.  Digests are now remembered per file, keyed by
+``(resolved path, size, mtime_ns, inode)``, so an unchanged file costs one
+``stat()``:
+
+- ``file_sha256``: digest of one file's bytes
+- ``bulk_sha256`` / ``directory_sha256``: digests of many files, the
+  uncached ones hashed on a thread pool (hashlib releases the GIL)
+- ``concat_sha256``: digest of several files' bytes concatenated in order
+  (the Phase 4 chunk-set hash), remembered under the members' stat keys
+
+Layout (one small JSON index)::
+
+    .pipeline/fingerprints/index.json
+    {
+      "version": 1,
+      "files": {"<resolved path>": [size, mtime_ns, inode, "<sha256>"]},
+      "sets": {"<stat signature>": "<sha256>"}
+    }
+
+``PIPELINE_FINGERPRINT_CACHE`` relocates the index;
+``PIPELINE_FINGERPRINT_CACHE=off`` keeps digests in memory only.
+
+A file modified less than ``RACY_SECONDS`` ago is hashed but not
+persisted: on filesystems with coarse timestamps a second write in the
+same tick would leave size and mtime unchanged.  Stdlib only; writes are
+atomic (temp file + ``os.replace``) and merge with entries other processes
+stored meanwhile, so a lost race only costs a re-hash.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENV = "PIPELINE_FINGERPRINT_CACHE"
+DISABLE_VALUES = {"0", "off", "false", "none", "disabled"}
+DEFAULT_ROOT = Path(__file__).resolve().parents[1] / ".pipeline" / "fingerprints"
+INDEX_VERSION = 1
+BLOCK_SIZE = 1 << 20
+RACY_SECONDS = 2.0
+MAX_FILES = 50_000  # oldest entries are dropped beyond this
+MAX_SETS = 2_000
+FLUSH_SECONDS = 1.0  # single-file lookups flush at most this often; the rest at exit
+
+StatKey = Tuple[str, int, int, int]
+
+_DEFAULT: Optional["FingerprintIndex"] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def stat_key(path: Path | str) -> StatKey:
+    """``(resolved path, size, mtime_ns, inode)`` of ``path``; raises OSError if missing."""
+    resolved = Path(path).resolve()
+    stat = resolved.stat()
+    return str(resolved), stat.st_size, stat.st_mtime_ns, stat.st_ino
+
+
+def _is_racy(key: StatKey) -> bool:
+    return time.time_ns() - key[2] < RACY_SECONDS * 1e9
+
+
+def _hash_file(path: str, block_size: int = BLOCK_SIZE) -> str:
+    sha = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for block in iter(lambda: handle.read(block_size), b""):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def default_workers() -> int:
+    """Thread-pool size for bulk hashing."""
+    return max(1, min((os.cpu_count() or 1) * 2, 16))
+
+
+class FingerprintIndex:
+    """Digest memo keyed by stat data, persisted to ``<root>/index.json``."""
+
+    def __init__(self, root: Optional[Path | str] = None, persist: bool = True):
+        base = Path(root) if root is not None else DEFAULT_ROOT
+        self.index_path = base / "index.json" if persist else None
+        self._files: Dict[str, List] = {}
+        self._sets: Dict[str, str] = {}
+        self._dirty_files: Dict[str, List] = {}
+        self._dirty_sets: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._flushed_at = 0.0
+        self._load()
+
+    @classmethod
+    def from_env(cls, root: Optional[Path | str] = None) -> "FingerprintIndex":
+        """
+        Index rooted at ``root``, else ``$PIPELINE_FINGERPRINT_CACHE``, else
+        ``.pipeline/fingerprints``; memory-only when the env var disables it.
+        """
+        env = os.environ.get(CACHE_ENV, "").strip()
+        if root is None and env.lower() in DISABLE_VALUES:
+            return cls(persist=False)
+        return cls(root if root is not None else (env or None))
+
+    # ------------------------------------------------------------------ io
+    def _read_index(self) -> Tuple[Dict[str, List], Dict[str, str]]:
+        if self.index_path is None:
+            return {}, {}
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                doc = json.load(f)
+        except FileNotFoundError:
+            return {}, {}
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.debug("Ignoring unreadable fingerprint index %s: %s", self.index_path, exc)
+            return {}, {}
+        if doc.get("version") != INDEX_VERSION:
+            return {}, {}
+        return dict(doc.get("files") or {}), dict(doc.get("sets") or {})
+
+    def _load(self) -> None:
+        self._files, self._sets = self._read_index()
+
+    def flush(self) -> None:
+        """Merge digests computed since the last flush into the on-disk index."""
+        if self.index_path is None:
+            return
+        with self._lock:
+            if not self._dirty_files and not self._dirty_sets:
+                return
+            files, sets = self._read_index()
+            for name, entry in self._dirty_files.items():
+                files.pop(name, None)  # re-insert so eviction drops the least recently hashed
+                files[name] = entry
+            sets.update(self._dirty_sets)
+            files = dict(list(files.items())[-MAX_FILES:])
+            sets = dict(list(sets.items())[-MAX_SETS:])
+            doc = {"version": INDEX_VERSION, "files": files, "sets": sets}
+            try:
+                self.index_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(prefix=".index.", suffix=".tmp", dir=self.index_path.parent)
+                try:
+                    with os.fdopen(fd, "w", encoding="utf-8") as f:
+                        json.dump(doc, f)
+                    os.replace(tmp, self.index_path)
+                except BaseException:
+                    Path(tmp).unlink(missing_ok=True)
+                    raise
+            except OSError as exc:
+                logger.debug("Could not persist fingerprint index %s: %s", self.index_path, exc)
+                return
+            for name, entry in files.items():  # pick up other processes' digests
+                self._files.setdefault(name, entry)
+            for signature, digest in sets.items():
+                self._sets.setdefault(signature, digest)
+            self._dirty_files.clear()
+            self._dirty_sets.clear()
+            self._flushed_at = time.monotonic()
+
+    # ------------------------------------------------------------------ memo
+    def cached(self, key: StatKey) -> Optional[str]:
+        """Digest remembered for ``key``, or None if the file changed or was never hashed."""
+        with self._lock:
+            entry = self._files.get(key[0])
+        if entry and tuple(entry[:3]) == key[1:]:
+            return entry[3]
+        return None
+
+    def _remember(self, key: StatKey, digest: str) -> None:
+        entry = [key[1], key[2], key[3], digest]
+        with self._lock:
+            self._files[key[0]] = entry
+            if not _is_racy(key):
+                self._dirty_files[key[0]] = entry
+
+    # ------------------------------------------------------------------ api
+    def sha256(self, path: Path | str) -> str:
+        """SHA-256 of the file bytes, read only when its stat data changed."""
+        key = stat_key(path)
+        digest = self.cached(key)
+        if digest is None:
+            digest = _hash_file(key[0])
+            self._remember(key, digest)
+            # Single lookups (e.g. one per audio chunk) would rewrite the index each time
+            if time.monotonic() - self._flushed_at >= FLUSH_SECONDS:
+                self.flush()
+        return digest
+
+    def bulk_sha256(self, paths: Iterable[Path | str], workers: Optional[int] = None) -> Dict[str, str]:
+        """
+        Digests of ``paths`` keyed by the path as given; missing or unreadable
+        files are left out.  Uncached files are hashed across ``workers`` threads.
+        """
+        digests: Dict[str, str] = {}
+        pending: List[Tuple[str, StatKey]] = []
+        for path in paths:
+            try:
+                key = stat_key(path)
+            except OSError:
+                continue
+            digest = self.cached(key)
+            if digest is None:
+                pending.append((str(path), key))
+            else:
+                digests[str(path)] = digest
+
+        if pending:
+            workers = workers or default_workers()
+            logger.debug("Hashing %d uncached files across %d threads", len(pending), workers)
+            with ThreadPoolExecutor(max_workers=min(workers, len(pending))) as pool:
+                futures = [(name, key, pool.submit(_hash_file, key[0])) for name, key in pending]
+                for name, key, future in futures:
+                    try:
+                        digest = future.result()
+                    except OSError as exc:
+                        logger.warning("Could not hash %s: %s", name, exc)
+                        continue
+                    self._remember(key, digest)
+                    digests[name] = digest
+            self.flush()
+        return digests
+
+    def directory_sha256(
+        self, directory: Path | str, pattern: str = "*", workers: Optional[int] = None
+    ) -> Dict[str, str]:
+        """``bulk_sha256`` over the files in ``directory`` matching ``pattern``, sorted by name."""
+        paths = sorted(path for path in Path(directory).glob(pattern) if path.is_file())
+        return self.bulk_sha256(paths, workers=workers)
+
+    def concat_sha256(self, paths: Sequence[Path | str], workers: Optional[int] = None) -> str:
+        """
+        SHA-256 of the bytes of ``paths`` concatenated in order, skipping
+        missing files.  Remembered under the members' stat keys, so an
+        unchanged set costs one ``stat()`` per file.
+        """
+        keys: List[StatKey] = []
+        for path in paths:
+            try:
+                keys.append(stat_key(path))
+            except OSError:
+                continue
+        signature = hashlib.sha256(json.dumps(keys).encode("utf-8")).hexdigest()
+        with self._lock:
+            cached = self._sets.get(signature)
+        if cached:
+            return cached
+
+        sha = hashlib.sha256()
+        complete = True
+        for key, payload in zip(keys, self._read_in_order(keys, workers or default_workers())):
+            if payload is None:
+                complete = False
+                continue
+            sha.update(payload)
+            self._remember(key, hashlib.sha256(payload).hexdigest())
+        digest = sha.hexdigest()
+        if complete:
+            with self._lock:
+                self._sets[signature] = digest
+                if not any(_is_racy(key) for key in keys):
+                    self._dirty_sets[signature] = digest
+        self.flush()
+        return digest
+
+    @staticmethod
+    def _read_in_order(keys: List[StatKey], workers: int) -> Iterator[Optional[bytes]]:
+        """File bytes in order, read ahead on a thread pool within a bounded window."""
+
+        def _read(path: str) -> Optional[bytes]:
+            try:
+                return Path(path).read_bytes()
+            except OSError as exc:  # best-effort, like the per-chunk hashing it replaces
+                logger.warning("Could not hash %s: %s", path, exc)
+                return None
+
+        if workers <= 1 or len(keys) < 2:
+            for key in keys:
+                yield _read(key[0])
+            return
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            window: Deque[Future] = deque()
+            for key in keys:
+                window.append(pool.submit(_read, key[0]))
+                if len(window) >= 4 * workers:
+                    yield window.popleft().result()
+            while window:
+                yield window.popleft().result()
+
+
+def default_index() -> FingerprintIndex:
+    """Process-wide index configured from ``$PIPELINE_FINGERPRINT_CACHE``."""
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            _DEFAULT = FingerprintIndex.from_env()
+            atexit.register(_DEFAULT.flush)
+        return _DEFAULT
+
+
+def file_sha256(path: Path | str) -> str:
+    """SHA-256 of the file bytes via the shared index."""
+    return default_index().sha256(path)
+
+
+def bulk_sha256(paths: Iterable[Path | str], workers: Optional[int] = None) -> Dict[str, str]:
+    """Digests of many files via the shared index (see ``FingerprintIndex.bulk_sha256``)."""
+    return default_index().bulk_sha256(paths, workers=workers)
+
+
+def directory_sha256(directory: Path | str, pattern: str = "*", workers: Optional[int] = None) -> Dict[str, str]:
+    """Digests of the files in a directory via the shared index."""
+    return default_index().directory_sha256(directory, pattern, workers=workers)
+
+
+def concat_sha256(paths: Sequence[Path | str], workers: Optional[int] = None) -> str:
+    """Digest of several files concatenated via the shared index."""
+    return default_index().concat_sha256(paths, workers=workers)
@@ -0,0 +1,256 @@
+"""
+Single-pass keyword counting for genre detection.
+
+``genre_classifier`` used to run one ``re.findall`` per keyword per genre
+over the whole lowercased book, and Phase 3 ``detect_genre`` ran another
+regex scan for every marker list.  ``KeywordScorer`` tokenizes the text
+once (``\\w+`` runs, lowercased), counts tokens into a ``Counter`` and
+answers every single-word keyword with a dictionary lookup.  Multi-word
+keywords ("when I was", "looking back") go through a token-level
+Aho–Corasick automaton, so every phrase is matched in the same pass.
+
+Counting a word token is equivalent to counting ``\\bword\\b`` matches
+case-insensitively; phrases match their words separated by any run of
+non-word characters.
+
+Large books are scored on ``sample_windows``: evenly spaced windows over
+the whole text rather than its first pages, so the cost is bounded
+without biasing towards front matter.
+
+Results are cached by text digest (``cached_result``), in memory and
+under ``.pipeline/genre_cache/<namespace>/<digest>.json``, so Phase 3 and
+the orchestrator's planner do not rescore a book they have seen.
+``PIPELINE_GENRE_CACHE`` relocates the cache; ``PIPELINE_GENRE_CACHE=off``
+keeps it in memory only.  Stdlib only; writes are atomic.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import Counter, OrderedDict, deque
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENV = "PIPELINE_GENRE_CACHE"
+DISABLE_VALUES = {"0", "off", "false", "none", "disabled"}
+DEFAULT_ROOT = Path(__file__).resolve().parents[1] / ".pipeline" / "genre_cache"
+MEMO_SIZE = 256
+SAMPLE_CHARS = 200_000  # texts longer than this are scored on windows
+SAMPLE_WINDOWS = 16
+
+TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased ``\\w+`` tokens of ``text``."""
+    return TOKEN_RE.findall(text.lower())
+
+
+class KeywordScorer:
+    """Counts hits for named keyword groups in one pass over the tokens."""
+
+    def __init__(self, groups: Mapping[str, Iterable[str]]):
+        self.groups: Dict[str, Tuple[str, ...]] = {}
+        self._words: Dict[str, str] = {}  # token -> keyword
+        self._phrases: Dict[Tuple[str, ...], str] = {}  # tokens -> keyword
+        for name, keywords in groups.items():
+            kept = []
+            for keyword in keywords:
+                tokens = tuple(tokenize(keyword))
+                if not tokens:
+                    continue
+                keyword = " ".join(tokens)
+                kept.append(keyword)
+                if len(tokens) == 1:
+                    self._words[tokens[0]] = keyword
+                else:
+                    self._phrases[tokens] = keyword
+            self.groups[name] = tuple(kept)
+        self._build_automaton()
+        self.signature = hashlib.sha256(
+            json.dumps(self.groups, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:16]
+
+    def _build_automaton(self) -> None:
+        # State 0 is the root; goto[state][token] -> state
+        self._goto: List[Dict[str, int]] = [{}]
+        self._out: List[List[str]] = [[]]
+        for tokens, keyword in self._phrases.items():
+            state = 0
+            for token in tokens:
+                nxt = self._goto[state].get(token)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[state][token] = nxt
+                    self._goto.append({})
+                    self._out.append([])
+                state = nxt
+            self._out[state].append(keyword)
+
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def _phrase_hits(self, tokens: List[str], counts: Counter) -> Counter:
+        hits: Counter = Counter()
+        # Skip the token walk when no phrase can possibly occur
+        if not any(all(token in counts for token in phrase) for phrase in self._phrases):
+            return hits
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for token in tokens:
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            if out[state]:
+                hits.update(out[state])
+        return hits
+
+    def term_counts(self, text: str) -> Counter:
+        """Hits per keyword (phrases joined by single spaces)."""
+        tokens = tokenize(text)
+        counts = Counter(tokens)
+        hits = Counter({keyword: counts[word] for word, keyword in self._words.items() if word in counts})
+        if self._phrases:
+            hits.update(self._phrase_hits(tokens, counts))
+        return hits
+
+    def score(self, text: str) -> Dict[str, int]:
+        """Total keyword hits per group."""
+        hits = self.term_counts(text)
+        return {name: sum(hits[keyword] for keyword in keywords) for name, keywords in self.groups.items()}
+
+
+def sample_windows(text: str, limit: int = SAMPLE_CHARS, windows: int = SAMPLE_WINDOWS) -> str:
+    """
+    ``text`` itself if it fits in ``limit`` characters, else ``windows``
+    evenly spaced slices covering ``limit`` characters in total.
+
+    Window edges are moved to whitespace so no token is cut in half.
+    """
+    if len(text) <= limit or windows <= 0:
+        return text
+    width = limit // windows
+    stride = (len(text) - width) / max(windows - 1, 1)
+    parts = []
+    for index in range(windows):
+        start = int(index * stride)
+        end = start + width
+        if start:
+            space = text.find(" ", start, end)
+            start = space + 1 if space != -1 else start
+        if end < len(text):
+            space = text.rfind(" ", start, end)
+            end = space if space > start else end
+        parts.append(text[start:end])
+    return "\n".join(parts)
+
+
+def text_digest(text: str, *extra: str) -> str:
+    """SHA-256 of ``text`` plus any ``extra`` key parts (metadata, scorer signature)."""
+    sha = hashlib.sha256(text.encode("utf-8", "surrogatepass"))
+    for part in extra:
+        sha.update(b"\0")
+        sha.update(part.encode("utf-8", "surrogatepass"))
+    return sha.hexdigest()
+
+
+class ResultCache:
+    """JSON results keyed by ``(namespace, digest)``: an LRU memo over per-digest files."""
+
+    def __init__(self, root: Optional[Path | str] = None, persist: bool = True):
+        self.root = (Path(root) if root is not None else DEFAULT_ROOT) if persist else None
+        self._memo: "OrderedDict[Tuple[str, str], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, root: Optional[Path | str] = None) -> "ResultCache":
+        """
+        Cache rooted at ``root``, else ``$PIPELINE_GENRE_CACHE``, else
+        ``.pipeline/genre_cache``; memory-only when the env var disables it.
+        """
+        env = os.environ.get(CACHE_ENV, "").strip()
+        if root is None and env.lower() in DISABLE_VALUES:
+            return cls(persist=False)
+        return cls(root if root is not None else (env or None))
+
+    def _path(self, namespace: str, digest: str) -> Optional[Path]:
+        return self.root / namespace / f"{digest}.json" if self.root is not None else None
+
+    def _memoise(self, key: Tuple[str, str], value: Any) -> None:
+        with self._lock:
+            self._memo[key] = value
+            self._memo.move_to_end(key)
+            while len(self._memo) > MEMO_SIZE:
+                self._memo.popitem(last=False)
+
+    def get(self, namespace: str, digest: str) -> Optional[Any]:
+        key = (namespace, digest)
+        with self._lock:
+            if key in self._memo:
+                self._memo.move_to_end(key)
+                return self._memo[key]
+        path = self._path(namespace, digest)
+        if path is None or not path.exists():
+            return None
+        try:
+            value = json.loads(path.read_text(encoding="utf-8"))["result"]
+        except (OSError, ValueError, KeyError) as exc:
+            logger.debug("Ignoring unreadable genre cache entry %s: %s", path, exc)
+            return None
+        self._memoise(key, value)
+        return value
+
+    def put(self, namespace: str, digest: str, value: Any) -> None:
+        self._memoise((namespace, digest), value)
+        path = self._path(namespace, digest)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"digest": digest, "result": value}, handle)
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError) as exc:
+            logger.debug("Could not persist genre cache entry %s: %s", path, exc)
+
+
+_DEFAULT: Optional[ResultCache] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_cache() -> ResultCache:
+    """Process-wide cache configured from the environment."""
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            _DEFAULT = ResultCache.from_env()
+        return _DEFAULT
+
+
+def cached_result(namespace: str, digest: str, compute: Callable[[], Any]) -> Any:
+    """``compute()``, remembered under ``digest``; the result must be JSON-serialisable."""
+    cache = default_cache()
+    value = cache.get(namespace, digest)
+    if value is None:
+        value = compute()
+        cache.put(namespace, digest, value)
+    return value
@@ -0,0 +1,92 @@
+"""
+Deferred imports for heavy optional dependencies.
+
+Phase entry points used to import numpy, librosa, spaCy, scipy (through
+pyloudnorm) and the Llama agents at module import time, so ``--help`` or a
+single ``--chunk_id`` retry paid for every model stack before argument
+parsing.  Two helpers defer that cost to first use:
+
+- ``lazy_module("librosa")`` returns a stand-in module that imports the
+  real one on first attribute access.  A module that is not installed
+  raises ``ImportError`` right away (``find_spec`` only looks at the file
+  system), so existing ``try: ... except ImportError`` fallbacks keep
+  working unchanged.
+- ``optional_import("agents.llama_rewriter", "LlamaRewriter")`` imports on
+  call and returns None (memoised) when the import fails, for opt-in
+  components that used to be bound to None at import time.
+
+Stdlib only, so entry points can import it before anything heavy.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import logging
+import sys
+import types
+from functools import lru_cache
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class LazyModule(types.ModuleType):
+    """Module stand-in that imports ``__name__`` on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_target"] = None
+
+    def _load(self) -> types.ModuleType:
+        module = self.__dict__["_lazy_target"]
+        if module is None:
+            # importlib's per-module locks make concurrent first access safe
+            module = importlib.import_module(self.__name__)
+            self.__dict__["_lazy_target"] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.__dict__["_lazy_target"] is not None else "not loaded"
+        return f"<lazy module {self.__name__!r} ({state})>"
+
+
+def lazy_module(name: str) -> types.ModuleType:
+    """
+    ``name`` itself if it is already imported, else a :class:`LazyModule`.
+
+    Raises ModuleNotFoundError now if ``name`` is not installed.  For dotted
+    names the parent package is imported to locate the submodule.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+    try:
+        spec = importlib.util.find_spec(name)
+    except (ImportError, ValueError):
+        spec = None
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    return LazyModule(name)
+
+
+def is_loaded(module: Any) -> bool:
+    """False for a :class:`LazyModule` that has not been touched yet."""
+    return not isinstance(module, LazyModule) or module.__dict__["_lazy_target"] is not None
+
+
+@lru_cache(maxsize=None)
+def optional_import(module: str, attr: Optional[str] = None) -> Any:
+    """``module`` (or ``module.attr``) imported now, or None if it cannot be imported."""
+    try:
+        loaded = importlib.import_module(module)
+    except ImportError as exc:
+        logger.debug("Optional import %s unavailable: %s", module, exc)
+        return None
+    return getattr(loaded, attr, None) if attr else loaded
@@ -0,0 +1,353 @@
+"""
+Fused float32 gain staging shared by Phase 4 mastering and Phase 5 enhancement.
+
+A chunk is analysed once (RMS, sample peak, true peak, integrated loudness);
+loudness/peak gain and the peak limiter are folded into a single in-place
+multiply on one float32 buffer, and the output metrics are derived from that
+analysis plus the applied gain instead of being re-measured.  Only the
+non-linear stages (compression, noise gate) force a fresh measurement.
+
+pyloudnorm is used for integrated loudness when installed; otherwise the
+RMS approximation already used by Phase 4 (LUFS ~= RMS - 3 dB) applies.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .lazy_import import lazy_module
+
+logger = logging.getLogger(__name__)
+
+try:
+    _pyln = lazy_module("pyloudnorm")  # pulls in scipy.signal; loaded on first meter
+except ImportError:  # pragma: no cover - optional dependency
+    _pyln = None
+
+SILENCE_DB = -100.0
+LUFS_FROM_RMS_OFFSET_DB = 3.0  # Speech: LUFS ~= RMS(dB) - 3
+MIN_GATED_LUFS = -70.0  # BS.1770 absolute gate
+MIN_NORMALIZABLE_RMS_DB = -60.0
+TRUE_PEAK_OVERSAMPLE = 4
+_TRUE_PEAK_BLOCK = 1 << 16
+_TRUE_PEAK_PAD = 64
+_LUFS_MIN_SECONDS = 0.4  # One BS.1770 gating block
+
+
+def db_to_linear(value_db: float) -> float:
+    return float(10.0 ** (value_db / 20.0))
+
+
+def linear_to_db(value: float) -> float:
+    if value < 1e-10:
+        return SILENCE_DB
+    return float(20.0 * math.log10(value))
+
+
+def as_work_buffer(audio: np.ndarray) -> np.ndarray:
+    """Return ``audio`` as a writeable, contiguous float32 buffer (copying only if needed)."""
+    if (
+        isinstance(audio, np.ndarray)
+        and audio.dtype == np.float32
+        and audio.flags.c_contiguous
+        and audio.flags.writeable
+    ):
+        return audio
+    return np.array(audio, dtype=np.float32, order="C")
+
+
+def sample_peak(audio: np.ndarray) -> float:
+    if audio.size == 0:
+        return 0.0
+    # max/-min avoids allocating np.abs(audio)
+    return float(max(audio.max(), -audio.min()))
+
+
+def true_peak(audio: np.ndarray, oversample: int = TRUE_PEAK_OVERSAMPLE) -> float:
+    """
+    Estimate the inter-sample (true) peak by FFT oversampling.
+
+    Works on padded blocks so memory stays bounded for long files; the sample
+    peak is a lower bound and is always honoured.
+    """
+    peak = sample_peak(audio)
+    if oversample <= 1 or audio.size < 2:
+        return peak
+    n = audio.size
+    for start in range(0, n, _TRUE_PEAK_BLOCK):
+        lo = max(0, start - _TRUE_PEAK_PAD)
+        hi = min(n, start + _TRUE_PEAK_BLOCK + _TRUE_PEAK_PAD)
+        segment = audio[lo:hi]
+        if segment.size < 2:
+            continue
+        upsampled = np.fft.irfft(np.fft.rfft(segment), segment.size * oversample) * oversample
+        core_lo = (start - lo) * oversample
+        core_hi = core_lo + min(_TRUE_PEAK_BLOCK, n - start) * oversample
+        core = upsampled[core_lo:core_hi]
+        if core.size:
+            peak = max(peak, float(max(core.max(), -core.min())))
+    return peak
+
+
+@lru_cache(maxsize=8)
+def _meter(sample_rate: int):
+    return _pyln.Meter(sample_rate)
+
+
+def integrated_loudness(audio: np.ndarray, sample_rate: int, rms_db: Optional[float] = None) -> float:
+    """Integrated loudness in LUFS, falling back to the RMS approximation."""
+    if rms_db is None:
+        rms_db = linear_to_db(_rms(audio))
+    if _pyln is not None and audio.size >= int(_LUFS_MIN_SECONDS * sample_rate):
+        try:
+            loudness = float(_meter(sample_rate).integrated_loudness(audio))
+            if math.isfinite(loudness) and loudness > MIN_GATED_LUFS:
+                return loudness
+        except Exception as exc:  # noqa: BLE001 - meter failures fall back to RMS
+            logger.debug("pyloudnorm measurement failed, using RMS estimate: %s", exc)
+    if rms_db <= SILENCE_DB:
+        return float("-inf")
+    return rms_db - LUFS_FROM_RMS_OFFSET_DB
+
+
+def _rms(audio: np.ndarray) -> float:
+    if audio.size == 0:
+        return 0.0
+    flat = audio.reshape(-1)
+    return float(math.sqrt(float(np.dot(flat, flat)) / flat.size))
+
+
+@dataclass
+class LoudnessMetrics:
+    """Single-pass level analysis of a mono float32 buffer."""
+
+    rms: float
+    peak: float
+    true_peak: float
+    lufs: float
+
+    @property
+    def rms_db(self) -> float:
+        return linear_to_db(self.rms)
+
+    @property
+    def peak_db(self) -> float:
+        return linear_to_db(self.peak)
+
+    @property
+    def true_peak_db(self) -> float:
+        return linear_to_db(self.true_peak)
+
+    def scaled(self, gain_db: float) -> "LoudnessMetrics":
+        """Metrics of the same buffer after a uniform gain, without re-measuring."""
+        factor = db_to_linear(gain_db)
+        return LoudnessMetrics(
+            rms=self.rms * factor,
+            peak=self.peak * factor,
+            true_peak=self.true_peak * factor,
+            lufs=self.lufs + gain_db,
+        )
+
+    def as_dict(self, prefix: str = "") -> Dict[str, float]:
+        return {
+            f"{prefix}rms": self.rms,
+            f"{prefix}rms_db": self.rms_db,
+            f"{prefix}peak_db": self.peak_db,
+            f"{prefix}true_peak_db": self.true_peak_db,
+            f"{prefix}lufs": self.lufs,
+        }
+
+
+def analyze(audio: np.ndarray, sample_rate: int, oversample: int = TRUE_PEAK_OVERSAMPLE) -> LoudnessMetrics:
+    """Measure RMS, sample peak, true peak and LUFS in one pass over ``audio``."""
+    rms = _rms(audio)
+    return LoudnessMetrics(
+        rms=rms,
+        peak=sample_peak(audio),
+        true_peak=true_peak(audio, oversample),
+        lufs=integrated_loudness(audio, sample_rate, linear_to_db(rms)),
+    )
+
+
+@dataclass
+class CompressorSettings:
+    threshold_db: float
+    ratio: float
+    attack_ms: float = 5.0
+    release_ms: float = 50.0
+
+
+def compress_in_place(audio: np.ndarray, sample_rate: int, settings: CompressorSettings) -> float:
+    """
+    Feed-forward RMS compressor applied in place.
+
+    Levels are measured per attack-length block; gain reduction is released
+    with a one-pole decay and interpolated back to sample resolution.
+    Returns the maximum gain reduction applied, in dB.
+    """
+    n = audio.size
+    if n == 0 or settings.ratio <= 1.0:
+        return 0.0
+    block = max(1, int(sample_rate * settings.attack_ms / 1000.0))
+    n_full = n // block
+    energies = []
+    if n_full:
+        frames = audio[: n_full * block].reshape(n_full, block)
+        energies.append(np.einsum("ij,ij->i", frames, frames) / block)
+    if n % block:
+        tail = audio[n_full * block :]
+        energies.append(np.array([float(np.dot(tail, tail)) / tail.size], dtype=np.float32))
+    energy = np.concatenate(energies).astype(np.float64)
+    level_db = 10.0 * np.log10(np.maximum(energy, 1e-20))
+    over_db = level_db - settings.threshold_db
+    target_db = np.where(over_db > 0.0, over_db * (1.0 - 1.0 / settings.ratio), 0.0)
+    if not np.any(target_db > 0.0):
+        return 0.0
+
+    release = math.exp(-block / max(1.0, sample_rate * settings.release_ms / 1000.0))
+    reduction_db = np.empty_like(target_db)
+    current = 0.0
+    for i, wanted in enumerate(target_db):
+        current = wanted if wanted > current else current * release
+        reduction_db[i] = current
+
+    centers = np.arange(reduction_db.size, dtype=np.float64) * block + block / 2.0
+    gain = np.interp(np.arange(n, dtype=np.float64), centers, -reduction_db)
+    np.power(10.0, gain / 20.0, out=gain)
+    audio *= gain.astype(np.float32)
+    return float(reduction_db.max())
+
+
+def gate_in_place(
+    audio: np.ndarray,
+    threshold_db: float = -50.0,
+    reduction_db: float = -20.0,
+    window_size: int = 1024,
+    hop_size: int = 512,
+) -> None:
+    """
+    Attenuate regions whose windowed RMS falls below ``threshold_db``.
+
+    Vectorised equivalent of the original Phase 4 noise gate (same windows,
+    same envelope hold per hop, tail beyond the last full window is gated).
+    """
+    n = audio.size
+    envelope = np.zeros(n, dtype=np.float32)
+    starts = np.arange(0, max(0, n - window_size), hop_size)
+    if starts.size:
+        squares = np.empty(n + 1, dtype=np.float64)
+        squares[0] = 0.0
+        np.cumsum(np.square(audio, dtype=np.float64), out=squares[1:])
+        window_rms = np.sqrt((squares[starts + window_size] - squares[starts]) / window_size)
+        held = np.repeat(window_rms.astype(np.float32), hop_size)
+        envelope[: held.size] = held
+    mask = envelope < db_to_linear(threshold_db)
+    audio[mask] *= db_to_linear(reduction_db)
+
+
+@dataclass
+class GainStageResult:
+    """Outcome of :func:`master_in_place`; ``audio`` is the processed buffer."""
+
+    audio: np.ndarray
+    input: LoudnessMetrics
+    output: LoudnessMetrics
+    gain_db: float = 0.0
+    limiter_db: float = 0.0
+    compression_db: float = 0.0
+    gate_applied: bool = False
+
+    def as_metrics(self) -> Dict[str, Any]:
+        metrics: Dict[str, Any] = {}
+        metrics.update(self.input.as_dict("input_"))
+        metrics.update(self.output.as_dict("output_"))
+        metrics.update(
+            {
+                "gain_db": self.gain_db,
+                "limiter_db": self.limiter_db,
+                "compression_db": self.compression_db,
+                "gate_applied": self.gate_applied,
+            }
+        )
+        return metrics
+
+
+def _loudness_gain_db(metrics: LoudnessMetrics, target_lufs: float) -> float:
+    if math.isfinite(metrics.lufs) and metrics.lufs > MIN_GATED_LUFS:
+        return target_lufs - metrics.lufs
+    rms_db = metrics.rms_db
+    if rms_db < MIN_NORMALIZABLE_RMS_DB:
+        logger.warning("Audio too quiet for loudness normalization, leaving level unchanged")
+        return 0.0
+    return target_lufs + LUFS_FROM_RMS_OFFSET_DB - rms_db
+
+
+def master_in_place(
+    audio: np.ndarray,
+    sample_rate: int,
+    *,
+    target_lufs: Optional[float] = None,
+    peak_headroom_db: Optional[float] = None,
+    ceiling_db: Optional[float] = None,
+    compressor: Optional[CompressorSettings] = None,
+    gate_threshold_db: Optional[float] = None,
+    gate_reduction_db: float = -20.0,
+    input_metrics: Optional[LoudnessMetrics] = None,
+    oversample: int = TRUE_PEAK_OVERSAMPLE,
+) -> GainStageResult:
+    """
+    Run the gain-staging chain on one float32 buffer.
+
+    Chain: optional compression -> loudness gain (``target_lufs``) or peak
+    normalisation (``peak_headroom_db`` below full scale) -> true-peak ceiling
+    -> optional noise gate.  Gain and ceiling are fused into one multiply.
+
+    ``input_metrics`` lets callers hand in an analysis they already hold so
+    the buffer is not measured twice.  The buffer is modified in place when it
+    is already contiguous float32; ``result.audio`` is always the output.
+    """
+    buf = as_work_buffer(audio)
+    measured = input_metrics or analyze(buf, sample_rate, oversample)
+    result = GainStageResult(audio=buf, input=measured, output=measured)
+
+    if buf.size == 0 or measured.peak < 1e-6:
+        logger.debug("Silent or empty buffer, skipping gain staging")
+        return result
+
+    stage = measured
+    if compressor is not None:
+        result.compression_db = compress_in_place(buf, sample_rate, compressor)
+        if result.compression_db > 0.0:
+            stage = analyze(buf, sample_rate, oversample)
+
+    gain_db = 0.0
+    if target_lufs is not None:
+        gain_db = _loudness_gain_db(stage, target_lufs)
+    elif peak_headroom_db is not None:
+        gain_db = -abs(peak_headroom_db) - stage.peak_db
+
+    limiter_db = 0.0
+    if ceiling_db is not None:
+        peak_after_db = stage.true_peak_db + gain_db
+        if peak_after_db > ceiling_db:
+            limiter_db = ceiling_db - peak_after_db
+
+    total_db = gain_db + limiter_db
+    if total_db != 0.0:
+        buf *= np.float32(db_to_linear(total_db))
+    result.gain_db = gain_db
+    result.limiter_db = limiter_db
+    result.output = stage.scaled(total_db)
+
+    if gate_threshold_db is not None:
+        gate_in_place(buf, gate_threshold_db, gate_reduction_db)
+        result.gate_applied = True
+        result.output = analyze(buf, sample_rate, oversample)
+
+    return result
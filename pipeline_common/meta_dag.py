@@ -0,0 +1,307 @@
+"""
+Declarative DAG for the orchestrator's post-run meta phases.
+
+After a book is finished the orchestrator runs a chain of optional,
+informational phases (research, self-eval, retro, review, audit, ...).
+Run one after another, the chain costs the sum of every phase even
+though most of them only read a run summary and write their own reports.
+Here each phase is a ``MetaPhase`` that declares what it touches:
+
+``reads`` / ``writes``
+    files or directories (relative to the working directory, where the
+    meta phases keep ``.pipeline/``);
+``summary_keys`` / ``uses_state``
+    the parts of the run summary and ``pipeline.json`` it looks at;
+``needs``
+    meta phases whose return value it consumes (``ctx.results``).
+
+Edges follow from those declarations in list order: a phase waits for an
+earlier one it ``needs``, or whose paths it would read-after-write,
+write-after-read or write-after-write.  Everything else runs at once on
+a thread pool against one snapshot of the run summary and state, read
+once by the caller.  Each phase gets read-only, deep-copied views of just
+the parts it declared (``MetaContext``), so an undeclared read comes back
+empty instead of silently escaping the fingerprint, and no phase can
+change what another one sees.
+
+A ``cacheable`` phase is skipped when the fingerprint of its inputs --
+declared summary/state parts, ``params`` (pydantic models via
+``model_dump(mode="json")``, keys sorted), the results it needs and a
+stat signature of its ``reads`` -- equals the one recorded after its
+last successful run and its ``writes`` still exist.  Its recorded
+return value stands in for ``ctx.results``.  Records live under
+``.pipeline/meta_dag/``.  Stdlib only; writes are atomic.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path, PurePath
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+RECORD_DIR = Path(".pipeline") / "meta_dag"
+DEFAULT_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class MetaPhase:
+    """One post-run phase and the inputs/outputs it declares."""
+
+    name: str
+    run: Callable[["MetaContext"], Any]
+    reads: Tuple[str, ...] = ()
+    writes: Tuple[str, ...] = ()
+    summary_keys: Optional[Tuple[str, ...]] = ()  # None: the whole summary
+    uses_state: bool = False
+    needs: Tuple[str, ...] = ()
+    params: Any = None  # config block etc.; part of the fingerprint
+    cacheable: bool = True
+
+
+@dataclass
+class MetaContext:
+    """What a meta phase sees: read-only views of its declared inputs and the results it needs."""
+
+    name: str
+    summary: Mapping[str, Any]
+    state: Mapping[str, Any]
+    results: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class MetaRunReport:
+    """Outcome of one DAG run; ``wall_time`` is the post-run overhead."""
+
+    phases: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    wall_time: float = 0.0
+
+    @property
+    def busy_time(self) -> float:
+        """What the same phases would have cost back to back."""
+        return sum(entry.get("duration", 0.0) for entry in self.phases.values())
+
+    def count(self, status: str) -> int:
+        return sum(1 for entry in self.phases.values() if entry["status"] == status)
+
+    def summary_line(self) -> str:
+        return (
+            f"{self.count('ran')} ran, {self.count('skipped')} skipped, "
+            f"{self.count('failed') + self.count('blocked')} failed/blocked "
+            f"in {self.wall_time:.2f}s wall ({self.busy_time:.2f}s of phase time)"
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"wall_time": self.wall_time, "busy_time": self.busy_time, "phases": self.phases}
+
+
+def _overlaps(first: Sequence[str], second: Sequence[str]) -> bool:
+    for a in first:
+        parts_a = PurePath(a).parts
+        for b in second:
+            parts_b = PurePath(b).parts
+            shorter = min(len(parts_a), len(parts_b))
+            if parts_a[:shorter] == parts_b[:shorter]:
+                return True
+    return False
+
+
+def _inside(path: str, roots: Sequence[str]) -> bool:
+    parts = PurePath(path).parts
+    return any(parts[: len(PurePath(root).parts)] == PurePath(root).parts for root in roots)
+
+
+def build_graph(phases: Sequence[MetaPhase]) -> Dict[str, Set[str]]:
+    """``{phase: earlier phases it must wait for}`` derived from the declarations."""
+    names = [phase.name for phase in phases]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate meta phase names: {names}")
+    graph: Dict[str, Set[str]] = {}
+    for index, phase in enumerate(phases):
+        unknown = set(phase.needs) - set(names[:index])
+        if unknown:
+            raise ValueError(f"{phase.name} needs {sorted(unknown)}, which must be listed before it")
+        deps = set(phase.needs)
+        for earlier in phases[:index]:
+            if (
+                _overlaps(earlier.writes, phase.reads)
+                or _overlaps(earlier.reads, phase.writes)
+                or _overlaps(earlier.writes, phase.writes)
+            ):
+                deps.add(earlier.name)
+        graph[phase.name] = deps
+    return graph
+
+
+def _tree_signature(path: Path) -> List[Tuple[str, int, int]]:
+    if path.is_file():
+        stat = path.stat()
+        return [(str(path), stat.st_size, stat.st_mtime_ns)]
+    entries = []
+    for root, dirs, files in os.walk(path):
+        dirs[:] = sorted(d for d in dirs if not _inside(os.path.join(root, d), [str(RECORD_DIR)]))
+        for name in sorted(files):
+            file_path = os.path.join(root, name)
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            entries.append((file_path, stat.st_size, stat.st_mtime_ns))
+    return entries
+
+
+def _declared_summary(phase: MetaPhase, summary: Mapping[str, Any]) -> Dict[str, Any]:
+    if phase.summary_keys is None:
+        return dict(summary)
+    return {key: summary[key] for key in phase.summary_keys if key in summary}
+
+
+def phase_inputs(
+    phase: MetaPhase, summary: Mapping[str, Any], state: Mapping[str, Any]
+) -> Tuple[Mapping[str, Any], Mapping[str, Any]]:
+    """Read-only, deep-copied views of the summary keys and state ``phase`` declared."""
+    declared_summary = copy.deepcopy(_declared_summary(phase, summary))
+    declared_state = copy.deepcopy(dict(state)) if phase.uses_state else {}
+    return MappingProxyType(declared_summary), MappingProxyType(declared_state)
+
+
+def _json_default(value: Any) -> Any:
+    """Stable JSON for the non-JSON values that show up in ``params``."""
+    if hasattr(value, "model_dump"):  # pydantic models: field values, not repr()
+        return value.model_dump(mode="json")
+    if isinstance(value, Mapping):
+        return dict(value)
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=str)
+    if isinstance(value, PurePath):
+        return value.as_posix()
+    return str(value)
+
+
+def input_fingerprint(phase: MetaPhase, ctx: MetaContext) -> str:
+    """SHA-256 over everything ``phase`` declares as input."""
+    payload = {
+        "name": phase.name,
+        "params": phase.params,
+        "summary": _declared_summary(phase, ctx.summary),
+        "state": dict(ctx.state) if phase.uses_state else None,
+        "needs": {name: ctx.results.get(name) for name in phase.needs},
+        "reads": {read: _tree_signature(Path(read)) for read in phase.reads},
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=_json_default).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class RecordStore:
+    """Last successful fingerprint (and result) per meta phase."""
+
+    def __init__(self, root: Path = RECORD_DIR):
+        self.root = Path(root)
+
+    def _path(self, name: str) -> Path:
+        return self.root / f"{name}.json"
+
+    def load(self, name: str) -> Optional[Dict[str, Any]]:
+        try:
+            return json.loads(self._path(name).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def save(self, name: str, fingerprint: str, result: Any) -> None:
+        record = {"fingerprint": fingerprint, "result": result, "finished_at": time.time()}
+        try:
+            encoded = json.dumps(record, default=str)
+        except (TypeError, ValueError):
+            encoded = json.dumps({**record, "result": None})
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                handle.write(encoded)
+            os.replace(tmp, self._path(name))
+        except OSError as exc:
+            logger.debug("Could not record meta phase %s: %s", name, exc)
+
+
+def _execute(phase: MetaPhase, ctx: MetaContext, store: Optional[RecordStore]) -> Dict[str, Any]:
+    start = time.perf_counter()
+    fingerprint = None
+    if phase.cacheable and store is not None:
+        fingerprint = input_fingerprint(phase, ctx)
+        record = store.load(phase.name)
+        if (
+            record
+            and record.get("fingerprint") == fingerprint
+            and all(Path(path).exists() for path in phase.writes)
+        ):
+            return {"status": "skipped", "result": record.get("result"), "duration": time.perf_counter() - start}
+    try:
+        result = phase.run(ctx)
+    except Exception as exc:
+        logger.debug("Meta phase %s failed", phase.name, exc_info=True)
+        return {"status": "failed", "error": f"{type(exc).__name__}: {exc}", "duration": time.perf_counter() - start}
+    if fingerprint is not None:
+        store.save(phase.name, fingerprint, result)
+    return {"status": "ran", "result": result, "duration": time.perf_counter() - start}
+
+
+def run_meta_phases(
+    phases: Sequence[MetaPhase],
+    summary: Mapping[str, Any],
+    state: Optional[Mapping[str, Any]] = None,
+    *,
+    workers: int = DEFAULT_WORKERS,
+    store: Optional[RecordStore] = None,
+) -> MetaRunReport:
+    """
+    Run ``phases`` in dependency order, independent ones concurrently.
+
+    A failed phase only stops the phases that ``need`` its result (they
+    are reported as ``blocked``); pass ``store=None`` to disable skipping.
+    """
+    graph = build_graph(phases)
+    by_name = {phase.name: phase for phase in phases}
+    state = state if state is not None else {}
+    report = MetaRunReport()
+    results: Dict[str, Any] = {}
+    pending = [phase.name for phase in phases]
+    running: Dict[Future, str] = {}
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="meta") as pool:
+        while pending or running:
+            for name in list(pending):
+                deps = graph[name]
+                if not deps <= set(report.phases):
+                    continue
+                pending.remove(name)
+                phase = by_name[name]
+                missing = [dep for dep in phase.needs if report.phases[dep]["status"] not in ("ran", "skipped")]
+                if missing:
+                    report.phases[name] = {"status": "blocked", "error": f"needs {', '.join(missing)}", "duration": 0.0}
+                    continue
+                phase_summary, phase_state = phase_inputs(phase, summary, state)
+                ctx = MetaContext(name, phase_summary, phase_state, {dep: results.get(dep) for dep in phase.needs})
+                running[pool.submit(_execute, phase, ctx, store)] = name
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                outcome = future.result()
+                if "result" in outcome:
+                    results[name] = outcome.pop("result")
+                report.phases[name] = outcome
+
+    report.wall_time = time.perf_counter() - start
+    return report
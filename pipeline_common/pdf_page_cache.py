@@ -0,0 +1,423 @@
+"""
+Per-page PDF artifact cache shared by Phase 1 and Phase 2.
+
+A text PDF used to be parsed five or more times before chunking (Phase 1
+classification, three Phase 2 extraction backends, metadata, TOC and font
+analysis).  ``PdfPageCache`` parses each backend at most once per document
+and keeps the results per page, keyed by the file's SHA-256 (the hash
+Phase 1 already records):
+
+- ``text.<backend>``: page text from ``pypdf``, ``pdfplumber`` or ``pymupdf``
+- ``spans``: PyMuPDF ``get_text("dict")`` spans as ``[text, size, flags]``
+- ``stats``: page width/height
+- ``doc``: page count, PDF metadata and embedded TOC
+
+Layers are filled lazily and page-by-page (unfilled pages are ``None``) and
+persisted under ``.pipeline/page_cache/<aa>/<sha256>/<layer>.json`` so a
+re-run costs no parsing at all.  ``PIPELINE_PAGE_CACHE`` relocates the store;
+``PIPELINE_PAGE_CACHE=off`` keeps it in memory only.  The store is capped at
+``PIPELINE_PAGE_CACHE_MAX_MB`` (2 GiB by default, 0 for no cap): when a new document is
+cached, the least recently used documents are deleted until it fits.  The
+process-wide ``for_file`` registry keeps the ``REGISTRY_SIZE`` most recently
+used documents.
+
+``opener`` replaces ``pymupdf.open`` for in-process parses, so callers that
+already hold (or patch) a PyMuPDF module share it with the cache.
+
+PDF libraries are imported lazily so ``pipeline_common`` has no hard
+dependency on them.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+from . import fingerprint
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENV = "PIPELINE_PAGE_CACHE"
+MAX_MB_ENV = "PIPELINE_PAGE_CACHE_MAX_MB"
+DEFAULT_MAX_MB = 2048
+REGISTRY_SIZE = 8
+DISABLE_VALUES = {"0", "off", "false", "none", "disabled"}
+DEFAULT_ROOT = Path(__file__).resolve().parents[1] / ".pipeline" / "page_cache"
+CACHE_VERSION = 1
+TEXT_BACKENDS = ("pypdf", "pdfplumber", "pymupdf")
+# Below this many uncached pages a worker pool costs more than it saves
+PARALLEL_MIN_PAGES = 48
+
+_REGISTRY: "OrderedDict[str, PdfPageCache]" = OrderedDict()
+_REGISTRY_LOCK = threading.Lock()
+
+
+def file_sha256(path: Path | str) -> str:
+    """SHA-256 of the file bytes (same digest Phase 1 stores in pipeline.json)."""
+    return fingerprint.file_sha256(path)
+
+
+def _default_root() -> Optional[Path]:
+    env = os.environ.get(CACHE_ENV, "").strip()
+    if env.lower() in DISABLE_VALUES:
+        return None
+    return Path(env) if env else DEFAULT_ROOT
+
+
+def _max_store_bytes() -> int:
+    try:
+        return int(float(os.environ.get(MAX_MB_ENV, DEFAULT_MAX_MB)) * 1024 * 1024)
+    except ValueError:
+        return DEFAULT_MAX_MB * 1024 * 1024
+
+
+def prune_store(root: Path, max_bytes: int, keep: Optional[Path] = None) -> List[Path]:
+    """
+    Delete least recently used document directories until ``root`` fits ``max_bytes``.
+
+    Recency is the directory mtime (touched whenever a document is opened
+    from the store).  ``keep`` is never deleted.  Returns the removed paths.
+    """
+    if max_bytes <= 0 or not root.is_dir():
+        return []
+    entries = []
+    for doc_dir in root.glob("*/*"):
+        if not doc_dir.is_dir():
+            continue
+        try:
+            size = sum(f.stat().st_size for f in doc_dir.iterdir() if f.is_file())
+            entries.append((doc_dir.stat().st_mtime, doc_dir, size))
+        except OSError:
+            continue
+    total = sum(size for _, _, size in entries)
+    removed = []
+    for _, doc_dir, size in sorted(entries, key=lambda entry: entry[0]):
+        if total <= max_bytes:
+            break
+        if keep is not None and doc_dir == keep:
+            continue
+        shutil.rmtree(doc_dir, ignore_errors=True)
+        total -= size
+        removed.append(doc_dir)
+    if removed:
+        logger.info("Page cache over %d MB: evicted %d document(s)", max_bytes // (1024 * 1024), len(removed))
+    return removed
+
+
+class PdfPageCache:
+    """Lazily filled, persisted per-page artifacts for one PDF."""
+
+    def __init__(
+        self,
+        pdf_path: Path | str,
+        sha256: Optional[str] = None,
+        root: Optional[Path | str] = None,
+        persist: bool = True,
+        opener: Optional[Callable[[str], Any]] = None,
+        max_bytes: Optional[int] = None,
+    ):
+        self.pdf_path = Path(pdf_path)
+        self.sha256 = sha256 or file_sha256(self.pdf_path)
+        base = Path(root) if root is not None else _default_root()
+        self.root = base if persist else None
+        self.cache_dir = base / self.sha256[:2] / self.sha256 if (persist and base is not None) else None
+        self.opener = opener
+        self.max_bytes = _max_store_bytes() if max_bytes is None else max_bytes
+        self._pruned = False
+        if self.cache_dir is not None and self.cache_dir.is_dir():
+            try:
+                os.utime(self.cache_dir)  # mark recently used for pruning
+            except OSError:
+                pass
+        self._layers: Dict[str, Any] = {}
+        self._lock = threading.RLock()
+        self.parses: Dict[str, int] = {}
+
+    @classmethod
+    def for_file(
+        cls,
+        pdf_path: Path | str,
+        sha256: Optional[str] = None,
+        opener: Optional[Callable[[str], Any]] = None,
+    ) -> "PdfPageCache":
+        """Process-wide shared instance per document digest (LRU, ``REGISTRY_SIZE`` documents)."""
+        digest = sha256 or file_sha256(pdf_path)
+        with _REGISTRY_LOCK:
+            cache = _REGISTRY.get(digest)
+            if cache is None:
+                cache = _REGISTRY[digest] = cls(pdf_path, sha256=digest, opener=opener)
+            elif opener is not None:
+                cache.opener = opener
+            _REGISTRY.move_to_end(digest)
+            while len(_REGISTRY) > REGISTRY_SIZE:
+                _REGISTRY.popitem(last=False)
+            return cache
+
+    # ------------------------------------------------------------------ io
+    def _layer_path(self, name: str) -> Optional[Path]:
+        return self.cache_dir / f"{name}.json" if self.cache_dir is not None else None
+
+    def _load(self, name: str) -> Any:
+        if name in self._layers:
+            return self._layers[name]
+        path = self._layer_path(name)
+        value = None
+        if path is not None and path.exists():
+            try:
+                with open(path, "r", encoding="utf-8") as handle:
+                    payload = json.load(handle)
+                if payload.get("version") == CACHE_VERSION:
+                    value = payload.get("data")
+            except (OSError, json.JSONDecodeError) as exc:
+                logger.debug("Ignoring unreadable page cache layer %s: %s", path, exc)
+        if value is not None:
+            self._layers[name] = value
+        return value
+
+    def _store(self, name: str, value: Any) -> None:
+        self._layers[name] = value
+        path = self._layer_path(name)
+        if path is None:
+            return
+        try:
+            if not self._pruned:
+                self._pruned = True
+                if self.root is not None and not path.parent.exists():
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    prune_store(self.root, self.max_bytes, keep=path.parent)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(prefix=f".{name}.", suffix=".tmp", dir=path.parent)
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump({"version": CACHE_VERSION, "data": value}, handle)
+            os.replace(tmp, path)
+        except OSError as exc:
+            logger.debug("Could not persist page cache layer %s: %s", path, exc)
+
+    def _pages_layer(self, name: str) -> List[Any]:
+        layer = self._load(name)
+        if layer is None:
+            layer = [None] * self.page_count()
+            self._layers[name] = layer
+        return layer
+
+    def _open_pymupdf(self) -> Any:
+        if self.opener is not None:
+            return self.opener(str(self.pdf_path))
+        import pymupdf as fitz
+
+        return fitz.open(str(self.pdf_path))
+
+    def _count_parse(self, backend: str) -> None:
+        self.parses[backend] = self.parses.get(backend, 0) + 1
+
+    # ------------------------------------------------------------ document
+    def _doc(self) -> Dict[str, Any]:
+        doc = self._load("doc")
+        if doc is None:
+            doc = self._read_doc_info()
+            self._store("doc", doc)
+        return doc
+
+    def _read_doc_info(self) -> Dict[str, Any]:
+        try:
+            pdf = self._open_pymupdf()
+        except ImportError:
+            pdf = None
+        if pdf is not None:
+            try:
+                self._count_parse("pymupdf_doc")
+                return {
+                    "page_count": len(pdf),
+                    "metadata": dict(pdf.metadata or {}),
+                    "toc": [list(entry[:3]) for entry in pdf.get_toc()],
+                }
+            finally:
+                pdf.close()
+        from pypdf import PdfReader
+
+        reader = PdfReader(str(self.pdf_path))
+        self._count_parse("pypdf_doc")
+        return {"page_count": len(reader.pages), "metadata": {}, "toc": []}
+
+    def page_count(self) -> int:
+        with self._lock:
+            return int(self._doc()["page_count"])
+
+    def metadata(self) -> Dict[str, Any]:
+        """PyMuPDF ``doc.metadata`` (empty when PyMuPDF is unavailable)."""
+        with self._lock:
+            return dict(self._doc().get("metadata") or {})
+
+    def toc(self) -> List[List[Any]]:
+        """PyMuPDF ``doc.get_toc()`` as ``[level, title, page]`` entries."""
+        with self._lock:
+            return [list(entry) for entry in self._doc().get("toc") or []]
+
+    # --------------------------------------------------------------- pages
+    def _resolve_pages(self, pages: Optional[Iterable[int]]) -> List[int]:
+        if pages is None:
+            return list(range(self.page_count()))
+        return list(pages)
+
+    def texts(self, backend: str, pages: Optional[Iterable[int]] = None, workers: int = 1) -> List[str]:
+        """
+        Page texts from ``backend`` for ``pages`` (all pages by default).
+
+        With ``workers > 1`` and enough uncached pages, the pages are split
+        into contiguous ranges parsed in a process pool (each worker opens
+        the document once) and merged back in page order.
+
+        Empty pages come back as ``""``; if uncached pages cannot be parsed
+        the backend's ImportError/parse error propagates.
+        """
+        if backend not in TEXT_BACKENDS:
+            raise ValueError(f"Unknown extraction backend: {backend}")
+        with self._lock:
+            wanted = self._resolve_pages(pages)
+            layer = self._pages_layer(f"text.{backend}")
+            missing = [i for i in wanted if layer[i] is None]
+            if missing:
+                if workers > 1 and len(missing) >= PARALLEL_MIN_PAGES:
+                    self._parallel_pass(backend, missing, workers)
+                elif backend == "pymupdf":
+                    self._pymupdf_pass(missing)
+                else:
+                    extracted = _TEXT_READERS[backend](self.pdf_path, missing)
+                    self._count_parse(backend)
+                    self.put_pages(f"text.{backend}", extracted)
+                layer = self._pages_layer(f"text.{backend}")
+            return [layer[i] or "" for i in wanted]
+
+    def page_text(self, backend: str, index: int) -> str:
+        return self.texts(backend, [index])[0]
+
+    def spans(self, pages: Optional[Iterable[int]] = None) -> List[List[List[Any]]]:
+        """PyMuPDF spans per page as ``[text, size, flags]`` triples."""
+        with self._lock:
+            wanted = self._resolve_pages(pages)
+            layer = self._pages_layer("spans")
+            missing = [i for i in wanted if layer[i] is None]
+            if missing:
+                self._pymupdf_pass(missing)
+                layer = self._pages_layer("spans")
+            return [layer[i] or [] for i in wanted]
+
+    def page_stats(self, pages: Optional[Iterable[int]] = None) -> List[Dict[str, float]]:
+        """Page geometry (``width``/``height``) from PyMuPDF."""
+        with self._lock:
+            wanted = self._resolve_pages(pages)
+            layer = self._pages_layer("stats")
+            missing = [i for i in wanted if layer[i] is None]
+            if missing:
+                self._pymupdf_pass(missing)
+                layer = self._pages_layer("stats")
+            return [layer[i] or {} for i in wanted]
+
+    def put_pages(self, layer_name: str, pages: Dict[int, Any]) -> None:
+        """Merge externally extracted pages (e.g. from worker processes) into a layer."""
+        if not pages:
+            return
+        with self._lock:
+            layer = self._pages_layer(layer_name)
+            for index, value in pages.items():
+                layer[index] = value
+            self._store(layer_name, layer)
+
+    def _pymupdf_pass(self, pages: Sequence[int]) -> None:
+        """
+        One PyMuPDF walk filling text, stats and spans for ``pages``.
+
+        Spans are collected even when only text was asked for: font analysis
+        always follows extraction, and a second document walk costs more.
+        """
+        texts: Dict[int, str] = {}
+        stats: Dict[int, Dict[str, float]] = {}
+        spans: Dict[int, List[List[Any]]] = {}
+        text_layer = self._pages_layer("text.pymupdf")
+        pdf = self._open_pymupdf()
+        try:
+            self._count_parse("pymupdf")
+            wanted = set(pages)
+            if len(wanted) == len(text_layer):
+                walk = enumerate(pdf)  # full document: sequential page walk
+            else:
+                walk = ((index, pdf.load_page(index)) for index in sorted(wanted))
+            for index, page in walk:
+                page_text, stats[index], spans[index] = _pymupdf_page_artifacts(page)
+                if text_layer[index] is None:
+                    texts[index] = page_text
+        finally:
+            pdf.close()
+        self.put_pages("text.pymupdf", texts)
+        self.put_pages("stats", stats)
+        self.put_pages("spans", spans)
+
+    def _parallel_pass(self, backend: str, pages: Sequence[int], workers: int) -> None:
+        """Parse ``pages`` with ``backend`` across a process pool, one contiguous range per worker."""
+        ordered = sorted(pages)
+        size = -(-len(ordered) // workers)
+        ranges = [ordered[start : start + size] for start in range(0, len(ordered), size)]
+        merged: Dict[str, Dict[int, Any]] = {}
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            for layers in pool.map(_extract_range, [str(self.pdf_path)] * len(ranges), [backend] * len(ranges), ranges):
+                self._count_parse(backend)
+                for name, values in layers.items():
+                    merged.setdefault(name, {}).update(values)
+        for name, values in merged.items():
+            self.put_pages(name, values)
+
+
+def _pymupdf_page_artifacts(page: Any) -> tuple:
+    """(text, stats, spans) for one PyMuPDF page."""
+    stats = {"width": float(page.rect.width), "height": float(page.rect.height)}
+    spans = [
+        [span["text"], span["size"], span["flags"]]
+        for block in page.get_text("dict")["blocks"]
+        for line in block.get("lines", [])
+        for span in line["spans"]
+    ]
+    return page.get_text() or "", stats, spans
+
+
+def _extract_range(pdf_path: str, backend: str, pages: Sequence[int]) -> Dict[str, Dict[int, Any]]:
+    """Worker-process entry point: layer name -> {page index: value} for ``pages``."""
+    if backend != "pymupdf":
+        return {f"text.{backend}": _TEXT_READERS[backend](Path(pdf_path), pages)}
+    import pymupdf as fitz
+
+    layers: Dict[str, Dict[int, Any]] = {"text.pymupdf": {}, "stats": {}, "spans": {}}
+    with fitz.open(pdf_path) as pdf:
+        for index in pages:
+            text, stats, spans = _pymupdf_page_artifacts(pdf.load_page(index))
+            layers["text.pymupdf"][index] = text
+            layers["stats"][index] = stats
+            layers["spans"][index] = spans
+    return layers
+
+
+def _read_pypdf(pdf_path: Path, pages: Sequence[int]) -> Dict[int, str]:
+    from pypdf import PdfReader
+
+    reader = PdfReader(str(pdf_path))
+    return {index: reader.pages[index].extract_text() or "" for index in pages}
+
+
+def _read_pdfplumber(pdf_path: Path, pages: Sequence[int]) -> Dict[int, str]:
+    import pdfplumber
+
+    with pdfplumber.open(str(pdf_path)) as pdf:
+        return {index: pdf.pages[index].extract_text() or "" for index in pages}
+
+
+_TEXT_READERS: Dict[str, Callable[[Path, Sequence[int]], Dict[int, str]]] = {
+    "pypdf": _read_pypdf,
+    "pdfplumber": _read_pdfplumber,
+}
@@ -0,0 +1,324 @@
+"""
+In-process phase execution and venv fingerprints.
+
+The orchestrator starts a phase with ``poetry run python -m <entry>``:
+every launch pays Poetry's environment resolution plus a cold import of
+numpy/librosa/torch, and ``run_phase_with_retry`` pays it again on each
+attempt.  ``InProcessRunner`` imports a phase's CLI entry once
+(``PHASE_ENTRIES``) and calls it with the argv the subprocess would have
+received, so the modules -- and any models they cache at module level --
+stay warm across phases, retries and books.  Each run returns::
+
+    {"phase": 3, "success": True, "exit_code": 0, "duration": 12.4,
+     "mode": "in_process", "warm": True, "error": None}
+
+A phase should only run in-process when this interpreter satisfies the
+phase's ``poetry.lock`` (``dependency_conflicts``); anything else keeps
+the subprocess in the phase's own venv.  That venv is trusted when the
+fingerprint recorded inside it -- a hash of ``poetry.lock`` and
+``pyproject.toml`` -- matches (``venv_is_current``), rather than probing
+for ``.venv`` and re-running ``poetry install`` checks.
+
+In-process runs switch the working directory and ``sys.argv`` like the
+subprocess did, so they are serialised; do not use them for phases that
+must run side by side (streaming mode).  Stdlib only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import importlib
+import logging
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+import tomllib
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+LOCK_FILES = ("poetry.lock", "pyproject.toml")
+FINGERPRINT_FILE = ".pipeline-fingerprint"
+ERROR_TAIL = 50  # warning/error records kept for a failed run's error text
+
+PathLike = Union[Path, str]
+
+
+def venv_fingerprint(phase_dir: PathLike) -> str:
+    """SHA-256 over the phase's ``poetry.lock`` and ``pyproject.toml``."""
+    sha = hashlib.sha256()
+    for name in LOCK_FILES:
+        sha.update(name.encode("utf-8") + b"\0")
+        try:
+            sha.update((Path(phase_dir) / name).read_bytes())
+        except FileNotFoundError:
+            sha.update(b"<missing>")
+        sha.update(b"\0")
+    return sha.hexdigest()
+
+
+def venv_stamp_path(phase_dir: PathLike) -> Path:
+    """Where the fingerprint of the last successful install is kept (inside ``.venv``)."""
+    return Path(phase_dir) / ".venv" / FINGERPRINT_FILE
+
+
+def venv_is_current(phase_dir: PathLike) -> bool:
+    """True when ``.venv`` was installed from the current lock files."""
+    try:
+        recorded = venv_stamp_path(phase_dir).read_text(encoding="utf-8").strip()
+    except OSError:
+        return False
+    return recorded == venv_fingerprint(phase_dir)
+
+
+def record_venv_fingerprint(phase_dir: PathLike) -> None:
+    """Stamp ``.venv`` after a successful ``poetry install``."""
+    stamp = venv_stamp_path(phase_dir)
+    if not stamp.parent.is_dir():
+        logger.debug("No in-project venv at %s; fingerprint not recorded", stamp.parent)
+        return
+    try:
+        fd, tmp = tempfile.mkstemp(dir=stamp.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            handle.write(venv_fingerprint(phase_dir) + "\n")
+        os.replace(tmp, stamp)
+    except OSError as exc:
+        logger.debug("Could not record venv fingerprint %s: %s", stamp, exc)
+
+
+def _canonical(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def locked_packages(phase_dir: PathLike) -> Dict[str, Tuple[str, bool]]:
+    """
+    Runtime packages pinned by the phase's ``poetry.lock``:
+    ``{name: (version, conditional)}``.
+
+    Dev-only and optional (extra) packages are left out; ``conditional``
+    marks packages that carry environment markers (platform-specific).
+    """
+    data = tomllib.loads((Path(phase_dir) / "poetry.lock").read_text(encoding="utf-8"))
+    packages = {}
+    for package in data.get("package", []):
+        groups = package.get("groups") or [package.get("category", "main")]
+        if "main" not in groups or package.get("optional"):
+            continue
+        packages[_canonical(package["name"])] = (str(package["version"]), bool(package.get("markers")))
+    return packages
+
+
+_CONFLICTS: Dict[Tuple[str, str], List[str]] = {}
+_CONFLICTS_LOCK = threading.Lock()
+
+
+def dependency_conflicts(phase_dir: PathLike) -> List[str]:
+    """
+    Ways this interpreter differs from the phase's locked runtime
+    dependencies (empty when the phase can be imported here).
+
+    Memoised per lock fingerprint, so repeated calls are free.
+    """
+    key = (str(Path(phase_dir).resolve()), venv_fingerprint(phase_dir))
+    with _CONFLICTS_LOCK:
+        if key in _CONFLICTS:
+            return list(_CONFLICTS[key])
+    try:
+        locked = locked_packages(phase_dir)
+    except (OSError, tomllib.TOMLDecodeError, KeyError) as exc:
+        conflicts = [f"poetry.lock unreadable ({exc})"]
+    else:
+        conflicts = []
+        for name, (version, conditional) in sorted(locked.items()):
+            try:
+                installed = metadata.version(name)
+            except metadata.PackageNotFoundError:
+                if not conditional:
+                    conflicts.append(f"{name} not installed (locked {version})")
+                continue
+            if installed != version:
+                conflicts.append(f"{name} {installed} installed (locked {version})")
+    with _CONFLICTS_LOCK:
+        _CONFLICTS[key] = conflicts
+    return list(conflicts)
+
+
+ArgvBuilder = Callable[[str, Path, Mapping[str, Any]], List[str]]
+
+
+@dataclass(frozen=True)
+class PhaseEntry:
+    """A phase's CLI entry (``module.function(argv)``) and how to build its argv."""
+
+    module: str
+    function: str
+    argv: ArgvBuilder
+
+
+def _phase1_argv(file_id: str, pipeline_json: Path, config: Mapping[str, Any]) -> List[str]:
+    return [f"--file={config['file']}", f"--json_path={pipeline_json}"]
+
+
+def _phase2_argv(file_id: str, pipeline_json: Path, config: Mapping[str, Any]) -> List[str]:
+    return [f"--file={config['file']}", f"--file_id={file_id}", f"--json_path={pipeline_json}"]
+
+
+def _phase3_argv(file_id: str, pipeline_json: Path, config: Mapping[str, Any]) -> List[str]:
+    argv = [f"--file_id={file_id}", f"--json_path={pipeline_json}"]
+    if config.get("config"):
+        argv.append(f"--config={config['config']}")
+    if config.get("voice"):
+        argv.append(f"--voice={config['voice']}")
+    return argv
+
+
+def _phase5_argv(file_id: str, pipeline_json: Path, config: Mapping[str, Any]) -> List[str]:
+    return [f"--config={config.get('config', 'config.yaml')}"]
+
+
+# Phase 4 (TTS engines) and Phase 3b (plain script) always run as subprocesses.
+PHASE_ENTRIES: Dict[int, PhaseEntry] = {
+    1: PhaseEntry("phase1_validation.validation", "main", _phase1_argv),
+    2: PhaseEntry("phase2_extraction.ingest", "cli", _phase2_argv),
+    3: PhaseEntry("phase3_chunking.main", "main", _phase3_argv),
+    5: PhaseEntry("phase5_enhancement.main", "main", _phase5_argv),
+}
+
+
+def phase_argv(phase: int, file_id: str, pipeline_json: PathLike, config: Optional[Mapping[str, Any]] = None) -> List[str]:
+    """The argv for ``phase``'s entry, shared by the subprocess and in-process paths."""
+    return PHASE_ENTRIES[phase].argv(file_id, Path(pipeline_json), config or {})
+
+
+def _exit_code(code: Any) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    return 1  # sys.exit("message")
+
+
+class _TailHandler(logging.Handler):
+    """Keeps the last warning/error lines so a failed run reports like stderr did."""
+
+    def __init__(self, size: int = ERROR_TAIL):
+        super().__init__(logging.WARNING)
+        self.records: deque = deque(maxlen=size)
+        self.setFormatter(logging.Formatter("%(levelname)s %(name)s: %(message)s"))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.records.append(self.format(record))
+        except Exception:  # pragma: no cover - never let logging break a run
+            pass
+
+    def text(self) -> str:
+        return "\n".join(self.records)
+
+
+_RUN_LOCK = threading.Lock()
+
+
+class InProcessRunner:
+    """Calls phase entry points in this interpreter, importing each one once."""
+
+    def __init__(self, entries: Optional[Mapping[int, PhaseEntry]] = None):
+        self.entries: Dict[int, PhaseEntry] = dict(PHASE_ENTRIES if entries is None else entries)
+        self._functions: Dict[int, Callable[[List[str]], Any]] = {}
+
+    def supports(self, phase: int) -> bool:
+        return phase in self.entries
+
+    def _load(self, phase: int, phase_dir: Path) -> Tuple[Callable[[List[str]], Any], bool]:
+        function = self._functions.get(phase)
+        if function is not None:
+            return function, True
+        src = str(phase_dir / "src")
+        if src not in sys.path:
+            sys.path.insert(0, src)
+        entry = self.entries[phase]
+        function = getattr(importlib.import_module(entry.module), entry.function)
+        self._functions[phase] = function
+        return function, False
+
+    def run(
+        self,
+        phase: int,
+        phase_dir: PathLike,
+        file_id: str,
+        pipeline_json: PathLike,
+        config: Optional[Mapping[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Run ``phase`` as ``cd phase_dir && python -m <entry> <argv>`` would,
+        without the new interpreter.  Never raises for phase failures; they
+        come back as ``success=False`` with the traceback or log tail in
+        ``error``.
+        """
+        phase_dir = Path(phase_dir).resolve()
+        entry = self.entries[phase]
+        argv = entry.argv(file_id, Path(pipeline_json), config or {})
+        result: Dict[str, Any] = {
+            "phase": phase,
+            "success": False,
+            "exit_code": 1,
+            "duration": 0.0,
+            "mode": "in_process",
+            "warm": False,
+            "error": None,
+        }
+        root = logging.getLogger()
+        tail = _TailHandler()
+        start = time.perf_counter()
+        with _RUN_LOCK:
+            saved_cwd, saved_argv = os.getcwd(), sys.argv
+            saved_handlers, saved_level = list(root.handlers), root.level
+            root.addHandler(tail)
+            try:
+                function, result["warm"] = self._load(phase, phase_dir)
+                os.chdir(phase_dir)
+                sys.argv = [entry.module, *argv]
+                try:
+                    code = function(argv)
+                except SystemExit as exc:
+                    code = exc.code
+                result["exit_code"] = _exit_code(code)
+            except Exception:  # the subprocess would have died with this traceback
+                result["exit_code"] = 1
+                result["error"] = traceback.format_exc()
+            finally:
+                os.chdir(saved_cwd)
+                sys.argv = saved_argv
+                # Phases add their own log file handlers; keep them out of ours
+                for handler in root.handlers[:]:
+                    if handler not in saved_handlers:
+                        root.removeHandler(handler)
+                        if handler is not tail:
+                            handler.close()
+                root.setLevel(saved_level)
+        result["duration"] = time.perf_counter() - start
+        result["success"] = result["error"] is None and result["exit_code"] == 0
+        if not result["success"] and result["error"] is None:
+            result["error"] = tail.text() or f"exit code {result['exit_code']}"
+        return result
+
+
+_DEFAULT: Optional[InProcessRunner] = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def default_runner() -> InProcessRunner:
+    """Process-wide runner, so imported phases stay warm between calls."""
+    global _DEFAULT
+    with _DEFAULT_LOCK:
+        if _DEFAULT is None:
+            _DEFAULT = InProcessRunner()
+        return _DEFAULT
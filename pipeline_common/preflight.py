@@ -0,0 +1,304 @@
+"""
+Cached, parallel environment and dependency preflight checks.
+
+The orchestrator used to probe its environment piecemeal and repeatedly:
+Ollama (package, server, model), the Phase 4 Conda env, each phase's venv
+and locked dependencies, the voice and engine registries - per phase, and
+again in every orchestrator process a Phase 7 batch launches per book.
+``PreflightService`` runs registered checks once, side by side on a thread
+pool, and remembers each outcome:
+
+- in memory for the life of the process, and
+- on disk for other processes (later books in the same batch)::
+
+      .pipeline/preflight/cache.json
+      {
+        "version": 1,
+        "checks": {"<name>": {"fingerprint": "<sha256>", "checked_at": 1700000000.0,
+                              "ok": true, "duration_sec": 0.41, "result": {...}}}
+      }
+
+An outcome is reused while its ``ttl`` (``failure_ttl`` for failed checks,
+so a server that was down is retried soon) has not expired and the check's
+input files (poetry.lock, config.yaml, registry YAML, ...) still have the
+same size and mtime.  ``run_all(budget_sec=...)`` bounds startup: checks
+still running when the budget is spent keep going in the background and
+``get()`` waits for them when they are first needed.  Concurrent ``get()``
+calls for the same check share one run.
+
+``PIPELINE_PREFLIGHT_CACHE`` relocates the cache file;
+``PIPELINE_PREFLIGHT_CACHE=off`` keeps outcomes in memory only.  Stdlib
+only.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence
+
+from .fingerprint import stat_key
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENV = "PIPELINE_PREFLIGHT_CACHE"
+DISABLE_VALUES = {"0", "off", "false", "none", "disabled"}
+DEFAULT_CACHE = Path(__file__).resolve().parents[1] / ".pipeline" / "preflight" / "cache.json"
+CACHE_VERSION = 1
+DEFAULT_TTL = 300.0
+FAILURE_TTL = 30.0
+DEFAULT_BUDGET_SEC = 20.0
+MAX_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class PreflightCheck:
+    """One named probe.  ``run`` returns a JSON-serialisable dict with ``ok``."""
+
+    name: str
+    run: Callable[[], Dict[str, Any]]
+    inputs: Sequence[Path] = ()
+    ttl: float = DEFAULT_TTL
+    failure_ttl: float = FAILURE_TTL
+    salt: str = ""  # folded into the fingerprint (model name, interpreter, ...)
+    persist: bool = True
+
+
+@dataclass
+class CheckOutcome:
+    name: str
+    ok: bool
+    result: Dict[str, Any]
+    fingerprint: str
+    checked_at: float
+    duration_sec: float
+    source: str  # "run", "memory" or "disk"
+    error: Optional[str] = None
+    wait_sec: float = 0.0
+
+    def fresh(self, check: PreflightCheck, fingerprint: str, now: float) -> bool:
+        ttl = check.ttl if self.ok else check.failure_ttl
+        return self.fingerprint == fingerprint and now - self.checked_at < ttl
+
+    def as_dict(self) -> Dict[str, Any]:
+        payload = {
+            "ok": self.ok,
+            "source": self.source,
+            "duration_sec": round(self.duration_sec, 3),
+            "wait_sec": round(self.wait_sec, 3),
+        }
+        if self.error:
+            payload["error"] = self.error
+        return payload
+
+
+def inputs_fingerprint(paths: Iterable[Path], salt: str = "") -> str:
+    """Digest of the inputs' stat data; missing files count as a distinct state."""
+    sha = hashlib.sha256(salt.encode("utf-8"))
+    for path in paths:
+        try:
+            key = stat_key(path)
+        except OSError:
+            key = (str(path), "missing")
+        sha.update(repr(key).encode("utf-8"))
+    return sha.hexdigest()
+
+
+class PreflightService:
+    """Registry of checks with a shared thread pool and TTL cache."""
+
+    def __init__(
+        self,
+        checks: Iterable[PreflightCheck] = (),
+        cache_path: Optional[Path] = None,
+        max_workers: int = MAX_WORKERS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.cache_path = cache_path
+        self.clock = clock
+        self.checks: Dict[str, PreflightCheck] = {}
+        self.outcomes: Dict[str, CheckOutcome] = {}
+        self.startup: Dict[str, Any] = {}
+        self._pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._disk: Dict[str, Dict[str, Any]] = self._read_cache()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="preflight")
+        for check in checks:
+            self.register(check)
+
+    @classmethod
+    def from_env(cls, checks: Iterable[PreflightCheck] = (), **kwargs: Any) -> "PreflightService":
+        env = os.environ.get(CACHE_ENV, "").strip()
+        if env.lower() in DISABLE_VALUES:
+            return cls(checks, cache_path=None, **kwargs)
+        return cls(checks, cache_path=Path(env) if env else DEFAULT_CACHE, **kwargs)
+
+    def register(self, check: PreflightCheck) -> None:
+        with self._lock:
+            self.checks[check.name] = check
+
+    # ------------------------------------------------------------------ cache
+    def _read_cache(self) -> Dict[str, Dict[str, Any]]:
+        if self.cache_path is None:
+            return {}
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as handle:
+                doc = json.load(handle)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.debug("Ignoring unreadable preflight cache %s: %s", self.cache_path, exc)
+            return {}
+        if doc.get("version") != CACHE_VERSION:
+            return {}
+        return dict(doc.get("checks") or {})
+
+    def _store(self, outcome: CheckOutcome) -> None:
+        """Merge one outcome into the on-disk cache (atomic replace)."""
+        if self.cache_path is None:
+            return
+        entry = {
+            "fingerprint": outcome.fingerprint,
+            "checked_at": outcome.checked_at,
+            "ok": outcome.ok,
+            "duration_sec": outcome.duration_sec,
+            "result": outcome.result,
+        }
+        with self._lock:
+            entries = self._read_cache()
+            entries[outcome.name] = entry
+            self._disk = entries
+            try:
+                self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+                fd, tmp = tempfile.mkstemp(dir=self.cache_path.parent, suffix=".tmp")
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump({"version": CACHE_VERSION, "checks": entries}, handle, indent=2, default=str)
+                os.replace(tmp, self.cache_path)
+            except OSError as exc:
+                logger.debug("Could not write preflight cache %s: %s", self.cache_path, exc)
+
+    def _cached(self, check: PreflightCheck, fingerprint: str) -> Optional[CheckOutcome]:
+        now = self.clock()
+        outcome = self.outcomes.get(check.name)
+        if outcome is not None and outcome.fresh(check, fingerprint, now):
+            return outcome
+        entry = self._disk.get(check.name) if check.persist else None
+        if entry:
+            outcome = CheckOutcome(
+                name=check.name,
+                ok=bool(entry.get("ok")),
+                result=dict(entry.get("result") or {}),
+                fingerprint=str(entry.get("fingerprint")),
+                checked_at=float(entry.get("checked_at") or 0.0),
+                duration_sec=float(entry.get("duration_sec") or 0.0),
+                source="disk",
+            )
+            if outcome.fresh(check, fingerprint, now):
+                self.outcomes[check.name] = outcome
+                return outcome
+        return None
+
+    # ------------------------------------------------------------------ running
+    def _execute(self, check: PreflightCheck, fingerprint: str) -> CheckOutcome:
+        started = time.perf_counter()
+        error = None
+        try:
+            result = dict(check.run() or {})
+            ok = bool(result.get("ok", True))
+        except Exception as exc:  # pylint: disable=broad-except
+            result, ok, error = {}, False, f"{type(exc).__name__}: {exc}"
+            logger.warning("Preflight %s raised %s", check.name, error)
+        outcome = CheckOutcome(
+            name=check.name,
+            ok=ok,
+            result=result,
+            fingerprint=fingerprint,
+            checked_at=self.clock(),
+            duration_sec=time.perf_counter() - started,
+            source="run",
+            error=error or (None if ok else result.get("message") or result.get("error")),
+        )
+        with self._lock:
+            self.outcomes[check.name] = outcome
+            self._pending.pop(check.name, None)
+        if check.persist:
+            self._store(outcome)
+        logger.debug("Preflight %s: ok=%s in %.2fs", check.name, ok, outcome.duration_sec)
+        return outcome
+
+    def _submit(self, name: str) -> Optional[Future]:
+        """Start ``name`` unless a fresh outcome exists; None when cached."""
+        check = self.checks.get(name)
+        if check is None:
+            raise KeyError(f"Unknown preflight check: {name}")
+        fingerprint = inputs_fingerprint(check.inputs, check.salt)
+        with self._lock:
+            future = self._pending.get(name)
+            if future is not None:
+                return future
+            cached = self._cached(check, fingerprint)
+            if cached is not None:
+                if cached.source == "run":
+                    cached.source = "memory"
+                return None
+            future = self._executor.submit(self._execute, check, fingerprint)
+            self._pending[name] = future
+            return future
+
+    def start(self, names: Optional[Iterable[str]] = None) -> None:
+        """Kick off every (or the named) check that has no fresh outcome."""
+        for name in list(names) if names is not None else list(self.checks):
+            self._submit(name)
+
+    def get(self, name: str, timeout: Optional[float] = None) -> CheckOutcome:
+        """Outcome of ``name``, running or waiting for the check as needed."""
+        started = time.perf_counter()
+        future = self._submit(name)
+        if future is not None:
+            future.result(timeout=timeout)
+        outcome = self.outcomes[name]
+        outcome.wait_sec += time.perf_counter() - started
+        return outcome
+
+    def result(self, name: str, timeout: Optional[float] = None) -> Dict[str, Any]:
+        return self.get(name, timeout=timeout).result
+
+    def run_all(
+        self, names: Optional[Sequence[str]] = None, budget_sec: Optional[float] = DEFAULT_BUDGET_SEC
+    ) -> Dict[str, CheckOutcome]:
+        """Run checks in parallel, waiting at most ``budget_sec`` for them."""
+        names = list(names) if names is not None else list(self.checks)
+        started = time.perf_counter()
+        futures = {name: self._submit(name) for name in names}
+        _, not_done = wait([f for f in futures.values() if f is not None], timeout=budget_sec)
+        self.startup = {
+            "wall_sec": round(time.perf_counter() - started, 3),
+            "budget_sec": budget_sec,
+            "checks": names,
+            "over_budget": sorted(name for name, f in futures.items() if f in not_done),
+        }
+        return {name: self.outcomes[name] for name in names if name in self.outcomes}
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-check timings and cache use, for the run summary."""
+        with self._lock:
+            outcomes = dict(self.outcomes)
+            pending = sorted(self._pending)
+        return {
+            **self.startup,
+            "pending": pending,
+            "cache_hits": sum(1 for o in outcomes.values() if o.source != "run"),
+            "check_sec": round(sum(o.duration_sec for o in outcomes.values() if o.source == "run"), 3),
+            "results": {name: outcome.as_dict() for name, outcome in sorted(outcomes.items())},
+        }
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,297 @@
+"""
+Streaming, bounded output capture for phase subprocesses.
+
+``subprocess.run(capture_output=True)`` keeps everything a phase prints in
+memory until it exits (hours of Phase 4/5 logging), and nothing is visible
+while it runs.  Here each stream is read as it arrives, split into lines,
+and every line is:
+
+- appended to a rotating log file per book and phase::
+
+      .pipeline/logs/<file_id>/phase4.log   (+ phase4.log.1 ... .N when rotated)
+
+- kept in a ring buffer of the last ``tail_lines`` lines per stream, which
+  is all callers get back for error reporting, and
+- matched against ``PROGRESS_PATTERNS``; hits reach ``on_event`` as
+  ``ProgressEvent``s (chunk finished, its RTF, ...) while the process is
+  still running.
+
+``OutputCapture`` does the line handling and is fed raw bytes, so async
+callers (Phase 7 under trio) can drive it from their own stream readers.
+``run_streaming`` drives it with two reader threads for synchronous callers
+and mirrors ``subprocess.run``: it raises ``subprocess.TimeoutExpired``
+after killing a process that overruns ``timeout``.  Stdlib only.
+"""
+
+from __future__ import annotations
+
+import collections
+import re
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Pattern, Sequence, TextIO, Tuple, Union
+
+LOG_DIR = Path(".pipeline") / "logs"
+DEFAULT_TAIL_LINES = 200
+DEFAULT_MAX_BYTES = 20 * 1024 * 1024
+DEFAULT_BACKUPS = 3
+MAX_LINE_BYTES = 64 * 1024  # longer runs without a newline are split
+READ_SIZE = 64 * 1024
+STREAMS = ("stdout", "stderr")
+
+_NUMBER = r"[0-9]+(?:\.[0-9]+)?"
+PROGRESS_PATTERNS: List[Tuple[str, Pattern[str]]] = [
+    # Phase 4: "Chunk chunk_0001 via 'xtts': wall 12.31s, audio 4.20s, RT x2.93"
+    (
+        "chunk_done",
+        re.compile(
+            rf"Chunk (?P<chunk_id>\S+) via '(?P<engine>[^']+)': wall (?P<wall_sec>{_NUMBER})s, "
+            rf"audio (?P<audio_sec>{_NUMBER})s, RT x(?P<rtf>{_NUMBER})"
+        ),
+    ),
+    # Phase 4 resume: "Skipping chunk_0001 (already exists)"
+    ("chunk_skipped", re.compile(r"Skipping (?P<chunk_id>\S+) \(already exists\)")),
+    # Phase 5: "[OK] Saved enhanced chunk 12: /path/enhanced_0012.wav"
+    ("chunk_enhanced", re.compile(r"Saved enhanced chunk (?P<chunk_id>\S+):")),
+]
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """One progress line recognised in a phase's output."""
+
+    kind: str
+    stream: str
+    line: str
+    chunk_id: Optional[str] = None
+    rtf: Optional[float] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+def parse_progress(
+    line: str, stream: str = "stdout", patterns: Sequence[Tuple[str, Pattern[str]]] = PROGRESS_PATTERNS
+) -> Optional[ProgressEvent]:
+    for kind, pattern in patterns:
+        match = pattern.search(line)
+        if not match:
+            continue
+        data: Dict[str, Any] = {k: v for k, v in match.groupdict().items() if v is not None}
+        for key, value in data.items():
+            if key != "chunk_id" and re.fullmatch(_NUMBER, value):
+                data[key] = float(value)
+        return ProgressEvent(
+            kind=kind,
+            stream=stream,
+            line=line,
+            chunk_id=data.pop("chunk_id", None),
+            rtf=data.pop("rtf", None),
+            data=data,
+        )
+    return None
+
+
+def phase_log_path(file_id: str, phase: Union[int, str], root: Optional[Path] = None) -> Path:
+    """``<root>/.pipeline/logs/<file_id>/phase<phase>.log``."""
+    return (root or Path.cwd()) / LOG_DIR / file_id / f"phase{phase}.log"
+
+
+class RotatingLog:
+    """Append-only log file that rolls over to ``.1`` ... ``.N`` past ``max_bytes``."""
+
+    def __init__(self, path: Path, max_bytes: int = DEFAULT_MAX_BYTES, backups: int = DEFAULT_BACKUPS) -> None:
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = open(self.path, "ab")
+        self._size = self._handle.tell()
+
+    def write(self, data: bytes) -> None:
+        if self.max_bytes and self._size and self._size + len(data) > self.max_bytes:
+            self._rotate()
+        self._handle.write(data)
+        self._size += len(data)
+
+    def _rotate(self) -> None:
+        self._handle.close()
+        if self.backups > 0:
+            for index in range(self.backups - 1, 0, -1):
+                older = self.path.with_name(f"{self.path.name}.{index}")
+                if older.exists():
+                    older.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        self._handle = open(self.path, "wb")
+        self._size = 0
+
+    def flush(self) -> None:
+        self._handle.flush()
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class OutputCapture:
+    """Line-splits raw stream bytes into a rotating log, tails and events."""
+
+    def __init__(
+        self,
+        log_path: Optional[Path] = None,
+        tail_lines: int = DEFAULT_TAIL_LINES,
+        on_event: Optional[Callable[[ProgressEvent], None]] = None,
+        echo: Optional[TextIO] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        backups: int = DEFAULT_BACKUPS,
+        patterns: Sequence[Tuple[str, Pattern[str]]] = PROGRESS_PATTERNS,
+    ) -> None:
+        self.log_path = Path(log_path) if log_path else None
+        self.on_event = on_event
+        self.echo = echo
+        self.patterns = patterns
+        self.lines = 0
+        self.events = 0
+        self._log = RotatingLog(self.log_path, max_bytes, backups) if self.log_path else None
+        self._tails: Dict[str, Deque[str]] = {name: collections.deque(maxlen=tail_lines) for name in STREAMS}
+        self._pending: Dict[str, bytes] = {name: b"" for name in STREAMS}
+        self._lock = threading.Lock()
+
+    def feed(self, stream: str, data: bytes) -> None:
+        buffered = self._pending[stream] + data
+        *complete, rest = buffered.split(b"\n")
+        while len(rest) > MAX_LINE_BYTES:
+            complete.append(rest[:MAX_LINE_BYTES])
+            rest = rest[MAX_LINE_BYTES:]
+        self._pending[stream] = rest
+        for raw in complete:
+            self._line(stream, raw)
+        with self._lock:
+            if self._log is not None:
+                self._log.flush()  # once per read, so the log can be tailed live
+
+    def finish(self, stream: str) -> None:
+        """The stream hit EOF: emit any unterminated last line."""
+        rest, self._pending[stream] = self._pending[stream], b""
+        if rest:
+            self._line(stream, rest)
+
+    def _line(self, stream: str, raw: bytes) -> None:
+        text = raw.decode("utf-8", errors="replace").rstrip("\r")
+        event = parse_progress(text, stream, self.patterns) if self.patterns else None
+        with self._lock:
+            self.lines += 1
+            self._tails[stream].append(text)
+            if self._log is not None:
+                self._log.write(raw.rstrip(b"\r") + b"\n")
+            if self.echo is not None:
+                self.echo.write(text + "\n")
+            if event is not None:
+                self.events += 1
+        if event is not None and self.on_event is not None:
+            self.on_event(event)
+
+    def tail(self, stream: str = "stderr", lines: Optional[int] = None) -> str:
+        with self._lock:
+            kept = list(self._tails[stream])
+        return "\n".join(kept[-lines:] if lines else kept)
+
+    @property
+    def stdout_tail(self) -> str:
+        return self.tail("stdout")
+
+    @property
+    def stderr_tail(self) -> str:
+        return self.tail("stderr")
+
+    def close(self) -> None:
+        for stream in STREAMS:
+            self.finish(stream)
+        with self._lock:
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+            if self.echo is not None:
+                self.echo.flush()
+
+
+@dataclass
+class StreamResult:
+    """What ``run_streaming`` returns: exit status plus bounded tails."""
+
+    args: List[str]
+    returncode: int
+    stdout: str
+    stderr: str
+    duration_sec: float
+    log_path: Optional[Path] = None
+    events: int = 0
+
+
+def _pump(pipe: Any, stream: str, capture: OutputCapture) -> None:
+    try:
+        while True:
+            data = pipe.read1(READ_SIZE) if hasattr(pipe, "read1") else pipe.read(READ_SIZE)
+            if not data:
+                break
+            capture.feed(stream, data)
+    finally:
+        capture.finish(stream)
+        pipe.close()
+
+
+def run_streaming(
+    cmd: Sequence[str],
+    *,
+    log_path: Optional[Path] = None,
+    timeout: Optional[float] = None,
+    tail_lines: int = DEFAULT_TAIL_LINES,
+    on_event: Optional[Callable[[ProgressEvent], None]] = None,
+    echo: bool = False,
+    on_start: Optional[Callable[[subprocess.Popen], None]] = None,
+    **popen_kwargs: Any,
+) -> StreamResult:
+    """Run ``cmd`` to completion, streaming its output through ``OutputCapture``.
+
+    ``echo`` mirrors every line to this process's stdout so long phases stay
+    visible live.  Extra keyword arguments go to ``subprocess.Popen``.
+    """
+    capture = OutputCapture(
+        log_path, tail_lines=tail_lines, on_event=on_event, echo=sys.stdout if echo else None
+    )
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        list(cmd),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        **popen_kwargs,
+    )
+    readers = [
+        threading.Thread(target=_pump, args=(process.stdout, "stdout", capture), daemon=True),
+        threading.Thread(target=_pump, args=(process.stderr, "stderr", capture), daemon=True),
+    ]
+    for reader in readers:
+        reader.start()
+    try:
+        if on_start is not None:
+            on_start(process)
+        process.wait(timeout=timeout)
+    except BaseException:
+        process.kill()
+        process.wait()
+        raise
+    finally:
+        for reader in readers:
+            reader.join()
+        capture.close()
+    return StreamResult(
+        args=list(cmd),
+        returncode=process.returncode,
+        stdout=capture.stdout_tail,
+        stderr=capture.stderr_tail,
+        duration_sec=time.perf_counter() - start,
+        log_path=capture.log_path,
+        events=capture.events,
+    )
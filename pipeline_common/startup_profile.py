@@ -0,0 +1,207 @@
+"""
+Import-time breakdown for phase entry points (``--profile-startup``).
+
+Each phase CLI calls ``enable_if_requested("<phase>")`` before its heavy
+imports.  When ``--profile-startup`` is on the command line (or
+``PIPELINE_PROFILE_STARTUP`` is set, which reaches phases the orchestrator
+launches as subprocesses) every later import is timed, and at exit a
+report is written in the ``python -X importtime`` format::
+
+    .pipeline/startup/<phase>-<YYYYmmdd-HHMMSS>-<pid>.txt
+    # phase4_tts startup profile ...
+    import time: self [us] | cumulative | imported package
+    import time:       412 |       9821 |   numpy.core._multiarray_umath
+    ...
+    # slowest imports (cumulative)
+
+``PIPELINE_STARTUP_PROFILE_DIR`` relocates the reports.  Modules imported
+before the call (the stdlib and ``pipeline_common`` itself) are counted in
+the header but not timed.  Stdlib only.
+"""
+
+from __future__ import annotations
+
+import argparse
+import atexit
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple
+
+FLAG = "--profile-startup"
+ENABLE_ENV = "PIPELINE_PROFILE_STARTUP"
+DIR_ENV = "PIPELINE_STARTUP_PROFILE_DIR"
+DISABLE_VALUES = {"", "0", "off", "false", "none", "disabled"}
+DEFAULT_ROOT = Path(__file__).resolve().parents[1] / ".pipeline" / "startup"
+SLOWEST = 25
+
+# (depth, name, self_us, cumulative_us), in completion order like -X importtime
+Record = Tuple[int, str, int, int]
+
+_TIMER: Optional["_ImportTimer"] = None
+
+
+class _TimedLoader:
+    """Wraps a spec's loader to time module creation and execution."""
+
+    def __init__(self, loader, timer: "_ImportTimer", name: str):
+        self._loader = loader
+        self._timer = timer
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+    def create_module(self, spec):
+        self._timer.enter()
+        try:
+            create = getattr(self._loader, "create_module", None)
+            return create(spec) if create else None
+        except BaseException:
+            self._timer.leave(self._name, failed=True)
+            raise
+
+    def exec_module(self, module):
+        # The module keeps its real loader; the wrapper only lives for this import
+        spec = getattr(module, "__spec__", None)
+        if spec is not None and spec.loader is self:
+            spec.loader = self._loader
+        if getattr(module, "__loader__", None) is self:
+            module.__loader__ = self._loader
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._timer.leave(self._name)
+
+
+class _ImportTimer:
+    """Meta-path hook that times imports found by the finders after it."""
+
+    def __init__(self):
+        self.records: List[Record] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> List[List[float]]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def find_spec(self, name, path=None, target=None):
+        if getattr(self._local, "finding", False):
+            return None
+        self._local.finding = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(name, path, target)
+                if spec is not None:
+                    break
+            else:
+                return None
+        finally:
+            self._local.finding = False
+        if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+            spec.loader = _TimedLoader(spec.loader, self, name)
+        return spec
+
+    def enter(self) -> None:
+        # [start, time spent in nested imports]
+        self._stack().append([time.perf_counter(), 0.0])
+
+    def leave(self, name: str, failed: bool = False) -> None:
+        stack = self._stack()
+        start, children = stack.pop()
+        elapsed = time.perf_counter() - start
+        if stack:
+            stack[-1][1] += elapsed
+        if not failed:
+            with self._lock:
+                self.records.append(
+                    (len(stack), name, int((elapsed - children) * 1e6), int(elapsed * 1e6))
+                )
+
+
+def requested(argv: Optional[Sequence[str]] = None) -> bool:
+    """True when ``--profile-startup`` is in ``argv`` or the env var enables profiling."""
+    args = sys.argv[1:] if argv is None else argv
+    if FLAG in args:
+        return True
+    return os.environ.get(ENABLE_ENV, "").strip().lower() not in DISABLE_VALUES
+
+
+def add_argument(parser: argparse.ArgumentParser) -> None:
+    """Register ``--profile-startup`` on a phase CLI (handled by ``enable_if_requested``)."""
+    parser.add_argument(
+        FLAG,
+        action="store_true",
+        help="Write an import-time breakdown of this run's startup to .pipeline/startup/",
+    )
+
+
+def enable_if_requested(phase: str, argv: Optional[Sequence[str]] = None) -> Optional[Path]:
+    """
+    Start timing imports if profiling was requested; returns the report path.
+
+    Call once, at the top of an entry point.  The report is written at exit,
+    so it also covers imports deferred to first use.
+    """
+    global _TIMER
+    if _TIMER is not None or not requested(argv):
+        return None
+    root = Path(os.environ.get(DIR_ENV) or DEFAULT_ROOT)
+    stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+    report = root / f"{phase}-{stamp}-{os.getpid()}.txt"
+    preloaded = len(sys.modules)
+    started = time.perf_counter()
+
+    _TIMER = _ImportTimer()
+    sys.meta_path.insert(0, _TIMER)
+    atexit.register(_write_report, report, phase, preloaded, started)
+    return report
+
+
+def _write_report(report: Path, phase: str, preloaded: int, started: float) -> None:
+    timer = _TIMER
+    if timer is None:
+        return
+    with timer._lock:
+        records = list(timer.records)
+    imported = sum(cumulative for depth, _, _, cumulative in records if depth == 0)
+    lines = [
+        f"# {phase} startup profile, argv: {' '.join(sys.argv)}",
+        f"# {preloaded} modules were already loaded when profiling started (not timed)",
+        f"# {len(records)} modules imported, {imported / 1000:.1f} ms in imports,"
+        f" {(time.perf_counter() - started) * 1000:.1f} ms from profiling start to exit",
+        "import time: self [us] | cumulative | imported package",
+    ]
+    lines.extend(
+        f"import time: {self_us:>9} | {cumulative:>10} | {'  ' * depth}{name}"
+        for depth, name, self_us, cumulative in records
+    )
+    lines.append("# slowest imports (cumulative)")
+    for _, name, _, cumulative in sorted(records, key=lambda r: -r[3])[:SLOWEST]:
+        lines.append(f"#   {cumulative / 1000:>9.1f} ms  {name}")
+    try:
+        report.parent.mkdir(parents=True, exist_ok=True)
+        report.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        print(f"Startup profile written to {report}", file=sys.stderr)
+    except OSError as exc:
+        print(f"Could not write startup profile {report}: {exc}", file=sys.stderr)
+
+
+def read_report(report: Path | str) -> List[Record]:
+    """Parse a report back into records (for tests and tooling)."""
+    records: List[Record] = []
+    for line in Path(report).read_text(encoding="utf-8").splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        records.append((depth, name.strip(), int(self_us), int(cumulative)))
+    return records
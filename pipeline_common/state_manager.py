@@ -10,6 +10,9 @@ This module provides a single source of truth for reading and writing
 - Minimal structural validation on reads to catch corruption early.
 - Optional strict validation via Pydantic when available.
 - Transactional updates through ``PipelineState.transaction()``.
+- Optional per-book sharding (see ``state_shards``): once a state has been
+  migrated, ``transaction(file_id=...)`` locks and rewrites only that book's
+  shard while ``read()`` keeps returning the merged document.
 
 Public surface (kept stable for existing consumers):
     - PipelineState
@@ -42,6 +45,18 @@ from .schema import (
     canonicalize_state,
     validate_pipeline_schema,
 )
+from .state_shards import (
+    ShardLayout,
+    apply_root_changes,
+    commit_shard,
+    diff_entries,
+    diff_root,
+    merge_state,
+    now_iso,
+    read_shard,
+    refresh_root,
+    split_state,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -222,6 +237,8 @@ class PipelineState:
             self.path, max_backups=max_backups
         )
         self.transaction_log = StateTransactionLog(self.path)
+        # shard path -> ((mtime_ns, size), parsed shard)
+        self._shard_cache: Dict[Path, tuple[tuple[int, int], JsonDict]] = {}
 
         logger.debug("PipelineState initialized for %s", self.path)
 
@@ -246,11 +263,15 @@ class PipelineState:
             logger.debug("Lock release failed: %s", exc)
 
     @contextmanager
-    def _file_lock(self, timeout: float = 10.0) -> Iterator[None]:
-        """Acquire an exclusive lock on the lock file."""
+    def _file_lock(
+        self, timeout: float = 10.0, lock_path: Optional[Path] = None
+    ) -> Iterator[None]:
+        """Acquire an exclusive lock on the lock file (or a shard's)."""
         lock_file = None
+        lock_path = lock_path or self.lock_path
         try:
-            lock_file = open(self.lock_path, "w")
+            lock_path.parent.mkdir(parents=True, exist_ok=True)
+            lock_file = open(lock_path, "w")
             start_time = time.time()
             while True:
                 try:
@@ -260,7 +281,7 @@ class PipelineState:
                 except (BlockingIOError, OSError):
                     if time.time() - start_time > timeout:
                         raise StateLockError(
-                            f"Could not acquire lock for {self.path} after {timeout}s."
+                            f"Could not acquire lock {lock_path} after {timeout}s."
                         )
                     time.sleep(0.1)
             yield
@@ -273,19 +294,30 @@ class PipelineState:
     # ------------------------------------------------------------------ #
     # Public API
     # ------------------------------------------------------------------ #
-    def read(self, validate: Optional[bool] = None) -> JsonDict:
-        """Read current state from disk with optional validation."""
+    def read(
+        self, validate: Optional[bool] = None, *, file_id: Optional[str] = None
+    ) -> JsonDict:
+        """Read current state from disk with optional validation.
+
+        For a sharded state the root is merged with the book shards, or only
+        with ``file_id``'s shard when given.  Monolithic states ignore
+        ``file_id`` and return the whole document.
+        """
         run_validation = (
             self.validate_on_read if validate is None else validate
         )
 
-        if not self.path.exists():
+        layout = self.shard_layout()
+        if layout is None and not self.path.exists():
             self._log_transaction("read", True, {"note": "file_not_found"})
             return {}
 
         try:
-            with open(self.path, "r", encoding="utf-8") as state_file:
-                data = json.load(state_file)
+            if layout is None:
+                with open(self.path, "r", encoding="utf-8") as state_file:
+                    data = json.load(state_file)
+            else:
+                data = self._read_sharded(layout, file_id)
 
             self._validate_basic(data)
             if run_validation:
@@ -312,6 +344,10 @@ class PipelineState:
                 f"Unexpected error reading state: {exc}"
             ) from exc
 
+    def shard_layout(self) -> Optional[ShardLayout]:
+        """The shard layout if this state has been migrated, else None."""
+        return ShardLayout.load(self.path)
+
     def write(self, data: JsonDict, validate: bool = True) -> None:
         """Write the provided state to disk atomically via a transaction."""
         with self.transaction(
@@ -326,6 +362,7 @@ class PipelineState:
         validate: Optional[bool] = None,
         seed_data: Optional[JsonDict] = None,
         operation: str = "transaction",
+        file_id: Optional[str] = None,
     ) -> StateTransaction:
         """
         Create a transaction context manager.
@@ -334,9 +371,16 @@ class PipelineState:
             validate: Override validation behaviour (defaults to strict validation).
             seed_data: Optional initial payload to use instead of the on-disk state.
             operation: Operation name recorded in the transaction log.
+            file_id: Book the transaction is about.  On a sharded state only
+                that book's shard is locked and ``txn.data`` holds the root plus
+                that book's entries; ignored for monolithic states.
         """
         return StateTransaction(
-            self, validate=validate, seed_data=seed_data, operation=operation
+            self,
+            validate=validate,
+            seed_data=seed_data,
+            operation=operation,
+            file_id=file_id,
         )
 
     def list_backups(self, limit: int = 10) -> List[Path]:
@@ -591,13 +635,121 @@ class PipelineState:
                 f"Schema validation failed: {exc}"
             ) from exc
 
+    def _read_sharded(
+        self, layout: ShardLayout, file_id: Optional[str]
+    ) -> JsonDict:
+        root: JsonDict = {}
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as state_file:
+                root = json.load(state_file)
+        self._validate_basic(root)
+
+        paths = layout.shard_files(file_id)
+        if file_id is None:
+            for stale in set(self._shard_cache) - set(paths):
+                del self._shard_cache[stale]
+        entries: Dict[str, JsonDict] = {}
+        stamps: List[str] = []
+        for path in paths:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:  # removed since the listing
+                continue
+            key = (stat.st_mtime_ns, stat.st_size)
+            cached = self._shard_cache.get(path)
+            if cached is None or cached[0] != key:
+                cached = (key, read_shard(path))
+                self._shard_cache[path] = cached
+            shard = cached[1]
+            entries.setdefault(shard["file_id"], {}).update(shard["phases"])
+            stamps.append(shard.get("updated_at", ""))
+
+        # Cached shards are shared between reads: hand out a private copy.
+        return deepcopy(merge_state(root, entries, stamps))
+
+    def _plan_sharded_commit(
+        self, data: JsonDict, original: JsonDict, validate: bool
+    ) -> tuple[Dict[str, Dict[str, Optional[JsonDict]]], List[Any]]:
+        """Validate a sharded commit; return (changed entries, root changes)."""
+        if validate:
+            self._ensure_phase_blocks_are_objects(data)
+        normalized = self._normalize_for_write(data)
+        if validate:
+            self._validate_schema(normalized)
+        else:
+            self._validate_basic(normalized, enforce_sections=False)
+        new_root, new_entries = split_state(normalized)
+        old_root, old_entries = split_state(original)
+        return diff_entries(old_entries, new_entries), diff_root(old_root, new_root)
+
+    def _commit_sharded(
+        self,
+        layout: ShardLayout,
+        entry_changes: Dict[str, Dict[str, Optional[JsonDict]]],
+        root_changes: List[Any],
+        operation: str,
+        *,
+        held_file_id: Optional[str] = None,
+        root_locked: bool = False,
+    ) -> None:
+        """Write changed shards, then merge root changes into the fresh root.
+
+        Locks are only ever taken root-then-shard, so an unscoped transaction
+        (root lock held) and a book transaction (its shard lock held) cannot
+        deadlock: book transactions publish root changes after releasing
+        their shard (see ``StateTransaction.__exit__``).
+        """
+        stamp = now_iso()
+        try:
+            for file_id in sorted(entry_changes):
+                if file_id == held_file_id:
+                    commit_shard(layout, file_id, entry_changes[file_id], stamp)
+                    continue
+                with self._file_lock(lock_path=layout.lock_path(file_id)):
+                    commit_shard(layout, file_id, entry_changes[file_id], stamp)
+            if root_changes:
+                if root_locked:
+                    self._merge_root(root_changes, stamp, operation)
+                else:
+                    with self._file_lock():
+                        self._merge_root(root_changes, stamp, operation)
+        except StateError:
+            raise
+        except Exception as exc:
+            self._log_transaction(
+                operation, False, {"error": "shard_write_failed"}
+            )
+            raise StateWriteError(
+                f"Failed to persist state shards for {self.path}: {exc}"
+            ) from exc
+        if entry_changes and not root_changes:
+            self._log_transaction(
+                operation, True, {"shards": sorted(entry_changes)}
+            )
+
+    def _merge_root(
+        self, root_changes: List[Any], stamp: str, operation: str
+    ) -> None:
+        root: JsonDict = {}
+        if self.path.exists():
+            with open(self.path, "r", encoding="utf-8") as state_file:
+                root = json.load(state_file)
+        root = refresh_root(apply_root_changes(root, root_changes), stamp)
+        self._write_atomic(
+            root, validate=False, operation=operation, normalize=False
+        )
+
     def _write_atomic(
-        self, data: JsonDict, validate: bool = True, operation: str = "write"
+        self,
+        data: JsonDict,
+        validate: bool = True,
+        operation: str = "write",
+        normalize: bool = True,
     ) -> None:
         """Perform an atomic write with optional validation and backups."""
         if validate:
             self._ensure_phase_blocks_are_objects(data)
-        normalized = self._normalize_for_write(data)
+        normalized = self._normalize_for_write(data) if normalize else data
         if validate:
             self._validate_schema(normalized)
         else:
@@ -647,6 +799,7 @@ class StateTransaction:
         validate: Optional[bool] = None,
         seed_data: Optional[JsonDict] = None,
         operation: str = "transaction",
+        file_id: Optional[str] = None,
     ) -> None:
         self.state = state
         self.data: JsonDict = {}
@@ -656,13 +809,26 @@ class StateTransaction:
         self.validate_override = validate
         self.seed_data = seed_data
         self.operation = operation
+        self.file_id = file_id
+        self.layout: Optional[ShardLayout] = None
+
+    @property
+    def _scoped(self) -> bool:
+        return self.layout is not None and self.file_id is not None
 
     def __enter__(self) -> "StateTransaction":
-        self._lock_cm = self.state._file_lock()
+        self.layout = self.state.shard_layout()
+        if self._scoped:
+            self._lock_cm = self.state._file_lock(
+                lock_path=self.layout.lock_path(self.file_id)
+            )
+        else:
+            self._lock_cm = self.state._file_lock()
         self._lock_cm.__enter__()
         try:
             self.original_data = self.state.read(
-                validate=self.state.validate_on_read
+                validate=self.state.validate_on_read,
+                file_id=self.file_id if self._scoped else None,
             )
             if self.seed_data is not None:
                 seed_requires_validation = (
@@ -701,11 +867,14 @@ class StateTransaction:
                 else self.validate_override
             )
             commit_label = f"{self.operation}_commit"
-            self.state._write_atomic(
-                self.data,
-                validate=validate_flag,
-                operation=commit_label,
-            )
+            if self.layout is None:
+                self.state._write_atomic(
+                    self.data,
+                    validate=validate_flag,
+                    operation=commit_label,
+                )
+            else:
+                self._commit_sharded(validate_flag, commit_label)
             self.committed = True
             self.state._log_transaction(
                 commit_label,
@@ -735,6 +904,42 @@ class StateTransaction:
         finally:
             self._release_lock()
 
+    def _commit_sharded(self, validate: bool, commit_label: str) -> None:
+        entry_changes, root_changes = self.state._plan_sharded_commit(
+            self.data, self.original_data, validate
+        )
+        if not self._scoped:
+            self.state._commit_sharded(
+                self.layout,
+                entry_changes,
+                root_changes,
+                commit_label,
+                root_locked=True,
+            )
+            return
+        own = {
+            self.file_id: entry_changes.pop(self.file_id)
+        } if self.file_id in entry_changes else {}
+        self.state._commit_sharded(
+            self.layout,
+            own,
+            [],
+            commit_label,
+            held_file_id=self.file_id,
+        )
+        # Root (and any other book's) changes go out after our shard lock is
+        # released, keeping the root-then-shard lock order.
+        self._release_lock()
+        if entry_changes or root_changes:
+            with self.state._file_lock():
+                self.state._commit_sharded(
+                    self.layout,
+                    entry_changes,
+                    root_changes,
+                    commit_label,
+                    root_locked=True,
+                )
+
     def _get_changed_keys(self) -> List[str]:
         changed: List[str] = []
         for key in set(self.data.keys()) | set(self.original_data.keys()):
@@ -0,0 +1,342 @@
+"""Per-book sharding for ``pipeline.json``.
+
+A monolithic ``pipeline.json`` is rewritten in full (and locked globally) by
+every writer of every book, so a Phase 7 batch serialises all books on one
+file whose size grows with books x chunks.  In the sharded layout the
+per-book entries move out of the root document:
+
+    pipeline.json                                root index: metadata, batch_runs,
+                                                 phase status/metrics (files: {})
+    .pipeline/state/pipeline/layout.json         marks the state as sharded
+    .pipeline/state/pipeline/files/<book>.json   every phase<N>.files[<book>] entry
+    .pipeline/state/pipeline/files/<book>/<phase>.json   (per_phase layout)
+
+Each book has its own lock file, so ``PipelineState.transaction(file_id=...)``
+only contends with writers of the same book, and a commit rewrites just the
+shard(s) whose entries changed.  ``PipelineState.read()`` still returns the
+merged document; parsed shards are cached by mtime so only shards that
+changed since the last read are parsed again.
+
+Migrate an existing state (and back) with::
+
+    python -m pipeline_common.state_shards --pipeline pipeline.json [--per-phase]
+    python -m pipeline_common.state_shards --pipeline pipeline.json --unshard
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .schema import PHASE_KEYS
+
+JsonDict = Dict[str, Any]
+# {file_id: {phase_key: entry}}
+FileEntries = Dict[str, Dict[str, JsonDict]]
+# [(("phase4", "status"), "success"), (("batch_runs",), [...]), ...]
+RootChanges = List[Tuple[Tuple[str, ...], Any]]
+
+SHARD_ROOT = Path(".pipeline") / "state"
+LAYOUT_FILE = "layout.json"
+LAYOUT_VERSION = 1
+# Keys the root recomputes on every write; differences alone never force one.
+DERIVED_ROOT_KEYS = frozenset({"last_updated", "phases"})
+
+DELETED = object()
+_SAFE_NAME = re.compile(r"[^A-Za-z0-9._-]")
+
+
+@dataclass(frozen=True)
+class ShardLayout:
+    """Where the shards of one state file live and how they are split."""
+
+    directory: Path
+    per_phase: bool = False
+
+    @staticmethod
+    def directory_for(state_path: Path) -> Path:
+        return state_path.parent / SHARD_ROOT / state_path.stem
+
+    @classmethod
+    def load(cls, state_path: Path) -> Optional["ShardLayout"]:
+        directory = cls.directory_for(state_path)
+        try:
+            with open(directory / LAYOUT_FILE, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except FileNotFoundError:
+            return None
+        return cls(directory, per_phase=bool(payload.get("per_phase")))
+
+    def save(self) -> None:
+        write_json_atomic(
+            self.directory / LAYOUT_FILE,
+            {"version": LAYOUT_VERSION, "per_phase": self.per_phase},
+        )
+
+    @property
+    def files_dir(self) -> Path:
+        return self.directory / "files"
+
+    @staticmethod
+    def shard_name(file_id: str) -> str:
+        """Filesystem-safe, collision-free name for ``file_id``."""
+        name = _SAFE_NAME.sub("_", file_id)
+        if name != file_id or not name or name.startswith("."):
+            digest = hashlib.sha1(file_id.encode("utf-8")).hexdigest()[:8]
+            name = f"{name.lstrip('.')}-{digest}"
+        return name
+
+    def lock_path(self, file_id: str) -> Path:
+        return self.files_dir / f"{self.shard_name(file_id)}.lock"
+
+    def shard_path(self, file_id: str, phase_key: Optional[str] = None) -> Path:
+        name = self.shard_name(file_id)
+        if self.per_phase:
+            return self.files_dir / name / f"{phase_key}.json"
+        return self.files_dir / f"{name}.json"
+
+    def shard_files(self, file_id: Optional[str] = None) -> List[Path]:
+        """Existing shard files, for one book or all of them."""
+        if not self.files_dir.exists():
+            return []
+        if file_id is None:
+            pattern = "*/*.json" if self.per_phase else "*.json"
+            return sorted(self.files_dir.glob(pattern))
+        if self.per_phase:
+            return sorted((self.files_dir / self.shard_name(file_id)).glob("*.json"))
+        path = self.shard_path(file_id)
+        return [path] if path.exists() else []
+
+
+def now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def write_json_atomic(path: Path, payload: JsonDict) -> None:
+    """Temp file + fsync + ``os.replace`` in the target directory."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.parent / f"{path.name}.{os.getpid()}_{time.time_ns()}.tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle, indent=2, ensure_ascii=False)
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temp_path, path)
+    finally:
+        if temp_path.exists():
+            temp_path.unlink(missing_ok=True)
+
+
+def split_state(data: JsonDict) -> Tuple[JsonDict, FileEntries]:
+    """Separate per-book phase entries from the root document.
+
+    The returned structures share leaf objects with ``data``.
+    """
+    root = dict(data)
+    entries: FileEntries = {}
+    for phase_key in PHASE_KEYS:
+        block = data.get(phase_key)
+        if not isinstance(block, dict) or not isinstance(block.get("files"), dict):
+            continue
+        for file_id, entry in block["files"].items():
+            entries.setdefault(file_id, {})[phase_key] = entry
+        root[phase_key] = {**block, "files": {}}
+    return root, entries
+
+
+def merge_state(root: JsonDict, entries: FileEntries, updated_at: Iterable[str] = ()) -> JsonDict:
+    """Inverse of ``split_state``; entries win over any left in the root."""
+    merged = dict(root)
+    for file_id, phases in entries.items():
+        for phase_key, entry in phases.items():
+            block = merged.get(phase_key)
+            block = dict(block) if isinstance(block, dict) else {}
+            block["files"] = {**(block.get("files") or {}), file_id: entry}
+            merged[phase_key] = block
+    stamps = [s for s in (root.get("last_updated"), *updated_at) if isinstance(s, str)]
+    if stamps:
+        merged["last_updated"] = max(stamps)
+    return merged
+
+
+def diff_entries(old: FileEntries, new: FileEntries) -> Dict[str, Dict[str, Optional[JsonDict]]]:
+    """Changed entries per book; ``None`` marks a removed phase entry."""
+    changes: Dict[str, Dict[str, Optional[JsonDict]]] = {}
+    for file_id in set(old) | set(new):
+        before, after = old.get(file_id, {}), new.get(file_id, {})
+        changed = {
+            phase_key: after.get(phase_key)
+            for phase_key in set(before) | set(after)
+            if before.get(phase_key) != after.get(phase_key)
+        }
+        if changed:
+            changes[file_id] = changed
+    return changes
+
+
+def diff_root(old: JsonDict, new: JsonDict) -> RootChanges:
+    """Changed root keys; phase blocks are compared one level deeper."""
+    changes: RootChanges = []
+    for key in sorted(set(old) | set(new)):
+        if key in DERIVED_ROOT_KEYS:
+            continue
+        before, after = old.get(key, DELETED), new.get(key, DELETED)
+        if before == after:
+            continue
+        if key in PHASE_KEYS and isinstance(before, dict) and isinstance(after, dict):
+            for sub in sorted(set(before) | set(after)):
+                if sub != "files" and before.get(sub, DELETED) != after.get(sub, DELETED):
+                    changes.append(((key, sub), after.get(sub, DELETED)))
+        else:
+            changes.append(((key,), after))
+    return changes
+
+
+def apply_root_changes(root: JsonDict, changes: RootChanges) -> JsonDict:
+    for path, value in changes:
+        target = root
+        if len(path) == 2:
+            block = root.get(path[0])
+            target = root[path[0]] = dict(block) if isinstance(block, dict) else {}
+        if value is DELETED:
+            target.pop(path[-1], None)
+        else:
+            target[path[-1]] = value
+    return root
+
+
+def refresh_root(root: JsonDict, updated_at: str) -> JsonDict:
+    """Recompute the derived root keys without re-canonicalising the root.
+
+    The root's phase blocks have their ``files`` moved out, which the
+    canonicaliser would treat as a legacy layout to re-infer entries from.
+    """
+    root["last_updated"] = updated_at
+    root["phases"] = {
+        phase_key: root[phase_key]["status"]
+        for phase_key in PHASE_KEYS
+        if isinstance(root.get(phase_key), dict) and "status" in root[phase_key]
+    }
+    return root
+
+
+def read_shard(path: Path) -> JsonDict:
+    with open(path, "r", encoding="utf-8") as handle:
+        payload = json.load(handle)
+    if not isinstance(payload, dict) or not isinstance(payload.get("phases"), dict):
+        raise ValueError(f"{path} is not a state shard")
+    return payload
+
+
+def commit_shard(
+    layout: ShardLayout, file_id: str, changes: Dict[str, Optional[JsonDict]], updated_at: str
+) -> None:
+    """Apply one book's changed entries; the caller holds the book's lock."""
+    if layout.per_phase:
+        for phase_key, entry in changes.items():
+            path = layout.shard_path(file_id, phase_key)
+            if entry is None:
+                path.unlink(missing_ok=True)
+            else:
+                payload = {"file_id": file_id, "updated_at": updated_at, "phases": {phase_key: entry}}
+                write_json_atomic(path, payload)
+        return
+
+    path = layout.shard_path(file_id)
+    phases = read_shard(path)["phases"] if path.exists() else {}
+    for phase_key, entry in changes.items():
+        if entry is None:
+            phases.pop(phase_key, None)
+        else:
+            phases[phase_key] = entry
+    if phases:
+        write_json_atomic(path, {"file_id": file_id, "updated_at": updated_at, "phases": phases})
+    else:
+        path.unlink(missing_ok=True)
+
+
+def migrate_to_shards(path: Path | str, *, per_phase: bool = False) -> ShardLayout:
+    """Split a monolithic state file into a root index plus per-book shards.
+
+    Shards are written before the layout marker and the slimmed root, so an
+    interrupted migration leaves either the untouched monolithic file or a
+    sharded state whose root still duplicates some entries (shards win).
+    """
+    from .state_manager import PipelineState  # circular at import time
+
+    state = PipelineState(path, validate_on_read=False)
+    existing = ShardLayout.load(state.path)
+    if existing is not None:
+        return existing
+    layout = ShardLayout(ShardLayout.directory_for(state.path), per_phase=per_phase)
+    with state._file_lock():
+        data = state.read(validate=False)
+        root, entries = split_state(data)
+        stamp = now_iso()
+        for file_id, phases in entries.items():
+            commit_shard(layout, file_id, dict(phases), stamp)
+        layout.save()
+        if data:
+            state._write_atomic(
+                refresh_root(root, stamp), validate=False, operation="shard_migrate", normalize=False
+            )
+    state._log_transaction("shard_migrate", True, {"books": len(entries), "per_phase": per_phase})
+    return layout
+
+
+def unshard(path: Path | str) -> JsonDict:
+    """Fold the shards back into a monolithic state file."""
+    from .state_manager import PipelineState  # circular at import time
+
+    state = PipelineState(path, validate_on_read=False)
+    layout = ShardLayout.load(state.path)
+    if layout is None:
+        return state.read(validate=False)
+    with state._file_lock():
+        data = state.read(validate=False)
+        state._write_atomic(data, validate=False, operation="shard_unshard")
+        shutil.rmtree(layout.directory, ignore_errors=True)
+    state._log_transaction("shard_unshard", True)
+    return data
+
+
+def _cli() -> None:
+    parser = argparse.ArgumentParser(description="Shard pipeline.json into per-book state files.")
+    parser.add_argument(
+        "--pipeline",
+        type=Path,
+        default=Path("pipeline.json"),
+        help="Path to pipeline.json (default: ./pipeline.json)",
+    )
+    parser.add_argument(
+        "--per-phase",
+        action="store_true",
+        help="Write one shard per book and phase instead of one per book.",
+    )
+    parser.add_argument(
+        "--unshard",
+        action="store_true",
+        help="Merge the shards back into a single pipeline.json.",
+    )
+    args = parser.parse_args()
+
+    if args.unshard:
+        data = unshard(args.pipeline)
+        print(f"[UNSHARDED] {args.pipeline} ({len(split_state(data)[1])} books)")
+        return
+    layout = migrate_to_shards(args.pipeline, per_phase=args.per_phase)
+    books = len({p.parent.name if layout.per_phase else p.stem for p in layout.shard_files()})
+    print(f"[SHARDED] {args.pipeline} -> {layout.directory} ({books} books)")
+
+
+if __name__ == "__main__":  # pragma: no cover - CLI convenience
+    _cli()
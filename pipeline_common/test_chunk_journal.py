@@ -0,0 +1,84 @@
+"""Tests for the append-only chunk journals used to stream Phases 3-5."""
+
+import threading
+
+from pipeline_common import chunk_journal
+from pipeline_common.chunk_journal import ChunkJournal, journal_path
+
+
+def test_journal_lives_next_to_pipeline_json(tmp_path):
+    path = journal_path(tmp_path / "pipeline.json", "book", "phase3")
+    assert path == tmp_path / ".pipeline" / "stream" / "book" / "phase3.jsonl"
+
+
+def test_poll_returns_new_records_until_sealed(tmp_path):
+    journal = ChunkJournal(tmp_path / "phase4.jsonl")
+    journal.reset()
+    reader = journal.reader()
+    assert reader.poll() == [] and not reader.sealed
+
+    journal.append({"chunk_id": "chunk_0001", "audio_path": tmp_path / "chunk_0001.wav"})
+    journal.append({"chunk_id": "chunk_0002", "audio_path": "chunk_0002.wav"})
+    records = reader.poll()
+    assert [r["chunk_id"] for r in records] == ["chunk_0001", "chunk_0002"]
+    assert records[0]["audio_path"] == str(tmp_path / "chunk_0001.wav")
+    assert reader.poll() == []
+
+    journal.seal(total=2)
+    assert reader.poll() == []
+    assert reader.sealed and not reader.failed and reader.total == 2
+
+
+def test_torn_lines_wait_and_duplicates_are_dropped(tmp_path):
+    journal = ChunkJournal(tmp_path / "phase3.jsonl")
+    journal.reset()
+    reader = journal.reader()
+
+    journal.append({"chunk_id": "chunk_0001", "index": 0})
+    with journal.path.open("ab") as handle:
+        handle.write(b'{"chunk_id": "chunk_0002", "in')  # producer mid-write
+    assert [r["chunk_id"] for r in reader.poll()] == ["chunk_0001"]
+
+    with journal.path.open("ab") as handle:
+        handle.write(b'dex": 1}\n')
+    journal.append({"chunk_id": "chunk_0001", "index": 0})  # resumed producer repeats itself
+    journal.seal("failed")
+    assert reader.poll() == [{"chunk_id": "chunk_0002", "index": 1}]
+    assert reader.failed
+
+
+def test_follow_streams_while_the_producer_writes(tmp_path):
+    journal = ChunkJournal(tmp_path / "phase3.jsonl")
+    journal.reset()
+
+    def produce():
+        for index in range(50):
+            journal.append({"chunk_id": f"chunk_{index + 1:04d}", "index": index})
+        journal.seal(total=50)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    seen = [record["index"] for record in journal.reader().follow(interval=0.01, timeout=10)]
+    producer.join()
+    assert seen == list(range(50))
+
+
+def test_streaming_enabled_reads_the_env(monkeypatch):
+    monkeypatch.delenv(chunk_journal.STREAM_ENV, raising=False)
+    assert not chunk_journal.streaming_enabled()
+    monkeypatch.setenv(chunk_journal.STREAM_ENV, "1")
+    assert chunk_journal.streaming_enabled()
+    monkeypatch.setenv(chunk_journal.STREAM_ENV, "off")
+    assert not chunk_journal.streaming_enabled()
+
+
+def test_plan_line_is_exposed_not_returned(tmp_path):
+    journal = ChunkJournal(tmp_path / "phase3.jsonl")
+    journal.reset()
+    reader = journal.reader()
+    assert reader.plan is None
+
+    journal.write_plan(chunks=2, total_chars=1200, voice="alloy")
+    journal.append({"chunk_id": "chunk_0001", "index": 0})
+    assert [r["chunk_id"] for r in reader.poll()] == ["chunk_0001"]
+    assert reader.plan == {"chunks": 2, "total_chars": 1200, "voice": "alloy"}
@@ -0,0 +1,99 @@
+"""Tests for the stat-keyed fingerprint index."""
+
+import hashlib
+import os
+
+from pipeline_common import fingerprint
+from pipeline_common.fingerprint import FingerprintIndex
+
+
+def _settled(path, payload, age=60):
+    """Write ``payload`` with an mtime old enough to be persisted."""
+    path.write_bytes(payload)
+    stamp = path.stat().st_mtime - age
+    os.utime(path, (stamp, stamp))
+    return path
+
+
+def _count_reads(monkeypatch):
+    reads = []
+    original = fingerprint._hash_file
+
+    def _hash(path, *args, **kwargs):
+        reads.append(path)
+        return original(path, *args, **kwargs)
+
+    monkeypatch.setattr(fingerprint, "_hash_file", _hash)
+    return reads
+
+
+def test_unchanged_file_is_not_reread(tmp_path, monkeypatch):
+    book = _settled(tmp_path / "book.pdf", b"%PDF-1.4 scanned pages")
+    reads = _count_reads(monkeypatch)
+
+    digest = FingerprintIndex(tmp_path / "idx").sha256(book)
+    FingerprintIndex(tmp_path / "idx").flush()
+    assert digest == hashlib.sha256(book.read_bytes()).hexdigest()
+
+    # A fresh index (a re-launched orchestrator) answers from disk
+    assert FingerprintIndex(tmp_path / "idx").sha256(book) == digest
+    assert len(reads) == 1
+
+    _settled(book, b"%PDF-1.4 rescanned pages", age=30)
+    assert FingerprintIndex(tmp_path / "idx").sha256(book) != digest
+    assert len(reads) == 2
+
+
+def test_recently_modified_files_are_not_persisted(tmp_path):
+    fresh = tmp_path / "fresh.txt"
+    fresh.write_bytes(b"just written")
+    index = FingerprintIndex(tmp_path / "idx")
+    index.sha256(fresh)
+    index.flush()
+
+    assert index.cached(fingerprint.stat_key(fresh))  # still memoised in-process
+    assert not FingerprintIndex(tmp_path / "idx").cached(fingerprint.stat_key(fresh))
+
+
+def test_bulk_hashes_only_uncached_files(tmp_path, monkeypatch):
+    chunks = tmp_path / "chunks"
+    chunks.mkdir()
+    for i in range(12):
+        _settled(chunks / f"chunk_{i:04d}.txt", f"chunk {i}".encode())
+    reads = _count_reads(monkeypatch)
+    index = FingerprintIndex(tmp_path / "idx")
+
+    first = index.directory_sha256(chunks, "*.txt", workers=4)
+    assert len(first) == 12 and len(reads) == 12
+    assert first[str(chunks / "chunk_0003.txt")] == hashlib.sha256(b"chunk 3").hexdigest()
+
+    _settled(chunks / "chunk_0003.txt", b"edited chunk", age=30)
+    again = FingerprintIndex(tmp_path / "idx").bulk_sha256(
+        [*sorted(chunks.glob("*.txt")), tmp_path / "missing.txt"], workers=4
+    )
+    assert len(reads) == 13
+    assert len(again) == 12
+
+
+def test_concat_matches_concatenated_bytes_and_is_cached(tmp_path, monkeypatch):
+    paths = [_settled(tmp_path / f"c{i}.txt", f"text {i}\n".encode()) for i in range(5)]
+    names = [str(path) for path in paths] + [str(tmp_path / "gone.txt")]
+    expected = hashlib.sha256(b"".join(path.read_bytes() for path in paths)).hexdigest()
+
+    assert FingerprintIndex(tmp_path / "idx").concat_sha256(names, workers=2) == expected
+
+    monkeypatch.setattr(fingerprint.Path, "read_bytes", lambda self: (_ for _ in ()).throw(AssertionError))
+    assert FingerprintIndex(tmp_path / "idx").concat_sha256(names) == expected
+    # The per-file digests were recorded on the way
+    assert FingerprintIndex(tmp_path / "idx").cached(fingerprint.stat_key(paths[0])) == (
+        hashlib.sha256(b"text 0\n").hexdigest()
+    )
+
+
+def test_from_env_can_disable(monkeypatch, tmp_path):
+    monkeypatch.setenv("PIPELINE_FINGERPRINT_CACHE", "off")
+    index = FingerprintIndex.from_env()
+    assert index.index_path is None
+    index.sha256(_settled(tmp_path / "a.bin", b"abc"))
+    index.flush()
+    assert not list(tmp_path.glob("**/index.json"))
@@ -0,0 +1,67 @@
+"""Tests for single-pass keyword scoring and the genre result cache."""
+
+import re
+
+from pipeline_common import keyword_scorer
+from pipeline_common.keyword_scorer import KeywordScorer, ResultCache, sample_windows, text_digest
+
+
+def test_single_words_match_whole_word_regex_counts():
+    text = "Reason, REASON and reasoning; the reason-giver. Logic? logical logic."
+    scorer = KeywordScorer({"philosophy": ["reason", "logic"]})
+    expected = sum(
+        len(re.findall(rf"\b{word}\b", text, re.IGNORECASE)) for word in ("reason", "logic")
+    )
+    assert scorer.score(text) == {"philosophy": expected} == {"philosophy": 5}
+
+
+def test_phrases_match_through_the_automaton_including_overlaps():
+    scorer = KeywordScorer(
+        {
+            "memoir": ["when I was", "looking back", "I was young"],
+            "misc": ["was young", "back"],
+        }
+    )
+    text = "Looking back, when I was young -- when  I was YOUNG, I looked back."
+    hits = scorer.term_counts(text)
+
+    assert hits["looking back"] == 1
+    assert hits["when i was"] == 2
+    assert hits["i was young"] == 2  # overlaps "when I was"
+    assert hits["was young"] == 2  # suffix of another phrase, found via failure links
+    assert hits["back"] == 2
+    assert scorer.score(text) == {"memoir": 5, "misc": 4}
+
+
+def test_sample_windows_bounds_long_texts():
+    short = "word " * 100
+    assert sample_windows(short, limit=1000) == short
+
+    text = " ".join(f"w{i}" for i in range(50_000))
+    sample = sample_windows(text, limit=10_000, windows=8)
+    tokens = sample.split()
+    assert len(sample) <= 10_000 + 8
+    assert tokens[0] == "w0" and "w49999" in tokens[-1]
+    assert all(re.fullmatch(r"w\d+", token) for token in tokens)  # no cut tokens
+
+
+def test_result_cache_round_trips_through_disk(tmp_path):
+    digest = text_digest("some book text", "title", "v1")
+    assert digest != text_digest("some book text", "title", "v2")
+
+    ResultCache(tmp_path).put("detect", digest, ["fiction", 0.8, {"fiction": 0.8}])
+    assert ResultCache(tmp_path).get("detect", digest) == ["fiction", 0.8, {"fiction": 0.8}]
+    assert ResultCache(tmp_path).get("other", digest) is None
+
+
+def test_cached_result_computes_once(tmp_path, monkeypatch):
+    monkeypatch.setattr(keyword_scorer, "_DEFAULT", ResultCache(tmp_path))
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"science": 1.0}
+
+    for _ in range(3):
+        assert keyword_scorer.cached_result("genre", "abc", compute) == {"science": 1.0}
+    assert len(calls) == 1
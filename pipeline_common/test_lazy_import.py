@@ -0,0 +1,50 @@
+"""Tests for deferred imports and the startup profiler."""
+
+import sys
+
+import pytest
+
+from pipeline_common import startup_profile
+from pipeline_common.lazy_import import LazyModule, is_loaded, lazy_module, optional_import
+
+
+def test_lazy_module_imports_on_first_attribute(monkeypatch):
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    module = lazy_module("colorsys")
+
+    assert isinstance(module, LazyModule) and not is_loaded(module)
+    assert "colorsys" not in sys.modules
+    assert module.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
+    assert is_loaded(module) and "colorsys" in sys.modules
+
+
+def test_lazy_module_returns_loaded_modules_and_rejects_missing():
+    assert lazy_module("json") is sys.modules["json"]
+    with pytest.raises(ImportError):
+        lazy_module("definitely_not_installed_pkg")
+
+
+def test_optional_import_returns_none_when_unavailable():
+    assert optional_import("definitely_not_installed_pkg", "Thing") is None
+    assert optional_import("json", "dumps") is sys.modules["json"].dumps
+
+
+def test_startup_report_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setenv(startup_profile.DIR_ENV, str(tmp_path))
+    monkeypatch.delenv(startup_profile.ENABLE_ENV, raising=False)
+    monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+    monkeypatch.setattr(startup_profile, "_TIMER", None)
+    monkeypatch.setattr(startup_profile.atexit, "register", lambda *args: None)
+
+    assert startup_profile.enable_if_requested("unit", argv=[]) is None
+    report = startup_profile.enable_if_requested("unit", argv=["--profile-startup"])
+    try:
+        import colorsys  # noqa: F401
+    finally:
+        sys.meta_path.remove(startup_profile._TIMER)
+    startup_profile._write_report(report, "unit", len(sys.modules), 0.0)
+
+    records = startup_profile.read_report(report)
+    assert report.parent == tmp_path
+    assert [name for _, name, _, _ in records] == ["colorsys"]
+    assert records[0][0] == 0 and records[0][3] >= records[0][2] >= 0
@@ -0,0 +1,80 @@
+"""Tests for the fused float32 gain-staging chain."""
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from pipeline_common.loudness import (  # noqa: E402
+    CompressorSettings,
+    analyze,
+    gate_in_place,
+    linear_to_db,
+    master_in_place,
+)
+
+SR = 48000
+
+
+def _tone(seconds: float = 2.0, amplitude: float = 0.3, freq: float = 220.0) -> "np.ndarray":
+    t = np.arange(int(SR * seconds)) / SR
+    return (amplitude * np.sin(2 * np.pi * freq * t)).astype(np.float32)
+
+
+def test_peak_normalization_hits_headroom_in_place():
+    audio = _tone(amplitude=0.2)
+    result = master_in_place(audio, SR, peak_headroom_db=0.1)
+
+    assert result.audio is audio  # contiguous float32 is processed in place
+    assert linear_to_db(float(np.max(np.abs(audio)))) == pytest.approx(-0.1, abs=1e-3)
+    assert result.output.rms == pytest.approx(float(np.sqrt(np.mean(audio.astype(np.float64) ** 2))), rel=1e-4)
+
+
+def test_derived_output_metrics_match_remeasurement():
+    audio = _tone(amplitude=0.05)
+    result = master_in_place(audio, SR, target_lufs=-20.0, ceiling_db=-3.0)
+    remeasured = analyze(result.audio, SR)
+
+    assert result.output.lufs == pytest.approx(remeasured.lufs, abs=0.05)
+    assert result.output.rms_db == pytest.approx(remeasured.rms_db, abs=0.01)
+    assert result.output.true_peak_db == pytest.approx(remeasured.true_peak_db, abs=0.01)
+
+
+def test_ceiling_limits_true_peak():
+    audio = _tone(amplitude=0.1)
+    result = master_in_place(audio, SR, target_lufs=-6.0, ceiling_db=-3.0)
+
+    assert result.limiter_db < 0.0
+    assert analyze(result.audio, SR).true_peak_db <= -3.0 + 1e-3
+
+
+def test_compressor_reduces_crest_of_loud_passages():
+    quiet = _tone(seconds=1.0, amplitude=0.02)
+    loud = _tone(seconds=1.0, amplitude=0.5)
+    audio = np.concatenate([quiet, loud])
+    result = master_in_place(audio, SR, compressor=CompressorSettings(threshold_db=-24.0, ratio=4.0))
+
+    assert result.compression_db > 0.0
+    quiet_rms = float(np.sqrt(np.mean(result.audio[: SR // 2] ** 2)))
+    loud_rms = float(np.sqrt(np.mean(result.audio[-SR // 2 :] ** 2)))
+    assert loud_rms / quiet_rms < 0.5 / 0.02
+
+
+def test_silence_is_left_untouched():
+    audio = np.zeros(SR, dtype=np.float32)
+    result = master_in_place(audio, SR, target_lufs=-20.0, ceiling_db=-1.0)
+
+    assert result.gain_db == 0.0
+    assert not np.any(result.audio)
+    assert math.isinf(result.output.lufs)
+
+
+def test_gate_attenuates_quiet_regions_only():
+    audio = _tone(seconds=1.0, amplitude=0.3)
+    audio[: SR // 4] *= 1e-4
+    before = audio[SR // 2 : SR // 2 + 1024].copy()
+    gate_in_place(audio, threshold_db=-50.0, reduction_db=-20.0)
+
+    assert np.max(np.abs(audio[: SR // 8])) < 0.3 * 1e-4
+    np.testing.assert_array_equal(audio[SR // 2 : SR // 2 + 1024], before)
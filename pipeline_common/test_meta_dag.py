@@ -0,0 +1,157 @@
+"""Tests for the post-run meta phase DAG."""
+
+import copy
+import threading
+import time
+
+import pytest
+
+from pipeline_common.meta_dag import MetaContext, MetaPhase, RecordStore, build_graph, input_fingerprint, run_meta_phases
+
+
+def _writer(path, text="report", calls=None):
+    def run(ctx):
+        if calls is not None:
+            calls.append(ctx.name)
+        path.mkdir(parents=True, exist_ok=True)
+        (path / "latest.json").write_text(text, encoding="utf-8")
+        return {"wrote": ctx.name}
+
+    return run
+
+
+def test_graph_follows_needs_and_path_overlaps():
+    phases = [
+        MetaPhase("research", lambda ctx: None, writes=(".pipeline/research",)),
+        MetaPhase("review", lambda ctx: None, writes=(".pipeline/review/reports",)),
+        MetaPhase("retro", lambda ctx: None, reads=(".pipeline/research/observations",), writes=(".pipeline/retro",)),
+        MetaPhase("reflect", lambda ctx: None, needs=("review",)),
+        MetaPhase("cleanup", lambda ctx: None, writes=(".pipeline",)),
+    ]
+    assert build_graph(phases) == {
+        "research": set(),
+        "review": set(),
+        "retro": {"research"},
+        "reflect": {"review"},
+        "cleanup": {"research", "review", "retro"},
+    }
+    with pytest.raises(ValueError):
+        build_graph([MetaPhase("a", lambda ctx: None, needs=("b",)), MetaPhase("b", lambda ctx: None)])
+
+
+def test_independent_phases_run_concurrently(tmp_path):
+    barrier = threading.Barrier(3, timeout=5)
+
+    def run(ctx):
+        barrier.wait()  # deadlocks (BrokenBarrierError) unless all three overlap
+        return ctx.name
+
+    phases = [MetaPhase(name, run, writes=(str(tmp_path / name),)) for name in ("q", "s", "t")]
+    report = run_meta_phases(phases, {}, workers=3)
+    assert {name: entry["status"] for name, entry in report.phases.items()} == dict.fromkeys("qst", "ran")
+
+
+def test_conflicting_writers_keep_list_order(tmp_path):
+    order = []
+
+    def run(ctx):
+        order.append(ctx.name)
+        time.sleep(0.01)
+
+    shared = str(tmp_path / "meta" / "reports")
+    phases = [MetaPhase(name, run, writes=(shared,)) for name in ("x", "z")]
+    run_meta_phases(phases, {}, workers=4)
+    assert order == ["x", "z"]
+
+
+def test_unchanged_inputs_skip_and_changes_rerun(tmp_path):
+    source, out = tmp_path / "policy_logs", tmp_path / "reports"
+    source.mkdir()
+    (source / "run1.json").write_text("{}", encoding="utf-8")
+    calls = []
+    phases = [MetaPhase("retro", _writer(out, calls=calls), reads=(str(source),), writes=(str(out),), summary_keys=("phase4",))]
+    store = RecordStore(tmp_path / "records")
+    summary = {"phase4": {"chunks": 3}, "elapsed": 1.0}
+
+    assert run_meta_phases(phases, summary, store=store).phases["retro"]["status"] == "ran"
+    report = run_meta_phases(phases, {**summary, "elapsed": 9.0}, store=store)  # undeclared key
+    assert report.phases["retro"]["status"] == "skipped"
+    assert calls == ["retro"]
+
+    (source / "run2.json").write_text("{}", encoding="utf-8")
+    assert run_meta_phases(phases, summary, store=store).phases["retro"]["status"] == "ran"
+    assert run_meta_phases(phases, {"phase4": {"chunks": 4}}, store=store).phases["retro"]["status"] == "ran"
+
+    (out / "latest.json").unlink()
+    out.rmdir()
+    assert run_meta_phases(phases, {"phase4": {"chunks": 4}}, store=store).phases["retro"]["status"] == "ran"
+    assert calls == ["retro"] * 4
+
+
+def test_skipped_phase_hands_its_recorded_result_on(tmp_path):
+    seen = []
+    phases = [
+        MetaPhase("research", _writer(tmp_path / "research"), writes=(str(tmp_path / "research"),)),
+        MetaPhase("reflect", lambda ctx: seen.append(ctx.results["research"]), needs=("research",), cacheable=False),
+    ]
+    store = RecordStore(tmp_path / "records")
+    run_meta_phases(phases, {}, store=store)
+    report = run_meta_phases(phases, {}, store=store)
+    assert report.phases["research"]["status"] == "skipped"
+    assert seen == [{"wrote": "research"}] * 2
+
+
+def test_failure_blocks_only_dependents(tmp_path):
+    def explode(ctx):
+        raise RuntimeError("no signals")
+
+    phases = [
+        MetaPhase("research", explode),
+        MetaPhase("reflect", lambda ctx: None, needs=("research",)),
+        MetaPhase("audit", lambda ctx: "ok", writes=(str(tmp_path / "audit"),)),
+    ]
+    report = run_meta_phases(phases, {})
+    assert report.phases["research"] == {"status": "failed", "error": "RuntimeError: no signals", "duration": pytest.approx(0, abs=1)}
+    assert report.phases["reflect"]["status"] == "blocked"
+    assert report.phases["audit"]["status"] == "ran"
+    assert "1 ran, 0 skipped, 2 failed/blocked" in report.summary_line()
+
+
+def test_phases_see_read_only_copies_of_declared_inputs():
+    seen = {}
+
+    def run(ctx):
+        seen[ctx.name] = copy.deepcopy((dict(ctx.summary), dict(ctx.state)))
+        with pytest.raises(TypeError):
+            ctx.summary["phase4"] = None
+        ctx.summary["phase4"]["chunks"] = 99  # nested values are private copies
+
+    summary = {"phase4": {"chunks": 3}, "elapsed": 1.0}
+    state = {"phase4": {"status": "success"}}
+    phases = [
+        MetaPhase("a", run, summary_keys=("phase4", "absent")),
+        MetaPhase("b", run, summary_keys=("phase4",), uses_state=True),
+    ]
+    run_meta_phases(phases, summary, state, workers=1)
+    assert seen["a"] == ({"phase4": {"chunks": 3}}, {})
+    assert seen["b"] == ({"phase4": {"chunks": 3}}, state)
+    assert summary["phase4"]["chunks"] == 3
+
+
+def test_model_params_fingerprint_by_value():
+    class Config:
+        def __init__(self, value):
+            self.value = value
+
+        def model_dump(self, mode="python"):
+            return {"value": self.value}
+
+        def __repr__(self):  # differs per instance, like many object reprs
+            return f"<Config at {id(self):#x}>"
+
+    def fingerprint(params):
+        phase = MetaPhase("policy", lambda ctx: None, params=params)
+        return input_fingerprint(phase, MetaContext("policy", {}, {}))
+
+    assert fingerprint(Config(1)) == fingerprint(Config(1)) != fingerprint(Config(2))
+    assert fingerprint({"b": 1, "a": {2, 1}}) == fingerprint({"a": {1, 2}, "b": 1})
@@ -0,0 +1,116 @@
+"""Tests for the shared per-page PDF artifact cache."""
+
+import pytest
+
+fitz = pytest.importorskip("pymupdf")
+
+from pipeline_common import pdf_page_cache  # noqa: E402
+from pipeline_common.pdf_page_cache import PdfPageCache, file_sha256, prune_store  # noqa: E402
+
+
+@pytest.fixture
+def sample_pdf(tmp_path):
+    path = tmp_path / "sample.pdf"
+    doc = fitz.open()
+    for index in range(3):
+        page = doc.new_page(width=400, height=600)
+        page.insert_text((72, 72), f"Chapter {index + 1}", fontsize=20)
+        page.insert_text((72, 120), f"Body text on page {index + 1}.", fontsize=11)
+    doc.set_toc([[1, "Chapter 1", 1], [1, "Chapter 2", 2]])
+    doc.save(str(path))
+    doc.close()
+    return path
+
+
+def test_single_pass_fills_text_spans_and_stats(sample_pdf, tmp_path):
+    cache = PdfPageCache(sample_pdf, root=tmp_path / "cache")
+
+    texts = cache.texts("pymupdf")
+    spans = cache.spans()
+    stats = cache.page_stats()
+
+    assert len(texts) == 3 and "Body text on page 2." in texts[1]
+    assert [span[0] for span in spans[0]] == ["Chapter 1", "Body text on page 1."]
+    assert spans[0][0][1] > spans[0][1][1]
+    assert stats[2] == {"width": 400.0, "height": 600.0}
+    assert cache.toc() == [[1, "Chapter 1", 1], [1, "Chapter 2", 2]]
+    assert cache.parses["pymupdf"] == 1
+
+
+def test_rerun_against_persisted_cache_parses_nothing(sample_pdf, tmp_path):
+    root = tmp_path / "cache"
+    sha = file_sha256(sample_pdf)
+    first = PdfPageCache(sample_pdf, sha256=sha, root=root)
+    expected = (first.texts("pymupdf"), first.texts("pypdf"), first.spans(), first.metadata())
+
+    second = PdfPageCache(sample_pdf, sha256=sha, root=root)
+    assert (second.texts("pymupdf"), second.texts("pypdf"), second.spans(), second.metadata()) == expected
+    assert second.parses == {}
+
+
+def test_partial_pages_are_filled_incrementally(sample_pdf, tmp_path):
+    cache = PdfPageCache(sample_pdf, persist=False)
+
+    assert cache.texts("pypdf", [1]) == [cache.page_text("pypdf", 1)]
+    assert cache.parses == {"pymupdf_doc": 1, "pypdf": 1}
+    cache.texts("pypdf")
+    cache.texts("pypdf")
+    assert cache.parses["pypdf"] == 2  # second call only parsed pages 0 and 2
+
+
+def test_parallel_pass_reassembles_pages_in_order(tmp_path):
+    path = tmp_path / "long.pdf"
+    doc = fitz.open()
+    for index in range(60):
+        doc.new_page().insert_text((72, 72), f"Page number {index}", fontsize=11)
+    doc.save(str(path))
+    doc.close()
+
+    serial = PdfPageCache(path, persist=False).texts("pymupdf")
+    parallel_cache = PdfPageCache(path, persist=False)
+    parallel = parallel_cache.texts("pymupdf", workers=3)
+
+    assert parallel == serial
+    assert parallel_cache.parses["pymupdf"] == 3
+    assert len(parallel_cache.spans()) == 60 and parallel_cache.parses["pymupdf"] == 3
+
+
+def test_opener_replaces_pymupdf_open(sample_pdf):
+    opened = []
+
+    def opener(path):
+        opened.append(path)
+        return fitz.open(path)
+
+    cache = PdfPageCache(sample_pdf, persist=False, opener=opener)
+    assert "Body text on page 1." in cache.texts("pymupdf")[0]
+    assert opened == [str(sample_pdf)] * 2  # doc info, then the page walk
+
+
+def test_registry_keeps_recent_documents(sample_pdf, monkeypatch):
+    monkeypatch.setenv(pdf_page_cache.CACHE_ENV, "off")
+    monkeypatch.setattr(pdf_page_cache, "REGISTRY_SIZE", 2)
+    monkeypatch.setattr(pdf_page_cache, "_REGISTRY", pdf_page_cache.OrderedDict())
+    first = PdfPageCache.for_file(sample_pdf, "a" * 64)
+    PdfPageCache.for_file(sample_pdf, "b" * 64)
+    assert PdfPageCache.for_file(sample_pdf, "a" * 64) is first
+    PdfPageCache.for_file(sample_pdf, "c" * 64)
+    assert list(pdf_page_cache._REGISTRY) == ["a" * 64, "c" * 64]
+
+
+def test_store_is_pruned_least_recently_used_first(sample_pdf, tmp_path):
+    import os
+
+    root = tmp_path / "cache"
+    for age, digest in enumerate(["11" * 32, "22" * 32]):
+        doc_dir = root / digest[:2] / digest
+        doc_dir.mkdir(parents=True)
+        (doc_dir / "text.pypdf.json").write_bytes(b"x" * 1000)
+        os.utime(doc_dir, (1000 + age, 1000 + age))
+
+    cache = PdfPageCache(sample_pdf, root=root, max_bytes=1500)
+    cache.texts("pypdf")
+    assert not (root / "11").exists() or not any((root / "11").iterdir())
+    assert (root / "22" / ("22" * 32)).exists()
+    assert (cache.cache_dir / "text.pypdf.json").exists()
+    assert prune_store(root, 0) == []  # zero disables the cap
@@ -0,0 +1,126 @@
+"""Tests for in-process phase execution and venv fingerprints."""
+
+import logging
+import os
+import sys
+from importlib import metadata
+
+import pytest
+
+from pipeline_common import phase_runner
+from pipeline_common.phase_runner import (
+    InProcessRunner,
+    PhaseEntry,
+    dependency_conflicts,
+    phase_argv,
+    record_venv_fingerprint,
+    venv_is_current,
+)
+
+FAKE_PHASE = '''
+import logging, os, sys
+IMPORTS = globals().get("IMPORTS", 0) + 1
+CALLS = []
+
+def main(argv):
+    CALLS.append((list(argv), os.getcwd()))
+    logging.getLogger().addHandler(logging.FileHandler("phase.log"))
+    if "--exit=3" in argv:
+        logging.getLogger("fake").error("chunk 7 is empty")
+        sys.exit(3)
+    if "--crash" in argv:
+        raise RuntimeError("model exploded")
+'''
+
+
+@pytest.fixture
+def fake_phase(tmp_path):
+    package = tmp_path / "fake_phase" / "src" / "fake_phase_pkg"
+    package.mkdir(parents=True)
+    (package / "__init__.py").write_text("", encoding="utf-8")
+    (package / "entry.py").write_text(FAKE_PHASE, encoding="utf-8")
+    yield tmp_path / "fake_phase"
+    sys.path[:] = [p for p in sys.path if not p.startswith(str(tmp_path))]
+    for name in ("fake_phase_pkg", "fake_phase_pkg.entry"):
+        sys.modules.pop(name, None)
+
+
+def _runner(extra=()):
+    return InProcessRunner(
+        {9: PhaseEntry("fake_phase_pkg.entry", "main", lambda file_id, pj, cfg: [f"--file_id={file_id}", *extra])}
+    )
+
+
+def test_fingerprint_tracks_the_lock_file(tmp_path):
+    (tmp_path / "poetry.lock").write_text("a", encoding="utf-8")
+    assert not venv_is_current(tmp_path)
+    record_venv_fingerprint(tmp_path)  # no .venv yet: nothing recorded
+    assert not venv_is_current(tmp_path)
+
+    (tmp_path / ".venv").mkdir()
+    record_venv_fingerprint(tmp_path)
+    assert venv_is_current(tmp_path)
+    (tmp_path / "poetry.lock").write_text("b", encoding="utf-8")
+    assert not venv_is_current(tmp_path)
+
+
+def test_dependency_conflicts_compare_runtime_packages(tmp_path):
+    pytest_version = metadata.version("pytest")
+    lock = f"""
+[[package]]
+name = "pytest"
+version = "{pytest_version}"
+groups = ["main"]
+
+[[package]]
+name = "surely-not-installed-pkg"
+version = "1.0"
+groups = ["dev"]
+
+[[package]]
+name = "windows-only-pkg"
+version = "1.0"
+groups = ["main"]
+markers = "sys_platform == 'win32'"
+"""
+    (tmp_path / "poetry.lock").write_text(lock, encoding="utf-8")
+    assert dependency_conflicts(tmp_path) == []
+
+    (tmp_path / "poetry.lock").write_text(lock.replace('groups = ["dev"]', 'groups = ["main"]'), encoding="utf-8")
+    assert dependency_conflicts(tmp_path) == ["surely-not-installed-pkg not installed (locked 1.0)"]
+
+
+def test_phase_argv_matches_the_cli(tmp_path):
+    argv = phase_argv(3, "book", tmp_path / "pipeline.json", {"config": "c.yaml", "voice": None})
+    assert argv == ["--file_id=book", f"--json_path={tmp_path / 'pipeline.json'}", "--config=c.yaml"]
+    assert phase_argv(5, "book", "pipeline.json") == ["--config=config.yaml"]
+
+
+def test_runner_keeps_the_phase_warm_and_restores_process_state(fake_phase):
+    runner = _runner()
+    cwd, argv, handlers = os.getcwd(), sys.argv, list(logging.getLogger().handlers)
+
+    first = runner.run(9, fake_phase, "book", "pipeline.json")
+    second = runner.run(9, fake_phase, "book", "pipeline.json")
+
+    assert first["success"] and first["exit_code"] == 0 and not first["warm"]
+    assert second["success"] and second["warm"] and second["mode"] == "in_process"
+    module = sys.modules["fake_phase_pkg.entry"]
+    assert module.IMPORTS == 1
+    assert module.CALLS == [(["--file_id=book"], str(fake_phase.resolve()))] * 2
+    assert (os.getcwd(), sys.argv, logging.getLogger().handlers) == (cwd, argv, handlers)
+
+
+def test_runner_reports_exit_codes_and_exceptions(fake_phase):
+    exited = _runner(["--exit=3"]).run(9, fake_phase, "book", "pipeline.json")
+    assert not exited["success"] and exited["exit_code"] == 3
+    assert "chunk 7 is empty" in exited["error"]
+
+    crashed = _runner(["--crash"]).run(9, fake_phase, "book", "pipeline.json")
+    assert not crashed["success"] and crashed["exit_code"] == 1
+    assert "RuntimeError: model exploded" in crashed["error"]
+
+
+def test_default_runner_is_shared(monkeypatch):
+    monkeypatch.setattr(phase_runner, "_DEFAULT", None)
+    assert phase_runner.default_runner() is phase_runner.default_runner()
@@ -0,0 +1,107 @@
+"""Tests for the cached, parallel preflight service."""
+
+import threading
+import time
+
+from pipeline_common.preflight import PreflightCheck, PreflightService
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _counting(result=None, delay=0.0):
+    calls = []
+
+    def run():
+        calls.append(threading.current_thread().name)
+        time.sleep(delay)
+        return dict(result or {"ok": True})
+
+    return run, calls
+
+
+def test_checks_run_in_parallel_once(tmp_path):
+    runs = {name: _counting(delay=0.2) for name in ("a", "b", "c")}
+    service = PreflightService(
+        [PreflightCheck(name, run) for name, (run, _) in runs.items()], cache_path=tmp_path / "c.json"
+    )
+    started = time.perf_counter()
+    outcomes = service.run_all()
+    assert time.perf_counter() - started < 0.5
+    assert all(outcome.ok and outcome.source == "run" for outcome in outcomes.values())
+
+    assert service.get("a").source == "memory"
+    assert [len(calls) for _, calls in runs.values()] == [1, 1, 1]
+    summary = service.summary()
+    assert summary["over_budget"] == [] and set(summary["results"]) == {"a", "b", "c"}
+
+
+def test_disk_cache_is_shared_until_ttl_or_inputs_change(tmp_path):
+    lock = tmp_path / "poetry.lock"
+    lock.write_text("a = 1\n")
+    clock = _Clock()
+    run, calls = _counting({"ok": True, "conflicts": []})
+
+    def service():
+        check = PreflightCheck("deps", run, inputs=[lock], ttl=60)
+        return PreflightService([check], cache_path=tmp_path / "c.json", clock=clock)
+
+    assert service().result("deps") == {"ok": True, "conflicts": []}
+    assert service().get("deps").source == "disk"  # another orchestrator process
+    assert len(calls) == 1
+
+    clock.now += 61
+    service().get("deps")
+    assert len(calls) == 2
+
+    lock.write_text("a = 2  # relocked\n")
+    assert service().get("deps").source == "run"
+    assert len(calls) == 3
+
+
+def test_failures_expire_sooner_and_errors_are_captured(tmp_path):
+    clock = _Clock()
+    down, calls = _counting({"ok": False, "message": "server down"})
+
+    def boom():
+        raise RuntimeError("no conda")
+
+    service = PreflightService(
+        [PreflightCheck("ollama", down, failure_ttl=10), PreflightCheck("conda", boom)],
+        cache_path=tmp_path / "c.json",
+        clock=clock,
+    )
+    outcomes = service.run_all()
+    assert outcomes["ollama"].error == "server down"
+    assert outcomes["conda"].ok is False and "no conda" in outcomes["conda"].error
+
+    clock.now += 5
+    service.get("ollama")
+    clock.now += 6
+    service.get("ollama")
+    assert len(calls) == 2
+
+
+def test_concurrent_gets_share_one_run(tmp_path):
+    run, calls = _counting(delay=0.1)
+    service = PreflightService([PreflightCheck("venv", run)], cache_path=None)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(service.get("venv").ok)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [True] * 6 and len(calls) == 1
+
+
+def test_budget_leaves_slow_checks_running(tmp_path):
+    run, calls = _counting(delay=0.3)
+    service = PreflightService([PreflightCheck("slow", run)], cache_path=None)
+    service.run_all(budget_sec=0.01)
+    assert service.summary()["over_budget"] == ["slow"]
+    assert service.get("slow").ok and len(calls) == 1
@@ -0,0 +1,104 @@
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from pipeline_common.process_runner import (
+    OutputCapture,
+    RotatingLog,
+    parse_progress,
+    phase_log_path,
+    run_streaming,
+)
+
+
+def _python(code: str):
+    return [sys.executable, "-c", textwrap.dedent(code)]
+
+
+def test_parse_progress_reads_phase4_chunk_lines():
+    event = parse_progress("Chunk chunk_0007 via 'xtts': wall 12.31s, audio 4.20s, RT x2.93")
+    assert event.kind == "chunk_done"
+    assert event.chunk_id == "chunk_0007"
+    assert event.rtf == pytest.approx(2.93)
+    assert event.data == {"engine": "xtts", "wall_sec": 12.31, "audio_sec": 4.2}
+    assert parse_progress("Skipping chunk_0002 (already exists)").kind == "chunk_skipped"
+    assert parse_progress("loading model...") is None
+
+
+def test_tail_stays_bounded_and_log_keeps_everything(tmp_path):
+    log_path = phase_log_path("book", 4, root=tmp_path)
+    result = run_streaming(
+        _python(
+            """
+            import sys
+            for i in range(20000):
+                print(f"line {i}")
+            print("boom", file=sys.stderr)
+            sys.exit(3)
+            """
+        ),
+        log_path=log_path,
+        tail_lines=5,
+    )
+    assert result.returncode == 3
+    assert result.stdout.splitlines() == [f"line {i}" for i in range(19995, 20000)]
+    assert result.stderr == "boom"
+    lines = log_path.read_text().splitlines()
+    assert len(lines) == 20001
+    assert log_path == tmp_path / ".pipeline" / "logs" / "book" / "phase4.log"
+
+
+def test_progress_events_arrive_while_the_process_runs(tmp_path):
+    flag = tmp_path / "seen"
+    seen = []
+
+    def on_event(event):
+        seen.append(event.chunk_id)
+        flag.write_text("1")
+
+    # The child blocks after its first chunk until the parent has reacted to it.
+    result = run_streaming(
+        _python(
+            f"""
+            import pathlib, time
+            print("Chunk c1 via 'kokoro': wall 1.0s, audio 2.0s, RT x0.5", flush=True)
+            deadline = time.time() + 10
+            while not pathlib.Path({str(flag)!r}).exists():
+                if time.time() > deadline:
+                    raise SystemExit(9)
+                time.sleep(0.01)
+            print("Chunk c2 via 'kokoro': wall 1.0s, audio 2.0s, RT x0.5")
+            """
+        ),
+        on_event=on_event,
+    )
+    assert result.returncode == 0
+    assert seen == ["c1", "c2"]
+    assert result.events == 2
+
+
+def test_timeout_kills_the_process(tmp_path):
+    with pytest.raises(subprocess.TimeoutExpired):
+        run_streaming(_python("import time; print('start', flush=True); time.sleep(30)"), timeout=0.5)
+
+
+def test_rotating_log_rolls_over_to_numbered_backups(tmp_path):
+    path = tmp_path / "phase5.log"
+    log = RotatingLog(path, max_bytes=100, backups=2)
+    for i in range(10):
+        log.write(f"{i:02d}".encode() * 20 + b"\n")  # 41 bytes per line
+    log.close()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["phase5.log", "phase5.log.1", "phase5.log.2"]
+    assert path.read_text().startswith("08")
+    assert all(p.stat().st_size <= 100 for p in tmp_path.iterdir())
+
+
+def test_capture_splits_partial_and_overlong_lines(tmp_path):
+    capture = OutputCapture(tmp_path / "x.log")
+    capture.feed("stdout", b"par")
+    capture.feed("stdout", b"tial\r\nnext")
+    capture.close()
+    assert capture.stdout_tail == "partial\nnext"
+    assert (tmp_path / "x.log").read_text() == "partial\nnext\n"
@@ -0,0 +1,116 @@
+import json
+import threading
+
+import pytest
+
+from pipeline_common.state_manager import PipelineState
+from pipeline_common.state_shards import ShardLayout, migrate_to_shards, unshard
+
+
+def _entry(status="success", **extra):
+    return {"status": status, "timestamps": {}, "artifacts": {}, "metrics": {}, "errors": [], **extra}
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    path = tmp_path / "pipeline.json"
+    state = PipelineState(path)
+    state.write(
+        {
+            "phase3": {"status": "success", "files": {f"book{i}": _entry(words=i) for i in range(3)}},
+            "phase4": {"status": "partial", "files": {"book0": _entry(audio_dir="a0")}},
+            "batch_runs": [],
+        }
+    )
+    return path
+
+
+def _without_stamp(data):
+    return {k: v for k, v in data.items() if k != "last_updated"}
+
+
+@pytest.mark.parametrize("per_phase", [False, True])
+def test_migration_splits_and_read_merges(state_path, per_phase):
+    before = PipelineState(state_path).read()
+    layout = migrate_to_shards(state_path, per_phase=per_phase)
+
+    root = json.loads(state_path.read_text())
+    assert root["phase3"]["files"] == {} and root["phase4"]["status"] == "partial"
+    expected = 4 if per_phase else 3
+    assert len(layout.shard_files()) == expected
+    assert _without_stamp(PipelineState(state_path).read()) == _without_stamp(before)
+    assert migrate_to_shards(state_path) == layout  # idempotent
+
+
+def test_book_transaction_touches_only_its_shard(state_path):
+    layout = migrate_to_shards(state_path)
+    state = PipelineState(state_path)
+    root_before = state_path.read_text()
+    others = {p: p.stat().st_mtime_ns for p in layout.shard_files() if p.stem != "book1"}
+
+    with state.transaction(file_id="book1") as txn:
+        assert set(txn.data["phase3"]["files"]) == {"book1"}
+        txn.data["phase3"]["files"]["book1"]["words"] = 42
+        txn.data.setdefault("phase4", {}).setdefault("files", {})["book1"] = _entry("running")
+
+    assert state_path.read_text() == root_before
+    assert {p: p.stat().st_mtime_ns for p in others} == others
+    data = state.read()
+    assert data["phase3"]["files"]["book1"]["words"] == 42
+    assert data["phase3"]["files"]["book2"]["words"] == 2
+    assert set(data["phase4"]["files"]) == {"book0", "book1"}
+
+
+def test_book_transaction_merges_root_changes(state_path):
+    migrate_to_shards(state_path)
+    state = PipelineState(state_path)
+    with state.transaction(file_id="book2") as txn:
+        txn.data["phase4"]["status"] = "success"
+    with state.transaction() as txn:
+        txn.data["batch_runs"].append({"run_id": "r1", "status": "success", "files": {}})
+        del txn.data["phase3"]["files"]["book0"]
+
+    data = state.read()
+    assert data["phase4"]["status"] == "success" == data["phases"]["phase4"]
+    assert [run["run_id"] for run in data["batch_runs"]] == ["r1"]
+    assert set(data["phase3"]["files"]) == {"book1", "book2"}
+    assert json.loads(state_path.read_text())["phase3"]["files"] == {}
+
+
+def test_concurrent_books_do_not_lose_updates(state_path):
+    migrate_to_shards(state_path)
+    errors = []
+
+    def book(file_id):
+        state = PipelineState(state_path)
+        try:
+            for n in range(5):
+                with state.transaction(file_id=file_id) as txn:
+                    files = txn.data.setdefault("phase4", {}).setdefault("files", {})
+                    entry = files.setdefault(file_id, _entry("running", done=0))
+                    entry["done"] = n + 1
+        except Exception as exc:  # pragma: no cover - surfaced below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=book, args=(f"book{i}",)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    files = PipelineState(state_path).read()["phase4"]["files"]
+    assert {fid: entry["done"] for fid, entry in files.items()} == {f"book{i}": 5 for i in range(8)}
+
+
+def test_unshard_restores_a_monolithic_file(state_path):
+    migrate_to_shards(state_path, per_phase=True)
+    state = PipelineState(state_path)
+    with state.transaction(file_id="odd/name") as txn:
+        txn.data["phase3"]["files"]["odd/name"] = _entry()
+    merged = state.read()
+
+    unshard(state_path)
+    assert ShardLayout.load(state_path) is None
+    assert json.loads(state_path.read_text())["phase3"]["files"].keys() == merged["phase3"]["files"].keys()
+    assert _without_stamp(state.read()) == _without_stamp(merged)
@@ -0,0 +1,83 @@
+"""Tests for the compiled text-rewrite rule tables."""
+
+import random
+import re
+
+import pytest
+
+from pipeline_common.text_rules import Call, Keywords, Replace, RuleTable, Sub
+
+ABBREVIATIONS = {
+    "Dr.": "Doctor",
+    "Ph.D.": "PhD",
+    "Ph.D": "PhD",
+    "vs.": "versus",
+    "vs": "versus",
+    "est.": "established",
+    "a.m.": "AM",
+    "A.M.": "AM",
+    "St.": "Street",
+    "U.S.": "US",
+    "U.S.A.": "USA",
+}
+LOOKAHEAD = r'(?=\s|$|[,;:\'")\]])'
+PIECES = ["Dr.", "dr.", "vs", "VS.", "best.", "St.", "ſt.", "U.S.A.", "u.s.", "Ph.D", "A.M.", "x", " ", ",", "\n\n", "."]
+
+
+def _samples(count=400, seed=3):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(PIECES) for _ in range(rng.randint(0, 30))) for _ in range(count)]
+
+
+def test_keywords_match_key_by_key_substitution():
+    table = RuleTable("abbrev", [Keywords("abbrev", ABBREVIATIONS, suffix=LOOKAHEAD, flags=re.IGNORECASE)])
+
+    for text in _samples():
+        assert table.apply(text)[0] == table.apply_reference(text)
+    assert table.apply("Dr. Who vs. best. ſt. U.S.A.")[0] == "Doctor Who versus bestablished Street USA"
+
+
+def test_keywords_fall_back_when_trie_order_is_ambiguous():
+    # "a" sits between "ab" and "abc" in key order, so no trie ordering reproduces the alternation
+    table = RuleTable("ambiguous", [Keywords("ambiguous", {"ab": "1", "a": "2", "abc": "3"}, suffix=r"(?=\s|$)")])
+
+    for text in ["ab", "a", "abc", "abc ab a", "abca"]:
+        assert table.apply(text)[0] == table.apply_reference(text)
+
+
+def test_literal_runs_match_sequential_replace():
+    many = {chr(0x2460 + index): f"<{index}>" for index in range(20)}
+    fused = RuleTable("fused", [Replace("circled", many)])
+    overlapping = RuleTable("overlap", [Replace("quotes", {"â€œ": '"', "â€": '"', "â€™": "'"})])
+    text = "".join(many) * 3 + " â€œhiâ€™ â€ "
+
+    for table in (fused, overlapping):
+        assert table.apply(text)[0] == table.apply_reference(text)
+    assert fused.apply(text)[1] == {"circled": 60}
+
+
+def test_counts_and_required_literals():
+    table = RuleTable(
+        "artifacts",
+        [
+            Sub("collapse", r"  +", " ", requires=("  ",)),
+            Sub("site", r"Example\.com", "", flags=re.IGNORECASE, requires=(".com",)),
+            Call("upper", str.upper),
+        ],
+    )
+
+    text, counts = table.apply("a  b   c EXAMPLE.COM")
+    assert text == "A B C "
+    assert counts == {"collapse": 2, "site": 1, "upper": 1}
+    assert table.apply("a b")[1] == {"collapse": 0, "site": 0, "upper": 1}
+
+
+def test_stream_matches_whole_text_and_rejects_cross_paragraph_rules():
+    streamable = RuleTable("local", [Replace("tabs", {"\t": " "}), Sub("collapse", r"  +", " ")])
+    paragraphs = ["a\t\tb", "", "c   d", "e"]
+
+    assert "\n\n".join(streamable.stream(iter(paragraphs))) == streamable.apply("\n\n".join(paragraphs))[0]
+
+    spanning = RuleTable("spanning", [Sub("newlines", r"\n{3,}", "\n\n", streamable=False)])
+    with pytest.raises(ValueError):
+        list(spanning.stream(paragraphs))
@@ -0,0 +1,89 @@
+"""Tests for the shared content-addressed transcript store."""
+
+from pipeline_common.transcript_cache import (
+    TranscriptKey,
+    TranscriptStore,
+    audio_digest,
+    openai_whisper_key,
+    segments_from_openai_whisper,
+)
+
+TRANSCRIPT = {
+    "text": " Hello there.",
+    "segments": [{"start": 0.0, "end": 1.2, "text": " Hello there."}],
+    "words": [{"word": "Hello", "start": 0.1, "end": 0.5, "probability": 0.9}],
+}
+
+
+def _audio(tmp_path, name, payload):
+    path = tmp_path / name
+    path.write_bytes(payload)
+    return path
+
+
+def test_get_or_transcribe_runs_asr_once(tmp_path):
+    store = TranscriptStore(tmp_path / "cache")
+    audio = _audio(tmp_path, "chunk_001.wav", b"RIFF-one")
+    calls = []
+
+    def _asr():
+        calls.append(1)
+        return TRANSCRIPT
+
+    first, hit_first = store.get_or_transcribe(audio, openai_whisper_key("base"), _asr)
+    second, hit_second = TranscriptStore(tmp_path / "cache").get_or_transcribe(
+        audio, openai_whisper_key("base"), _asr
+    )
+
+    assert (hit_first, hit_second) == (False, True)
+    assert len(calls) == 1
+    assert second["text"] == first["text"] == " Hello there."
+
+
+def test_key_includes_backend_model_and_options(tmp_path):
+    store = TranscriptStore(tmp_path)
+    digest = audio_digest(_audio(tmp_path, "a.wav", b"abc"))
+    store.put(digest, openai_whisper_key("base"), TRANSCRIPT)
+
+    assert store.get(digest, openai_whisper_key("small")) is None
+    assert store.get(digest, TranscriptKey("faster-whisper", "base", {"task": "transcribe"})) is None
+    assert store.get(digest, TranscriptKey("openai-whisper", "base", {"task": "translate"})) is None
+    assert store.find(digest)["backend"] == "openai-whisper"
+
+
+def test_alias_resolves_to_source_transcripts(tmp_path):
+    store = TranscriptStore(tmp_path)
+    source = audio_digest(_audio(tmp_path, "chunk.wav", b"source"))
+    enhanced = audio_digest(_audio(tmp_path, "enhanced.wav", b"enhanced"))
+    key = TranscriptKey("faster-whisper", "base", {"word_timestamps": True})
+    store.put(source, key, TRANSCRIPT)
+    store.link(enhanced, source, reason="phase5_enhanced")
+
+    assert store.get(enhanced, key)["words"][0]["word"] == "Hello"
+    assert store.find(enhanced, require_words=True) is not None
+    assert store.find(enhanced, backend="openai-whisper") is None
+
+
+def test_digest_tracks_content_changes(tmp_path):
+    audio = _audio(tmp_path, "a.wav", b"one")
+    before = audio_digest(audio)
+    audio.write_bytes(b"two!")
+    assert audio_digest(audio) != before
+
+
+def test_from_env_can_disable(monkeypatch, tmp_path):
+    monkeypatch.setenv("PIPELINE_TRANSCRIPT_CACHE", "off")
+    assert TranscriptStore.from_env() is None
+    monkeypatch.setenv("PIPELINE_TRANSCRIPT_CACHE", str(tmp_path))
+    assert TranscriptStore.from_env().root == tmp_path
+
+
+def test_openai_whisper_result_is_normalised():
+    result = {
+        "text": " Hi.",
+        "segments": [{"start": 0, "end": 1, "text": " Hi.", "avg_logprob": -0.2, "no_speech_prob": 0.01}],
+    }
+    normalised = segments_from_openai_whisper(result)
+    assert normalised["text"] == " Hi."
+    assert normalised["segments"][0]["avg_logprob"] == -0.2
+    assert normalised["words"] is None
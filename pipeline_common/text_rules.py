@@ -0,0 +1,399 @@
+"""
+Compiled, ordered text-rewrite tables shared by the text normalizers.
+
+Phase 2 (``tts_normalizer``, ``cleaner``) and Phase 3 (``text_normalizer``)
+rewrite text through long chains of ``re.sub`` / ``str.replace`` passes.  A
+:class:`RuleTable` declares such a chain as an ordered list of rules and
+compiles it once:
+
+- :class:`Keywords` turns a per-key ``re.sub`` loop into one trie-shaped
+  regex (with explicit case classes, so the engine can skip positions that
+  cannot start a key) and a dict lookup;
+- runs of adjacent literal rules become one pass: guarded ``str.replace``
+  calls for a few keys, one trie alternation for many keys when that
+  provably gives the same result as replacing key by key;
+- regex rules can name literals they ``require`` and are skipped when none
+  occurs in the text;
+- every rule records how many substitutions it made.
+
+``str.translate`` is deliberately not used: on CPython it is an order of
+magnitude slower than a handful of ``str.replace`` scans once the map holds
+non-ASCII characters.
+
+:meth:`RuleTable.stream` applies a table paragraph by paragraph to a
+paragraph iterator; tables containing rules that can see across a paragraph
+break (``streamable=False``) refuse to stream.
+
+:meth:`RuleTable.apply_reference` runs the rules the naive way (one pass per
+rule, one ``replace``/``sub`` per key) and is what tests compare against.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
+
+PARAGRAPH_BREAK = "\n\n"
+# Literal runs with more keys than this are fused into one trie alternation
+LITERAL_TRIE_MIN_KEYS = 16
+# Case-insensitive ``requires`` literals with more spellings than this are not prefiltered
+MAX_REQUIRED_VARIANTS = 64
+
+Repl = Union[str, Callable[["re.Match[str]"], str]]
+
+
+@dataclass(frozen=True)
+class Sub:
+    """
+    Regex rule, equivalent to ``re.sub(pattern, repl, text, flags=flags)``.
+
+    ``requires`` lists literals of which every match contains at least one
+    (in any letter case under ``re.IGNORECASE``); the rule is skipped when
+    none is present.
+    ``streamable=False`` marks patterns whose match or lookarounds can span a
+    paragraph break (typically ``\\s`` runs).
+    """
+
+    name: str
+    pattern: str
+    repl: Repl
+    flags: int = 0
+    requires: Tuple[str, ...] = ()
+    streamable: bool = True
+
+
+@dataclass(frozen=True)
+class Replace:
+    """Literal rule, equivalent to ``text.replace(key, value)`` for each key in order."""
+
+    name: str
+    mapping: Mapping[str, str]
+    streamable: bool = True
+
+
+@dataclass(frozen=True)
+class Keywords:
+    """
+    Keyword rule, equivalent to one ``re.sub(prefix + re.escape(key) + suffix, value)``
+    per key in order, compiled into a single trie-shaped regex.
+
+    ``prefix`` and ``suffix`` must be zero-width (anchors or lookarounds).
+    Only valid when no key's match can overlap another's or be created by an
+    earlier replacement; ``RuleTable.apply_reference`` is the check.
+    """
+
+    name: str
+    mapping: Mapping[str, str]
+    prefix: str = ""
+    suffix: str = ""
+    flags: int = 0
+    streamable: bool = True
+
+
+@dataclass(frozen=True)
+class Call:
+    """Opaque whole-string function (e.g. Unicode normalization)."""
+
+    name: str
+    func: Callable[[str], str]
+    streamable: bool = True
+
+
+Rule = Union[Sub, Replace, Keywords, Call]
+
+
+@dataclass
+class _Step:
+    """One compiled pass: ``run(text, counts) -> text``."""
+
+    run: Callable[[str, Dict[str, int]], str]
+    streamable: bool
+
+
+# Non-ASCII characters that re.IGNORECASE matches against an ASCII letter
+# (simple case mappings onto i, s and k).
+_ASCII_CASE_EXTRAS = "İıſK"
+
+
+def _char_variants(char: str, fold: bool) -> List[str]:
+    """Characters matching ``char`` (case variants when folding)."""
+    if not fold or not char.isalpha():
+        return [char]
+    variants = {char.lower(), char.upper()}
+    variants.update(extra for extra in _ASCII_CASE_EXTRAS if re.fullmatch(char, extra, re.IGNORECASE))
+    return sorted(variants)
+
+
+def _char_class(chars: Iterable[str]) -> str:
+    chars = list(chars)
+    if len(chars) == 1:
+        return re.escape(chars[0])
+    return "[" + "".join(re.escape(char) for char in chars) + "]"
+
+
+def _trie_pattern(keys: List[str], fold: bool = False) -> Optional[str]:
+    """
+    Prefix-trie regex matching the same key as the flat alternation ``k1|k2|...``.
+
+    At each node the alternatives are tried in key order.  Returns None when a
+    key ending at a node sits between keys that continue past it, where no
+    order of the alternatives reproduces the flat alternation.
+    """
+    root: Dict[str, Any] = {}
+    for index, key in enumerate(keys):
+        node = root
+        for char in key:
+            node = node.setdefault(char, {})
+        node.setdefault("", index)
+
+    def indices(node: Dict[str, Any]) -> List[int]:
+        found = [node[""]] if "" in node else []
+        for char, child in node.items():
+            if char:
+                found.extend(indices(child))
+        return found
+
+    def emit(node: Dict[str, Any]) -> Optional[str]:
+        branches = []
+        for char, child in node.items():
+            if not char:
+                continue
+            body = emit(child)
+            if body is None:
+                return None
+            branches.append((min(indices(child)), _char_class(_char_variants(char, fold)) + body))
+        branches.sort()
+        if "" in node:
+            terminal = node[""]
+            below = [index for index in indices(node) if index != terminal]
+            if below and min(below) < terminal < max(below):
+                return None
+            branches.insert(0 if not below or min(below) > terminal else len(branches), (terminal, ""))
+        if len(branches) == 1:
+            return branches[0][1]
+        return "(?:" + "|".join(body for _, body in branches) + ")"
+
+    body = emit(root)
+    if body is None:
+        return None
+    first_chars = sorted({variant for key in keys for variant in _char_variants(key[0], fold)})
+    return f"(?={_char_class(first_chars)}){body}"
+
+
+def _required_literals(rule: Sub) -> Tuple[str, ...]:
+    """``rule.requires`` spelled out in every case variant the rule would match."""
+    if not rule.flags & re.IGNORECASE:
+        return rule.requires
+    variants: List[str] = []
+    for literal in rule.requires:
+        if not literal.isascii():
+            return ()
+        variants.extend("".join(chars) for chars in product(*(_char_variants(char, True) for char in literal)))
+    return tuple(variants) if len(variants) <= MAX_REQUIRED_VARIANTS else ()
+
+
+def _sub_step(rule: Sub) -> _Step:
+    compiled = re.compile(rule.pattern, rule.flags)
+    requires = _required_literals(rule)
+
+    def run(text: str, counts: Dict[str, int]) -> str:
+        if requires and not any(literal in text for literal in requires):
+            return text
+        text, n = compiled.subn(rule.repl, text)
+        counts[rule.name] += n
+        return text
+
+    return _Step(run, rule.streamable)
+
+
+def _call_step(rule: Call) -> _Step:
+    def run(text: str, counts: Dict[str, int]) -> str:
+        result = rule.func(text)
+        if result != text:
+            counts[rule.name] += 1
+        return result
+
+    return _Step(run, rule.streamable)
+
+
+def _keywords_step(rule: Keywords) -> _Step:
+    fold = bool(rule.flags & re.IGNORECASE)
+    lookup: Dict[str, str] = {}
+    for key, value in rule.mapping.items():
+        lookup.setdefault(key.casefold() if fold else key, value)
+    keys = list(lookup)
+    # Explicit case classes let the engine reject most positions on the first
+    # character; an IGNORECASE alternation tries every key at every position.
+    body = _trie_pattern(keys, fold) if all(key.isascii() for key in keys) else None
+    if body is None:
+        body = "(?:" + "|".join(re.escape(key) for key in rule.mapping) + ")"
+        flags = rule.flags
+        prefix, suffix = rule.prefix, rule.suffix
+    else:
+        flags = rule.flags & ~re.IGNORECASE
+        prefix = f"(?i:{rule.prefix})" if fold and rule.prefix else rule.prefix
+        suffix = f"(?i:{rule.suffix})" if fold and rule.suffix else rule.suffix
+    compiled = re.compile(prefix + body + suffix, flags)
+    # Unicode case-insensitive matching accepts a few characters casefold() does not map
+    # back to the ASCII key (e.g. U+0130); those fall back to testing keys in order.
+    ordered = [(re.compile(re.escape(key), rule.flags), value) for key, value in rule.mapping.items()]
+
+    def replace(match: "re.Match[str]") -> str:
+        found = match.group(0)
+        value = lookup.get(found.casefold() if fold else found)
+        if value is None:
+            value = next(value for pattern, value in ordered if pattern.fullmatch(found))
+        return value
+
+    def run(text: str, counts: Dict[str, int]) -> str:
+        text, n = compiled.subn(replace, text)
+        counts[rule.name] += n
+        return text
+
+    return _Step(run, rule.streamable)
+
+
+def _overlaps(a: str, b: str) -> bool:
+    """True when occurrences of ``a`` and ``b`` can share characters."""
+    if a in b or b in a:
+        return True
+    return any(a.endswith(b[:i]) or b.endswith(a[:i]) for i in range(1, min(len(a), len(b))))
+
+
+def _can_fuse(pairs: List[Tuple[str, str]]) -> bool:
+    """
+    Whether one leftmost pass over ``pairs`` equals replacing them one by one.
+
+    Holds when no earlier value contains a character of a later key (so no
+    replacement creates a later match), no deletion can join a later
+    multi-character key, and no two keys can overlap.
+    """
+    for i, (key, value) in enumerate(pairs):
+        later = [other for other, _ in pairs[i + 1 :]]
+        if not key:
+            return False
+        if set("".join(later)) & set(value):
+            return False
+        if not value and any(len(other) > 1 for other in later):
+            return False
+        if any(_overlaps(key, other) for other in later):
+            return False
+    return True
+
+
+def _literal_step(rules: List[Replace]) -> _Step:
+    """Compile a run of adjacent literal rules into one pass."""
+    pairs = [(key, value, rule.name) for rule in rules for key, value in rule.mapping.items()]
+    streamable = all(rule.streamable for rule in rules)
+
+    if len(pairs) > LITERAL_TRIE_MIN_KEYS and _can_fuse([(key, value) for key, value, _ in pairs]):
+        lookup = {key: (value, name) for key, value, name in pairs}
+        compiled = re.compile(_trie_pattern(list(lookup)) or "|".join(re.escape(key) for key in lookup))
+
+        def run_trie(text: str, counts: Dict[str, int]) -> str:
+            def replace(match: "re.Match[str]") -> str:
+                value, name = lookup[match.group(0)]
+                counts[name] += 1
+                return value
+
+            return compiled.sub(replace, text)
+
+        return _Step(run_trie, streamable)
+
+    def run_sequential(text: str, counts: Dict[str, int]) -> str:
+        for key, value, name in pairs:
+            if key in text:
+                counts[name] += text.count(key)
+                text = text.replace(key, value)
+        return text
+
+    return _Step(run_sequential, streamable)
+
+
+def _reference_pass(rule: Rule, text: str) -> str:
+    if isinstance(rule, Sub):
+        return re.sub(rule.pattern, rule.repl, text, flags=rule.flags)
+    if isinstance(rule, Replace):
+        for key, value in rule.mapping.items():
+            text = text.replace(key, value)
+        return text
+    if isinstance(rule, Keywords):
+        for key, value in rule.mapping.items():
+            pattern = rule.prefix + re.escape(key) + rule.suffix
+            text = re.sub(pattern, lambda _match, value=value: value, text, flags=rule.flags)
+        return text
+    return rule.func(text)
+
+
+@dataclass
+class RuleTable:
+    """An ordered list of rules compiled once into as few passes as is safe."""
+
+    name: str
+    rules: List[Rule]
+    _steps: List[_Step] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._steps = []
+        literals: List[Replace] = []
+        for rule in self.rules:
+            if isinstance(rule, Replace):
+                literals.append(rule)
+                continue
+            if literals:
+                self._steps.append(_literal_step(literals))
+                literals = []
+            if isinstance(rule, Sub):
+                self._steps.append(_sub_step(rule))
+            elif isinstance(rule, Keywords):
+                self._steps.append(_keywords_step(rule))
+            else:
+                self._steps.append(_call_step(rule))
+        if literals:
+            self._steps.append(_literal_step(literals))
+
+    @property
+    def passes(self) -> int:
+        """Number of compiled passes (after fusion)."""
+        return len(self._steps)
+
+    @property
+    def streamable(self) -> bool:
+        """Whether every rule is confined to a single paragraph."""
+        return all(step.streamable for step in self._steps)
+
+    def new_counts(self) -> Dict[str, int]:
+        """Zeroed substitution counters, one per rule name."""
+        return {rule.name: 0 for rule in self.rules}
+
+    def apply(self, text: str, counts: Optional[Dict[str, int]] = None) -> Tuple[str, Dict[str, int]]:
+        """Rewrite ``text``; returns ``(text, substitutions per rule name)``."""
+        counts = counts if counts is not None else self.new_counts()
+        for step in self._steps:
+            text = step.run(text, counts)
+        return text, counts
+
+    def stream(self, paragraphs: Iterable[str], counts: Optional[Dict[str, int]] = None) -> Iterator[str]:
+        """
+        Rewrite paragraphs lazily; joining the output with ``"\\n\\n"`` equals
+        ``apply`` on the joined input.
+
+        Raises:
+            ValueError: if the table has rules that can span paragraph breaks.
+        """
+        if not self.streamable:
+            raise ValueError(f"Rule table {self.name!r} has rules that span paragraph breaks")
+        counts = counts if counts is not None else self.new_counts()
+        for paragraph in paragraphs:
+            yield self.apply(paragraph, counts)[0]
+
+    def apply_reference(self, text: str) -> str:
+        """Naive rule-by-rule, key-by-key application (the behaviour ``apply`` must match)."""
+        for rule in self.rules:
+            text = _reference_pass(rule, text)
+        return text
+
+
+__all__ = ["Call", "Keywords", "PARAGRAPH_BREAK", "Replace", "RuleTable", "Sub"]
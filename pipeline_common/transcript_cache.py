@@ -0,0 +1,254 @@
+"""
+Content-addressed transcript store shared by every ASR consumer.
+
+Phase 4 Tier 2/Tier 3 validation, Phase 5 phrase cleanup and chunk-mode
+subtitles all transcribe the same chunk audio.  Transcripts are stored under
+the SHA-256 of the audio file bytes, keyed by (ASR backend, model, options),
+so each stage can look before it runs a model.
+
+Layout (one JSON document per audio digest)::
+
+    .pipeline/transcripts/<aa>/<digest>.json
+    {
+      "digest": "...",
+      "alias_of": null | {"digest": "...", "reason": "..."},
+      "transcripts": {"<key token>": {"backend", "model", "options", "text", "segments", "words"}}
+    }
+
+``alias_of`` lets a derived file (e.g. a Phase 5 enhanced chunk whose timing
+is unchanged) resolve to the transcripts of its source chunk.
+
+Stdlib only; writes are atomic (temp file + ``os.replace``) and a lost race
+only costs a re-transcription.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from . import fingerprint
+
+logger = logging.getLogger(__name__)
+
+CACHE_ENV = "PIPELINE_TRANSCRIPT_CACHE"
+DISABLE_VALUES = {"0", "off", "false", "none", "disabled"}
+DEFAULT_ROOT = Path(__file__).resolve().parents[1] / ".pipeline" / "transcripts"
+MAX_ALIAS_DEPTH = 4
+
+Transcript = Dict[str, Any]
+
+
+def audio_digest(path: Path | str) -> str:
+    """SHA-256 of the file bytes, remembered per (path, size, mtime, inode)."""
+    return fingerprint.file_sha256(path)
+
+
+@dataclass(frozen=True)
+class TranscriptKey:
+    """Which ASR produced a transcript: backend, model and decoding options."""
+
+    backend: str
+    model: str
+    options: Dict[str, Any] = field(default_factory=dict, hash=False, compare=False)
+
+    @property
+    def token(self) -> str:
+        payload = json.dumps(
+            {"backend": self.backend, "model": self.model, "options": self.options},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def openai_whisper_key(model: str) -> TranscriptKey:
+    """Key for a default ``openai-whisper`` ``model.transcribe(path)`` call (Phase 4 Tier 2/3)."""
+    return TranscriptKey("openai-whisper", model, {"task": "transcribe"})
+
+
+def segments_from_openai_whisper(result: Dict[str, Any]) -> Transcript:
+    """Normalise an ``openai-whisper`` ``model.transcribe`` result."""
+    segments: List[Dict[str, Any]] = []
+    words: List[Dict[str, Any]] = []
+    for seg in result.get("segments") or []:
+        seg_words = [
+            {
+                "word": str(w.get("word", "")).strip(),
+                "start": float(w["start"]),
+                "end": float(w["end"]),
+                "probability": w.get("probability"),
+            }
+            for w in seg.get("words") or []
+        ]
+        words.extend(seg_words)
+        segments.append(
+            {
+                "start": float(seg.get("start", 0.0)),
+                "end": float(seg.get("end", 0.0)),
+                "text": str(seg.get("text", "")),
+                "no_speech_prob": seg.get("no_speech_prob"),
+                "avg_logprob": seg.get("avg_logprob"),
+            }
+        )
+    return {"text": str(result.get("text", "")), "segments": segments, "words": words or None}
+
+
+def segments_from_faster_whisper(segments_iter: Iterable[Any]) -> Transcript:
+    """Normalise the segment generator returned by ``faster_whisper.WhisperModel.transcribe``."""
+    segments: List[Dict[str, Any]] = []
+    words: List[Dict[str, Any]] = []
+    have_words = False
+    for seg in segments_iter:
+        seg_words = getattr(seg, "words", None)
+        if seg_words is not None:
+            have_words = True
+            words.extend(
+                {"word": w.word.strip(), "start": float(w.start), "end": float(w.end), "probability": w.probability}
+                for w in seg_words
+            )
+        segments.append(
+            {
+                "start": float(seg.start),
+                "end": float(seg.end),
+                "text": seg.text,
+                "no_speech_prob": getattr(seg, "no_speech_prob", None),
+                "avg_logprob": getattr(seg, "avg_logprob", None),
+            }
+        )
+    text = "".join(s["text"] for s in segments)
+    return {"text": text, "segments": segments, "words": words if have_words else None}
+
+
+class TranscriptStore:
+    """Read-through transcript cache keyed by audio digest and :class:`TranscriptKey`."""
+
+    def __init__(self, root: Optional[Path | str] = None):
+        self.root = Path(root) if root is not None else DEFAULT_ROOT
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, root: Optional[Path | str] = None) -> Optional["TranscriptStore"]:
+        """
+        Store rooted at ``root``, else ``$PIPELINE_TRANSCRIPT_CACHE``, else
+        ``.pipeline/transcripts``.  Returns None when the env var disables it.
+        """
+        env = os.environ.get(CACHE_ENV, "").strip()
+        if root is None and env.lower() in DISABLE_VALUES:
+            return None
+        return cls(root if root is not None else (env or None))
+
+    # ------------------------------------------------------------------ io
+    def _doc_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / f"{digest}.json"
+
+    def _read(self, digest: str) -> Dict[str, Any]:
+        path = self._doc_path(digest)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, json.JSONDecodeError) as exc:
+            logger.debug("Ignoring unreadable transcript cache entry %s: %s", path, exc)
+            return {}
+
+    def _write(self, digest: str, doc: Dict[str, Any]) -> None:
+        path = self._doc_path(digest)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(prefix=f".{digest[:8]}.", suffix=".tmp", dir=path.parent)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(doc, f)
+            os.replace(tmp, path)
+        except BaseException:
+            Path(tmp).unlink(missing_ok=True)
+            raise
+
+    def _update(self, digest: str, mutate: Callable[[Dict[str, Any]], None]) -> None:
+        with self._lock:
+            doc = self._read(digest) or {"digest": digest, "alias_of": None, "transcripts": {}}
+            mutate(doc)
+            self._write(digest, doc)
+
+    def _chain(self, digest: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """``digest`` followed by the digests it aliases, with their documents."""
+        chain = []
+        seen = set()
+        while digest and digest not in seen and len(chain) <= MAX_ALIAS_DEPTH:
+            seen.add(digest)
+            doc = self._read(digest)
+            chain.append((digest, doc))
+            digest = (doc.get("alias_of") or {}).get("digest")
+        return chain
+
+    # ----------------------------------------------------------------- api
+    def get(self, digest: str, key: TranscriptKey) -> Optional[Transcript]:
+        """Exact (backend, model, options) hit for ``digest`` or any audio it aliases."""
+        for _, doc in self._chain(digest):
+            hit = (doc.get("transcripts") or {}).get(key.token)
+            if hit is not None:
+                return hit
+        return None
+
+    def find(
+        self,
+        digest: str,
+        *,
+        backend: Optional[str] = None,
+        require_words: bool = False,
+    ) -> Optional[Transcript]:
+        """
+        Any transcript of this audio (following aliases), optionally limited to
+        one backend or to transcripts carrying word timings.
+        """
+        for _, doc in self._chain(digest):
+            for entry in (doc.get("transcripts") or {}).values():
+                if backend and entry.get("backend") != backend:
+                    continue
+                if require_words and not entry.get("words"):
+                    continue
+                return entry
+        return None
+
+    def put(self, digest: str, key: TranscriptKey, transcript: Transcript) -> Transcript:
+        """Store a normalised transcript (``text``/``segments``/``words``)."""
+        entry = {
+            "backend": key.backend,
+            "model": key.model,
+            "options": key.options,
+            "text": transcript.get("text", ""),
+            "segments": transcript.get("segments") or [],
+            "words": transcript.get("words"),
+            "created": time.time(),
+        }
+        self._update(digest, lambda doc: doc["transcripts"].__setitem__(key.token, entry))
+        return entry
+
+    def link(self, derived_digest: str, source_digest: str, reason: str = "") -> None:
+        """Resolve ``derived_digest`` to ``source_digest``'s transcripts (same timing)."""
+        if derived_digest == source_digest:
+            return
+        alias = {"digest": source_digest, "reason": reason}
+        self._update(derived_digest, lambda doc: doc.__setitem__("alias_of", alias))
+
+    def get_or_transcribe(
+        self,
+        audio_path: Path | str,
+        key: TranscriptKey,
+        transcribe: Callable[[], Transcript],
+    ) -> Tuple[Transcript, bool]:
+        """Return (transcript, cache_hit); runs ``transcribe`` and stores on a miss."""
+        digest = audio_digest(audio_path)
+        hit = self.get(digest, key)
+        if hit is not None:
+            return hit, True
+        return self.put(digest, key, transcribe()), False
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
 import json
+import math
+import os
+import tempfile
+import threading
+import time
 from collections import defaultdict, deque
 from datetime import datetime
 from pathlib import Path
@@ -11,6 +16,13 @@ LOG_ROOT = Path(".pipeline") / "policy_logs"
 REPORT_DIR = Path("policy_reports")
 ROLLING_WINDOW = 40
 HALLUCINATION_WINDOW = 20
+CHECKPOINT_NAME = "advisor_state.json"  # folded aggregates + per-log byte offsets
+CHECKPOINT_VERSION = 1
+CHECKPOINT_INTERVAL_SEC = 30.0
+EXACT_SAMPLES = 512  # percentiles stay exact up to this many samples
+SKETCH_ACCURACY = 0.01  # relative error of sketched percentiles beyond that
+_GAMMA = (1 + SKETCH_ACCURACY) / (1 - SKETCH_ACCURACY)
+_LOG_GAMMA = math.log(_GAMMA)
 
 
 def _safe_float(value: Any) -> Optional[float]:
@@ -95,13 +107,499 @@ def _parse_timestamp(value: Any) -> float:
         return 0.0
 
 
+class QuantileSketch:
+    """
+    Running count/sum/min/max plus percentiles in bounded memory.
+
+    Samples are kept exactly up to ``EXACT_SAMPLES``; past that they move
+    into log-spaced buckets with ``SKETCH_ACCURACY`` relative error, so a
+    percentile over months of history costs O(buckets), not O(events).
+    Sketches over disjoint events merge by adding counts.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+        self.values: Optional[List[float]] = []
+        self.buckets: Dict[int, int] = {}
+        self.zeros = 0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        if self.values is not None:
+            self.values.append(value)
+            if len(self.values) > EXACT_SAMPLES:
+                self._spill()
+        else:
+            self._bucket(value, 1)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        if not other.count:
+            return
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        if self.values is not None and other.values is not None:
+            self.values.extend(other.values)
+            if len(self.values) > EXACT_SAMPLES:
+                self._spill()
+            return
+        self._spill()
+        for value in other.values or ():
+            self._bucket(value, 1)
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.zeros += other.zeros
+
+    def _spill(self) -> None:
+        for value in self.values or ():
+            self._bucket(value, 1)
+        self.values = None
+
+    def _bucket(self, value: float, count: int) -> None:
+        if value <= 0:
+            self.zeros += count
+            return
+        key = math.ceil(math.log(value) / _LOG_GAMMA)
+        self.buckets[key] = self.buckets.get(key, 0) + count
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def _value_at(self, rank: int) -> float:
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                return 2.0 * _GAMMA ** key / (_GAMMA + 1.0)
+        return float(self.max or 0.0)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Same interpolation as ``_percentile`` (exact until the sketch spills)."""
+        if not self.count:
+            return None
+        if self.values is not None:
+            return _percentile(sorted(self.values), pct)
+        k = (pct / 100.0) * (self.count - 1)
+        lower = int(k)
+        upper = min(self.count - 1, lower + 1)
+        weight = k - lower
+        value = self._value_at(lower) * (1 - weight) + self._value_at(upper) * weight
+        return min(max(value, self.min), self.max)
+
+    def summary_ms(self) -> Dict[str, float]:
+        if not self.count:
+            return {}
+        return {
+            "avg_ms": self.mean,
+            "p50_ms": self.percentile(50.0),
+            "p95_ms": self.percentile(95.0),
+            "min_ms": self.min,
+            "max_ms": self.max,
+            "samples": self.count,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+            "values": self.values,
+            "buckets": {str(key): count for key, count in self.buckets.items()},
+            "zeros": self.zeros,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        sketch = cls()
+        sketch.count = int(data["count"])
+        sketch.total = float(data["total"])
+        sketch.min = data["min"]
+        sketch.max = data["max"]
+        sketch.values = data["values"]
+        sketch.buckets = {int(key): int(count) for key, count in data["buckets"].items()}
+        sketch.zeros = int(data["zeros"])
+        return sketch
+
+
+def _sketch_map() -> Dict[str, QuantileSketch]:
+    return defaultdict(QuantileSketch)
+
+
+def _window_map(maxlen: int = ROLLING_WINDOW) -> Dict[str, deque]:
+    return defaultdict(lambda: deque(maxlen=maxlen))
+
+
+class StatsAccumulator:
+    """
+    Running aggregates behind ``compute_stats``: counters, sums, sketches
+    and fixed-size recent windows, folded one event at a time.
+
+    ``to_dict``/``from_dict`` round-trip through JSON so the advisor can
+    checkpoint what it has folded and resume from there.
+    """
+
+    def __init__(self) -> None:
+        self.phase_duration = _sketch_map()
+        self.rolling_phase_duration = _window_map()
+        self.phase_failures: Dict[str, int] = defaultdict(int)
+        self.phase_success: Dict[str, int] = defaultdict(int)
+        self.file_failures: Dict[Tuple[str, str], int] = defaultdict(int)
+        self.chunk_error_count = 0
+        self.chunk_event_total = 0
+        self.engine_success: Dict[str, int] = defaultdict(int)
+        self.engine_failure: Dict[str, int] = defaultdict(int)
+        self.hallucination_flags = 0
+        self.hallucination_by_engine: Dict[str, int] = defaultdict(int)
+        self.hallucination_recent: deque = deque(maxlen=HALLUCINATION_WINDOW)
+        self.enhancement_failures = 0
+        self.enhancement_total = 0
+        self.rtf = QuantileSketch()
+        self.rolling_rt_factor: deque = deque(maxlen=ROLLING_WINDOW)
+        self.rtf_by_engine = _sketch_map()
+        self.fallback = QuantileSketch()
+        self.rolling_fallback: deque = deque(maxlen=ROLLING_WINDOW)
+        self.fallback_by_engine = _sketch_map()
+        self.fallback_recent_by_engine = _window_map()
+        self.fallback_chunks = QuantileSketch()
+        self.fallback_chunks_by_engine = _sketch_map()
+        self.run_info: Dict[str, Dict[str, Any]] = {}
+        self.events = 0
+
+    def add(self, record: Dict[str, Any]) -> None:
+        self.events += 1
+        event_type = record.get("event")
+        phase = record.get("phase")
+        file_id = record.get("file_id")
+        status = record.get("status")
+        duration = record.get("duration_ms")
+        errors = record.get("errors") or []
+        metrics = record.get("metrics") or {}
+        run_id = record.get("run_id")
+        if run_id:
+            info = self.run_info.setdefault(run_id, {"failed": False})
+            ts = record.get("timestamp")
+            if ts and (
+                not info.get("timestamp") or ts < info.get("timestamp")
+            ):
+                info["timestamp"] = ts
+            if event_type == "phase_failure":
+                info["failed"] = True
+            if errors and any(
+                "hallucination" in str(err).lower() for err in errors
+            ):
+                info["hallucination"] = True
+            metrics_bucket = info.setdefault("metrics", {})
+            if phase == "phase4" and event_type == "phase_end":
+                for key in (
+                    "avg_rt_factor",
+                    "fallback_rate",
+                    "latency_fallback_chunks",
+                ):
+                    if metrics.get(key) is not None:
+                        metrics_bucket[key] = metrics.get(key)
+
+        if event_type == "phase_end" and isinstance(duration, (int, float)):
+            value = float(duration)
+            self.phase_duration[phase].add(value)
+            self.phase_success[phase] += 1
+            self.rolling_phase_duration[phase].append(value)
+        if event_type in {"phase_failure", "phase_retry"}:
+            self.phase_failures[phase] += 1
+            if phase and file_id:
+                self.file_failures[(phase, file_id)] += 1
+        if phase == "phase3":
+            self.chunk_event_total += 1
+            if errors and any("chunk" in str(err).lower() for err in errors):
+                self.chunk_error_count += 1
+        if phase == "phase4":
+            engine = (
+                metrics.get("engine_used")
+                or metrics.get("selected_engine")
+                or metrics.get("requested_engine")
+            )
+            if engine:
+                if status == "success" or event_type == "phase_end":
+                    self.engine_success[engine] += 1
+                elif event_type == "phase_failure":
+                    self.engine_failure[engine] += 1
+            avg_rt = _safe_float(metrics.get("avg_rt_factor"))
+            if avg_rt is not None:
+                self.rtf.add(avg_rt)
+                self.rolling_rt_factor.append(avg_rt)
+                if engine:
+                    self.rtf_by_engine[engine].add(avg_rt)
+            fallback_rate = _safe_float(metrics.get("fallback_rate"))
+            if fallback_rate is not None:
+                self.fallback.add(fallback_rate)
+                self.rolling_fallback.append(fallback_rate)
+                if engine:
+                    self.fallback_by_engine[engine].add(fallback_rate)
+                    self.fallback_recent_by_engine[engine].append(fallback_rate)
+            latency_chunks = _safe_float(
+                metrics.get("latency_fallback_chunks")
+            )
+            if latency_chunks is not None:
+                self.fallback_chunks.add(latency_chunks)
+                if engine:
+                    self.fallback_chunks_by_engine[engine].add(latency_chunks)
+            if errors and any(
+                "hallucination" in str(err).lower() for err in errors
+            ):
+                self.hallucination_flags += 1
+                if engine:
+                    self.hallucination_by_engine[engine] += 1
+                self.hallucination_recent.append(
+                    {
+                        "timestamp": record.get("timestamp"),
+                        "file_id": file_id,
+                        "engine": engine,
+                    }
+                )
+        if phase == "phase5":
+            self.enhancement_total += 1
+            if event_type == "phase_failure":
+                self.enhancement_failures += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """The ``compute_stats`` view of everything folded so far."""
+        phase_duration_summary = {
+            key: sketch.summary_ms()
+            for key, sketch in self.phase_duration.items()
+            if sketch.count
+        }
+        rolling_phase_summary = {
+            key: _summarize_recent(window)
+            for key, window in self.rolling_phase_duration.items()
+            if window
+        }
+        rolling_rt_factor = self.rolling_rt_factor
+        rolling_fallback = self.rolling_fallback
+        rtf_stats = _build_rtf_stats(self.rtf, rolling_rt_factor, self.rtf_by_engine)
+        fallback_stats = _build_fallback_stats(
+            self.fallback,
+            rolling_fallback,
+            self.fallback_by_engine,
+            self.fallback_recent_by_engine,
+            self.fallback_chunks,
+            self.fallback_chunks_by_engine,
+        )
+        hallucination_flags = self.hallucination_flags
+        hallucination_stats = {
+            "total": hallucination_flags,
+            "recent_total": len(self.hallucination_recent),
+            "by_engine": dict(self.hallucination_by_engine),
+            "recent_events": list(self.hallucination_recent),
+        }
+        rolling_metrics = {
+            "phase_duration_ms": rolling_phase_summary,
+            "rt_factor": {
+                "avg": mean(rolling_rt_factor) if rolling_rt_factor else None,
+                "max": max(rolling_rt_factor) if rolling_rt_factor else None,
+                "samples": len(rolling_rt_factor),
+            },
+            "fallback_rate": {
+                "avg": mean(rolling_fallback) if rolling_fallback else None,
+                "max": max(rolling_fallback) if rolling_fallback else None,
+                "samples": len(rolling_fallback),
+            },
+        }
+        run_history = [
+            {
+                "run_id": run_id,
+                "failed": details.get("failed", False),
+                "timestamp": details.get("timestamp"),
+                "metrics": dict(details.get("metrics", {})),
+                "hallucination": details.get("hallucination", False),
+            }
+            for run_id, details in self.run_info.items()
+        ]
+        run_history.sort(key=lambda item: _parse_timestamp(item.get("timestamp")))
+        recent_good_runs = 0
+        for entry in reversed(run_history):
+            if entry.get("failed"):
+                break
+            recent_good_runs += 1
+        run_rewards: List[Dict[str, Any]] = []
+        for entry in run_history:
+            reward = _compute_run_reward(entry)
+            entry["reward"] = reward
+            run_rewards.append({"run_id": entry["run_id"], "reward": reward})
+        reward_values = [item["reward"] for item in run_rewards]
+        reward_average = mean(reward_values) if reward_values else 0.0
+        chunk_error_rate = (
+            (self.chunk_error_count / self.chunk_event_total)
+            if self.chunk_event_total
+            else 0.0
+        )
+        engine_reliability_data = compute_engine_reliability(
+            self.engine_success, self.engine_failure
+        )
+        sorted_engines = sorted(
+            engine_reliability_data.items(), key=lambda item: item[1], reverse=True
+        )
+        best_score = sorted_engines[0][1] if sorted_engines else 0.0
+        second_score = sorted_engines[1][1] if len(sorted_engines) > 1 else 0.0
+        engine_bias = max(0.0, best_score - second_score)
+        voice_penalty = min(
+            1.0,
+            (
+                float(hallucination_flags) / max(1, len(run_history))
+                if run_history
+                else 0.0
+            ),
+        )
+        skill_weights = {
+            "chunk_size": max(0.0, 1.0 - chunk_error_rate),
+            "engine": best_score,
+            "voice": max(0.0, 1.0 - voice_penalty),
+        }
+        adaptive_deltas = {
+            "chunk_size": max(-2.0, min(2.0, reward_average * 2.0)),
+            "engine_bias": engine_bias,
+        }
+        safety_flags = {
+            "revert_chunk": reward_average < -0.5,
+            "revert_engine": reward_average < -0.75,
+            "voice_alert": bool(hallucination_flags),
+        }
+
+        return {
+            "phase_duration": {
+                key: sketch.mean
+                for key, sketch in self.phase_duration.items()
+                if sketch.count
+            },
+            "phase_duration_summary": phase_duration_summary,
+            "phase_duration_recent": rolling_phase_summary,
+            "phase_duration_analysis": _build_phase_duration_analysis(
+                phase_duration_summary
+            ),
+            "phase_failures": dict(self.phase_failures),
+            "phase_success": dict(self.phase_success),
+            "file_failures": dict(self.file_failures),
+            "chunk_error_rate": chunk_error_rate,
+            "engine_reliability": engine_reliability_data,
+            "hallucination_flags": hallucination_flags,
+            "hallucination_stats": hallucination_stats,
+            "enhancement_failure_rate": (
+                self.enhancement_failures / self.enhancement_total
+                if self.enhancement_total
+                else 0.0
+            ),
+            "rtf_stats": rtf_stats,
+            "engine_fallback_rates": fallback_stats,
+            "rolling_metrics": rolling_metrics,
+            "run_history": run_history,
+            "recent_good_runs": recent_good_runs,
+            "run_rewards": run_rewards,
+            "reward_average": reward_average,
+            "skill_weights": skill_weights,
+            "adaptive_deltas": adaptive_deltas,
+            "safety_flags": safety_flags,
+        }
+
+    # Checkpoint (de)serialisation ------------------------------------- #
+    _COUNTERS = (
+        "chunk_error_count",
+        "chunk_event_total",
+        "hallucination_flags",
+        "enhancement_failures",
+        "enhancement_total",
+        "events",
+    )
+    _COUNT_MAPS = (
+        "phase_failures",
+        "phase_success",
+        "engine_success",
+        "engine_failure",
+        "hallucination_by_engine",
+    )
+    _SKETCHES = ("rtf", "fallback", "fallback_chunks")
+    _SKETCH_MAPS = (
+        "phase_duration",
+        "rtf_by_engine",
+        "fallback_by_engine",
+        "fallback_chunks_by_engine",
+    )
+    _WINDOWS = ("hallucination_recent", "rolling_rt_factor", "rolling_fallback")
+    _WINDOW_MAPS = ("rolling_phase_duration", "fallback_recent_by_engine")
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {name: getattr(self, name) for name in self._COUNTERS}
+        data.update({name: dict(getattr(self, name)) for name in self._COUNT_MAPS})
+        data.update({name: getattr(self, name).to_dict() for name in self._SKETCHES})
+        data.update(
+            {
+                name: {key: sketch.to_dict() for key, sketch in getattr(self, name).items()}
+                for name in self._SKETCH_MAPS
+            }
+        )
+        data.update({name: list(getattr(self, name)) for name in self._WINDOWS})
+        data.update(
+            {
+                name: {key: list(window) for key, window in getattr(self, name).items()}
+                for name in self._WINDOW_MAPS
+            }
+        )
+        data["file_failures"] = [[phase, file_id, count] for (phase, file_id), count in self.file_failures.items()]
+        data["run_info"] = self.run_info
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "StatsAccumulator":
+        acc = cls()
+        for name in cls._COUNTERS:
+            setattr(acc, name, int(data[name]))
+        for name in cls._COUNT_MAPS:
+            getattr(acc, name).update(data[name])
+        for name in cls._SKETCHES:
+            setattr(acc, name, QuantileSketch.from_dict(data[name]))
+        for name in cls._SKETCH_MAPS:
+            getattr(acc, name).update(
+                {key: QuantileSketch.from_dict(value) for key, value in data[name].items()}
+            )
+        for name in cls._WINDOWS:
+            getattr(acc, name).extend(data[name])
+        for name in cls._WINDOW_MAPS:
+            for key, values in data[name].items():
+                getattr(acc, name)[key].extend(values)
+        for phase, file_id, count in data["file_failures"]:
+            acc.file_failures[(phase, file_id)] = int(count)
+        acc.run_info = dict(data["run_info"])
+        return acc
+
+
 class PolicyAdvisor:
-    """Lightweight analytics layer that reads policy logs and issues suggestions."""
+    """
+    Lightweight analytics layer that reads policy logs and issues suggestions.
+
+    Statistics are folded incrementally: the advisor remembers a byte
+    offset per daily log and only parses lines appended since the last
+    call.  What has been folded is checkpointed next to the logs
+    (``CHECKPOINT_NAME``), so a new process resumes from there instead of
+    replaying the whole history.  A log that shrinks or disappears forces a
+    full rebuild.
+    """
 
     def __init__(self, log_root: Optional[Path] = None) -> None:
         self.log_root = Path(log_root) if log_root else LOG_ROOT
-        self._cache_token: Optional[Tuple[float, int]] = None
+        self._lock = threading.Lock()
+        self._acc: Optional[StatsAccumulator] = None
+        self._offsets: Dict[str, int] = {}
         self._stats: Dict[str, Any] = {}
+        self._stats_events = -1
+        self._last_checkpoint = float("-inf")
 
     def advise(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         stats = self._refresh()
@@ -164,36 +662,107 @@ class PolicyAdvisor:
         return self._refresh()
 
     def _refresh(self) -> Dict[str, Any]:
-        try:
-            snapshot = self._log_snapshot()
-        except FileNotFoundError:
-            self._stats = {}
-            self._cache_token = None
-            return self._stats
-
-        if snapshot == self._cache_token and self._stats:
+        with self._lock:
+            try:
+                sizes = self._log_sizes()
+            except FileNotFoundError:
+                self._reset()
+                self._stats = {}
+                self._stats_events = -1
+                return self._stats
+
+            if self._acc is None:
+                self._load_checkpoint()
+            if any(sizes.get(name, -1) < offset for name, offset in self._offsets.items()):
+                self._reset()  # rotated or truncated: aggregates cannot un-fold events
+
+            folded = 0
+            for name, size in sizes.items():
+                if size > self._offsets.get(name, 0):
+                    folded += self._fold(name)
+
+            if self._acc.events != self._stats_events:
+                self._stats = self._acc.stats()
+                self._stats_events = self._acc.events
+            if folded and time.monotonic() - self._last_checkpoint >= CHECKPOINT_INTERVAL_SEC:
+                self._save_checkpoint()
             return self._stats
 
-        events = list(iter_events(self.log_root))
-        self._stats = compute_stats(events)
-        self._cache_token = snapshot
-        return self._stats
+    def _reset(self) -> None:
+        self._acc = StatsAccumulator()
+        self._offsets = {}
 
-    def _log_snapshot(self) -> Tuple[float, int]:
+    def _log_sizes(self) -> Dict[str, int]:
         if not self.log_root.exists():
             raise FileNotFoundError(self.log_root)
-        newest_mtime = 0.0
-        total_files = 0
-        for path in self.log_root.glob("*.log"):
+        sizes: Dict[str, int] = {}
+        for path in sorted(self.log_root.glob("*.log")):
             try:
-                mtime = path.stat().st_mtime
+                sizes[path.name] = path.stat().st_size
             except OSError:
                 continue
-            newest_mtime = max(newest_mtime, mtime)
-            total_files += 1
-        if total_files == 0:
+        if not sizes:
             raise FileNotFoundError(self.log_root)
-        return newest_mtime, total_files
+        return sizes
+
+    def _fold(self, name: str) -> int:
+        """Fold the complete lines appended to ``name`` since its offset."""
+        offset = self._offsets.get(name, 0)
+        try:
+            with (self.log_root / name).open("rb") as handle:
+                handle.seek(offset)
+                data = handle.read()
+        except OSError:
+            return 0
+        end = data.rfind(b"\n") + 1  # a line still being written waits for its newline
+        folded = 0
+        for line in data[:end].splitlines():
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(record, dict):
+                self._acc.add(record)
+                folded += 1
+        self._offsets[name] = offset + end
+        return folded
+
+    def _checkpoint_path(self) -> Path:
+        return self.log_root / CHECKPOINT_NAME
+
+    def _load_checkpoint(self) -> None:
+        self._reset()
+        try:
+            data = json.loads(self._checkpoint_path().read_text(encoding="utf-8"))
+            if data.get("version") != CHECKPOINT_VERSION or data.get("windows") != [
+                ROLLING_WINDOW,
+                HALLUCINATION_WINDOW,
+            ]:
+                return
+            acc = StatsAccumulator.from_dict(data["state"])
+            offsets = {str(name): int(offset) for name, offset in data["offsets"].items()}
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+        self._acc, self._offsets = acc, offsets
+
+    def _save_checkpoint(self) -> None:
+        payload = {
+            "version": CHECKPOINT_VERSION,
+            "windows": [ROLLING_WINDOW, HALLUCINATION_WINDOW],
+            "offsets": self._offsets,
+            "state": self._acc.to_dict(),
+        }
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.log_root, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                json.dump(payload, handle, default=str)
+            os.replace(tmp, self._checkpoint_path())
+            self._last_checkpoint = time.monotonic()
+        except (OSError, TypeError, ValueError):
+            pass
 
 
 def iter_events(log_root: Path) -> Iterable[Dict[str, Any]]:
@@ -213,332 +782,74 @@ def iter_events(log_root: Path) -> Iterable[Dict[str, Any]]:
 
 
 def compute_stats(events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
-    def _rolling_deque() -> deque[float]:
-        return deque(maxlen=ROLLING_WINDOW)
-
-    phase_duration: Dict[str, List[float]] = defaultdict(list)
-    rolling_phase_duration: Dict[str, deque[float]] = defaultdict(
-        _rolling_deque
-    )
-    phase_failures: Dict[str, int] = defaultdict(int)
-    phase_success: Dict[str, int] = defaultdict(int)
-    file_failures: Dict[Tuple[str, str], int] = defaultdict(int)
-    chunk_error_count = 0
-    chunk_event_total = 0
-    engine_success: Dict[str, int] = defaultdict(int)
-    engine_failure: Dict[str, int] = defaultdict(int)
-    hallucination_flags = 0
-    hallucination_by_engine: Dict[str, int] = defaultdict(int)
-    hallucination_recent: deque[Dict[str, Any]] = deque(
-        maxlen=HALLUCINATION_WINDOW
-    )
-    enhancement_failures = 0
-    enhancement_total = 0
-    rtf_samples: List[float] = []
-    rolling_rt_factor: deque[float] = deque(maxlen=ROLLING_WINDOW)
-    rtf_by_engine: Dict[str, List[float]] = defaultdict(list)
-    fallback_rates: List[float] = []
-    rolling_fallback: deque[float] = deque(maxlen=ROLLING_WINDOW)
-    fallback_by_engine: Dict[str, List[float]] = defaultdict(list)
-    fallback_recent_by_engine: Dict[str, deque[float]] = defaultdict(
-        _rolling_deque
-    )
-    fallback_chunk_counts: List[float] = []
-    fallback_chunks_by_engine: Dict[str, List[float]] = defaultdict(list)
-    run_info: Dict[str, Dict[str, Any]] = {}
-
+    acc = StatsAccumulator()
     for record in events:
-        event_type = record.get("event")
-        phase = record.get("phase")
-        file_id = record.get("file_id")
-        status = record.get("status")
-        duration = record.get("duration_ms")
-        errors = record.get("errors") or []
-        metrics = record.get("metrics") or {}
-        run_id = record.get("run_id")
-        if run_id:
-            info = run_info.setdefault(run_id, {"failed": False})
-            ts = record.get("timestamp")
-            if ts and (
-                not info.get("timestamp") or ts < info.get("timestamp")
-            ):
-                info["timestamp"] = ts
-            if event_type == "phase_failure":
-                info["failed"] = True
-            if errors and any(
-                "hallucination" in str(err).lower() for err in errors
-            ):
-                info["hallucination"] = True
-            metrics_bucket = info.setdefault("metrics", {})
-            if phase == "phase4" and event_type == "phase_end":
-                for key in (
-                    "avg_rt_factor",
-                    "fallback_rate",
-                    "latency_fallback_chunks",
-                ):
-                    if metrics.get(key) is not None:
-                        metrics_bucket[key] = metrics.get(key)
-
-        if event_type == "phase_end" and isinstance(duration, (int, float)):
-            value = float(duration)
-            phase_duration[phase].append(value)
-            phase_success[phase] += 1
-            rolling_phase_duration[phase].append(value)
-        if event_type in {"phase_failure", "phase_retry"}:
-            phase_failures[phase] += 1
-            if phase and file_id:
-                file_failures[(phase, file_id)] += 1
-        if phase == "phase3":
-            chunk_event_total += 1
-            if errors and any("chunk" in str(err).lower() for err in errors):
-                chunk_error_count += 1
-        if phase == "phase4":
-            engine = (
-                metrics.get("engine_used")
-                or metrics.get("selected_engine")
-                or metrics.get("requested_engine")
-            )
-            if engine:
-                if status == "success" or event_type == "phase_end":
-                    engine_success[engine] += 1
-                elif event_type == "phase_failure":
-                    engine_failure[engine] += 1
-            avg_rt = _safe_float(metrics.get("avg_rt_factor"))
-            if avg_rt is not None:
-                rtf_samples.append(avg_rt)
-                rolling_rt_factor.append(avg_rt)
-                if engine:
-                    rtf_by_engine[engine].append(avg_rt)
-            fallback_rate = _safe_float(metrics.get("fallback_rate"))
-            if fallback_rate is not None:
-                fallback_rates.append(fallback_rate)
-                rolling_fallback.append(fallback_rate)
-                if engine:
-                    fallback_by_engine[engine].append(fallback_rate)
-                    fallback_recent_by_engine[engine].append(fallback_rate)
-            latency_chunks = _safe_float(
-                metrics.get("latency_fallback_chunks")
-            )
-            if latency_chunks is not None:
-                fallback_chunk_counts.append(latency_chunks)
-                if engine:
-                    fallback_chunks_by_engine[engine].append(latency_chunks)
-            if errors and any(
-                "hallucination" in str(err).lower() for err in errors
-            ):
-                hallucination_flags += 1
-                if engine:
-                    hallucination_by_engine[engine] += 1
-                hallucination_recent.append(
-                    {
-                        "timestamp": record.get("timestamp"),
-                        "file_id": file_id,
-                        "engine": engine,
-                    }
-                )
-        if phase == "phase5":
-            enhancement_total += 1
-            if event_type == "phase_failure":
-                enhancement_failures += 1
-
-    phase_duration_summary = {
-        key: _summarize_numbers(values)
-        for key, values in phase_duration.items()
-        if values
-    }
-    rolling_phase_summary = {
-        key: _summarize_recent(window)
-        for key, window in rolling_phase_duration.items()
-        if window
-    }
-    rtf_stats = _build_rtf_stats(rtf_samples, rolling_rt_factor, rtf_by_engine)
-    fallback_stats = _build_fallback_stats(
-        fallback_rates,
-        rolling_fallback,
-        fallback_by_engine,
-        fallback_recent_by_engine,
-        fallback_chunk_counts,
-        fallback_chunks_by_engine,
-    )
-    hallucination_stats = {
-        "total": hallucination_flags,
-        "recent_total": len(hallucination_recent),
-        "by_engine": dict(hallucination_by_engine),
-        "recent_events": list(hallucination_recent),
-    }
-    rolling_metrics = {
-        "phase_duration_ms": rolling_phase_summary,
-        "rt_factor": {
-            "avg": mean(rolling_rt_factor) if rolling_rt_factor else None,
-            "max": max(rolling_rt_factor) if rolling_rt_factor else None,
-            "samples": len(rolling_rt_factor),
-        },
-        "fallback_rate": {
-            "avg": mean(rolling_fallback) if rolling_fallback else None,
-            "max": max(rolling_fallback) if rolling_fallback else None,
-            "samples": len(rolling_fallback),
-        },
-    }
-    run_history = [
-        {
-            "run_id": run_id,
-            "failed": details.get("failed", False),
-            "timestamp": details.get("timestamp"),
-            "metrics": details.get("metrics", {}),
-            "hallucination": details.get("hallucination", False),
-        }
-        for run_id, details in run_info.items()
-    ]
-    run_history.sort(key=lambda item: _parse_timestamp(item.get("timestamp")))
-    recent_good_runs = 0
-    for entry in reversed(run_history):
-        if entry.get("failed"):
-            break
-        recent_good_runs += 1
-    run_rewards: List[Dict[str, Any]] = []
-    for entry in run_history:
-        reward = _compute_run_reward(entry)
-        entry["reward"] = reward
-        run_rewards.append({"run_id": entry["run_id"], "reward": reward})
-    reward_values = [item["reward"] for item in run_rewards]
-    reward_average = mean(reward_values) if reward_values else 0.0
-    chunk_error_rate = (
-        (chunk_error_count / chunk_event_total) if chunk_event_total else 0.0
-    )
-    engine_reliability_data = compute_engine_reliability(
-        engine_success, engine_failure
-    )
-    sorted_engines = sorted(
-        engine_reliability_data.items(), key=lambda item: item[1], reverse=True
-    )
-    best_score = sorted_engines[0][1] if sorted_engines else 0.0
-    second_score = sorted_engines[1][1] if len(sorted_engines) > 1 else 0.0
-    engine_bias = max(0.0, best_score - second_score)
-    voice_penalty = min(
-        1.0,
-        (
-            float(hallucination_flags) / max(1, len(run_history))
-            if run_history
-            else 0.0
-        ),
-    )
-    skill_weights = {
-        "chunk_size": max(0.0, 1.0 - chunk_error_rate),
-        "engine": best_score,
-        "voice": max(0.0, 1.0 - voice_penalty),
-    }
-    adaptive_deltas = {
-        "chunk_size": max(-2.0, min(2.0, reward_average * 2.0)),
-        "engine_bias": engine_bias,
-    }
-    safety_flags = {
-        "revert_chunk": reward_average < -0.5,
-        "revert_engine": reward_average < -0.75,
-        "voice_alert": bool(hallucination_flags),
-    }
-
-    return {
-        "phase_duration": {
-            key: mean(values)
-            for key, values in phase_duration.items()
-            if values
-        },
-        "phase_duration_summary": phase_duration_summary,
-        "phase_duration_recent": rolling_phase_summary,
-        "phase_duration_analysis": _build_phase_duration_analysis(
-            phase_duration_summary
-        ),
-        "phase_failures": dict(phase_failures),
-        "phase_success": dict(phase_success),
-        "file_failures": dict(file_failures),
-        "chunk_error_rate": chunk_error_rate,
-        "engine_reliability": engine_reliability_data,
-        "hallucination_flags": hallucination_flags,
-        "hallucination_stats": hallucination_stats,
-        "enhancement_failure_rate": (
-            enhancement_failures / enhancement_total
-            if enhancement_total
-            else 0.0
-        ),
-        "rtf_stats": rtf_stats,
-        "engine_fallback_rates": fallback_stats,
-        "rolling_metrics": rolling_metrics,
-        "run_history": run_history,
-        "recent_good_runs": recent_good_runs,
-        "run_rewards": run_rewards,
-        "reward_average": reward_average,
-        "skill_weights": skill_weights,
-        "adaptive_deltas": adaptive_deltas,
-        "safety_flags": safety_flags,
-    }
+        acc.add(record)
+    return acc.stats()
 
 
 def _build_rtf_stats(
-    samples: List[float],
+    samples: QuantileSketch,
     rolling: deque[float],
-    per_engine: Dict[str, List[float]],
+    per_engine: Dict[str, QuantileSketch],
 ) -> Dict[str, Any]:
-    ordered = sorted(samples)
     summary: Dict[str, Any] = {
-        "avg": mean(ordered) if ordered else None,
-        "p90": _percentile(ordered, 90.0),
-        "p99": _percentile(ordered, 99.0),
+        "avg": samples.mean,
+        "p90": samples.percentile(90.0),
+        "p99": samples.percentile(99.0),
         "recent_avg": mean(rolling) if rolling else None,
-        "samples": len(ordered),
+        "samples": samples.count,
         "rolling_samples": len(rolling),
         "by_engine": {},
     }
     engines: Dict[str, Dict[str, Any]] = {}
-    for engine, values in per_engine.items():
-        if not values:
+    for engine, sketch in per_engine.items():
+        if not sketch.count:
             continue
-        ordered_vals = sorted(values)
         engines[engine] = {
-            "avg": mean(ordered_vals),
-            "p90": _percentile(ordered_vals, 90.0),
-            "samples": len(ordered_vals),
+            "avg": sketch.mean,
+            "p90": sketch.percentile(90.0),
+            "samples": sketch.count,
         }
     summary["by_engine"] = engines
     return summary
 
 
 def _build_fallback_stats(
-    overall_rates: List[float],
+    overall_rates: QuantileSketch,
     rolling_rates: deque[float],
-    per_engine: Dict[str, List[float]],
+    per_engine: Dict[str, QuantileSketch],
     per_engine_recent: Dict[str, deque[float]],
-    chunk_counts: List[float],
-    chunk_counts_by_engine: Dict[str, List[float]],
+    chunk_counts: QuantileSketch,
+    chunk_counts_by_engine: Dict[str, QuantileSketch],
 ) -> Dict[str, Any]:
-    ordered = sorted(overall_rates)
     overall = {
-        "avg_rate": mean(ordered) if ordered else None,
+        "avg_rate": overall_rates.mean,
         "recent_rate": mean(rolling_rates) if rolling_rates else None,
-        "max_rate": max(ordered) if ordered else None,
-        "samples": len(ordered),
+        "max_rate": overall_rates.max,
+        "samples": overall_rates.count,
         "rolling_samples": len(rolling_rates),
     }
     engines: Dict[str, Dict[str, Any]] = {}
-    for engine, values in per_engine.items():
-        if not values:
+    for engine, sketch in per_engine.items():
+        if not sketch.count:
             continue
-        ordered_vals = sorted(values)
         recent_window = per_engine_recent.get(engine)
-        chunk_counts_for_engine = chunk_counts_by_engine.get(engine) or []
+        chunk_counts_for_engine = chunk_counts_by_engine.get(engine)
         engines[engine] = {
-            "avg_rate": mean(ordered_vals),
+            "avg_rate": sketch.mean,
             "recent_rate": mean(recent_window) if recent_window else None,
-            "samples": len(ordered_vals),
+            "samples": sketch.count,
             "avg_latency_chunks": (
-                mean(chunk_counts_for_engine)
-                if chunk_counts_for_engine
+                chunk_counts_for_engine.mean
+                if chunk_counts_for_engine is not None
                 else None
             ),
         }
     return {
         "overall": overall,
         "per_engine": engines,
-        "latency_chunks_avg": mean(chunk_counts) if chunk_counts else None,
+        "latency_chunks_avg": chunk_counts.mean,
     }
 
 
@@ -0,0 +1,186 @@
+"""
+Failure Classifier - Decide whether a failed phase is worth retrying.
+
+The orchestrator retries a failed phase in full.  That only helps when the
+cause can go away on its own (memory pressure, a timeout, a busy device);
+a malformed PDF, a schema error or a missing model file fails the same way
+every time.  Before each retry the phase's stderr tail and exit code are
+labelled:
+
+- transient: retry after an exponential backoff with jitter
+- deterministic: fail fast, go straight to failure analysis
+- unknown: keep the old fixed pause and retry
+
+Only the lines that say why the phase died are read: the final exception
+line of the last traceback and any ERROR-level lines after it (or, with no
+exception, the ERROR-level lines; failing that, the last line).  Warnings
+and INFO chatter elsewhere in the tail do not count.  Signatures come from
+LogParser's FAILURE_PATTERNS, anchored at word starts so "OOM" does not
+match "boom" or "zoom" (the last matching line wins, since it is closest
+to the exit), a few whole-phase patterns below, and failure messages
+already recorded in the ErrorRegistry.
+"""
+
+from __future__ import annotations
+
+import random
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from .log_parser import FAILURE_PATTERNS, LogParser
+
+TRANSIENT = "transient"
+DETERMINISTIC = "deterministic"
+UNKNOWN = "unknown"
+
+# LogParser/ErrorRegistry category -> retry label.  "quality" stays unknown:
+# TTS sampling can produce a clean take on the next attempt.
+CATEGORY_LABELS: Dict[str, str] = {
+    "oom": TRANSIENT,
+    "timeout": TRANSIENT,
+    "busy": TRANSIENT,
+    "schema": DETERMINISTIC,
+    "io": DETERMINISTIC,
+    "truncation": DETERMINISTIC,
+    "input": DETERMINISTIC,
+    "environment": DETERMINISTIC,
+}
+
+# Whole-phase failures the chunk-level log patterns do not cover.
+PHASE_FAILURE_PATTERNS: Dict[str, List[Tuple[str, str]]] = {
+    "busy": [
+        (r"resource (temporarily )?(busy|unavailable)", "Resource busy"),
+        (r"database is locked", "Lock held by another process"),
+        (r"connection (reset|refused)", "Service not reachable"),
+        (r"too many open files", "File descriptors exhausted"),
+    ],
+    "input": [
+        (r"PDFSyntaxError|PdfReadError|EOF marker not found", "Malformed PDF"),
+        (r"not a valid (pdf|epub|docx)", "Unsupported or corrupt input"),
+        (r"UnicodeDecodeError", "Undecodable input text"),
+        (r"JSONDecodeError", "Malformed JSON"),
+    ],
+    "environment": [
+        (r"ModuleNotFoundError|ImportError", "Missing dependency"),
+        (r"SyntaxError", "Broken source file"),
+        (r"usage: .*error:", "Invalid command line"),
+        (r"model (file )?not found|checkpoint .*not found", "Missing model file"),
+    ],
+}
+
+# Exit codes that say more than the text: 137/-9 is the OOM killer, 124 is
+# timeout(1), 2 is an argparse usage error.
+EXIT_CODE_CATEGORIES: Dict[int, str] = {137: "oom", -9: "oom", 124: "timeout", 2: "environment"}
+
+# "pkg.module.SomeError: message" - the line a Python traceback ends with
+EXCEPTION_LINE = re.compile(r"^\s*(?:[A-Za-z_]\w*\.)*[A-Za-z_]\w*(?:Error|Exception|Exit|Interrupt)(?::|\s*$)")
+# "... - ERROR - ...", "[CRITICAL] ...", "prog: error: ..."
+ERROR_LINE = re.compile(r"(?<!\w)(?:ERROR|CRITICAL|FATAL)\b|(?<!\w)(?:[Ee]rror|[Ff]atal):")
+
+BACKOFF_BASE_SEC = 5.0
+BACKOFF_MAX_SEC = 60.0
+UNKNOWN_PAUSE_SEC = 2.0
+TAIL_LINES = 200
+
+
+@dataclass(frozen=True)
+class FailureVerdict:
+    """How a failure was labelled and the signature that decided it."""
+
+    label: str
+    category: str = "unknown"
+    reason: str = ""
+
+    @property
+    def retryable(self) -> bool:
+        return self.label != DETERMINISTIC
+
+
+def _word_start(pattern: str) -> str:
+    """Anchor a substring pattern at a word start ("OOM" still matches "OOMKilled")."""
+    return r"\b" + pattern if pattern[:1].isalnum() else pattern
+
+
+def decisive_lines(lines: List[str]) -> List[str]:
+    """The final exception line plus later ERROR-level lines (see module docstring)."""
+    last_exception = None
+    for index, line in enumerate(lines):
+        if EXCEPTION_LINE.match(line):
+            last_exception = index
+    if last_exception is not None:
+        return [lines[last_exception]] + [line for line in lines[last_exception + 1 :] if ERROR_LINE.search(line)]
+    picked = [line for line in lines if ERROR_LINE.search(line)]
+    if picked:
+        return picked
+    tail = [line for line in lines if line.strip()]
+    return tail[-1:]
+
+
+class FailureClassifier:
+    """
+    Labels a phase failure from its stderr tail and exit code.
+
+    Usage:
+        classifier = FailureClassifier(registry=ErrorRegistry())
+        verdict = classifier.classify(stderr, exit_code=1)
+        delay = retry_delay(verdict, attempt=1)  # None: do not retry
+    """
+
+    def __init__(self, registry: Optional[Any] = None):
+        self.parser = LogParser(
+            {
+                category: [(_word_start(pattern), description) for pattern, description in patterns]
+                for category, patterns in {**FAILURE_PATTERNS, **PHASE_FAILURE_PATTERNS}.items()
+            }
+        )
+        self.registry = registry
+
+    def _registry_signatures(self) -> List[Tuple[str, str]]:
+        entries = getattr(self.registry, "entries", None) or {}
+        signatures = []
+        for entry in entries.values():
+            message = (entry.failure_message or "").strip()
+            if len(message) >= 10 and entry.failure_category in CATEGORY_LABELS:
+                signatures.append((message, entry.failure_category))
+        return signatures
+
+    def classify(self, error_text: Optional[str], exit_code: Optional[int] = None) -> FailureVerdict:
+        """Label one failure; empty text with an uninformative exit code is unknown."""
+        lines = decisive_lines((error_text or "").splitlines()[-TAIL_LINES:])
+        for line in reversed(lines):
+            for message, category in self._registry_signatures():
+                if message in line:
+                    return FailureVerdict(CATEGORY_LABELS[category], category, f"error registry: {message[:80]}")
+        events = self.parser.parse_lines(lines, source="phase_stderr")
+        for event in reversed(events):
+            label = CATEGORY_LABELS.get(event.category)
+            if label:
+                return FailureVerdict(label, event.category, event.context.get("pattern", ""))
+        category = EXIT_CODE_CATEGORIES.get(exit_code) if exit_code is not None else None
+        if category:
+            return FailureVerdict(CATEGORY_LABELS[category], category, f"exit code {exit_code}")
+        return FailureVerdict(UNKNOWN)
+
+
+def retry_delay(
+    verdict: FailureVerdict,
+    attempt: int,
+    *,
+    base: float = BACKOFF_BASE_SEC,
+    cap: float = BACKOFF_MAX_SEC,
+    rng: Optional[random.Random] = None,
+) -> Optional[float]:
+    """
+    Seconds to wait before retry ``attempt`` (1-based), or None to stop.
+
+    Transient failures back off exponentially with "equal jitter" (half
+    fixed, half random), so parallel books do not retry in lockstep.
+    """
+    if verdict.label == DETERMINISTIC:
+        return None
+    if verdict.label == UNKNOWN:
+        return UNKNOWN_PAUSE_SEC
+    ceiling = min(cap, base * (2 ** max(0, attempt - 1)))
+    return ceiling / 2 + (rng or random).uniform(0, ceiling / 2)
+
@@ -337,11 +337,11 @@ class DeadChunkRepair:
                 reference_audio=reference_audio,
             )
 
-                attempt = RepairAttempt(
-                    strategy=strategy,
-                    success=result is not None,
-                    chunk_id=chunk_id,
-                    details={
+            attempt = RepairAttempt(
+                strategy=strategy,
+                success=result is not None,
+                chunk_id=chunk_id,
+                details={
                     "auto_repair": True,
                     "success_rate": success_rate,
                     "confidence": confidence,
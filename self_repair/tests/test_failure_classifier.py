@@ -0,0 +1,107 @@
+"""Failure classification before whole-phase retries."""
+
+from __future__ import annotations
+
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from self_repair.failure_classifier import (
+    DETERMINISTIC,
+    TRANSIENT,
+    UNKNOWN,
+    UNKNOWN_PAUSE_SEC,
+    FailureClassifier,
+    FailureVerdict,
+    retry_delay,
+)
+from self_repair.repair_loop import ErrorRegistry
+
+RECORDED_FAILURES = Path(__file__).parent / "fixtures" / "phase_failures.jsonl"
+MAX_RETRIES = 2  # run_phase_with_retry default
+
+
+def _recorded():
+    return [json.loads(line) for line in RECORDED_FAILURES.read_text(encoding="utf-8").splitlines() if line.strip()]
+
+
+@pytest.mark.parametrize("record", _recorded(), ids=lambda r: f"phase{r['phase']}-{r['expected']}")
+def test_recorded_failures_are_labelled(record):
+    verdict = FailureClassifier().classify(record["stderr"], record["exit_code"])
+    assert verdict.label == record["expected"], verdict
+
+
+def test_last_signature_wins_and_registry_messages_count(tmp_path):
+    classifier = FailureClassifier()
+    text = "WARNING timeout talking to ollama, continuing\nKeyError: 'chunk_paths'\n"
+    assert classifier.classify(text).category == "schema"
+
+    registry = ErrorRegistry(path=tmp_path / "error_registry.json")
+    registry.add_failure("chunk_0007", "book", "oom", "allocator refused block for vocoder")
+    verdict = FailureClassifier(registry=registry).classify("fatal: allocator refused block for vocoder\n", 1)
+    assert verdict == FailureVerdict(TRANSIENT, "oom", "error registry: allocator refused block for vocoder")
+
+
+@pytest.mark.parametrize(
+    "stderr",
+    [
+        "Traceback (most recent call last):\n  File \"main.py\", line 3, in <module>\nValueError: boom\n",
+        "INFO zoom level set\nRuntimeError: bad thing\n",
+        "2025-11-03 04:40:02 - INFO - room tone measured\nERROR - Enhancement aborted\n",
+    ],
+)
+def test_only_the_failing_line_counts_and_patterns_match_whole_words(stderr):
+    assert FailureClassifier().classify(stderr, 1).label == UNKNOWN
+
+
+def test_warnings_beside_the_exception_are_ignored():
+    text = (
+        "/venv/lib/pydantic/_internal/_config.py:291: PydanticDeprecatedSince20: "
+        "Support for class-based `config` is deprecated\n"
+        "Traceback (most recent call last):\n"
+        "  File \"engine.py\", line 88, in synthesize\n"
+        "RuntimeError: CUDA error: device-side assert triggered\n"
+    )
+    verdict = FailureClassifier().classify(text, 1)
+    assert verdict.label == UNKNOWN and verdict.retryable
+
+
+def test_retry_delay_backs_off_with_jitter():
+    rng = random.Random(7)
+    transient = FailureVerdict(TRANSIENT, "oom")
+    delays = [retry_delay(transient, attempt, rng=rng) for attempt in (1, 2, 3, 6)]
+    assert 2.5 <= delays[0] <= 5.0
+    assert 5.0 <= delays[1] <= 10.0
+    assert 10.0 <= delays[2] <= 20.0
+    assert 30.0 <= delays[3] <= 60.0  # capped
+    assert retry_delay(FailureVerdict(DETERMINISTIC, "io"), 1) is None
+    assert retry_delay(FailureVerdict(UNKNOWN), 1) == UNKNOWN_PAUSE_SEC
+
+
+def _retry_cost(record, classify):
+    """Seconds spent after the first failure: pauses plus repeated attempts (all failing)."""
+    cost = 0.0
+    for attempt in range(1, MAX_RETRIES + 1):
+        if classify:
+            pause = retry_delay(FailureClassifier().classify(record["stderr"], record["exit_code"]), attempt, rng=random.Random(0))
+            if pause is None:
+                break
+        else:
+            pause = 2.0  # the old fixed sleep
+        cost += pause + record["duration"]
+    return cost
+
+
+def test_replay_shows_retry_time_saved():
+    records = _recorded()
+    before = sum(_retry_cost(record, classify=False) for record in records)
+    after = sum(_retry_cost(record, classify=True) for record in records)
+    deterministic = [r for r in records if r["expected"] == DETERMINISTIC]
+    saved_on_deterministic = sum(_retry_cost(r, classify=False) for r in deterministic)
+
+    print(f"\nretry time over {len(records)} recorded failures: {before:.0f}s -> {after:.0f}s")
+    # Deterministic failures stop paying for repeats; transient ones only add backoff.
+    assert before - after > 0.9 * saved_on_deterministic
+    assert all(_retry_cost(r, classify=True) == 0.0 for r in deterministic)
@@ -0,0 +1,129 @@
+"""
+Incremental PolicyAdvisor statistics: only appended log bytes are parsed,
+and a checkpoint lets a new advisor skip history it has already folded.
+"""
+
+import json
+import random
+
+import pytest
+
+from policy_engine import advisor as advisor_mod
+from policy_engine.advisor import (
+    CHECKPOINT_NAME,
+    EXACT_SAMPLES,
+    PolicyAdvisor,
+    QuantileSketch,
+    _percentile,
+    compute_stats,
+)
+
+
+def _event(index, rng):
+    return {
+        "event": rng.choice(["phase_start", "phase_end", "phase_failure", "phase_retry"]),
+        "phase": rng.choice(["phase3", "phase4", "phase5"]),
+        "file_id": rng.choice(["book_a", "book_b"]),
+        "run_id": f"run-{index // 10}",
+        "timestamp": f"2025-01-01T00:{index // 60 % 60:02d}:{index % 60:02d}",
+        "duration_ms": rng.uniform(1_000, 900_000),
+        "errors": rng.choice([[], ["chunk_0003 too long"], ["hallucination suspected"]]),
+        "metrics": {
+            "engine_used": rng.choice(["xtts", "kokoro"]),
+            "avg_rt_factor": rng.uniform(0.5, 6.0),
+            "fallback_rate": rng.random(),
+        },
+    }
+
+
+def _append(path, events, tail=""):
+    with path.open("a", encoding="utf-8") as handle:
+        for event in events:
+            handle.write(json.dumps(event) + "\n")
+        handle.write(tail)
+
+
+@pytest.fixture
+def folded(monkeypatch):
+    """Counts events the advisor parses and folds."""
+    calls = []
+    original = advisor_mod.StatsAccumulator.add
+    monkeypatch.setattr(
+        advisor_mod.StatsAccumulator, "add", lambda self, record: (calls.append(record), original(self, record))
+    )
+    monkeypatch.setattr(advisor_mod, "CHECKPOINT_INTERVAL_SEC", 0.0)
+    return calls
+
+
+def test_only_new_complete_lines_are_folded(tmp_path, folded):
+    rng = random.Random(3)
+    events = [_event(i, rng) for i in range(60)]
+    log = tmp_path / "20250101.log"
+    _append(log, events[:40])
+
+    expected = [compute_stats(events[:40]), compute_stats(events[:50]), compute_stats(events)]
+    folded.clear()
+
+    advisor = PolicyAdvisor(log_root=tmp_path)
+    assert advisor.snapshot() == expected[0]
+    assert len(folded) == 40
+    assert advisor.snapshot() is advisor.snapshot()  # nothing new: cached
+    assert len(folded) == 40
+
+    partial = json.dumps(events[50])
+    _append(log, events[40:50], tail=partial[:25])  # writer mid-line
+    assert advisor.snapshot() == expected[1]
+    assert len(folded) == 50
+
+    with log.open("a", encoding="utf-8") as handle:
+        handle.write(partial[25:] + "\n")
+    _append(tmp_path / "20250102.log", events[51:])
+    assert advisor.snapshot() == expected[2]
+    assert len(folded) == 60
+
+
+def test_checkpoint_lets_a_cold_start_skip_folded_history(tmp_path, folded):
+    rng = random.Random(5)
+    events = [_event(i, rng) for i in range(80)]
+    log = tmp_path / "20250101.log"
+    _append(log, events[:70])
+    PolicyAdvisor(log_root=tmp_path).snapshot()
+    assert (tmp_path / CHECKPOINT_NAME).exists()
+
+    _append(log, events[70:])
+    expected = compute_stats(events)
+    folded.clear()
+    assert PolicyAdvisor(log_root=tmp_path).snapshot() == expected
+    assert len(folded) == 10
+
+
+def test_truncated_log_forces_a_rebuild(tmp_path, folded):
+    rng = random.Random(7)
+    events = [_event(i, rng) for i in range(30)]
+    log = tmp_path / "20250101.log"
+    _append(log, events)
+    advisor = PolicyAdvisor(log_root=tmp_path)
+    advisor.snapshot()
+
+    log.write_text("", encoding="utf-8")
+    _append(log, events[:5])
+    assert advisor.snapshot() == compute_stats(events[:5])
+
+
+def test_sketch_percentiles_are_bounded_and_mergeable():
+    rng = random.Random(11)
+    values = [rng.lognormvariate(10, 1.5) for _ in range(EXACT_SAMPLES * 8)]
+    first, second, whole = QuantileSketch(), QuantileSketch(), QuantileSketch()
+    for index, value in enumerate(values):
+        (first if index % 2 else second).add(value)
+        whole.add(value)
+    first.merge(second)
+
+    ordered = sorted(values)
+    for pct in (50.0, 90.0, 95.0, 99.0):
+        exact = _percentile(ordered, pct)
+        assert whole.percentile(pct) == pytest.approx(exact, rel=0.03)
+        assert first.percentile(pct) == pytest.approx(whole.percentile(pct), rel=1e-9)
+    assert (whole.count, whole.min, whole.max) == (len(values), ordered[0], ordered[-1])
+    assert QuantileSketch.from_dict(json.loads(json.dumps(whole.to_dict()))).percentile(95.0) == whole.percentile(95.0)
+    assert len(whole.buckets) < len(values) / 10
@@ -0,0 +1,81 @@
+"""
+Cold-start budgets for the phase CLIs.
+
+Each entry point is started with ``--help --profile-startup``, so the test
+measures exactly what a user pays before argument parsing: interpreter
+start plus module-level imports.  A phase fails when it goes over its wall
+time budget or when its startup profile shows a model stack that should
+only load on first use.  Phases whose hard dependencies are not installed
+in this environment are skipped.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from pipeline_common.startup_profile import DIR_ENV, read_report
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# name -> (argv after the interpreter, extra PYTHONPATH entries, budget in seconds)
+PHASE_CLIS = {
+    "phase1_validation": (
+        ["phase1-validation/src/phase1_validation/validation.py"],
+        [],
+        3.0,
+    ),
+    "phase2_extraction": (["-m", "phase2_extraction.ingest"], ["phase2-extraction/src"], 3.0),
+    "phase3_chunking": (["-m", "phase3_chunking.main"], ["phase3-chunking/src"], 3.0),
+    "phase4_tts": (["phase4_tts/src/main_multi_engine.py"], [], 3.0),
+    "phase5_enhancement": (["-m", "phase5_enhancement.main"], ["phase5_enhancement/src"], 3.0),
+    "phase6_orchestrator": (["phase6_orchestrator/orchestrator.py"], [], 3.0),
+}
+
+# Top-level packages that must stay deferred until a run actually needs them
+HEAVY_MODULES = {
+    "easyocr",
+    "faster_whisper",
+    "librosa",
+    "noisereduce",
+    "scipy",
+    "spacy",
+    "torch",
+    "transformers",
+    "whisper",
+}
+
+
+@pytest.mark.parametrize("phase", sorted(PHASE_CLIS))
+def test_cli_cold_start_within_budget(phase, tmp_path):
+    argv, extra_paths, budget = PHASE_CLIS[phase]
+    env = dict(os.environ)
+    env[DIR_ENV] = str(tmp_path)
+    env["PYTHONPATH"] = os.pathsep.join(
+        [str(ROOT), *(str(ROOT / path) for path in extra_paths), env.get("PYTHONPATH", "")]
+    )
+
+    started = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, *argv, "--help", "--profile-startup"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    elapsed = time.perf_counter() - started
+
+    missing = [line for line in proc.stderr.splitlines() if line.startswith("ModuleNotFoundError")]
+    if proc.returncode != 0 and missing:
+        pytest.skip(f"{phase} dependencies not installed: {missing[-1]}")
+    assert proc.returncode == 0, proc.stderr
+
+    reports = list(tmp_path.glob(f"{phase}-*.txt"))
+    assert len(reports) == 1, f"no startup profile written for {phase}"
+    loaded = {name.split(".")[0] for _, name, _, _ in read_report(reports[0])}
+    assert not loaded & HEAVY_MODULES, f"{phase} imports {sorted(loaded & HEAVY_MODULES)} at startup"
+    assert elapsed < budget, f"{phase} cold start took {elapsed:.2f}s (budget {budget:.1f}s)"
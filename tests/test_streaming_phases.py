@@ -0,0 +1,141 @@
+"""
+Streaming mode of the orchestrator: Phases 3-5 run side by side.
+
+The phase runners are stand-ins that talk through the real chunk journals,
+so the test checks the hand-over and sealing logic without TTS engines.
+"""
+
+import json
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from pipeline_common.chunk_journal import ChunkJournal, streaming_enabled
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "phase6_orchestrator"))
+orchestrator = pytest.importorskip("orchestrator")
+
+FILE_ID = "book"
+CHUNKS = 6
+
+
+@pytest.fixture
+def pipeline_json(tmp_path):
+    path = tmp_path / "pipeline.json"
+    path.write_text(json.dumps({"phase3": {"files": {}}}), encoding="utf-8")
+    return path
+
+
+def _consume(pipeline_json, stage, on_record):
+    reader = ChunkJournal.for_stage(pipeline_json, FILE_ID, stage).reader()
+    for record in reader.follow(interval=0.01, timeout=10):
+        on_record(record)
+    return not reader.failed
+
+
+def test_plan_streaming_phases_needs_a_contiguous_pending_run(monkeypatch):
+    done = set()
+    monkeypatch.setattr(
+        orchestrator, "check_phase_status", lambda state, num, file_id: "success" if num in done else "pending"
+    )
+    plan = orchestrator.plan_streaming_phases
+    assert plan([1, 2, 3, 4, 5], None, FILE_ID, True) == [3, 4, 5]
+    assert plan([3, 5], None, FILE_ID, True) == []
+    done.add(3)
+    assert plan([1, 2, 3, 4, 5], None, FILE_ID, True) == [4, 5]
+    assert plan([1, 2, 3, 4, 5], None, FILE_ID, False) == [3, 4, 5]
+    done.add(4)
+    assert plan([1, 2, 3, 4, 5], None, FILE_ID, True) == []
+
+
+def test_phases_overlap_and_only_the_concat_waits(pipeline_json):
+    events = []
+
+    def run(phase_num):
+        assert streaming_enabled()
+        if phase_num == 3:
+            journal = ChunkJournal.for_stage(pipeline_json, FILE_ID, "phase3")
+            for index in range(CHUNKS):
+                time.sleep(0.02)
+                journal.append({"chunk_id": f"chunk_{index + 1:04d}", "index": index, "path": f"c{index}.txt"})
+            events.append(("phase3_done", None))
+            return True
+        if phase_num == 4:
+            journal = ChunkJournal.for_stage(pipeline_json, FILE_ID, "phase4")
+            return _consume(
+                pipeline_json,
+                "phase3",
+                lambda record: journal.append({"chunk_id": record["chunk_id"], "audio_path": f"{record['chunk_id']}.wav"}),
+            )
+        ok = _consume(pipeline_json, "phase4", lambda record: events.append(("enhanced", record["chunk_id"])))
+        events.append(("concat", None))
+        return ok
+
+    streamer = orchestrator.StreamingPhases([3, 4, 5], FILE_ID, pipeline_json, run, strict_chunk_integrity=False)
+    streamer.start()
+    try:
+        assert [streamer.result(num) for num in (3, 4, 5)] == [True, True, True]
+    finally:
+        streamer.close()
+
+    kinds = [kind for kind, _ in events]
+    assert kinds.index("enhanced") < kinds.index("phase3_done")  # enhancement overlapped chunking
+    assert kinds[-1] == "concat"
+    assert [cid for kind, cid in events if kind == "enhanced"] == [f"chunk_{i:04d}" for i in range(1, CHUNKS + 1)]
+    assert not streaming_enabled()
+
+
+def test_failed_producer_seals_its_journal_so_consumers_stop(pipeline_json):
+    def run(phase_num):
+        if phase_num == 4:
+            raise RuntimeError("engine crashed")
+        return _consume(pipeline_json, "phase4", lambda record: None)
+
+    streamer = orchestrator.StreamingPhases([4, 5], FILE_ID, pipeline_json, run, strict_chunk_integrity=False)
+    streamer.start()
+    try:
+        assert streamer.result(4) is False
+        assert streamer.result(5) is False
+    finally:
+        streamer.close()
+    assert not ChunkJournal.for_stage(pipeline_json, FILE_ID, "phase3").exists()
+
+
+def test_concurrent_phases_are_judged_by_their_own_errors(monkeypatch, pipeline_json):
+    """Side-by-side phases return their errors, so one cannot be retried on another's."""
+    from self_repair.failure_classifier import FailureClassifier
+
+    errors = {
+        3: orchestrator.phase_failed("pypdf.errors.PdfReadError: EOF marker not found", 1),
+        4: orchestrator.phase_failed("RuntimeError: CUDA out of memory. Tried to allocate 512.00 MiB", 1),
+    }
+    attempts = {3: 0, 4: 0}
+    analysed = {}
+    both_failing = threading.Barrier(2)
+
+    def run_phase(phase_num, *args, **kwargs):
+        attempts[phase_num] += 1
+        if attempts[phase_num] == 1:
+            both_failing.wait(timeout=5)  # both first attempts fail before either is judged
+        return errors[phase_num]
+
+    monkeypatch.setattr(orchestrator, "run_phase", run_phase)
+    monkeypatch.setattr(orchestrator, "_get_failure_classifier", FailureClassifier)
+    monkeypatch.setattr(orchestrator.time, "sleep", lambda _: None)
+    monkeypatch.setattr(
+        orchestrator, "_analyze_failure_with_llm", lambda num, _id, error=None: analysed.setdefault(num, error)
+    )
+
+    def run(num):
+        return orchestrator.run_phase_with_retry(num, Path("book.pdf"), FILE_ID, pipeline_json, state=None, max_retries=2)
+
+    with orchestrator.ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(pool.map(run, [3, 4]))
+
+    assert results == [False, False]
+    assert attempts == {3: 1, 4: 3}  # deterministic stops at once, transient uses its retries
+    assert analysed == {3: errors[3].error, 4: errors[4].error}
@@ -0,0 +1,131 @@
+"""
+Benchmark pipeline.json write throughput with concurrent books, monolithic vs sharded.
+
+Each simulated book is a separate process that records its chunks one
+transaction at a time (as Phase 4 workers do), growing its own
+``phase4.files[<book>].chunk_audio_paths`` list.  The monolithic run uses the
+classic global lock and full-document rewrite; the sharded runs migrate the
+same seed state first and pass ``file_id`` so each book only locks and
+rewrites its own shard.
+
+Usage:
+    python -m tools.benchmark_state_sharding                    # 1, 2, 4, 8 books
+    python -m tools.benchmark_state_sharding --books 8 --chunks 60 --seed-books 40
+"""
+
+from __future__ import annotations
+
+import argparse
+import multiprocessing
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Ensure project root import path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from pipeline_common.state_manager import PipelineState, StateLockError  # noqa: E402
+from pipeline_common.state_shards import migrate_to_shards  # noqa: E402
+
+LAYOUTS = ("monolithic", "sharded", "sharded_per_phase")
+
+
+def _entry(status: str, chunks: int) -> Dict:
+    return {
+        "status": status,
+        "timestamps": {},
+        "artifacts": {},
+        "metrics": {},
+        "errors": [],
+        "chunk_audio_paths": [f"audio/chunk_{i:04d}.wav" for i in range(chunks)],
+    }
+
+
+def _seed(path: Path, seed_books: int, chunks: int, layout: str) -> None:
+    """Earlier books already in the state, so every rewrite carries their weight."""
+    files = {f"done_{i:03d}": _entry("success", chunks) for i in range(seed_books)}
+    PipelineState(path).write(
+        {
+            "phase3": {"status": "success", "files": {k: _entry("success", chunks) for k in files}},
+            "phase4": {"status": "running", "files": files},
+            "batch_runs": [],
+        }
+    )
+    if layout != "monolithic":
+        migrate_to_shards(path, per_phase=layout == "sharded_per_phase")
+
+
+def _book(path: str, file_id: str, chunks: int, scoped: bool, start, lock_timeouts) -> None:
+    state = PipelineState(path)
+    start.wait()
+    for index in range(chunks):
+        while True:
+            try:
+                with state.transaction(operation="bench_chunk", file_id=file_id if scoped else None) as txn:
+                    files = txn.data.setdefault("phase4", {}).setdefault("files", {})
+                    entry = files.setdefault(file_id, _entry("running", 0))
+                    entry["chunk_audio_paths"].append(f"audio/{file_id}/chunk_{index:04d}.wav")
+                break
+            except StateLockError:  # heavy contention: retry like a phase would
+                with lock_timeouts.get_lock():
+                    lock_timeouts.value += 1
+
+
+def run(layout: str, books: int, chunks: int, seed_books: int, workdir: Path) -> Dict[str, float]:
+    path = workdir / layout / f"books_{books}" / "pipeline.json"
+    path.parent.mkdir(parents=True)
+    _seed(path, seed_books, chunks, layout)
+
+    ctx = multiprocessing.get_context("spawn")
+    start = ctx.Barrier(books + 1)  # every book imported and ready before the clock starts
+    lock_timeouts = ctx.Value("i", 0)
+    procs: List[multiprocessing.Process] = []
+    for index in range(books):
+        proc = ctx.Process(
+            target=_book,
+            args=(str(path), f"book_{index:02d}", chunks, layout != "monolithic", start, lock_timeouts),
+        )
+        proc.start()
+        procs.append(proc)
+    start.wait()
+    began = time.perf_counter()
+    for proc in procs:
+        proc.join()
+    elapsed = time.perf_counter() - began
+
+    final = PipelineState(path).read()["phase4"]["files"]
+    written = sum(len(final[f"book_{i:02d}"]["chunk_audio_paths"]) for i in range(books))
+    if written != books * chunks:
+        raise SystemExit(f"{layout}: expected {books * chunks} chunk records, found {written}")
+    return {
+        "elapsed": elapsed,
+        "commits_per_sec": books * chunks / elapsed,
+        "lock_timeouts": lock_timeouts.value,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--books", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--chunks", type=int, default=40, help="Transactions per book")
+    parser.add_argument("--seed-books", type=int, default=20, help="Finished books already in the state")
+    parser.add_argument("--layouts", nargs="+", choices=LAYOUTS, default=list(LAYOUTS))
+    args = parser.parse_args(argv)
+
+    print(f"{'layout':<20}{'books':>6}{'seconds':>10}{'commits/s':>12}{'timeouts':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for layout in args.layouts:
+            for books in args.books:
+                result = run(layout, books, args.chunks, args.seed_books, Path(tmp))
+                print(
+                    f"{layout:<20}{books:>6}{result['elapsed']:>10.2f}"
+                    f"{result['commits_per_sec']:>12.1f}{result['lock_timeouts']:>10}"
+                )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Benchmark the compiled text-normalization rule tables on a book-sized input.
+
+Each table is timed against its naive rule-by-rule application
+(``RuleTable.apply_reference``, i.e. one ``re.sub``/``str.replace`` per rule
+and per key, as the normalizers used to run) and the outputs are checked to
+be identical.
+
+Usage:
+    python -m tools.benchmark_text_normalization                 # synthetic 1M-char book
+    python -m tools.benchmark_text_normalization --input book.txt --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+# Ensure project root import path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+sys.path.insert(0, str(PROJECT_ROOT / "phase2-extraction" / "src"))
+
+from phase2_extraction import cleaner, tts_normalizer  # noqa: E402
+from phase3_chunking import text_normalizer  # noqa: E402
+from pipeline_common.text_rules import RuleTable  # noqa: E402
+
+PROSE = [
+    "The river ran slow and brown beneath the old stone bridge.",
+    "She had kept the letters in a tin box under the stairs for years.",
+    "Nobody in the village could remember when the lantern was first lit.",
+    "He folded the map, put it in his coat, and walked on toward the harbour.",
+    "It rained all that week, and the roads turned to mud by Thursday.",
+]
+SPECIAL = [
+    "Dr. Smith met Mr. Jones on St. Paul Street at 9 a.m. yesterday.",
+    "“Well… I don’t know,” she said — and left.",
+    "Prices rose 12.5% to $1,250.00 , which was approx. twice the est. cost !!",
+    "It was the 21st time   the  committee\tmet , vs. the 3rd last year ?!",
+    "OceanofPDF.com",
+    "T h e   G i f t of the Magi, etc. ... and so on... the end",
+    "He moved to the U.S.A. in 1999 and earned a Ph.D. in 3 yrs.",
+    "café naïve ﬁnance  non-breaking space   ",
+]
+
+
+def synthetic_book(chars: int, seed: int = 7, special_rate: float = 0.15) -> str:
+    """Paragraphs of plain prose salted with the patterns the normalizers rewrite."""
+    rng = random.Random(seed)
+    paragraphs: List[str] = []
+    size = 0
+    while size < chars:
+        if rng.random() < 0.05:
+            paragraph = rng.choice(["42", "Page 7 of 300", "-----", "Chapter 3", "CHAPTER 12"])
+        else:
+            paragraph = " ".join(
+                rng.choice(SPECIAL if rng.random() < special_rate else PROSE) for _ in range(rng.randint(3, 9))
+            )
+        paragraphs.append(paragraph)
+        size += len(paragraph) + 2
+    return "".join(
+        paragraph + ("\n\n\n" if rng.random() < 0.1 else "\n\n") for paragraph in paragraphs
+    )[:chars]
+
+
+def chunked(text: str, size: int) -> List[str]:
+    return [text[start : start + size] for start in range(0, len(text), size)]
+
+
+def _best_of(func: Callable[[], List[str]], repeat: int) -> Tuple[float, List[str]]:
+    best = float("inf")
+    result: List[str] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark compiled text normalization rule tables.")
+    parser.add_argument("--input", type=Path, help="Text file to normalize (default: synthetic book)")
+    parser.add_argument("--chars", type=int, default=1_000_000, help="Synthetic book size (default: 1,000,000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement; best is reported")
+    parser.add_argument("--chunk-chars", type=int, default=1000, help="Chunk size for the per-chunk run (Phase 3)")
+    args = parser.parse_args()
+
+    text = args.input.read_text(encoding="utf-8") if args.input else synthetic_book(args.chars)
+    chunks = chunked(text, args.chunk_chars)
+    print(f"Input: {len(text):,} chars, {text.count(chr(10) * 2):,} paragraph breaks, {len(chunks):,} chunks")
+
+    tables: List[RuleTable] = [
+        tts_normalizer.TTS_TABLE,
+        cleaner.ENCODING_TABLE,
+        cleaner.OCR_ARTIFACT_TABLE,
+        cleaner.WHITESPACE_TABLE,
+        text_normalizer.PUNCTUATION_TABLE,
+        text_normalizer.ABBREVIATION_TABLE,
+    ]
+    print(f"{'table':<22} {'input':<6} {'rules':>5} {'passes':>6} {'reference s':>12} {'compiled s':>11} {'speedup':>8}")
+    failures = 0
+    runs = [(table, "book") for table in tables]
+    runs += [(text_normalizer.PUNCTUATION_TABLE, "chunks"), (text_normalizer.ABBREVIATION_TABLE, "chunks")]
+    for table, unit in runs:
+        pieces = [text] if unit == "book" else chunks
+        reference_time, expected = _best_of(lambda: [table.apply_reference(piece) for piece in pieces], args.repeat)
+        compiled_time, actual = _best_of(lambda: [table.apply(piece)[0] for piece in pieces], args.repeat)
+        identical = actual == expected
+        failures += not identical
+        print(
+            f"{table.name:<22} {unit:<6} {len(table.rules):>5} {table.passes:>6} {reference_time:>12.3f} "
+            f"{compiled_time:>11.3f} {reference_time / compiled_time:>7.1f}x"
+            + ("" if identical else "  OUTPUT DIFFERS")
+        )
+
+    _, counts = tts_normalizer.TTS_TABLE.apply(text)
+    busiest = sorted(counts.items(), key=lambda item: -item[1])[:5]
+    print("Top phase 2 rule counts: " + ", ".join(f"{name}={count:,}" for name, count in busiest))
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())